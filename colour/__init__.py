@@ -46,131 +46,172 @@ Sub-packages
 
 import numpy as np
 import sys
+from importlib.util import find_spec
 
 from .utilities.deprecation import ModuleAPI, build_API_changes
 from .utilities.documentation import is_documentation_building
 from .utilities.common import (domain_range_scale, get_domain_range_scale,
-                               set_domain_range_scale)
-
-from .adaptation import (CHROMATIC_ADAPTATION_METHODS,
-                         CHROMATIC_ADAPTATION_TRANSFORMS,
-                         VIEWING_CONDITIONS_CMCCAT2000, chromatic_adaptation)
-from .algebra import (CubicSplineInterpolator, Extrapolator,
-                      KernelInterpolator, NearestNeighbourInterpolator,
-                      LinearInterpolator, NullInterpolator, PchipInterpolator,
-                      SpragueInterpolator, TABLE_INTERPOLATION_METHODS,
-                      kernel_cardinal_spline, kernel_lanczos, kernel_linear,
-                      kernel_nearest_neighbour, kernel_sinc,
-                      table_interpolation, lagrange_coefficients)
-from .colorimetry import (
-    BANDPASS_CORRECTION_METHODS, CCS_ILLUMINANTS, CCS_LIGHT_SOURCES,
-    LIGHTNESS_METHODS, LUMINANCE_METHODS, MSDS_CMFS, MSDS_TO_XYZ_METHODS,
-    MultiSpectralDistributions, SDS_ILLUMINANTS, SDS_LEFS, SDS_LIGHT_SOURCES,
-    SD_GAUSSIAN_METHODS, SD_MULTI_LEDS_METHODS, SD_SINGLE_LED_METHODS,
-    SD_TO_XYZ_METHODS, SPECTRAL_SHAPE_ASTME308, SPECTRAL_SHAPE_DEFAULT,
-    SpectralDistribution, SpectralShape, TVS_ILLUMINANTS,
-    TVS_ILLUMINANTS_HUNTERLAB, WHITENESS_METHODS, YELLOWNESS_METHODS,
-    bandpass_correction, colorimetric_purity, complementary_wavelength,
-    dominant_wavelength, excitation_purity, lightness, luminance,
-    luminous_efficacy, luminous_efficiency, luminous_flux, msds_constant,
-    msds_ones, msds_zeros, msds_to_XYZ, sd_CIE_illuminant_D_series,
-    sd_CIE_standard_illuminant_A, sd_blackbody, sd_constant, sd_gaussian,
-    sd_mesopic_luminous_efficiency_function, sd_multi_leds, sd_ones,
-    sd_single_led, sd_to_XYZ, sd_zeros, wavelength_to_XYZ, whiteness,
-    yellowness)
-from .blindness import (
-    CVD_MATRICES_MACHADO2010, matrix_anomalous_trichromacy_Machado2009,
-    matrix_cvd_Machado2009, msds_cmfs_anomalous_trichromacy_Machado2009)
-from .appearance import (
-    CAM_Specification_ATD95, CAM_Specification_CAM16,
-    CAM_Specification_CIECAM02, CAM_Specification_Hunt, CAM_Specification_LLAB,
-    CAM_Specification_Nayatani95, CAM_Specification_RLAB, CAM16_to_XYZ,
-    CIECAM02_to_XYZ, VIEWING_CONDITIONS_CAM16, VIEWING_CONDITIONS_CIECAM02,
-    VIEWING_CONDITIONS_HUNT, VIEWING_CONDITIONS_LLAB, VIEWING_CONDITIONS_RLAB,
-    XYZ_to_ATD95, XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB,
-    XYZ_to_Nayatani95, XYZ_to_RLAB)
-from .difference import DELTA_E_METHODS, delta_E
-from .geometry import (PRIMITIVE_METHODS, primitive,
-                       PRIMITIVE_VERTICES_METHODS, primitive_vertices)
-from .io import (LUT1D, LUT3x1D, LUT3D, LUTSequence, READ_IMAGE_METHODS,
-                 SpectralDistribution_IESTM2714, WRITE_IMAGE_METHODS,
-                 read_image, read_LUT, read_sds_from_csv_file,
-                 read_sds_from_xrite_file, read_spectral_data_from_csv_file,
-                 write_image, write_LUT, write_sds_to_csv_file)
-from .models import (
-    CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
-    CAM02UCS_to_JMh_CIECAM02, CAM02LCD_to_XYZ, CAM02SCD_to_XYZ,
-    CAM02UCS_to_XYZ, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
-    CAM16UCS_to_JMh_CAM16, CAM16LCD_to_XYZ, CAM16SCD_to_XYZ, CAM16UCS_to_XYZ,
-    CCTF_DECODINGS, CCTF_ENCODINGS, CMYK_to_CMY, CMY_to_CMYK, CMY_to_RGB,
-    COLOURSPACE_MODELS, CV_range, DATA_MACADAM_1942_ELLIPSES, DIN99_to_Lab,
-    EOTFS, EOTF_INVERSES, HDR_CIELAB_METHODS, HDR_IPT_METHODS, HSL_to_RGB,
-    HSV_to_RGB, Hunter_Lab_to_XYZ, Hunter_Rdab_to_XYZ, ICtCp_to_RGB,
-    ICtCp_to_XYZ, IgPgTg_to_XYZ, IPT_hue_angle, IPT_to_XYZ,
-    JMh_CAM16_to_CAM16LCD, JMh_CAM16_to_CAM16SCD, JMh_CAM16_to_CAM16UCS,
-    JMh_CIECAM02_to_CAM02LCD, JMh_CIECAM02_to_CAM02SCD,
-    JMh_CIECAM02_to_CAM02UCS, JzAzBz_to_XYZ, LCHab_to_Lab, LCHuv_to_Luv,
-    LOG_DECODINGS, LOG_ENCODINGS, Lab_to_DIN99, Lab_to_LCHab, Lab_to_XYZ,
-    Luv_to_LCHuv, Luv_to_XYZ, Luv_to_uv, Luv_uv_to_xy, OETFS, OETF_INVERSES,
-    OOTFS, OOTF_INVERSES, OSA_UCS_to_XYZ, Oklab_to_XYZ, Prismatic_to_RGB,
-    RGB_COLOURSPACES, RGB_Colourspace, RGB_luminance, RGB_luminance_equation,
-    RGB_to_CMY, RGB_to_HSL, RGB_to_HSV, RGB_to_ICtCp, RGB_to_Prismatic,
-    RGB_to_RGB, RGB_to_XYZ, RGB_to_YCbCr, RGB_to_YCoCg, RGB_to_YcCbcCrc,
-    UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy, UVW_to_XYZ, WEIGHTS_YCBCR,
-    XYZ_to_CAM02LCD, XYZ_to_CAM02SCD, XYZ_to_CAM02UCS, XYZ_to_CAM16LCD,
-    XYZ_to_CAM16SCD, XYZ_to_CAM16UCS, XYZ_to_Hunter_Lab, XYZ_to_Hunter_Rdab,
-    XYZ_to_ICtCp, XYZ_to_IgPgTg, XYZ_to_IPT, XYZ_to_JzAzBz,
-    XYZ_to_K_ab_HunterLab1966, XYZ_to_Lab, XYZ_to_Luv, XYZ_to_OSA_UCS,
-    XYZ_to_Oklab, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW, XYZ_to_hdr_CIELab,
-    XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY, YCbCr_to_RGB,
-    YCoCg_to_RGB, YcCbcCrc_to_RGB, cctf_decoding, cctf_encoding,
-    chromatically_adapted_primaries, eotf, eotf_inverse, full_to_legal,
-    gamma_function, hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ, legal_to_full,
-    linear_function, log_decoding, log_encoding, matrix_RGB_to_RGB,
-    matrix_YCbCr, normalised_primary_matrix, oetf, oetf_inverse, offset_YCbCr,
-    ootf, ootf_inverse, primaries_whitepoint, sRGB_to_XYZ, uv_to_Luv,
-    uv_to_UCS, xyY_to_XYZ, xyY_to_xy, xy_to_Luv_uv, xy_to_UCS_uv, xy_to_XYZ,
-    xy_to_xyY)
-from .corresponding import (
-    BRENEMAN_EXPERIMENTS, BRENEMAN_EXPERIMENT_PRIMARIES_CHROMATICITIES,
-    CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS, CorrespondingColourDataset,
-    CorrespondingChromaticitiesPrediction,
-    corresponding_chromaticities_prediction)
-from .contrast import (CONTRAST_SENSITIVITY_METHODS,
-                       contrast_sensitivity_function)
-from .phenomena import (rayleigh_scattering, scattering_cross_section,
-                        sd_rayleigh_scattering)
-from .notation import (MUNSELL_COLOURS, MUNSELL_VALUE_METHODS,
-                       munsell_colour_to_xyY, munsell_value,
-                       xyY_to_munsell_colour)
-from .quality import (COLOUR_FIDELITY_INDEX_METHODS,
-                      COLOUR_QUALITY_SCALE_METHODS, colour_fidelity_index,
-                      colour_quality_scale, colour_rendering_index,
-                      spectral_similarity_index)
-from .recovery import XYZ_TO_SD_METHODS, XYZ_to_sd
-from .temperature import (CCT_TO_UV_METHODS, CCT_TO_XY_METHODS, CCT_to_uv,
-                          CCT_to_xy, UV_TO_CCT_METHODS, XY_TO_CCT_METHODS,
-                          uv_to_CCT, xy_to_CCT)
-from .characterisation import (
-    CCS_COLOURCHECKERS, MATRIX_COLOUR_CORRECTION_METHODS,
-    COLOUR_CORRECTION_METHODS, MSDS_CAMERA_SENSITIVITIES,
-    MSDS_DISPLAY_PRIMARIES, POLYNOMIAL_EXPANSION_METHODS, SDS_COLOURCHECKERS,
-    SDS_FILTERS, SDS_LENSES, colour_correction, matrix_colour_correction,
-    matrix_idt, polynomial_expansion, sd_to_aces_relative_exposure_values)
-from .volume import (
-    OPTIMAL_COLOUR_STIMULI_ILLUMINANTS, RGB_colourspace_limits,
-    RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
-    RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
-    RGB_colourspace_volume_MonteCarlo,
-    RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
-    is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
-from .graph import describe_conversion_path, convert
+                               set_domain_range_scale, lazy_module_attributes)
 
 from colour.utilities import is_matplotlib_installed
 
-# Exposing "colour.plotting" sub-package if "Matplotlib" is available.
-if is_matplotlib_installed():
-    import colour.plotting as plotting  # noqa
+# The sub-packages are imported on first access of their attributes, the
+# attributes being listed per sub-package.
+_SUBPACKAGES_ATTRIBUTES = {
+    'adaptation': [
+        'CHROMATIC_ADAPTATION_METHODS', 'CHROMATIC_ADAPTATION_TRANSFORMS',
+        'VIEWING_CONDITIONS_CMCCAT2000', 'chromatic_adaptation'
+    ],
+    'algebra': [
+        'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator',
+        'NearestNeighbourInterpolator', 'LinearInterpolator',
+        'NullInterpolator', 'PchipInterpolator', 'SpragueInterpolator',
+        'TABLE_INTERPOLATION_METHODS', 'kernel_cardinal_spline',
+        'kernel_lanczos', 'kernel_linear', 'kernel_nearest_neighbour',
+        'kernel_sinc', 'table_interpolation', 'lagrange_coefficients'
+    ],
+    'colorimetry': [
+        'BANDPASS_CORRECTION_METHODS', 'CCS_ILLUMINANTS', 'CCS_LIGHT_SOURCES',
+        'LIGHTNESS_METHODS', 'LUMINANCE_METHODS', 'MSDS_CMFS',
+        'MSDS_TO_XYZ_METHODS', 'MultiSpectralDistributions', 'SDS_ILLUMINANTS',
+        'SDS_LEFS', 'SDS_LIGHT_SOURCES', 'SD_GAUSSIAN_METHODS',
+        'SD_MULTI_LEDS_METHODS', 'SD_SINGLE_LED_METHODS', 'SD_TO_XYZ_METHODS',
+        'SPECTRAL_SHAPE_ASTME308', 'SPECTRAL_SHAPE_DEFAULT',
+        'SpectralDistribution', 'SpectralShape', 'TVS_ILLUMINANTS',
+        'TVS_ILLUMINANTS_HUNTERLAB', 'WHITENESS_METHODS', 'YELLOWNESS_METHODS',
+        'bandpass_correction', 'colorimetric_purity',
+        'complementary_wavelength', 'dominant_wavelength', 'excitation_purity',
+        'lightness', 'luminance', 'luminous_efficacy', 'luminous_efficiency',
+        'luminous_flux', 'msds_constant', 'msds_ones', 'msds_zeros',
+        'msds_to_XYZ', 'sd_CIE_illuminant_D_series',
+        'sd_CIE_standard_illuminant_A', 'sd_blackbody', 'sd_constant',
+        'sd_gaussian', 'sd_mesopic_luminous_efficiency_function',
+        'sd_multi_leds', 'sd_ones', 'sd_single_led', 'sd_to_XYZ', 'sd_zeros',
+        'wavelength_to_XYZ', 'whiteness', 'yellowness'
+    ],
+    'blindness': [
+        'CVD_MATRICES_MACHADO2010', 'matrix_anomalous_trichromacy_Machado2009',
+        'matrix_cvd_Machado2009', 'msds_cmfs_anomalous_trichromacy_Machado2009'
+    ],
+    'appearance': [
+        'CAM_Specification_ATD95', 'CAM_Specification_CAM16',
+        'CAM_Specification_CIECAM02', 'CAM_Specification_Hunt',
+        'CAM_Specification_LLAB', 'CAM_Specification_Nayatani95',
+        'CAM_Specification_RLAB', 'CAM16_to_XYZ', 'CIECAM02_to_XYZ',
+        'VIEWING_CONDITIONS_CAM16', 'VIEWING_CONDITIONS_CIECAM02',
+        'VIEWING_CONDITIONS_HUNT', 'VIEWING_CONDITIONS_LLAB',
+        'VIEWING_CONDITIONS_RLAB', 'XYZ_to_ATD95', 'XYZ_to_CAM16',
+        'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB', 'XYZ_to_Nayatani95',
+        'XYZ_to_RLAB'
+    ],
+    'difference': ['DELTA_E_METHODS', 'delta_E'],
+    'geometry': [
+        'PRIMITIVE_METHODS', 'primitive', 'PRIMITIVE_VERTICES_METHODS',
+        'primitive_vertices'
+    ],
+    'io': [
+        'LUT1D', 'LUT3x1D', 'LUT3D', 'LUTSequence', 'READ_IMAGE_METHODS',
+        'SpectralDistribution_IESTM2714', 'WRITE_IMAGE_METHODS', 'read_image',
+        'read_LUT', 'read_sds_from_csv_file', 'read_sds_from_xrite_file',
+        'read_spectral_data_from_csv_file', 'write_image', 'write_LUT',
+        'write_sds_to_csv_file'
+    ],
+    'models': [
+        'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
+        'CAM02UCS_to_JMh_CIECAM02', 'CAM02LCD_to_XYZ', 'CAM02SCD_to_XYZ',
+        'CAM02UCS_to_XYZ', 'CAM16LCD_to_JMh_CAM16', 'CAM16SCD_to_JMh_CAM16',
+        'CAM16UCS_to_JMh_CAM16', 'CAM16LCD_to_XYZ', 'CAM16SCD_to_XYZ',
+        'CAM16UCS_to_XYZ', 'CCTF_DECODINGS', 'CCTF_ENCODINGS', 'CMYK_to_CMY',
+        'CMY_to_CMYK', 'CMY_to_RGB', 'COLOURSPACE_MODELS', 'CV_range',
+        'DATA_MACADAM_1942_ELLIPSES', 'DIN99_to_Lab', 'EOTFS', 'EOTF_INVERSES',
+        'HDR_CIELAB_METHODS', 'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB',
+        'Hunter_Lab_to_XYZ', 'Hunter_Rdab_to_XYZ', 'ICtCp_to_RGB',
+        'ICtCp_to_XYZ', 'IgPgTg_to_XYZ', 'IPT_hue_angle', 'IPT_to_XYZ',
+        'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD',
+        'JMh_CAM16_to_CAM16UCS', 'JMh_CIECAM02_to_CAM02LCD',
+        'JMh_CIECAM02_to_CAM02SCD', 'JMh_CIECAM02_to_CAM02UCS',
+        'JzAzBz_to_XYZ', 'LCHab_to_Lab', 'LCHuv_to_Luv', 'LOG_DECODINGS',
+        'LOG_ENCODINGS', 'Lab_to_DIN99', 'Lab_to_LCHab', 'Lab_to_XYZ',
+        'Luv_to_LCHuv', 'Luv_to_XYZ', 'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS',
+        'OETF_INVERSES', 'OOTFS', 'OOTF_INVERSES', 'OSA_UCS_to_XYZ',
+        'Oklab_to_XYZ', 'Prismatic_to_RGB', 'RGB_COLOURSPACES',
+        'RGB_Colourspace', 'RGB_luminance', 'RGB_luminance_equation',
+        'RGB_to_CMY', 'RGB_to_HSL', 'RGB_to_HSV', 'RGB_to_ICtCp',
+        'RGB_to_Prismatic', 'RGB_to_RGB', 'RGB_to_XYZ', 'RGB_to_YCbCr',
+        'RGB_to_YCoCg', 'RGB_to_YcCbcCrc', 'UCS_to_XYZ', 'UCS_to_uv',
+        'UCS_uv_to_xy', 'UVW_to_XYZ', 'WEIGHTS_YCBCR', 'XYZ_to_CAM02LCD',
+        'XYZ_to_CAM02SCD', 'XYZ_to_CAM02UCS', 'XYZ_to_CAM16LCD',
+        'XYZ_to_CAM16SCD', 'XYZ_to_CAM16UCS', 'XYZ_to_Hunter_Lab',
+        'XYZ_to_Hunter_Rdab', 'XYZ_to_ICtCp', 'XYZ_to_IgPgTg', 'XYZ_to_IPT',
+        'XYZ_to_JzAzBz', 'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab',
+        'XYZ_to_Luv', 'XYZ_to_OSA_UCS', 'XYZ_to_Oklab', 'XYZ_to_RGB',
+        'XYZ_to_UCS', 'XYZ_to_UVW', 'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT',
+        'XYZ_to_sRGB', 'XYZ_to_xy', 'XYZ_to_xyY', 'YCbCr_to_RGB',
+        'YCoCg_to_RGB', 'YcCbcCrc_to_RGB', 'cctf_decoding', 'cctf_encoding',
+        'chromatically_adapted_primaries', 'eotf', 'eotf_inverse',
+        'full_to_legal', 'gamma_function', 'hdr_CIELab_to_XYZ',
+        'hdr_IPT_to_XYZ', 'legal_to_full', 'linear_function', 'log_decoding',
+        'log_encoding', 'matrix_RGB_to_RGB', 'matrix_YCbCr',
+        'normalised_primary_matrix', 'oetf', 'oetf_inverse', 'offset_YCbCr',
+        'ootf', 'ootf_inverse', 'primaries_whitepoint', 'sRGB_to_XYZ',
+        'uv_to_Luv', 'uv_to_UCS', 'xyY_to_XYZ', 'xyY_to_xy', 'xy_to_Luv_uv',
+        'xy_to_UCS_uv', 'xy_to_XYZ', 'xy_to_xyY'
+    ],
+    'corresponding': [
+        'BRENEMAN_EXPERIMENTS', 'BRENEMAN_EXPERIMENT_PRIMARIES_CHROMATICITIES',
+        'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
+        'CorrespondingColourDataset', 'CorrespondingChromaticitiesPrediction',
+        'corresponding_chromaticities_prediction'
+    ],
+    'contrast': [
+        'CONTRAST_SENSITIVITY_METHODS', 'contrast_sensitivity_function'
+    ],
+    'phenomena': [
+        'rayleigh_scattering', 'scattering_cross_section',
+        'sd_rayleigh_scattering'
+    ],
+    'notation': [
+        'MUNSELL_COLOURS', 'MUNSELL_VALUE_METHODS', 'munsell_colour_to_xyY',
+        'munsell_value', 'xyY_to_munsell_colour'
+    ],
+    'quality': [
+        'COLOUR_FIDELITY_INDEX_METHODS', 'COLOUR_QUALITY_SCALE_METHODS',
+        'colour_fidelity_index', 'colour_quality_scale',
+        'colour_rendering_index', 'spectral_similarity_index'
+    ],
+    'recovery': ['XYZ_TO_SD_METHODS', 'XYZ_to_sd'],
+    'temperature': [
+        'CCT_TO_UV_METHODS', 'CCT_TO_XY_METHODS', 'CCT_to_uv', 'CCT_to_xy',
+        'UV_TO_CCT_METHODS', 'XY_TO_CCT_METHODS', 'uv_to_CCT', 'xy_to_CCT'
+    ],
+    'characterisation': [
+        'CCS_COLOURCHECKERS', 'MATRIX_COLOUR_CORRECTION_METHODS',
+        'COLOUR_CORRECTION_METHODS', 'MSDS_CAMERA_SENSITIVITIES',
+        'MSDS_DISPLAY_PRIMARIES', 'POLYNOMIAL_EXPANSION_METHODS',
+        'SDS_COLOURCHECKERS', 'SDS_FILTERS', 'SDS_LENSES', 'colour_correction',
+        'matrix_colour_correction', 'matrix_idt', 'polynomial_expansion',
+        'sd_to_aces_relative_exposure_values'
+    ],
+    'volume': [
+        'OPTIMAL_COLOUR_STIMULI_ILLUMINANTS', 'RGB_colourspace_limits',
+        'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
+        'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+        'RGB_colourspace_volume_MonteCarlo',
+        'RGB_colourspace_volume_coverage_MonteCarlo',
+        'is_within_macadam_limits', 'is_within_mesh_volume',
+        'is_within_pointer_gamut', 'is_within_visible_spectrum'
+    ],
+    'graph': ['compile_conversion', 'describe_conversion_path', 'convert'],
+    'biochemistry': [],
+    'constants': [],
+    'continuous': [],
+    'utilities': []
+}
+
+# Exposing "colour.plotting" sub-package if "Matplotlib" is available, its
+# availability is checked without importing it.
+if find_spec('matplotlib') is not None:
+    _SUBPACKAGES_ATTRIBUTES['plotting'] = []
 else:
 
     class MockPlotting:
@@ -184,6 +225,9 @@ else:
 
     globals()['plotting'] = MockPlotting()
 
+__getattr__, __dir__ = lazy_module_attributes(globals(),
+                                              _SUBPACKAGES_ATTRIBUTES)
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
 __license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
@@ -195,143 +239,11 @@ __all__ = [
     'domain_range_scale', 'get_domain_range_scale', 'set_domain_range_scale'
 ]
 __all__ += [
-    'CHROMATIC_ADAPTATION_METHODS', 'CHROMATIC_ADAPTATION_TRANSFORMS',
-    'VIEWING_CONDITIONS_CMCCAT2000', 'chromatic_adaptation'
+    attribute for attributes in _SUBPACKAGES_ATTRIBUTES.values()
+    for attribute in attributes
 ]
-__all__ += [
-    'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator',
-    'NearestNeighbourInterpolator', 'LinearInterpolator', 'NullInterpolator',
-    'PchipInterpolator', 'SpragueInterpolator', 'TABLE_INTERPOLATION_METHODS',
-    'kernel_cardinal_spline', 'kernel_lanczos', 'kernel_linear',
-    'kernel_nearest_neighbour', 'kernel_sinc', 'table_interpolation',
-    'lagrange_coefficients'
-]
-__all__ += [
-    'BANDPASS_CORRECTION_METHODS', 'CCS_ILLUMINANTS', 'CCS_LIGHT_SOURCES',
-    'LIGHTNESS_METHODS', 'LUMINANCE_METHODS', 'MSDS_CMFS',
-    'MSDS_TO_XYZ_METHODS', 'MultiSpectralDistributions', 'SDS_ILLUMINANTS',
-    'SDS_LEFS', 'SDS_LIGHT_SOURCES', 'SD_GAUSSIAN_METHODS',
-    'SD_MULTI_LEDS_METHODS', 'SD_SINGLE_LED_METHODS', 'SD_TO_XYZ_METHODS',
-    'SPECTRAL_SHAPE_ASTME308', 'SPECTRAL_SHAPE_DEFAULT',
-    'SpectralDistribution', 'SpectralShape', 'TVS_ILLUMINANTS',
-    'TVS_ILLUMINANTS_HUNTERLAB', 'WHITENESS_METHODS', 'YELLOWNESS_METHODS',
-    'bandpass_correction', 'colorimetric_purity', 'complementary_wavelength',
-    'dominant_wavelength', 'excitation_purity', 'lightness', 'luminance',
-    'luminous_efficacy', 'luminous_efficiency', 'luminous_flux',
-    'msds_constant', 'msds_ones', 'msds_zeros', 'msds_to_XYZ',
-    'sd_CIE_illuminant_D_series', 'sd_CIE_standard_illuminant_A',
-    'sd_blackbody', 'sd_constant', 'sd_gaussian',
-    'sd_mesopic_luminous_efficiency_function', 'sd_multi_leds', 'sd_ones',
-    'sd_single_led', 'sd_to_XYZ', 'sd_zeros', 'wavelength_to_XYZ', 'whiteness',
-    'yellowness'
-]
-__all__ += [
-    'CVD_MATRICES_MACHADO2010', 'matrix_anomalous_trichromacy_Machado2009',
-    'matrix_cvd_Machado2009', 'msds_cmfs_anomalous_trichromacy_Machado2009'
-]
-__all__ += [
-    'CAM_Specification_ATD95', 'CAM_Specification_CAM16',
-    'CAM_Specification_CIECAM02', 'CAM_Specification_Hunt',
-    'CAM_Specification_LLAB', 'CAM_Specification_Nayatani95',
-    'CAM_Specification_RLAB', 'CAM16_to_XYZ', 'CIECAM02_to_XYZ',
-    'VIEWING_CONDITIONS_CAM16', 'VIEWING_CONDITIONS_CIECAM02',
-    'VIEWING_CONDITIONS_HUNT', 'VIEWING_CONDITIONS_LLAB',
-    'VIEWING_CONDITIONS_RLAB', 'XYZ_to_ATD95', 'XYZ_to_CAM16',
-    'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB', 'XYZ_to_Nayatani95',
-    'XYZ_to_RLAB'
-]
-__all__ += ['DELTA_E_METHODS', 'delta_E']
-__all__ += [
-    'PRIMITIVE_METHODS', 'primitive', 'PRIMITIVE_VERTICES_METHODS',
-    'primitive_vertices'
-]
-__all__ += [
-    'LUT1D', 'LUT3x1D', 'LUT3D', 'LUTSequence', 'READ_IMAGE_METHODS',
-    'SpectralDistribution_IESTM2714', 'WRITE_IMAGE_METHODS', 'read_image',
-    'read_LUT', 'read_sds_from_csv_file', 'read_sds_from_xrite_file',
-    'read_spectral_data_from_csv_file', 'write_image', 'write_LUT',
-    'write_sds_to_csv_file'
-]
-__all__ += [
-    'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
-    'CAM02UCS_to_JMh_CIECAM02', 'CAM02LCD_to_XYZ', 'CAM02SCD_to_XYZ',
-    'CAM02UCS_to_XYZ', 'CAM16LCD_to_JMh_CAM16', 'CAM16SCD_to_JMh_CAM16',
-    'CAM16UCS_to_JMh_CAM16', 'CAM16LCD_to_XYZ', 'CAM16SCD_to_XYZ',
-    'CAM16UCS_to_XYZ', 'CCTF_DECODINGS', 'CCTF_ENCODINGS', 'CMYK_to_CMY',
-    'CMY_to_CMYK', 'CMY_to_RGB', 'COLOURSPACE_MODELS', 'CV_range',
-    'DATA_MACADAM_1942_ELLIPSES', 'DIN99_to_Lab', 'EOTFS', 'EOTF_INVERSES',
-    'HDR_CIELAB_METHODS', 'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB',
-    'Hunter_Lab_to_XYZ', 'Hunter_Rdab_to_XYZ', 'ICtCp_to_RGB', 'ICtCp_to_XYZ',
-    'IgPgTg_to_XYZ', 'IPT_hue_angle', 'IPT_to_XYZ', 'JMh_CAM16_to_CAM16LCD',
-    'JMh_CAM16_to_CAM16SCD', 'JMh_CAM16_to_CAM16UCS',
-    'JMh_CIECAM02_to_CAM02LCD', 'JMh_CIECAM02_to_CAM02SCD',
-    'JMh_CIECAM02_to_CAM02UCS', 'JzAzBz_to_XYZ', 'LCHab_to_Lab',
-    'LCHuv_to_Luv', 'LOG_DECODINGS', 'LOG_ENCODINGS', 'Lab_to_DIN99',
-    'Lab_to_LCHab', 'Lab_to_XYZ', 'Luv_to_LCHuv', 'Luv_to_XYZ', 'Luv_to_uv',
-    'Luv_uv_to_xy', 'OETFS', 'OETF_INVERSES', 'OOTFS', 'OOTF_INVERSES',
-    'OSA_UCS_to_XYZ', 'Oklab_to_XYZ', 'Prismatic_to_RGB', 'RGB_COLOURSPACES',
-    'RGB_Colourspace', 'RGB_luminance', 'RGB_luminance_equation', 'RGB_to_CMY',
-    'RGB_to_HSL', 'RGB_to_HSV', 'RGB_to_ICtCp', 'RGB_to_Prismatic',
-    'RGB_to_RGB', 'RGB_to_XYZ', 'RGB_to_YCbCr', 'RGB_to_YCoCg',
-    'RGB_to_YcCbcCrc', 'UCS_to_XYZ', 'UCS_to_uv', 'UCS_uv_to_xy', 'UVW_to_XYZ',
-    'WEIGHTS_YCBCR', 'XYZ_to_CAM02LCD', 'XYZ_to_CAM02SCD', 'XYZ_to_CAM02UCS',
-    'XYZ_to_CAM16LCD', 'XYZ_to_CAM16SCD', 'XYZ_to_CAM16UCS',
-    'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab', 'XYZ_to_ICtCp', 'XYZ_to_IgPgTg',
-    'XYZ_to_IPT', 'XYZ_to_JzAzBz', 'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab',
-    'XYZ_to_Luv', 'XYZ_to_OSA_UCS', 'XYZ_to_Oklab', 'XYZ_to_RGB', 'XYZ_to_UCS',
-    'XYZ_to_UVW', 'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT', 'XYZ_to_sRGB',
-    'XYZ_to_xy', 'XYZ_to_xyY', 'YCbCr_to_RGB', 'YCoCg_to_RGB',
-    'YcCbcCrc_to_RGB', 'cctf_decoding', 'cctf_encoding',
-    'chromatically_adapted_primaries', 'eotf', 'eotf_inverse', 'full_to_legal',
-    'gamma_function', 'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ', 'legal_to_full',
-    'linear_function', 'log_decoding', 'log_encoding', 'matrix_RGB_to_RGB',
-    'matrix_YCbCr', 'normalised_primary_matrix', 'oetf', 'oetf_inverse',
-    'offset_YCbCr', 'ootf', 'ootf_inverse', 'primaries_whitepoint',
-    'sRGB_to_XYZ', 'uv_to_Luv', 'uv_to_UCS', 'xyY_to_XYZ', 'xyY_to_xy',
-    'xy_to_Luv_uv', 'xy_to_UCS_uv', 'xy_to_XYZ', 'xy_to_xyY'
-]
-__all__ += [
-    'BRENEMAN_EXPERIMENTS', 'BRENEMAN_EXPERIMENT_PRIMARIES_CHROMATICITIES',
-    'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
-    'CorrespondingColourDataset', 'CorrespondingChromaticitiesPrediction',
-    'corresponding_chromaticities_prediction'
-]
-__all__ += ['CONTRAST_SENSITIVITY_METHODS', 'contrast_sensitivity_function']
-__all__ += [
-    'rayleigh_scattering', 'scattering_cross_section', 'sd_rayleigh_scattering'
-]
-__all__ += [
-    'MUNSELL_COLOURS', 'MUNSELL_VALUE_METHODS', 'munsell_colour_to_xyY',
-    'munsell_value', 'xyY_to_munsell_colour'
-]
-__all__ += [
-    'COLOUR_FIDELITY_INDEX_METHODS', 'COLOUR_QUALITY_SCALE_METHODS',
-    'colour_fidelity_index', 'colour_quality_scale', 'colour_rendering_index',
-    'spectral_similarity_index'
-]
-__all__ += ['XYZ_TO_SD_METHODS', 'XYZ_to_sd']
-__all__ += [
-    'CCT_TO_UV_METHODS', 'CCT_TO_XY_METHODS', 'CCT_to_uv', 'CCT_to_xy',
-    'UV_TO_CCT_METHODS', 'XY_TO_CCT_METHODS', 'uv_to_CCT', 'xy_to_CCT'
-]
-__all__ += [
-    'CCS_COLOURCHECKERS', 'MATRIX_COLOUR_CORRECTION_METHODS',
-    'COLOUR_CORRECTION_METHODS', 'MSDS_CAMERA_SENSITIVITIES',
-    'MSDS_DISPLAY_PRIMARIES', 'POLYNOMIAL_EXPANSION_METHODS',
-    'SDS_COLOURCHECKERS', 'SDS_FILTERS', 'SDS_LENSES', 'colour_correction',
-    'matrix_colour_correction', 'matrix_idt', 'polynomial_expansion',
-    'sd_to_aces_relative_exposure_values'
-]
-__all__ += [
-    'OPTIMAL_COLOUR_STIMULI_ILLUMINANTS', 'RGB_colourspace_limits',
-    'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
-    'RGB_colourspace_volume_MonteCarlo',
-    'RGB_colourspace_volume_coverage_MonteCarlo', 'is_within_macadam_limits',
-    'is_within_mesh_volume', 'is_within_pointer_gamut',
-    'is_within_visible_spectrum'
-]
-__all__ += ['describe_conversion_path', 'convert']
+
+del find_spec, lazy_module_attributes, _SUBPACKAGES_ATTRIBUTES
 
 __application_name__ = 'Colour'
 
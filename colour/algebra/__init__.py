@@ -1,26 +1,44 @@
 # -*- coding: utf-8 -*-
 
-from .coordinates import *  # noqa
-from . import coordinates
-from .common import (is_spow_enabled, set_spow_enable, spow_enable, spow,
-                     smoothstep_function)
-from .extrapolation import Extrapolator
-from .geometry import (
-    normalise_vector, euclidean_distance, manhattan_distance,
-    extend_line_segment, LineSegmentsIntersections_Specification,
-    intersect_line_segments, ellipse_coefficients_general_form,
-    ellipse_coefficients_canonical_form, point_at_angle_on_ellipse,
-    ellipse_fitting_Halir1998, ELLIPSE_FITTING_METHODS, ellipse_fitting)
-from .interpolation import (
-    kernel_nearest_neighbour, kernel_linear, kernel_sinc, kernel_lanczos,
-    kernel_cardinal_spline, KernelInterpolator, NearestNeighbourInterpolator,
-    LinearInterpolator, SpragueInterpolator, CubicSplineInterpolator,
-    PchipInterpolator, NullInterpolator, lagrange_coefficients,
-    table_interpolation_trilinear, table_interpolation_tetrahedral,
-    TABLE_INTERPOLATION_METHODS, table_interpolation)
-from .matrix import is_identity
-from .random import random_triplet_generator
-from .regression import least_square_mapping_MoorePenrose
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'coordinates':
+            None,
+        'common': [
+            'is_spow_enabled', 'set_spow_enable', 'spow_enable', 'spow',
+            'smoothstep_function'
+        ],
+        'extrapolation': ['Extrapolator'],
+        'geometry': [
+            'normalise_vector', 'euclidean_distance', 'manhattan_distance',
+            'extend_line_segment', 'LineSegmentsIntersections_Specification',
+            'intersect_line_segments', 'ellipse_coefficients_general_form',
+            'ellipse_coefficients_canonical_form', 'point_at_angle_on_ellipse',
+            'ellipse_fitting_Halir1998', 'ELLIPSE_FITTING_METHODS',
+            'ellipse_fitting'
+        ],
+        'interpolation': [
+            'kernel_nearest_neighbour', 'kernel_linear', 'kernel_sinc',
+            'kernel_lanczos', 'kernel_cardinal_spline', 'KernelInterpolator',
+            'NearestNeighbourInterpolator', 'LinearInterpolator',
+            'SpragueInterpolator', 'CubicSplineInterpolator',
+            'PchipInterpolator', 'NullInterpolator', 'lagrange_coefficients',
+            'table_interpolation_trilinear', 'table_interpolation_tetrahedral',
+            'TABLE_INTERPOLATION_METHODS', 'table_interpolation',
+            'TableInterpolator'
+        ],
+        'matrix': ['is_identity'],
+        'random': [
+            'random_triplet_generator', 'halton_triplet_generator',
+            'sobol_triplet_generator'
+        ],
+        'regression': ['least_square_mapping_MoorePenrose']
+    })
+del lazy_module_attributes
+
+from . import coordinates  # noqa
 
 __all__ = []
 __all__ += coordinates.__all__
@@ -43,8 +61,11 @@ __all__ += [
     'SpragueInterpolator', 'CubicSplineInterpolator', 'PchipInterpolator',
     'NullInterpolator', 'lagrange_coefficients',
     'table_interpolation_trilinear', 'table_interpolation_tetrahedral',
-    'TABLE_INTERPOLATION_METHODS', 'table_interpolation'
+    'TABLE_INTERPOLATION_METHODS', 'table_interpolation', 'TableInterpolator'
 ]
 __all__ += ['is_identity']
-__all__ += ['random_triplet_generator']
+__all__ += [
+    'random_triplet_generator', 'halton_triplet_generator',
+    'sobol_triplet_generator'
+]
 __all__ += ['least_square_mapping_MoorePenrose']
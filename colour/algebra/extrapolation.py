@@ -72,6 +72,8 @@ class Extrapolator:
     Notes
     -----
     -   The interpolator must define *x* and *y* attributes.
+    -   A 2-dimensional interpolator *y* attribute is extrapolated
+        column-wise.
 
     References
     ----------
@@ -298,13 +300,18 @@ class Extrapolator:
         xi = self._interpolator.x
         yi = self._interpolator.y
 
-        y = np.empty_like(x)
+        # A 2-dimensional "yi" variable is extrapolated column-wise.
+        y = np.empty(x.shape + np.shape(yi)[1:], dtype=x.dtype)
 
         if self._method == 'linear':
-            y[x < xi[0]] = (yi[0] + (x[x < xi[0]] - xi[0]) * (yi[1] - yi[0]) /
-                            (xi[1] - xi[0]))
-            y[x > xi[-1]] = (yi[-1] + (x[x > xi[-1]] - xi[-1]) *
-                             (yi[-1] - yi[-2]) / (xi[-1] - xi[-2]))
+            x_l, x_h = x[x < xi[0]], x[x > xi[-1]]
+            if np.ndim(yi) == 2:
+                x_l, x_h = x_l[..., np.newaxis], x_h[..., np.newaxis]
+
+            y[x < xi[0]] = (
+                yi[0] + (x_l - xi[0]) * (yi[1] - yi[0]) / (xi[1] - xi[0]))
+            y[x > xi[-1]] = (yi[-1] + (x_h - xi[-1]) * (yi[-1] - yi[-2]) /
+                             (xi[-1] - xi[-2]))
         elif self._method == 'constant':
             y[x < xi[0]] = yi[0]
             y[x > xi[-1]] = yi[-1]
@@ -27,6 +27,8 @@ Defines classes and definitions for interpolating variables.
     methods.
 -   :func:`colour.table_interpolation`: Interpolation with table using given
     method.
+-   :class:`colour.algebra.TableInterpolator`: Prepared interpolation with
+    table.
 
 References
 ----------
@@ -63,6 +65,7 @@ import numpy as np
 import scipy.interpolate
 from collections import OrderedDict
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
@@ -85,7 +88,7 @@ __all__ = [
     'NullInterpolator', 'lagrange_coefficients',
     'vertices_and_relative_coordinates', 'table_interpolation_trilinear',
     'table_interpolation_tetrahedral', 'TABLE_INTERPOLATION_METHODS',
-    'table_interpolation'
+    'table_interpolation', 'TableInterpolator'
 ]
 
 
@@ -283,7 +286,8 @@ class KernelInterpolator:
         variable.
     y : array_like
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-dimensional :math:`y` variable is interpolated
+        column-wise.
     window : int, optional
         Width of the window in samples on each side.
     kernel : callable, optional
@@ -458,13 +462,22 @@ class KernelInterpolator:
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             self._y = value
 
             if self._window is not None:
-                self._y_p = np.pad(self._y, **self._padding_kwargs)
+                padding_kwargs = dict(self._padding_kwargs)
+                if value.ndim == 2:
+                    # Padding only happens along the first axis, i.e. each
+                    # column is padded independently.
+                    padding_kwargs['pad_width'] = np.vstack([
+                        np.broadcast_to(padding_kwargs['pad_width'], (1, 2)),
+                        [0, 0]
+                    ])
+
+                self._y_p = np.pad(self._y, **padding_kwargs)
 
     @property
     def window(self):
@@ -653,11 +666,14 @@ class KernelInterpolator:
         windows = np.clip(windows, clip_l, clip_h) - clip_l
         windows = np.around(windows).astype(DEFAULT_INT_DTYPE)
 
-        return np.sum(
-            self._y_p[windows] * self._kernel(
-                x[:, np.newaxis] / x_interval - windows -
-                min(self._x_p) / x_interval, **self._kernel_kwargs),
-            axis=-1)
+        kernel = self._kernel(
+            x[:, np.newaxis] / x_interval - windows -
+            min(self._x_p) / x_interval, **self._kernel_kwargs)
+
+        if self._y_p.ndim == 2:
+            kernel = kernel[..., np.newaxis]
+
+        return np.sum(self._y_p[windows] * kernel, axis=1)
 
     def _validate_dimensions(self):
         """
@@ -696,7 +712,8 @@ class NearestNeighbourInterpolator(KernelInterpolator):
         variable.
     y : array_like
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-dimensional :math:`y` variable is interpolated
+        column-wise.
     window : int, optional
         Width of the window in samples on each side.
     padding_kwargs : dict, optional
@@ -729,7 +746,8 @@ class LinearInterpolator:
         variable.
     y : array_like
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-dimensional :math:`y` variable is interpolated
+        column-wise.
     dtype : type
         Data type used for internal conversions.
 
@@ -838,8 +856,8 @@ class LinearInterpolator:
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
         self._y = value
 
@@ -883,7 +901,28 @@ class LinearInterpolator:
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
-        return np.interp(x, self._x, self._y)
+        # :func:`np.interp` definition computes in double precision, it is
+        # only used for 1-dimensional :math:`y` variable of that type.
+        if self._y.ndim == 1 and self._dtype == np.float64:
+            return np.interp(x, self._x, self._y)
+
+        # Vectorised equivalent of :func:`np.interp` definition for the other
+        # types and the columns of a 2-dimensional :math:`y` variable.
+        i = np.clip(
+            np.searchsorted(self._x, x, side='right') - 1, 0,
+            len(self._x) - 2)
+
+        x_0, x_1 = self._x[i], self._x[i + 1]
+        y_0, y_1 = self._y[i], self._y[i + 1]
+
+        x_d, x_r = x_1 - x_0, x - x_0
+        if self._y.ndim == 2:
+            x_d, x_r = x_d[..., np.newaxis], x_r[..., np.newaxis]
+
+        y = (y_1 - y_0) / x_d * x_r + y_0
+        y[x == self._x[-1]] = self._y[-1]
+
+        return y
 
     def _validate_dimensions(self):
         """
@@ -926,7 +965,8 @@ class SpragueInterpolator:
         variable.
     y : array_like
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-dimensional :math:`y` variable is interpolated
+        column-wise.
     dtype : type
         Data type used for internal conversions.
 
@@ -1069,27 +1109,19 @@ class SpragueInterpolator:
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             assert len(value) >= 6, (
                 '"y" dependent variable values count must be equal to or '
                 'greater than 6!')
 
-            yp1 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[0],
-                        np.array(value[0:6]).reshape([6, 1]))) / 209)[0]
-            yp2 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[1],
-                        np.array(value[0:6]).reshape([6, 1]))) / 209)[0]
-            yp3 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[2],
-                        np.array(value[-6:]).reshape([6, 1]))) / 209)[0]
-            yp4 = np.ravel(
-                (np.dot(self.SPRAGUE_C_COEFFICIENTS[3],
-                        np.array(value[-6:]).reshape([6, 1]))) / 209)[0]
-
-            self._yp = np.concatenate(((yp1, yp2), value, (yp3, yp4)))
+            yp1 = np.dot(self.SPRAGUE_C_COEFFICIENTS[0], value[0:6]) / 209
+            yp2 = np.dot(self.SPRAGUE_C_COEFFICIENTS[1], value[0:6]) / 209
+            yp3 = np.dot(self.SPRAGUE_C_COEFFICIENTS[2], value[-6:]) / 209
+            yp4 = np.dot(self.SPRAGUE_C_COEFFICIENTS[3], value[-6:]) / 209
+
+            self._yp = np.concatenate(([yp1], [yp2], value, [yp3], [yp4]))
 
         self._y = value
 
@@ -1135,6 +1167,9 @@ class SpragueInterpolator:
 
         r = self._yp
 
+        if r.ndim == 2:
+            X = np.expand_dims(X, -1)
+
         a0p = r[i]
         a1p = ((2 * r[i - 2] - 16 * r[i - 1] + 16 * r[i + 1] -
                 2 * r[i + 2]) / 24)  # yapf: disable
@@ -1189,9 +1224,13 @@ class CubicSplineInterpolator(scipy.interpolate.interp1d):
     Notes
     -----
     -   This class is a wrapper around *scipy.interpolate.interp1d* class.
+    -   A 2-dimensional :math:`y` variable is interpolated along its first
+        axis, i.e. column-wise, unless the ``axis`` argument is given.
     """
 
     def __init__(self, *args, **kwargs):
+        kwargs['axis'] = kwargs.get('axis', 0)
+
         super(CubicSplineInterpolator, self).__init__(
             kind='cubic', *args, **kwargs)
 
@@ -1248,7 +1287,8 @@ class NullInterpolator:
         variable.
     y : ndarray
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-dimensional :math:`y` variable is interpolated
+        column-wise.
     absolute_tolerance : numeric, optional
         Absolute tolerance.
     relative_tolerance : numeric, optional
@@ -1372,8 +1412,8 @@ class NullInterpolator:
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
         self._y = value
 
@@ -1661,11 +1701,14 @@ def vertices_and_relative_coordinates(V_xyz, table):
     # table axis, ``i_f`` and ``i_c`` respectively the floor and ceiling
     # indexes encompassing a given V_xyz value.
     i_m = np.array(table.shape[0:-1]) - 1
-    i_f = np.floor(V_xyz * i_m).astype(DEFAULT_INT_DTYPE)
+    V_xyzi = V_xyz * as_float_array(i_m)
+    V_xyzf = np.floor(V_xyzi)
+    i_f = V_xyzf.astype(DEFAULT_INT_DTYPE)
     i_c = np.clip(i_f + 1, 0, i_m)
 
-    # Relative to indexes ``V_xyz`` values.
-    V_xyzr = i_m * V_xyz - i_f
+    # Relative to indexes ``V_xyz`` values, the computations are performed
+    # with floating point indexes to preserve the ``V_xyz`` values type.
+    V_xyzr = V_xyzi - V_xyzf
 
     i_f_c = i_f, i_c
 
@@ -1878,3 +1921,364 @@ def table_interpolation(V_xyz, table, method='Trilinear'):
     """
 
     return TABLE_INTERPOLATION_METHODS.get(method)(V_xyz, table)
+
+
+class TableInterpolator:
+    """
+    Performs prepared interpolation of :math:`V_{xyz}` values using given
+    4-dimensional interpolation table.
+
+    The table is flattened and its strides are computed once so that the
+    interpolation only gathers the vertices it needs by index. The
+    :math:`V_{xyz}` values are interpolated in chunks with bounded scratch
+    memory, optionally on a thread pool as *Numpy* releases the *GIL* for the
+    underlying operations.
+
+    Parameters
+    ----------
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+    domain : array_like, optional
+        :math:`V_{xyz}` values domain minimum and maximum, i.e. a (2x3) array,
+        the :math:`V_{xyz}` values are linearly converted from the domain to
+        [0, 1] before interpolation. Default is [0, 1].
+    method : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation method.
+    chunk_size : int, optional
+        Number of :math:`V_{xyz}` values interpolated at once.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.algebra.TableInterpolator.table`
+    -   :attr:`~colour.algebra.TableInterpolator.domain`
+    -   :attr:`~colour.algebra.TableInterpolator.method`
+    -   :attr:`~colour.algebra.TableInterpolator.chunk_size`
+
+    Methods
+    -------
+    -   :meth:`~colour.algebra.TableInterpolator.__init__`
+    -   :meth:`~colour.algebra.TableInterpolator.__call__`
+
+    References
+    ----------
+    :cite:`Bourkeb`, :cite:`Kirk2006`
+
+    Examples
+    --------
+    >>> import os
+    >>> import colour
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__),'..', 'io', 'luts', 'tests', 'resources',
+    ...     'iridas_cube', 'Colour_Correct.cube')
+    >>> LUT = colour.read_LUT(path)
+    >>> prng = np.random.RandomState(4)
+    >>> V_xyz = colour.algebra.random_triplet_generator(3, random_state=prng)
+    >>> interpolator = TableInterpolator(LUT.table)
+    >>> interpolator(V_xyz)  # doctest: +ELLIPSIS
+    array([[ 1.0120664...,  0.7539146...,  1.0228540...],
+           [ 0.5075794...,  0.6479459...,  0.1066404...],
+           [ 1.0976519...,  0.1785998...,  0.2299897...]])
+    >>> interpolator = TableInterpolator(LUT.table, method='Tetrahedral')
+    >>> interpolator(V_xyz)  # doctest: +ELLIPSIS
+    array([[ 1.0196197...,  0.7674062...,  1.0311751...],
+           [ 0.5105603...,  0.6466722...,  0.1077296...],
+           [ 1.1178206...,  0.1762039...,  0.2209534...]])
+    """
+
+    def __init__(self,
+                 table,
+                 domain=None,
+                 method='Trilinear',
+                 chunk_size=65536):
+        self._table = None
+        self._domain = None
+        self._method = None
+        self._chunk_size = None
+
+        self.table = table
+        self.domain = domain
+        self.method = method
+        self.chunk_size = chunk_size
+
+    @property
+    def table(self):
+        """
+        Getter and setter property for the interpolation table.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the interpolation table with.
+
+        Returns
+        -------
+        ndarray
+            Interpolation table.
+        """
+
+        return self._table
+
+    @table.setter
+    def table(self, value):
+        """
+        Setter for the **self.table** property.
+        """
+
+        value = as_float_array(value)
+
+        assert value.ndim == 4 and value.shape[-1] == 3, (
+            '"table" must be a 4-dimensional (NxNxNx3) array!')
+
+        self._table = value
+
+        size = np.array(value.shape[:-1])
+        strides = np.array([size[1] * size[2], size[2], 1])
+
+        # The table is flattened so that the vertices are gathered with a
+        # single index, axes with only one sample have a null stride so that
+        # the "ceiling" vertices are the "floor" vertices.
+        self._table_flat = np.ascontiguousarray(np.reshape(value, (-1, 3)))
+        self._i_m = DEFAULT_INT_DTYPE(size - 1)
+        self._i_f_m = np.maximum(self._i_m - 1, 0)
+        self._strides = DEFAULT_INT_DTYPE(strides)
+        self._strides_c = DEFAULT_INT_DTYPE(strides * (size > 1))
+
+    @property
+    def domain(self):
+        """
+        Getter and setter property for the :math:`V_{xyz}` values domain.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the :math:`V_{xyz}` values domain with.
+
+        Returns
+        -------
+        ndarray
+            :math:`V_{xyz}` values domain.
+        """
+
+        return self._domain
+
+    @domain.setter
+    def domain(self, value):
+        """
+        Setter for the **self.domain** property.
+        """
+
+        if value is None:
+            value = np.array([[0, 0, 0], [1, 1, 1]])
+
+        value = as_float_array(value)
+
+        assert value.shape == (2, 3), '"domain" must be a (2x3) array!'
+
+        self._domain = value
+
+        self._scale = self._domain[1] - self._domain[0]
+
+    @property
+    def method(self):
+        """
+        Getter and setter property for the interpolation method.
+
+        Parameters
+        ----------
+        value : unicode
+            Value to set the interpolation method with.
+
+        Returns
+        -------
+        unicode
+            Interpolation method.
+        """
+
+        return self._method
+
+    @method.setter
+    def method(self, value):
+        """
+        Setter for the **self.method** property.
+        """
+
+        assert value.lower() in ('trilinear', 'tetrahedral'), (
+            '"method" must be one of {0}!'.format(
+                list(TABLE_INTERPOLATION_METHODS.keys())))
+
+        self._method = value
+
+    @property
+    def chunk_size(self):
+        """
+        Getter and setter property for the number of :math:`V_{xyz}` values
+        interpolated at once.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the number of :math:`V_{xyz}` values interpolated at
+            once with.
+
+        Returns
+        -------
+        int
+            Number of :math:`V_{xyz}` values interpolated at once.
+        """
+
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value):
+        """
+        Setter for the **self.chunk_size** property.
+        """
+
+        assert is_integer(value) and value > 0, (
+            '"chunk_size" must be a positive integer!')
+
+        self._chunk_size = DEFAULT_INT_DTYPE(value)
+
+    def __call__(self, V_xyz, out=None, threads=None):
+        """
+        Evaluates the interpolator at given :math:`V_{xyz}` values.
+
+        Parameters
+        ----------
+        V_xyz : array_like
+            :math:`V_{xyz}` values to interpolate.
+        out : ndarray, optional
+            C-contiguous array with the same shape as :math:`V_{xyz}` values
+            to write the interpolated :math:`V_{xyz}` values into.
+        threads : int, optional
+            Number of threads interpolating the chunks, the chunks are
+            interpolated in the calling thread if *None* or 1.
+
+        Returns
+        -------
+        ndarray
+            Interpolated :math:`V_{xyz}` values.
+        """
+
+        V_xyz = as_float_array(V_xyz)
+
+        if out is None:
+            out = np.empty(V_xyz.shape, DEFAULT_FLOAT_DTYPE)
+        else:
+            assert out.shape == V_xyz.shape and out.flags.c_contiguous, (
+                '"out" must be a C-contiguous array with the same shape as '
+                '"V_xyz"!')
+
+        V_xyz_f = np.reshape(V_xyz, (-1, 3))
+        out_f = np.reshape(out, (-1, 3))
+
+        def interpolate_chunk(i):
+            """
+            Interpolates the chunk starting at given index.
+            """
+
+            self._interpolate(V_xyz_f[i:i + self._chunk_size],
+                              out_f[i:i + self._chunk_size])
+
+        chunks = range(0, V_xyz_f.shape[0], self._chunk_size)
+        if threads is None or threads == 1 or len(chunks) == 1:
+            for i in chunks:
+                interpolate_chunk(i)
+        else:
+            with ThreadPoolExecutor(threads) as executor:
+                list(executor.map(interpolate_chunk, chunks))
+
+        return out
+
+    def _interpolate(self, V_xyz, out):
+        """
+        Interpolates given :math:`V_{xyz}` values chunk into given output
+        chunk.
+        """
+
+        # Indexes relative "V_xyzr" values and "i_f" floor indexes, the
+        # latter are clipped so that the ceiling indexes are always valid,
+        # i.e. the maximum "V_xyz" value uses the last cell.
+        V_xyzr = np.subtract(V_xyz, self._domain[0])
+        V_xyzr /= self._scale
+        np.clip(V_xyzr, 0, 1, out=V_xyzr)
+        V_xyzr *= self._i_m
+
+        i_f = np.floor(V_xyzr)
+        np.minimum(i_f, self._i_f_m, out=i_f)
+        V_xyzr -= i_f
+
+        i = np.dot(i_f.astype(DEFAULT_INT_DTYPE), self._strides)
+
+        if self._method.lower() == 'trilinear':
+            self._interpolate_trilinear(i, V_xyzr, out)
+        else:
+            self._interpolate_tetrahedral(i, V_xyzr, out)
+
+    def _interpolate_trilinear(self, i, V_xyzr, out):
+        """
+        Performs trilinear interpolation of given floor indexes and indexes
+        relative :math:`V_{xyzr}` values into given output chunk.
+        """
+
+        table = self._table_flat
+        s_x, s_y, s_z = self._strides_c
+        x, y, z = V_xyzr[:, 0:1], V_xyzr[:, 1:2], V_xyzr[:, 2:3]
+
+        def lerp(a, b, t):
+            """
+            Linearly interpolates between given arrays in place.
+            """
+
+            b -= a
+            b *= t
+            a += b
+
+            return a
+
+        def lerp_x(j):
+            """
+            Linearly interpolates the vertices at given indexes along the
+            :math:`x` axis.
+            """
+
+            return lerp(table[j], table[j + s_x], x)
+
+        V_00 = lerp_x(i)
+        V_01 = lerp_x(i + s_z)
+        V_10 = lerp_x(i + s_y)
+        V_11 = lerp_x(i + s_y + s_z)
+
+        V_0 = lerp(V_00, V_10, y)
+        V_1 = lerp(V_01, V_11, y)
+
+        V_1 -= V_0
+        V_1 *= z
+        np.add(V_0, V_1, out=out)
+
+    def _interpolate_tetrahedral(self, i, V_xyzr, out):
+        """
+        Performs tetrahedral interpolation of given floor indexes and indexes
+        relative :math:`V_{xyzr}` values into given output chunk.
+        """
+
+        table = self._table_flat
+
+        # The tetrahedron encompassing a given "V_xyzr" value is defined by
+        # the descending order of its components: its vertices are the floor
+        # vertex, the vertices offset along the first axis, along the first
+        # and second axes, and the ceiling vertex.
+        order = np.argsort(-V_xyzr, axis=-1)
+        r = np.take_along_axis(V_xyzr, order, axis=-1)
+        r_1, r_2, r_3 = r[:, 0], r[:, 1], r[:, 2]
+        s = self._strides_c[order]
+
+        i_1 = i + s[:, 0]
+        i_2 = i_1 + s[:, 1]
+        i_3 = i_2 + s[:, 2]
+
+        np.multiply((1 - r_1)[:, np.newaxis], table[i], out=out)
+        out += (r_1 - r_2)[:, np.newaxis] * table[i_1]
+        out += (r_2 - r_3)[:, np.newaxis] * table[i_2]
+        out += r_3[:, np.newaxis] * table[i_3]
@@ -6,6 +6,9 @@ Random Numbers Utilities
 Defines random numbers generator objects:
 
 -   :func:`colour.algebra.random_triplet_generator`
+-   :func:`colour.algebra.halton_triplet_generator`
+-   :func:`colour.algebra.sobol_triplet_generator`
+
 References
 ----------
 -   :cite:`Laurent2012a` : Laurent. (2012). Reproducibility of python
@@ -13,6 +16,9 @@ References
     2015, from
     http://stackoverflow.com/questions/8786084/\
 reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
+-   :cite:`Joe2008` : Joe, S., & Kuo, F. Y. (2008). Constructing Sobol
+    Sequences with Better Two-Dimensional Projections. SIAM Journal on
+    Scientific Computing, 30(5), 2635-2654. doi:10.1137/070709359
 """
 
 import numpy as np
@@ -27,10 +33,54 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['RANDOM_STATE', 'random_triplet_generator']
+__all__ = [
+    'RANDOM_STATE', 'random_triplet_generator', 'HALTON_BASES',
+    'halton_triplet_generator', 'SOBOL_DIRECTION_NUMBERS',
+    'sobol_triplet_generator'
+]
 
 RANDOM_STATE = np.random.RandomState()
 
+HALTON_BASES = np.array([2, 3, 5])
+"""
+*Halton* sequence bases of each triplet axis.
+
+HALTON_BASES : ndarray
+"""
+
+
+def _sobol_direction_numbers(s, a, m):
+    """
+    Returns the 32-bit *Sobol* sequence direction numbers for given primitive
+    polynomial degree :math:`s`, coefficients :math:`a` and initial direction
+    numbers :math:`m`.
+    """
+
+    m = list(m)
+    for k in range(s, 32):
+        m_k = m[k - s] ^ (m[k - s] << s)
+        for j in range(1, s):
+            m_k ^= ((a >> (s - 1 - j)) & 1) * (m[k - j] << j)
+        m.append(m_k)
+
+    return [m_k << (31 - k) for k, m_k in enumerate(m)]
+
+
+SOBOL_DIRECTION_NUMBERS = np.array(
+    [
+        [1 << (31 - k) for k in range(32)],
+        _sobol_direction_numbers(1, 0, [1]),
+        _sobol_direction_numbers(2, 1, [1, 3]),
+    ],
+    dtype=np.uint64)
+"""
+*Sobol* sequence 32-bit direction numbers of each triplet axis, the second
+and third axes use the primitive polynomials and initial direction numbers of
+:cite:`Joe2008`.
+
+SOBOL_DIRECTION_NUMBERS : ndarray
+"""
+
 
 def random_triplet_generator(size,
                              limits=np.array([[0, 1], [0, 1], [0, 1]]),
@@ -88,3 +138,122 @@ def random_triplet_generator(size,
         random_state.uniform(*limits[1], size=integer_size),
         random_state.uniform(*limits[2], size=integer_size),
     ])
+
+
+def _scale_triplets(triplets, limits):
+    """
+    Scales given unit cube triplets to given limits.
+    """
+
+    limits = np.asarray(limits)
+
+    return limits[..., 0] + triplets * (limits[..., 1] - limits[..., 0])
+
+
+def halton_triplet_generator(size,
+                             limits=np.array([[0, 1], [0, 1], [0, 1]]),
+                             offset=0):
+    """
+    Returns *Halton* low-discrepancy sequence triplets.
+
+    Parameters
+    ----------
+    size : int
+        Generator size.
+    limits : array_like, (3, 2)
+        Values limits on each triplet axis.
+    offset : int, optional
+        Index of the first triplet in the sequence, successive calls with an
+        offset incremented by ``size`` yield the continuation of the sequence.
+
+    Returns
+    -------
+    ndarray
+        *Halton* sequence triplets.
+
+    Notes
+    -----
+    -   The sequence is deterministic and starts at its second triplet, i.e.
+        the origin is skipped.
+
+    Examples
+    --------
+    >>> halton_triplet_generator(4)  # doctest: +ELLIPSIS
+    array([[ 0.5       ,  0.3333333...,  0.2       ],
+           [ 0.25      ,  0.6666666...,  0.4       ],
+           [ 0.75      ,  0.1111111...,  0.6       ],
+           [ 0.125     ,  0.4444444...,  0.8       ]])
+    """
+
+    integer_size = DEFAULT_INT_DTYPE(size)
+    if integer_size != size:
+        runtime_warning(
+            '"size" has been cast to integer: {0}'.format(integer_size))
+
+    indexes = np.arange(offset + 1, offset + 1 + integer_size)
+
+    triplets = np.zeros([integer_size, 3])
+    for i, base in enumerate(HALTON_BASES):
+        n = np.copy(indexes)
+        f = 1 / base
+        while np.any(n > 0):
+            triplets[..., i] += f * (n % base)
+            n //= base
+            f /= base
+
+    return _scale_triplets(triplets, limits)
+
+
+def sobol_triplet_generator(size,
+                            limits=np.array([[0, 1], [0, 1], [0, 1]]),
+                            offset=0):
+    """
+    Returns *Sobol* low-discrepancy sequence triplets.
+
+    Parameters
+    ----------
+    size : int
+        Generator size.
+    limits : array_like, (3, 2)
+        Values limits on each triplet axis.
+    offset : int, optional
+        Index of the first triplet in the sequence, successive calls with an
+        offset incremented by ``size`` yield the continuation of the sequence.
+
+    Returns
+    -------
+    ndarray
+        *Sobol* sequence triplets.
+
+    Notes
+    -----
+    -   The sequence is deterministic, generated in *Gray* code order and
+        starts at its second triplet, i.e. the origin is skipped.
+
+    References
+    ----------
+    :cite:`Joe2008`
+
+    Examples
+    --------
+    >>> sobol_triplet_generator(4)  # doctest: +ELLIPSIS
+    array([[ 0.5  ,  0.5  ,  0.5  ],
+           [ 0.75 ,  0.25 ,  0.25 ],
+           [ 0.25 ,  0.75 ,  0.75 ],
+           [ 0.375,  0.375,  0.625]])
+    """
+
+    integer_size = DEFAULT_INT_DTYPE(size)
+    if integer_size != size:
+        runtime_warning(
+            '"size" has been cast to integer: {0}'.format(integer_size))
+
+    indexes = np.arange(offset + 1, offset + 1 + integer_size, dtype=np.uint64)
+    gray_codes = indexes ^ (indexes >> np.uint64(1))
+
+    integers = np.zeros([integer_size, 3], dtype=np.uint64)
+    for k in range(int(offset + integer_size).bit_length()):
+        bits = (gray_codes >> np.uint64(k)) & np.uint64(1)
+        integers ^= bits[..., np.newaxis] * SOBOL_DIRECTION_NUMBERS[..., k]
+
+    return _scale_triplets(integers / 2 ** 32, limits)
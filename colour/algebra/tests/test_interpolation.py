@@ -20,10 +20,11 @@ from colour.algebra import (
     kernel_cardinal_spline, KernelInterpolator, NearestNeighbourInterpolator,
     LinearInterpolator, SpragueInterpolator, CubicSplineInterpolator,
     PchipInterpolator, NullInterpolator, lagrange_coefficients,
-    table_interpolation_trilinear, table_interpolation_tetrahedral)
+    table_interpolation_trilinear, table_interpolation_tetrahedral,
+    TableInterpolator)
 from colour.algebra import random_triplet_generator
 from colour.io import read_LUT
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import ignore_numpy_errors, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -43,7 +44,7 @@ __all__ = [
     'TestCubicSplineInterpolator', 'TestPchipInterpolator',
     'TestNullInterpolator', 'TestLagrangeCoefficients',
     'TestVerticesAndRelativeCoordinates', 'TestTableInterpolationTrilinear',
-    'TestTableInterpolationTetrahedral'
+    'TestTableInterpolationTetrahedral', 'TestTableInterpolator'
 ]
 
 DATA_POINTS_A = (9.3700, 12.3200, 12.4600, 9.5100, 5.9200, 4.3300, 4.2900,
@@ -508,6 +509,14 @@ padding_kwargs` property.
             KernelInterpolator(x_3, y)(x_i / 10),
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            KernelInterpolator(x_1, tstack([y, y * 2]))(x_i),
+            tstack([
+                KernelInterpolator(x_1, y)(x_i),
+                KernelInterpolator(x_1, y * 2)(x_i)
+            ]),
+            decimal=7)
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.KernelInterpolator.__call__`
@@ -634,6 +643,17 @@ class TestLinearInterpolator(unittest.TestCase):
                           len(DATA_POINTS_A) - 1 + interval, interval)),
             DATA_POINTS_A_LINEAR_INTERPOLATED_10_SAMPLES)
 
+        y = tstack([DATA_POINTS_A, np.array(DATA_POINTS_A) * 2])
+        linear_interpolator = LinearInterpolator(x, y)
+        np.testing.assert_almost_equal(
+            linear_interpolator(
+                np.arange(0,
+                          len(DATA_POINTS_A) - 1 + interval, interval)),
+            tstack([
+                DATA_POINTS_A_LINEAR_INTERPOLATED_10_SAMPLES,
+                np.array(DATA_POINTS_A_LINEAR_INTERPOLATED_10_SAMPLES) * 2
+            ]))
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.LinearInterpolator.__call__`
@@ -724,6 +744,17 @@ class TestSpragueInterpolator(unittest.TestCase):
                           len(DATA_POINTS_A) - 1 + interval, interval)),
             DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES)
 
+        y = tstack([DATA_POINTS_A, np.array(DATA_POINTS_A) * 2])
+        sprague_interpolator = SpragueInterpolator(x, y)
+        np.testing.assert_almost_equal(
+            sprague_interpolator(
+                np.arange(0,
+                          len(DATA_POINTS_A) - 1 + interval, interval)),
+            tstack([
+                DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES,
+                np.array(DATA_POINTS_A_SPRAGUE_INTERPOLATED_10_SAMPLES) * 2
+            ]))
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.SpragueInterpolator.__call__`
@@ -914,6 +945,12 @@ default` property.
             null_interpolator(np.array([0.75, 2.0, 3.0, 4.75])),
             np.array([12.32, 12.46, 9.51, 4.33]))
 
+        null_interpolator = NullInterpolator(
+            x, tstack([DATA_POINTS_A, DATA_POINTS_A]), 0.25, 0.25)
+        np.testing.assert_almost_equal(
+            null_interpolator(np.array([0.75, 2.0, 3.0, 4.75])),
+            tstack([np.array([12.32, 12.46, 9.51, 4.33])] * 2))
+
     def test_raise_exception___call__(self):
         """
         Tests :func:`colour.algebra.interpolation.NullInterpolator.__call__`
@@ -1128,5 +1165,110 @@ table_interpolation_tetrahedral` definition.
             ]))
 
 
+class TestTableInterpolator(unittest.TestCase):
+    """
+    Defines :class:`colour.algebra.interpolation.TableInterpolator` class
+    unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('table', 'domain', 'method', 'chunk_size')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(TableInterpolator))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(TableInterpolator))
+
+    def test_raise_exception___init__(self):
+        """
+        Tests :func:`colour.algebra.interpolation.TableInterpolator.__init__`
+        method raised exception.
+        """
+
+        self.assertRaises(AssertionError, TableInterpolator, LUT_TABLE[..., 0])
+
+        self.assertRaises(
+            AssertionError, TableInterpolator, LUT_TABLE, domain=[0, 1])
+
+        self.assertRaises(
+            AssertionError, TableInterpolator, LUT_TABLE, method='Cubic')
+
+        self.assertRaises(
+            AssertionError, TableInterpolator, LUT_TABLE, chunk_size=0)
+
+    def test__call__(self):
+        """
+        Tests :func:`colour.algebra.interpolation.TableInterpolator.__call__`
+        method.
+        """
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = prng.uniform(-0.1, 1.1, (4, 64, 3))
+        V_xyz[0, :8] = [[0, 0, 0], [1, 1, 1], [1, 0, 0], [0, 1, 0], [0, 0, 1],
+                        [0.5, 0.5, 0.5], [1, 0.5, 0.5], [0.5, 0.5, 1]]
+
+        for method, table_interpolation_method in [
+            ('Trilinear', table_interpolation_trilinear),
+            ('Tetrahedral', table_interpolation_tetrahedral),
+        ]:
+            V_xyz_t = table_interpolation_method(V_xyz, LUT_TABLE)
+
+            for chunk_size in (1, 7, 65536):
+                interpolator = TableInterpolator(
+                    LUT_TABLE, method=method, chunk_size=chunk_size)
+
+                np.testing.assert_almost_equal(
+                    interpolator(V_xyz), V_xyz_t, decimal=7)
+
+                np.testing.assert_almost_equal(
+                    interpolator(V_xyz, threads=4), V_xyz_t, decimal=7)
+
+                out = np.zeros(V_xyz.shape)
+                self.assertIs(interpolator(V_xyz, out=out), out)
+                np.testing.assert_almost_equal(out, V_xyz_t, decimal=7)
+
+            np.testing.assert_almost_equal(
+                TableInterpolator(LUT_TABLE[:, :1, :], method=method)(V_xyz),
+                table_interpolation_method(V_xyz, LUT_TABLE[:, :1, :]),
+                decimal=7)
+
+            domain = np.array([[-0.1, 0, 1], [0.1, 2, 2]])
+            interpolator = TableInterpolator(LUT_TABLE, domain, method)
+            np.testing.assert_almost_equal(
+                interpolator(domain[0] + V_xyz * (domain[1] - domain[0])),
+                V_xyz_t,
+                decimal=7)
+
+    def test_raise_exception___call__(self):
+        """
+        Tests :func:`colour.algebra.interpolation.TableInterpolator.__call__`
+        method raised exception.
+        """
+
+        interpolator = TableInterpolator(LUT_TABLE)
+
+        self.assertRaises(
+            AssertionError, interpolator, np.zeros([4, 3]), out=np.zeros(12))
+
+        self.assertRaises(
+            AssertionError,
+            interpolator,
+            np.zeros([4, 3]),
+            out=np.zeros([3, 4]).T)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,7 +13,8 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
 import numpy as np
 import unittest
 
-from colour.algebra import random_triplet_generator
+from colour.algebra import (halton_triplet_generator, random_triplet_generator,
+                            sobol_triplet_generator)
 from colour.utilities import ColourRuntimeWarning
 
 __author__ = 'Colour Developers'
@@ -23,7 +24,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['RANDOM_TRIPLETS', 'TestRandomTripletGenerator']
+__all__ = [
+    'RANDOM_TRIPLETS', 'TestRandomTripletGenerator',
+    'TestHaltonTripletGenerator', 'TestSobolTripletGenerator'
+]
 
 RANDOM_TRIPLETS = np.array([
     [0.96702984, 0.77938292, 0.43614665],
@@ -68,5 +72,91 @@ class TestRandomTripletGenerator(unittest.TestCase):
         self.assertWarns(ColourRuntimeWarning, random_triplet_generator, 5.5)
 
 
+class TestHaltonTripletGenerator(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.random.halton_triplet_generator` definition
+    unit tests methods.
+    """
+
+    def test_halton_triplet_generator(self):
+        """
+        Tests :func:`colour.algebra.random.halton_triplet_generator`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            halton_triplet_generator(5),
+            np.array([
+                [0.50000000, 0.33333333, 0.20000000],
+                [0.25000000, 0.66666667, 0.40000000],
+                [0.75000000, 0.11111111, 0.60000000],
+                [0.12500000, 0.44444444, 0.80000000],
+                [0.62500000, 0.77777778, 0.04000000],
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            halton_triplet_generator(
+                2, limits=np.array([[0, 100], [-150, 150], [-150, 150]])),
+            np.array([
+                [50.00000000, -50.00000000, -90.00000000],
+                [25.00000000, 50.00000000, -30.00000000],
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            halton_triplet_generator(1024)[512:],
+            halton_triplet_generator(512, offset=512),
+            decimal=7)
+
+        self.assertWarns(ColourRuntimeWarning, halton_triplet_generator, 5.5)
+
+
+class TestSobolTripletGenerator(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.random.sobol_triplet_generator` definition
+    unit tests methods.
+    """
+
+    def test_sobol_triplet_generator(self):
+        """
+        Tests :func:`colour.algebra.random.sobol_triplet_generator`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            sobol_triplet_generator(5),
+            np.array([
+                [0.50000000, 0.50000000, 0.50000000],
+                [0.75000000, 0.25000000, 0.25000000],
+                [0.25000000, 0.75000000, 0.75000000],
+                [0.37500000, 0.37500000, 0.62500000],
+                [0.87500000, 0.87500000, 0.12500000],
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            sobol_triplet_generator(
+                2, limits=np.array([[0, 100], [-150, 150], [-150, 150]])),
+            np.array([
+                [50.00000000, 0.00000000, 0.00000000],
+                [75.00000000, -75.00000000, -75.00000000],
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            sobol_triplet_generator(1024)[512:],
+            sobol_triplet_generator(512, offset=512),
+            decimal=7)
+
+        triplets = sobol_triplet_generator(2 ** 10 - 1)
+        for i in range(3):
+            np.testing.assert_equal(
+                np.sort(np.floor(triplets[..., i] * 2 ** 10)),
+                np.arange(1, 2 ** 10))
+
+        self.assertWarns(ColourRuntimeWarning, sobol_triplet_generator, 5.5)
+
+
 if __name__ == '__main__':
     unittest.main()
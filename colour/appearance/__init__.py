@@ -1,18 +1,35 @@
 # -*- coding: utf-8 -*-
 
-from .hunt import (InductionFactors_Hunt, VIEWING_CONDITIONS_HUNT,
-                   CAM_Specification_Hunt, XYZ_to_Hunt)
-from .atd95 import CAM_Specification_ATD95, XYZ_to_ATD95
-from .ciecam02 import (InductionFactors_CIECAM02, VIEWING_CONDITIONS_CIECAM02,
-                       CAM_KWARGS_CIECAM02_sRGB, CAM_Specification_CIECAM02,
-                       XYZ_to_CIECAM02, CIECAM02_to_XYZ)
-from .cam16 import (InductionFactors_CAM16, VIEWING_CONDITIONS_CAM16,
-                    CAM_Specification_CAM16, XYZ_to_CAM16, CAM16_to_XYZ)
-from .llab import (InductionFactors_LLAB, VIEWING_CONDITIONS_LLAB,
-                   CAM_Specification_LLAB, XYZ_to_LLAB)
-from .nayatani95 import CAM_Specification_Nayatani95, XYZ_to_Nayatani95
-from .rlab import (VIEWING_CONDITIONS_RLAB, D_FACTOR_RLAB,
-                   CAM_Specification_RLAB, XYZ_to_RLAB)
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'hunt': [
+            'InductionFactors_Hunt', 'VIEWING_CONDITIONS_HUNT',
+            'CAM_Specification_Hunt', 'XYZ_to_Hunt'
+        ],
+        'atd95': ['CAM_Specification_ATD95', 'XYZ_to_ATD95'],
+        'ciecam02': [
+            'InductionFactors_CIECAM02', 'VIEWING_CONDITIONS_CIECAM02',
+            'CAM_KWARGS_CIECAM02_sRGB', 'CAM_Specification_CIECAM02',
+            'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ', 'ViewingConditions_CIECAM02'
+        ],
+        'cam16': [
+            'InductionFactors_CAM16', 'VIEWING_CONDITIONS_CAM16',
+            'CAM_Specification_CAM16', 'XYZ_to_CAM16', 'CAM16_to_XYZ',
+            'ViewingConditions_CAM16'
+        ],
+        'llab': [
+            'InductionFactors_LLAB', 'VIEWING_CONDITIONS_LLAB',
+            'CAM_Specification_LLAB', 'XYZ_to_LLAB'
+        ],
+        'nayatani95': ['CAM_Specification_Nayatani95', 'XYZ_to_Nayatani95'],
+        'rlab': [
+            'VIEWING_CONDITIONS_RLAB', 'D_FACTOR_RLAB',
+            'CAM_Specification_RLAB', 'XYZ_to_RLAB'
+        ]
+    })
+del lazy_module_attributes
 
 __all__ = [
     'InductionFactors_Hunt', 'VIEWING_CONDITIONS_HUNT',
@@ -22,11 +39,12 @@ __all__ += ['CAM_Specification_ATD95', 'XYZ_to_ATD95']
 __all__ += [
     'InductionFactors_CIECAM02', 'VIEWING_CONDITIONS_CIECAM02',
     'CAM_KWARGS_CIECAM02_sRGB', 'CAM_Specification_CIECAM02',
-    'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ'
+    'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ', 'ViewingConditions_CIECAM02'
 ]
 __all__ += [
     'InductionFactors_CAM16', 'VIEWING_CONDITIONS_CAM16',
-    'CAM_Specification_CAM16', 'XYZ_to_CAM16', 'CAM16_to_XYZ'
+    'CAM_Specification_CAM16', 'XYZ_to_CAM16', 'CAM16_to_XYZ',
+    'ViewingConditions_CAM16'
 ]
 __all__ += [
     'InductionFactors_LLAB', 'VIEWING_CONDITIONS_LLAB',
@@ -10,6 +10,7 @@ Defines *CIECAM02* colour appearance model objects:
 -   :class:`colour.CAM_Specification_CIECAM02`
 -   :func:`colour.XYZ_to_CIECAM02`
 -   :func:`colour.CIECAM02_to_XYZ`
+-   :class:`colour.appearance.ViewingConditions_CIECAM02`
 
 References
 ----------
@@ -43,8 +44,9 @@ from colour.constants import EPSILON
 from colour.models import xy_to_XYZ
 from colour.utilities import (
     CaseInsensitiveMapping, as_float_array, as_int_array, as_namedtuple,
-    as_float, from_range_degrees, matrix_dot, vector_dot, from_range_100, ones,
-    to_domain_100, to_domain_degrees, tsplit, tstack, zeros)
+    as_float, from_range_degrees, get_domain_range_scale, matrix_dot,
+    vector_dot, from_range_100, ones, to_domain_100, to_domain_degrees, tsplit,
+    tstack, zeros)
 from colour.utilities.documentation import (DocstringDict,
                                             is_documentation_building)
 __author__ = 'Colour Developers'
@@ -58,10 +60,11 @@ __all__ = [
     'CAT_INVERSE_CAT02', 'InductionFactors_CIECAM02',
     'VIEWING_CONDITIONS_CIECAM02', 'HUE_DATA_FOR_HUE_QUADRATURE',
     'CAM_KWARGS_CIECAM02_sRGB', 'CAM_Specification_CIECAM02',
-    'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ', 'chromatic_induction_factors',
-    'base_exponential_non_linearity', 'viewing_condition_dependent_parameters',
-    'degree_of_adaptation', 'full_chromatic_adaptation_forward',
-    'full_chromatic_adaptation_inverse', 'RGB_to_rgb', 'rgb_to_RGB',
+    'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ', 'ViewingConditions_CIECAM02',
+    'chromatic_induction_factors', 'base_exponential_non_linearity',
+    'viewing_condition_dependent_parameters', 'degree_of_adaptation',
+    'full_chromatic_adaptation_forward', 'full_chromatic_adaptation_inverse',
+    'RGB_to_rgb', 'rgb_to_RGB',
     'post_adaptation_non_linear_response_compression_forward',
     'post_adaptation_non_linear_response_compression_inverse',
     'opponent_colour_dimensions_forward', 'opponent_colour_dimensions_inverse',
@@ -304,73 +307,8 @@ h=219.0484326..., s=2.3603053..., Q=195.3713259..., M=0.1088421..., \
 H=278.0607358..., HC=None)
     """
 
-    XYZ = to_domain_100(XYZ)
-    XYZ_w = to_domain_100(XYZ_w)
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = as_float_array(L_A)
-    Y_b = as_float_array(Y_b)
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
-    # sharpened *RGB* values.
-    RGB = vector_dot(CAT_CAT02, XYZ)
-    RGB_w = vector_dot(CAT_CAT02, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = (degree_of_adaptation(surround.F, L_A)
-         if not discount_illuminant else ones(L_A.shape))
-
-    # Computing full chromatic adaptation.
-    RGB_c = full_chromatic_adaptation_forward(RGB, RGB_w, Y_w, D)
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_p = RGB_to_rgb(RGB_c)
-    RGB_pw = RGB_to_rgb(RGB_wc)
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_p, F_L)
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
-
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic responses for the stimulus and the whitepoint.
-    A = achromatic_response_forward(RGB_a, N_bb)
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CAM_Specification_CIECAM02(
-        from_range_100(J), from_range_100(C), from_range_degrees(h),
-        from_range_100(s), from_range_100(Q), from_range_100(M),
-        from_range_degrees(H, 400), None)
+    return ViewingConditions_CIECAM02(XYZ_w, L_A, Y_b, surround,
+                                      discount_illuminant).forward(XYZ)
 
 
 def CIECAM02_to_XYZ(specification,
@@ -491,79 +429,475 @@ def CIECAM02_to_XYZ(specification,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(specification,
-                                                CAM_Specification_CIECAM02)
-    J = to_domain_100(J)
-    C = to_domain_100(C) if C is not None else C
-    h = to_domain_degrees(h)
-    M = to_domain_100(M) if M is not None else M
-    L_A = as_float_array(L_A)
-    XYZ_w = to_domain_100(XYZ_w)
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
+    return ViewingConditions_CIECAM02(
+        XYZ_w, L_A, Y_b, surround, discount_illuminant).inverse(specification)
+
+
+class ViewingConditions_CIECAM02:
+    """
+    Defines the *CIECAM02* colour appearance model prepared viewing
+    conditions.
+
+    The terms depending only on the viewing conditions, i.e. the viewing
+    condition dependent parameters, the degree of adaptation :math:`D`, the
+    achromatic response :math:`A_w` of the reference white and the full
+    chromatic adaptation folded with the conversion to the
+    *Hunt-Pointer-Estevez* colourspace into a single matrix, are computed once
+    and reused by the *forward* and *inverse* implementations for any number
+    of stimuli.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white.
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Luminous factor of background :math:`Y_b` such as
+        :math:`Y_b = 100 x L_b / L_w` where :math:`L_w` is the luminance of the
+        light source and :math:`L_b` is the luminance of the background.
+    surround : InductionFactors_CIECAM02, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.XYZ_w`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.L_A`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.Y_b`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.surround`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.\
+discount_illuminant`
+
+    Methods
+    -------
+    -   :meth:`~colour.appearance.ViewingConditions_CIECAM02.__init__`
+    -   :meth:`~colour.appearance.ViewingConditions_CIECAM02.forward`
+    -   :meth:`~colour.appearance.ViewingConditions_CIECAM02.inverse`
+
+    Notes
+    -----
+    -   The terms are computed on the first conversion and computed again when
+        the viewing conditions or the domain-range scale are modified, the
+        reference white is thus expected in the domain-range scale in use for
+        the conversions.
+    -   :func:`colour.XYZ_to_CIECAM02` and :func:`colour.CIECAM02_to_XYZ`
+        definitions are implemented with that class, see their notes section
+        for the domain-range scales.
+
+    References
+    ----------
+    :cite:`Fairchild2004c`, :cite:`Luo2013`, :cite:`Moroneya`,
+    :cite:`Wikipedia2007a`
+
+    Examples
+    --------
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> viewing_conditions = ViewingConditions_CIECAM02(XYZ_w, L_A, Y_b)
+    >>> specification = viewing_conditions.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CAM_Specification_CIECAM02(J=41.7310911..., C=0.1047077..., \
+h=219.0484326..., s=2.3603053..., Q=195.3713259..., M=0.1088421..., \
+H=278.0607358..., HC=None)
+    >>> viewing_conditions.inverse(specification)  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    _SPECIFICATION = CAM_Specification_CIECAM02
+    """
+    Colour appearance model specification class type.
+
+    _SPECIFICATION : type
+    """
+
+    _MATRIX_ADAPTATION = CAT_CAT02
+    """
+    Matrix converting *CIE XYZ* tristimulus values to the sharpened *RGB*
+    values used for the full chromatic adaptation.
+
+    _MATRIX_ADAPTATION : array_like, (3, 3)
+    """
+
+    _MATRIX_RESPONSE = matrix_dot(MATRIX_XYZ_TO_HPE, CAT_INVERSE_CAT02)
+    """
+    Matrix converting the adapted sharpened *RGB* values to the *RGB* values
+    used for the post-adaptation non linear response compression.
+
+    _MATRIX_RESPONSE : array_like, (3, 3)
+    """
 
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=VIEWING_CONDITIONS_CIECAM02['Average'],
+                 discount_illuminant=False):
+        self._XYZ_w = None
+        self._L_A = None
+        self._Y_b = None
+        self._surround = None
+        self._discount_illuminant = None
+        self._scale = None
+
+        self.XYZ_w = XYZ_w
+        self.L_A = L_A
+        self.Y_b = Y_b
+        self.surround = surround
+        self.discount_illuminant = discount_illuminant
+
+    @property
+    def XYZ_w(self):
+        """
+        Getter and setter property for the *CIE XYZ* tristimulus values of
+        reference white.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the *CIE XYZ* tristimulus values of reference white
+            with.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values of reference white.
+        """
 
-    if C is None and M is not None:
-        C = M / spow(F_L, 0.25)
-    elif C is None:
-        raise ValueError('Either "C" or "M" correlate must be defined in '
-                         'the "CAM_Specification_CIECAM02" argument!')
+        return self._XYZ_w
+
+    @XYZ_w.setter
+    def XYZ_w(self, value):
+        """
+        Setter for the **self.XYZ_w** property.
+        """
 
-    # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
-    # sharpened *RGB* values.
-    RGB_w = vector_dot(CAT_CAT02, XYZ_w)
+        self._XYZ_w = as_float_array(value)
+        self._scale = None
 
-    # Computing degree of adaptation :math:`D`.
-    D = (degree_of_adaptation(surround.F, L_A)
-         if not discount_illuminant else ones(L_A.shape))
+    @property
+    def L_A(self):
+        """
+        Getter and setter property for the adapting field *luminance*
+        :math:`L_A`.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Value to set the adapting field *luminance* :math:`L_A` with.
+
+        Returns
+        -------
+        ndarray
+            Adapting field *luminance* :math:`L_A`.
+        """
 
-    # Computing full chromatic adaptation.
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
+        return self._L_A
 
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_pw = RGB_to_rgb(RGB_wc)
+    @L_A.setter
+    def L_A(self, value):
+        """
+        Setter for the **self.L_A** property.
+        """
 
-    # Applying post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
+        self._L_A = as_float_array(value)
+        self._scale = None
 
-    # Computing achromatic response for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
+    @property
+    def Y_b(self):
+        """
+        Getter and setter property for the luminous factor of background
+        :math:`Y_b`.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Value to set the luminous factor of background :math:`Y_b` with.
+
+        Returns
+        -------
+        ndarray
+            Luminous factor of background :math:`Y_b`.
+        """
+
+        return self._Y_b
+
+    @Y_b.setter
+    def Y_b(self, value):
+        """
+        Setter for the **self.Y_b** property.
+        """
+
+        self._Y_b = as_float_array(value)
+        self._scale = None
+
+    @property
+    def surround(self):
+        """
+        Getter and setter property for the surround viewing conditions
+        induction factors.
+
+        Parameters
+        ----------
+        value : InductionFactors_CIECAM02
+            Value to set the surround viewing conditions induction factors
+            with.
+
+        Returns
+        -------
+        InductionFactors_CIECAM02
+            Surround viewing conditions induction factors.
+        """
+
+        return self._surround
+
+    @surround.setter
+    def surround(self, value):
+        """
+        Setter for the **self.surround** property.
+        """
+
+        self._surround = value
+        self._scale = None
+
+    @property
+    def discount_illuminant(self):
+        """
+        Getter and setter property for whether the illuminant is discounted.
+
+        Parameters
+        ----------
+        value : bool
+            Value to set whether the illuminant is discounted with.
+
+        Returns
+        -------
+        bool
+            Whether the illuminant is discounted.
+        """
+
+        return self._discount_illuminant
+
+    @discount_illuminant.setter
+    def discount_illuminant(self, value):
+        """
+        Setter for the **self.discount_illuminant** property.
+        """
+
+        self._discount_illuminant = value
+        self._scale = None
+
+    def _degree_of_adaptation(self):
+        """
+        Returns the degree of adaptation :math:`D`.
+
+        Returns
+        -------
+        ndarray
+            Degree of adaptation :math:`D`.
+        """
+
+        return degree_of_adaptation(self._surround.F, self._L_A)
+
+    def _prepare(self):
+        """
+        Computes the terms depending only on the viewing conditions if they
+        have been modified or if the domain-range scale has changed since they
+        were last computed.
+        """
+
+        scale = get_domain_range_scale()
+        if self._scale == scale:
+            return
+
+        XYZ_w = to_domain_100(self._XYZ_w)
+        _X_w, Y_w, _Z_w = tsplit(XYZ_w)
+
+        self._n, self._F_L, self._N_bb, self._N_cb, self._z = tsplit(
+            viewing_condition_dependent_parameters(self._Y_b, Y_w, self._L_A))
+
+        # Computing degree of adaptation :math:`D`.
+        D = (self._degree_of_adaptation()
+             if not self._discount_illuminant else ones(self._L_A.shape))
+
+        # Folding the full chromatic adaptation into the conversion matrices:
+        # the forward matrix converts *CIE XYZ* tristimulus values to the
+        # *RGB* values before the post-adaptation non linear response
+        # compression and the inverse matrix converts them back.
+        RGB_w = vector_dot(self._MATRIX_ADAPTATION, XYZ_w)
+        D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
+                 D[..., np.newaxis])
+
+        self._M_forward = matrix_dot(
+            self._MATRIX_RESPONSE,
+            D_RGB[..., np.newaxis] * self._MATRIX_ADAPTATION)
+        self._M_inverse = matrix_dot(
+            np.linalg.inv(self._MATRIX_ADAPTATION),
+            (1 / D_RGB)[..., np.newaxis] * np.linalg.inv(
+                self._MATRIX_RESPONSE))
+
+        # Computing achromatic response for the whitepoint.
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            vector_dot(self._M_forward, XYZ_w), self._F_L)
+        self._A_w = achromatic_response_forward(RGB_aw, self._N_bb)
+
+        self._scale = scale
+
+    def forward(self, XYZ):
+        """
+        Computes the colour appearance model correlates from given *CIE XYZ*
+        tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus.
+
+        Returns
+        -------
+        CAM_Specification_CIECAM02
+            Colour appearance model specification.
+
+        Examples
+        --------
+        >>> XYZ = np.array([19.01, 20.00, 21.78])
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> ViewingConditions_CIECAM02(XYZ_w, 318.31, 20.0).forward(XYZ)
+        ... # doctest: +ELLIPSIS
+        CAM_Specification_CIECAM02(J=41.7310911..., C=0.1047077..., \
+h=219.0484326..., s=2.3603053..., Q=195.3713259..., M=0.1088421..., \
+H=278.0607358..., HC=None)
+        """
+
+        self._prepare()
+
+        XYZ = to_domain_100(XYZ)
+        c, N_c = self._surround.c, self._surround.N_c
+
+        # Converting *CIE XYZ* tristimulus values to adapted *RGB* values and
+        # applying forward post-adaptation non linear response compression.
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            vector_dot(self._M_forward, XYZ), self._F_L)
+
+        # Converting to preliminary cartesian coordinates.
+        a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
+
+        # Computing hue :math:`h` quadrature :math:`H`.
+        H = hue_quadrature(h)
+        # TODO: Compute hue composition.
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response for the stimulus.
+        A = achromatic_response_forward(RGB_a, self._N_bb)
+
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = lightness_correlate(A, self._A_w, c, self._z)
+
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = brightness_correlate(c, J, self._A_w, self._F_L)
+
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, self._n, N_c, self._N_cb, e_t, a, b, RGB_a)
+
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, self._F_L)
+
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
+
+        return self._SPECIFICATION(
+            from_range_100(J), from_range_100(C), from_range_degrees(h),
+            from_range_100(s), from_range_100(Q), from_range_100(M),
+            from_range_degrees(H, 400), None)
+
+    def inverse(self, specification):
+        """
+        Converts from colour appearance model specification to *CIE XYZ*
+        tristimulus values.
+
+        Parameters
+        ----------
+        specification : CAM_Specification_CIECAM02
+            Colour appearance model specification. Correlate of *Lightness*
+            :math:`J`, correlate of *chroma* :math:`C` or correlate of
+            *colourfulness* :math:`M` and *hue* angle :math:`h` in degrees
+            must be specified, e.g. :math:`JCh` or :math:`JMh`.
+
+        Returns
+        -------
+        XYZ : ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            ``specification`` argument.
+
+        Examples
+        --------
+        >>> specification = CAM_Specification_CIECAM02(
+        ...     J=41.731091132513917, C=0.104707757171031,
+        ...     h=219.048432658311780)
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> ViewingConditions_CIECAM02(XYZ_w, 318.31, 20.0).inverse(
+        ...     specification)  # doctest: +ELLIPSIS
+        array([ 19.01...,  20...  ,  21.78...])
+        """
 
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_inverse(C, J, n)
+        self._prepare()
 
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(specification,
+                                                    self._SPECIFICATION)
+        J = to_domain_100(J)
+        C = to_domain_100(C) if C is not None else C
+        h = to_domain_degrees(h)
+        M = to_domain_100(M) if M is not None else M
+        c, N_c = self._surround.c, self._surround.N_c
 
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_inverse(A_w, J, surround.c, z)
+        if C is None and M is not None:
+            C = M / spow(self._F_L, 0.25)
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "{0}" argument!'.format(
+                                 self._SPECIFICATION.__name__))
 
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
+        # Computing temporary magnitude quantity :math:`t`.
+        t = temporary_magnitude_quantity_inverse(C, J, self._n)
 
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_inverse(P_n, h))
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
 
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = matrix_post_adaptation_non_linear_response_compression(P_2, a, b)
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = achromatic_response_inverse(self._A_w, J, c, self._z)
 
-    # Applying inverse post-adaptation non linear response compression.
-    RGB_p = post_adaptation_non_linear_response_compression_inverse(RGB_a, F_L)
+        # Computing *P_1* to *P_3*.
+        P_n = P(N_c, self._N_cb, e_t, t, A, self._N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
 
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_c = rgb_to_RGB(RGB_p)
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_inverse(P_n, h))
 
-    # Applying inverse full chromatic adaptation.
-    RGB = full_chromatic_adaptation_inverse(RGB_c, RGB_w, Y_w, D)
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = matrix_post_adaptation_non_linear_response_compression(
+            P_2, a, b)
 
-    # Converting *CMCCAT2000* transform sharpened *RGB* values to *CIE XYZ*
-    # tristimulus values.
-    XYZ = vector_dot(CAT_INVERSE_CAT02, RGB)
+        # Applying inverse post-adaptation non linear response compression
+        # and converting adapted *RGB* values to *CIE XYZ* tristimulus values.
+        RGB = post_adaptation_non_linear_response_compression_inverse(
+            RGB_a, self._F_L)
+        XYZ = vector_dot(self._M_inverse, RGB)
 
-    return from_range_100(XYZ)
+        return from_range_100(XYZ)
 
 
 def chromatic_induction_factors(n):
@@ -1067,9 +1401,9 @@ def hue_quadrature(h):
 
     h = as_float_array(h)
 
-    h_i = HUE_DATA_FOR_HUE_QUADRATURE['h_i']
-    e_i = HUE_DATA_FOR_HUE_QUADRATURE['e_i']
-    H_i = HUE_DATA_FOR_HUE_QUADRATURE['H_i']
+    h_i = as_float_array(HUE_DATA_FOR_HUE_QUADRATURE['h_i'])
+    e_i = as_float_array(HUE_DATA_FOR_HUE_QUADRATURE['e_i'])
+    H_i = as_float_array(HUE_DATA_FOR_HUE_QUADRATURE['H_i'])
 
     # *np.searchsorted* returns an erroneous index if a *nan* is used as input.
     h[np.asarray(np.isnan(h))] = 0
@@ -670,7 +670,7 @@ def chromatic_adaptation(XYZ,
         D_rgb = zeros(F_rgb.shape)
 
     # Computing cone bleach factors.
-    B_rgb = (10 ** 7) / ((10 ** 7) + 5 * L_A[..., np.newaxis] * (rgb_w / 100))
+    B_rgb = 1e7 / (1e7 + 5 * L_A[..., np.newaxis] * (rgb_w / 100))
 
     # Computing adjusted reference white signals.
     if XYZ_p is not None and p is not None:
@@ -855,7 +855,7 @@ def eccentricity_factor(hue):
     h_s = HUE_DATA_FOR_HUE_QUADRATURE['h_s']
     e_s = HUE_DATA_FOR_HUE_QUADRATURE['e_s']
 
-    x = np.interp(hue, h_s, e_s)
+    x = as_float_array(np.interp(hue, h_s, e_s))
     x = np.where(hue < 20.14, 0.856 - (hue / 20.14) * 0.056, x)
     x = np.where(hue > 237.53, 0.856 + 0.344 * (360 - hue) / (360 - 237.53), x)
 
@@ -27,8 +27,9 @@ from colour.adaptation.cie1994 import (MATRIX_XYZ_TO_RGB_CIE1994, beta_1,
                                        exponential_factors,
                                        intermediate_values)
 from colour.models import XYZ_to_xy
-from colour.utilities import (as_float_array, vector_dot, from_range_degrees,
-                              to_domain_100, tsplit, tstack)
+from colour.utilities import (as_float, as_float_array, vector_dot,
+                              from_range_degrees, to_domain_100, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -363,7 +364,7 @@ def scaling_coefficient(x, y):
     x = as_float_array(x)
     y = as_float_array(y)
 
-    return np.where(x >= (20 * y), 1.758, 1)
+    return np.where(x >= (20 * y), as_float(1.758), as_float(1))
 
 
 def achromatic_response(RGB, bRGB_o, xez, bL_or, eR, eG, n=1):
@@ -5,11 +5,12 @@ Defines unit tests for :mod:`colour.appearance.cam16` module.
 """
 
 import numpy as np
+import unittest
 from itertools import permutations
 
-from colour.appearance import (VIEWING_CONDITIONS_CAM16,
-                               InductionFactors_CAM16, CAM_Specification_CAM16,
-                               XYZ_to_CAM16, CAM16_to_XYZ)
+from colour.appearance import (
+    VIEWING_CONDITIONS_CAM16, InductionFactors_CAM16, CAM_Specification_CAM16,
+    XYZ_to_CAM16, CAM16_to_XYZ, ViewingConditions_CAM16)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import (as_namedtuple, domain_range_scale,
                               ignore_numpy_errors, tsplit, tstack)
@@ -23,7 +24,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCAM16ColourAppearanceModelForward',
-    'TestCAM16ColourAppearanceModelInverse'
+    'TestCAM16ColourAppearanceModelInverse', 'TestViewingConditions_CAM16'
 ]
 
 
@@ -297,3 +298,89 @@ class TestCAM16ColourAppearanceModelInverse(ColourAppearanceModelTest):
             surround = InductionFactors_CAM16(case[0], case[0], case[0])
             CAM16_to_XYZ(
                 CAM_Specification_CAM16(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestViewingConditions_CAM16(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.cam16.ViewingConditions_CAM16`
+    class unit tests methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'forward', 'inverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ViewingConditions_CAM16))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.appearance.cam16.\
+ViewingConditions_CAM16.forward` method.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 100, (2, 3, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+
+        for surround in VIEWING_CONDITIONS_CAM16.values():
+            for discount_illuminant in (False, True):
+                viewing_conditions = ViewingConditions_CAM16(
+                    XYZ_w, L_A, Y_b, surround, discount_illuminant)
+                for XYZ_i in (XYZ, XYZ[0], XYZ[0, 0]):
+                    np.testing.assert_almost_equal(
+                        viewing_conditions.forward(XYZ_i)[:-1],
+                        XYZ_to_CAM16(XYZ_i, XYZ_w, L_A, Y_b, surround,
+                                     discount_illuminant)[:-1],
+                        decimal=7)
+
+        viewing_conditions = ViewingConditions_CAM16(XYZ_w, L_A, Y_b)
+        viewing_conditions.forward(XYZ)
+        viewing_conditions.L_A = 20
+        np.testing.assert_almost_equal(
+            viewing_conditions.forward(XYZ)[:-1],
+            XYZ_to_CAM16(XYZ, XYZ_w, 20, Y_b)[:-1],
+            decimal=7)
+
+        viewing_conditions.XYZ_w = XYZ_w / 100
+        with domain_range_scale(1):
+            np.testing.assert_almost_equal(
+                viewing_conditions.forward(XYZ / 100)[:-1],
+                XYZ_to_CAM16(XYZ / 100, XYZ_w / 100, 20, Y_b)[:-1],
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            viewing_conditions.forward(XYZ)[:-1],
+            XYZ_to_CAM16(XYZ, XYZ_w / 100, 20, Y_b)[:-1],
+            decimal=7)
+
+    def test_inverse(self):
+        """
+        Tests :meth:`colour.appearance.cam16.\
+ViewingConditions_CAM16.inverse` method.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 100, (2, 3, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+
+        viewing_conditions = ViewingConditions_CAM16(XYZ_w, L_A, Y_b)
+        specification = viewing_conditions.forward(XYZ)
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(specification), XYZ, decimal=7)
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(specification._replace(C=None)),
+            XYZ,
+            decimal=7)
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(specification),
+            CAM16_to_XYZ(specification, XYZ_w, L_A, Y_b),
+            decimal=7)
+
+        self.assertRaises(ValueError, viewing_conditions.inverse,
+                          CAM_Specification_CAM16(41.731, None, 219.048))
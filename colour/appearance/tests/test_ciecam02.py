@@ -5,11 +5,13 @@ Defines unit tests for :mod:`colour.appearance.ciecam02` module.
 """
 
 import numpy as np
+import unittest
 from itertools import permutations
 
-from colour.appearance import (
-    VIEWING_CONDITIONS_CIECAM02, InductionFactors_CIECAM02,
-    CAM_Specification_CIECAM02, XYZ_to_CIECAM02, CIECAM02_to_XYZ)
+from colour.appearance import (VIEWING_CONDITIONS_CIECAM02,
+                               InductionFactors_CIECAM02,
+                               CAM_Specification_CIECAM02, XYZ_to_CIECAM02,
+                               CIECAM02_to_XYZ, ViewingConditions_CIECAM02)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import (as_namedtuple, domain_range_scale,
                               ignore_numpy_errors, tsplit, tstack)
@@ -23,7 +25,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCIECAM02ColourAppearanceModelForward',
-    'TestCIECAM02ColourAppearanceModelInverse'
+    'TestCIECAM02ColourAppearanceModelInverse',
+    'TestViewingConditions_CIECAM02'
 ]
 
 
@@ -293,3 +296,89 @@ class TestCIECAM02ColourAppearanceModelInverse(ColourAppearanceModelTest):
             surround = InductionFactors_CIECAM02(case[0], case[0], case[0])
             CIECAM02_to_XYZ(
                 CAM_Specification_CIECAM02(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestViewingConditions_CIECAM02(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.ciecam02.ViewingConditions_CIECAM02`
+    class unit tests methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'forward', 'inverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ViewingConditions_CIECAM02))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.\
+ViewingConditions_CIECAM02.forward` method.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 100, (2, 3, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+
+        for surround in VIEWING_CONDITIONS_CIECAM02.values():
+            for discount_illuminant in (False, True):
+                viewing_conditions = ViewingConditions_CIECAM02(
+                    XYZ_w, L_A, Y_b, surround, discount_illuminant)
+                for XYZ_i in (XYZ, XYZ[0], XYZ[0, 0]):
+                    np.testing.assert_almost_equal(
+                        viewing_conditions.forward(XYZ_i)[:-1],
+                        XYZ_to_CIECAM02(XYZ_i, XYZ_w, L_A, Y_b, surround,
+                                        discount_illuminant)[:-1],
+                        decimal=7)
+
+        viewing_conditions = ViewingConditions_CIECAM02(XYZ_w, L_A, Y_b)
+        viewing_conditions.forward(XYZ)
+        viewing_conditions.L_A = 20
+        np.testing.assert_almost_equal(
+            viewing_conditions.forward(XYZ)[:-1],
+            XYZ_to_CIECAM02(XYZ, XYZ_w, 20, Y_b)[:-1],
+            decimal=7)
+
+        viewing_conditions.XYZ_w = XYZ_w / 100
+        with domain_range_scale(1):
+            np.testing.assert_almost_equal(
+                viewing_conditions.forward(XYZ / 100)[:-1],
+                XYZ_to_CIECAM02(XYZ / 100, XYZ_w / 100, 20, Y_b)[:-1],
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            viewing_conditions.forward(XYZ)[:-1],
+            XYZ_to_CIECAM02(XYZ, XYZ_w / 100, 20, Y_b)[:-1],
+            decimal=7)
+
+    def test_inverse(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.\
+ViewingConditions_CIECAM02.inverse` method.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 100, (2, 3, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+
+        viewing_conditions = ViewingConditions_CIECAM02(XYZ_w, L_A, Y_b)
+        specification = viewing_conditions.forward(XYZ)
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(specification), XYZ, decimal=7)
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(specification._replace(C=None)),
+            XYZ,
+            decimal=7)
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(specification),
+            CIECAM02_to_XYZ(specification, XYZ_w, L_A, Y_b),
+            decimal=7)
+
+        self.assertRaises(ValueError, viewing_conditions.inverse,
+                          CAM_Specification_CIECAM02(41.731, None, 219.048))
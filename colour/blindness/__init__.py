@@ -1,11 +1,21 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from .datasets import *  # noqa
-from . import datasets
-from .machado2009 import (msds_cmfs_anomalous_trichromacy_Machado2009,
-                          matrix_anomalous_trichromacy_Machado2009,
-                          matrix_cvd_Machado2009)
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'datasets':
+            None,
+        'machado2009': [
+            'msds_cmfs_anomalous_trichromacy_Machado2009',
+            'matrix_anomalous_trichromacy_Machado2009',
+            'matrix_cvd_Machado2009'
+        ]
+    })
+del lazy_module_attributes
+
+from . import datasets  # noqa
 
 __all__ = []
 __all__ += datasets.__all__
@@ -1,24 +1,38 @@
 # -*- coding: utf-8 -*-
 
-from .cameras import RGB_CameraSensitivities
-from .displays import RGB_DisplayPrimaries
-from .datasets import *  # noqa
-from . import datasets
-from .aces_it import (
-    sd_to_aces_relative_exposure_values, read_training_data_rawtoaces_v1,
-    generate_illuminants_rawtoaces_v1, white_balance_multipliers,
-    best_illuminant, normalise_illuminant, training_data_sds_to_RGB,
-    training_data_sds_to_XYZ, optimisation_factory_rawtoaces_v1,
-    optimisation_factory_JzAzBz, matrix_idt)
-from .correction import (
-    matrix_augmented_Cheung2004, polynomial_expansion_Finlayson2015,
-    polynomial_expansion_Vandermonde, POLYNOMIAL_EXPANSION_METHODS,
-    polynomial_expansion, matrix_colour_correction_Cheung2004,
-    matrix_colour_correction_Finlayson2015,
-    matrix_colour_correction_Vandermonde, MATRIX_COLOUR_CORRECTION_METHODS,
-    matrix_colour_correction, colour_correction_Cheung2004,
-    colour_correction_Finlayson2015, colour_correction_Vandermonde,
-    COLOUR_CORRECTION_METHODS, colour_correction)
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'cameras': ['RGB_CameraSensitivities'],
+        'displays': ['RGB_DisplayPrimaries'],
+        'datasets':
+            None,
+        'aces_it': [
+            'sd_to_aces_relative_exposure_values',
+            'read_training_data_rawtoaces_v1',
+            'generate_illuminants_rawtoaces_v1', 'white_balance_multipliers',
+            'best_illuminant', 'normalise_illuminant',
+            'training_data_sds_to_RGB', 'training_data_sds_to_XYZ',
+            'optimisation_factory_rawtoaces_v1', 'optimisation_factory_JzAzBz',
+            'matrix_idt'
+        ],
+        'correction': [
+            'matrix_augmented_Cheung2004',
+            'polynomial_expansion_Finlayson2015',
+            'polynomial_expansion_Vandermonde', 'POLYNOMIAL_EXPANSION_METHODS',
+            'polynomial_expansion', 'matrix_colour_correction_Cheung2004',
+            'matrix_colour_correction_Finlayson2015',
+            'matrix_colour_correction_Vandermonde',
+            'MATRIX_COLOUR_CORRECTION_METHODS', 'matrix_colour_correction',
+            'colour_correction_Cheung2004', 'colour_correction_Finlayson2015',
+            'colour_correction_Vandermonde', 'COLOUR_CORRECTION_METHODS',
+            'colour_correction'
+        ]
+    })
+del lazy_module_attributes
+
+from . import datasets  # noqa
 
 __all__ = ['RGB_CameraSensitivities']
 __all__ += ['RGB_DisplayPrimaries']
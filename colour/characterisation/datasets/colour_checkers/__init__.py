@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from .chromaticity_coordinates import CCS_COLOURCHECKERS, ColourChecker
-from .sds import SDS_COLOURCHECKERS
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'chromaticity_coordinates': ['CCS_COLOURCHECKERS', 'ColourChecker'],
+        'sds': ['SDS_COLOURCHECKERS']
+    })
+del lazy_module_attributes
 
 __all__ = ['CCS_COLOURCHECKERS', 'ColourChecker']
 __all__ += ['SDS_COLOURCHECKERS']
@@ -1,36 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from .spectrum import (SpectralShape, SPECTRAL_SHAPE_DEFAULT,
-                       SpectralDistribution, MultiSpectralDistributions,
-                       sds_and_msds_to_sds, sds_and_msds_to_msds)
-from .blackbody import sd_blackbody, blackbody_spectral_radiance, planck_law
-from .cmfs import (LMS_ConeFundamentals, RGB_ColourMatchingFunctions,
-                   XYZ_ColourMatchingFunctions)
-from .datasets import *  # noqa
-from . import datasets
-from .generation import sd_constant, sd_zeros, sd_ones
-from .generation import msds_constant, msds_zeros, msds_ones
-from .generation import SD_GAUSSIAN_METHODS
-from .generation import sd_gaussian, sd_gaussian_normal, sd_gaussian_fwhm
-from .generation import SD_SINGLE_LED_METHODS
-from .generation import sd_single_led, sd_single_led_Ohno2005
-from .generation import SD_MULTI_LEDS_METHODS
-from .generation import sd_multi_leds, sd_multi_leds_Ohno2005
-from .tristimulus import SD_TO_XYZ_METHODS, MSDS_TO_XYZ_METHODS
-from .tristimulus import sd_to_XYZ, msds_to_XYZ
-from .tristimulus import (
-    SPECTRAL_SHAPE_ASTME308, lagrange_coefficients_ASTME2022,
-    tristimulus_weighting_factors_ASTME2022,
-    adjust_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_integration,
-    sd_to_XYZ_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_ASTME308,
-    msds_to_XYZ_integration, msds_to_XYZ_ASTME308, wavelength_to_XYZ)
-from .correction import BANDPASS_CORRECTION_METHODS
-from .correction import bandpass_correction
-from .correction import bandpass_correction_Stearns1988
-from .illuminants import (sd_CIE_standard_illuminant_A,
-                          sd_CIE_illuminant_D_series, daylight_locus_function)
-from .lefs import (sd_mesopic_luminous_efficiency_function,
-                   mesopic_weighting_function)
+from colour.utilities import lazy_module_attributes
+
 from .lightness import LIGHTNESS_METHODS
 from .lightness import lightness
 from .lightness import (lightness_Glasser1958, lightness_Wyszecki1963,
@@ -43,14 +14,6 @@ from .luminance import (luminance_Newhall1943, luminance_ASTMD1535,
                         luminance_CIE1976, luminance_Fairchild2010,
                         luminance_Fairchild2011)
 from .luminance import intermediate_luminance_function_CIE1976
-from .dominant import (dominant_wavelength, complementary_wavelength,
-                       excitation_purity, colorimetric_purity)
-from .photometry import luminous_flux, luminous_efficiency, luminous_efficacy
-from .transformations import RGB_10_degree_cmfs_to_LMS_10_degree_cmfs
-from .transformations import RGB_2_degree_cmfs_to_XYZ_2_degree_cmfs
-from .transformations import RGB_10_degree_cmfs_to_XYZ_10_degree_cmfs
-from .transformations import LMS_2_degree_cmfs_to_XYZ_2_degree_cmfs
-from .transformations import LMS_10_degree_cmfs_to_XYZ_10_degree_cmfs
 from .whiteness import WHITENESS_METHODS
 from .whiteness import whiteness
 from .whiteness import (whiteness_Berger1959, whiteness_Taube1960,
@@ -60,9 +23,76 @@ from .yellowness import YELLOWNESS_METHODS
 from .yellowness import yellowness
 from .yellowness import yellowness_ASTMD1925, yellowness_ASTME313
 
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'spectrum': [
+            'SpectralShape', 'SPECTRAL_SHAPE_DEFAULT', 'SpectralDistribution',
+            'MultiSpectralDistributions', 'resample_spectral_values',
+            'sds_and_msds_to_sds', 'sds_and_msds_to_msds'
+        ],
+        'blackbody': [
+            'sd_blackbody', 'blackbody_spectral_radiance', 'planck_law'
+        ],
+        'cmfs': [
+            'LMS_ConeFundamentals', 'RGB_ColourMatchingFunctions',
+            'XYZ_ColourMatchingFunctions'
+        ],
+        'datasets':
+            None,
+        'generation': [
+            'sd_constant', 'sd_zeros', 'sd_ones', 'msds_constant',
+            'msds_zeros', 'msds_ones', 'SD_GAUSSIAN_METHODS', 'sd_gaussian',
+            'sd_gaussian_normal', 'sd_gaussian_fwhm', 'SD_SINGLE_LED_METHODS',
+            'sd_single_led', 'sd_single_led_Ohno2005', 'SD_MULTI_LEDS_METHODS',
+            'sd_multi_leds', 'sd_multi_leds_Ohno2005'
+        ],
+        'tristimulus': [
+            'SD_TO_XYZ_METHODS', 'MSDS_TO_XYZ_METHODS', 'sd_to_XYZ',
+            'msds_to_XYZ', 'SPECTRAL_SHAPE_ASTME308',
+            'lagrange_coefficients_ASTME2022',
+            'tristimulus_weighting_factors_ASTME2022',
+            'adjust_tristimulus_weighting_factors_ASTME308',
+            'sd_to_XYZ_integration',
+            'sd_to_XYZ_tristimulus_weighting_factors_ASTME308',
+            'sd_to_XYZ_ASTME308', 'msds_to_XYZ_integration',
+            'msds_to_XYZ_ASTME308', 'wavelength_to_XYZ'
+        ],
+        'correction': [
+            'BANDPASS_CORRECTION_METHODS', 'bandpass_correction',
+            'bandpass_correction_Stearns1988'
+        ],
+        'illuminants': [
+            'sd_CIE_standard_illuminant_A', 'sd_CIE_illuminant_D_series',
+            'daylight_locus_function'
+        ],
+        'lefs': [
+            'sd_mesopic_luminous_efficiency_function',
+            'mesopic_weighting_function'
+        ],
+        'dominant': [
+            'SpectralLocusIndex', 'dominant_wavelength',
+            'complementary_wavelength', 'excitation_purity',
+            'colorimetric_purity'
+        ],
+        'photometry': [
+            'luminous_flux', 'luminous_efficiency', 'luminous_efficacy'
+        ],
+        'transformations': [
+            'RGB_10_degree_cmfs_to_LMS_10_degree_cmfs',
+            'RGB_2_degree_cmfs_to_XYZ_2_degree_cmfs',
+            'RGB_10_degree_cmfs_to_XYZ_10_degree_cmfs',
+            'LMS_2_degree_cmfs_to_XYZ_2_degree_cmfs',
+            'LMS_10_degree_cmfs_to_XYZ_10_degree_cmfs'
+        ]
+    })
+del lazy_module_attributes
+
+from . import datasets  # noqa
+
 __all__ = [
     'SpectralShape', 'SPECTRAL_SHAPE_DEFAULT', 'SpectralDistribution',
-    'MultiSpectralDistributions', 'sds_and_msds_to_sds', 'sds_and_msds_to_msds'
+    'MultiSpectralDistributions', 'resample_spectral_values',
+    'sds_and_msds_to_sds', 'sds_and_msds_to_msds'
 ]
 __all__ += ['sd_blackbody', 'blackbody_spectral_radiance', 'planck_law']
 __all__ += [
@@ -112,8 +142,8 @@ __all__ += [
 ]
 __all__ += ['intermediate_luminance_function_CIE1976']
 __all__ += [
-    'dominant_wavelength', 'complementary_wavelength', 'excitation_purity',
-    'colorimetric_purity'
+    'SpectralLocusIndex', 'dominant_wavelength', 'complementary_wavelength',
+    'excitation_purity', 'colorimetric_purity'
 ]
 __all__ += ['luminous_flux', 'luminous_efficiency', 'luminous_efficacy']
 __all__ += ['RGB_10_degree_cmfs_to_LMS_10_degree_cmfs']
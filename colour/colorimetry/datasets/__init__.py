@@ -1,12 +1,23 @@
 # -*- coding: utf-8 -*-
 
-from .cmfs import (MSDS_CMFS, MSDS_CMFS_LMS, MSDS_CMFS_RGB,
-                   MSDS_CMFS_STANDARD_OBSERVER)
-from .illuminants import *  # noqa
-from . import illuminants
-from .light_sources import *  # noqa
-from . import light_sources
-from .lefs import SDS_LEFS, SDS_LEFS_PHOTOPIC, SDS_LEFS_SCOTOPIC
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'cmfs': [
+            'MSDS_CMFS', 'MSDS_CMFS_LMS', 'MSDS_CMFS_RGB',
+            'MSDS_CMFS_STANDARD_OBSERVER'
+        ],
+        'illuminants':
+            None,
+        'light_sources':
+            None,
+        'lefs': ['SDS_LEFS', 'SDS_LEFS_PHOTOPIC', 'SDS_LEFS_SCOTOPIC']
+    })
+del lazy_module_attributes
+
+from . import illuminants  # noqa
+from . import light_sources  # noqa
 
 __all__ = [
     'MSDS_CMFS', 'MSDS_CMFS_LMS', 'MSDS_CMFS_RGB',
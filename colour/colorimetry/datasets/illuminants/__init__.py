@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
 
-from .chromaticity_coordinates import CCS_ILLUMINANTS
-from .sds_d_illuminant_series import (
-    SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES)
-from .hunterlab import TVS_ILLUMINANTS_HUNTERLAB
-from .sds import SDS_ILLUMINANTS
-from .tristimulus_values import TVS_ILLUMINANTS
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'chromaticity_coordinates': ['CCS_ILLUMINANTS'],
+        'sds_d_illuminant_series': [
+            'SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES'
+        ],
+        'hunterlab': ['TVS_ILLUMINANTS_HUNTERLAB'],
+        'sds': ['SDS_ILLUMINANTS'],
+        'tristimulus_values': ['TVS_ILLUMINANTS']
+    })
+del lazy_module_attributes
 
 __all__ = [
     'CCS_ILLUMINANTS', 'SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES',
@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from .chromaticity_coordinates import CCS_LIGHT_SOURCES
-from .sds import SDS_LIGHT_SOURCES
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'chromaticity_coordinates': ['CCS_LIGHT_SOURCES'],
+        'sds': ['SDS_LIGHT_SOURCES']
+    })
+del lazy_module_attributes
 
 __all__ = ['CCS_LIGHT_SOURCES', 'SDS_LIGHT_SOURCES']
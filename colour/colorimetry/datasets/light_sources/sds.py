@@ -49,9 +49,11 @@ usp=sharing
     http://www.cis.rit.edu/research/mcsl2/online/PointerData.xls
 """
 
+from functools import partial
+
 from colour.algebra import LinearInterpolator
 from colour.colorimetry.spectrum import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -736,37 +738,45 @@ DATA_LIGHT_SOURCES_RIT = {
     }
 }
 
-SDS_LIGHT_SOURCES_RIT = CaseInsensitiveMapping({
+SDS_LIGHT_SOURCES_RIT = LazyCaseInsensitiveMapping({
     'Natural':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_RIT['Natural'],
             name='Natural'),
     'Philips TL-84':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_RIT['Philips TL-84'],
             name='Philips TL-84'),
     'SA':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_RIT['SA'],
             name='SA'),
     'SC':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_RIT['SC'],
             name='SC'),
     'T8 Luxline Plus White':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_RIT['T8 Luxline Plus White'],
             name='T8 Luxline Plus White'),
     'T8 Polylux 3000':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_RIT['T8 Polylux 3000'],
             name='T8 Polylux 3000'),
     'T8 Polylux 4000':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_RIT['T8 Polylux 4000'],
             name='T8 Polylux 4000'),
     'Thorn Kolor-rite':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_RIT['Thorn Kolor-rite'],
             name='Thorn Kolor-rite')
 })  # yapf: disable
@@ -784,7 +794,7 @@ References
 ----------
 :cite:`Pointer1980a`
 
-DATA_LIGHT_SOURCES_RIT : CaseInsensitiveMapping
+DATA_LIGHT_SOURCES_RIT : LazyCaseInsensitiveMapping
     **{'Natural', 'Philips TL-84', 'T8 Luxline Plus White', 'SA', 'SC',
     'T8 Polylux 3000', 'T8 Polylux 4000', 'Thorn Kolor-rite'}**
 """
@@ -1622,42 +1632,55 @@ DATA_LIGHT_SOURCES_NIST_TRADITIONAL = {
     }
 }
 
-SDS_LIGHT_SOURCES_NIST_TRADITIONAL = CaseInsensitiveMapping({
+SDS_LIGHT_SOURCES_NIST_TRADITIONAL = LazyCaseInsensitiveMapping({
     'Cool White FL':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_TRADITIONAL['Cool White FL'],
             name='Cool White FL'),
     'Daylight FL':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_TRADITIONAL['Daylight FL'],
             name='Daylight FL'),
     'HPS':
-        SpectralDistribution(
-            DATA_LIGHT_SOURCES_NIST_TRADITIONAL['HPS'], name='HPS'),
+        partial(
+            SpectralDistribution,
+            DATA_LIGHT_SOURCES_NIST_TRADITIONAL['HPS'],
+            name='HPS'),
     'Incandescent':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_TRADITIONAL['Incandescent'],
             name='Incandescent'),
     'LPS':
-        SpectralDistribution(
-            DATA_LIGHT_SOURCES_NIST_TRADITIONAL['LPS'], name='LPS'),
+        partial(
+            SpectralDistribution,
+            DATA_LIGHT_SOURCES_NIST_TRADITIONAL['LPS'],
+            name='LPS'),
     'Mercury':
-        SpectralDistribution(
-            DATA_LIGHT_SOURCES_NIST_TRADITIONAL['Mercury'], name='Mercury'),
+        partial(
+            SpectralDistribution,
+            DATA_LIGHT_SOURCES_NIST_TRADITIONAL['Mercury'],
+            name='Mercury'),
     'Metal Halide':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_TRADITIONAL['Metal Halide'],
             name='Metal Halide'),
     'Neodimium Incandescent':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_TRADITIONAL['Neodimium Incandescent'],
             name='Neodimium Incandescent'),
     'Super HPS':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_TRADITIONAL['Super HPS'],
             name='Super HPS'),
     'Triphosphor FL':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_TRADITIONAL['Triphosphor FL'],
             name='Triphosphor FL')
 })
@@ -1669,7 +1692,7 @@ References
 ----------
 :cite:`Ohno2008a`
 
-SDS_LIGHT_SOURCES_NIST_TRADITIONAL : CaseInsensitiveMapping
+SDS_LIGHT_SOURCES_NIST_TRADITIONAL : LazyCaseInsensitiveMapping
     **{'Cool White FL', 'Daylight FL', 'HPS', 'Incandescent', 'LPS', 'Mercury',
     'Metal Halide', 'Neodimium Incandescent', 'Super HPS', 'Triphosphor FL'}**
 """
@@ -2922,60 +2945,80 @@ DATA_LIGHT_SOURCES_NIST_LED = {
     }
 }
 
-SDS_LIGHT_SOURCES_NIST_LED = CaseInsensitiveMapping({
+SDS_LIGHT_SOURCES_NIST_LED = LazyCaseInsensitiveMapping({
     '3-LED-1 (457/540/605)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['3-LED-1 (457/540/605)'],
             name='3-LED-1 (457/540/605)'),
     '3-LED-2 (473/545/616)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['3-LED-2 (473/545/616)'],
             name='3-LED-2 (473/545/616)'),
     '3-LED-2 Yellow':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['3-LED-2 Yellow'],
             name='3-LED-2 Yellow'),
     '3-LED-3 (465/546/614)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['3-LED-3 (465/546/614)'],
             name='3-LED-3 (465/546/614)'),
     '3-LED-4 (455/547/623)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['3-LED-4 (455/547/623)'],
             name='3-LED-4 (455/547/623)'),
     '4-LED No Yellow':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['4-LED No Yellow'],
             name='4-LED No Yellow'),
     '4-LED Yellow':
-        SpectralDistribution(
-            DATA_LIGHT_SOURCES_NIST_LED['4-LED Yellow'], name='4-LED Yellow'),
+        partial(
+            SpectralDistribution,
+            DATA_LIGHT_SOURCES_NIST_LED['4-LED Yellow'],
+            name='4-LED Yellow'),
     '4-LED-1 (461/526/576/624)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['4-LED-1 (461/526/576/624)'],
             name='4-LED-1 (461/526/576/624)'),
     '4-LED-2 (447/512/573/627)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['4-LED-2 (447/512/573/627)'],
             name='4-LED-2 (447/512/573/627)'),
     'Luxeon WW 2880':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['Luxeon WW 2880'],
             name='Luxeon WW 2880'),
     'PHOS-1':
-        SpectralDistribution(
-            DATA_LIGHT_SOURCES_NIST_LED['PHOS-1'], name='PHOS-1'),
+        partial(
+            SpectralDistribution,
+            DATA_LIGHT_SOURCES_NIST_LED['PHOS-1'],
+            name='PHOS-1'),
     'PHOS-2':
-        SpectralDistribution(
-            DATA_LIGHT_SOURCES_NIST_LED['PHOS-2'], name='PHOS-2'),
+        partial(
+            SpectralDistribution,
+            DATA_LIGHT_SOURCES_NIST_LED['PHOS-2'],
+            name='PHOS-2'),
     'PHOS-3':
-        SpectralDistribution(
-            DATA_LIGHT_SOURCES_NIST_LED['PHOS-3'], name='PHOS-3'),
+        partial(
+            SpectralDistribution,
+            DATA_LIGHT_SOURCES_NIST_LED['PHOS-3'],
+            name='PHOS-3'),
     'PHOS-4':
-        SpectralDistribution(
-            DATA_LIGHT_SOURCES_NIST_LED['PHOS-4'], name='PHOS-4'),
+        partial(
+            SpectralDistribution,
+            DATA_LIGHT_SOURCES_NIST_LED['PHOS-4'],
+            name='PHOS-4'),
     'Phosphor LED YAG':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_LED['Phosphor LED YAG'],
             name='Phosphor LED YAG')
 })
@@ -2983,7 +3026,7 @@ SDS_LIGHT_SOURCES_NIST_LED = CaseInsensitiveMapping({
 Spectral distributions of the LED light sources from the *NIST*
 *NIST CQS simulation 7.4.xls* spreadsheet.
 
-SDS_LIGHT_SOURCES_NIST_LED : CaseInsensitiveMapping
+SDS_LIGHT_SOURCES_NIST_LED : LazyCaseInsensitiveMapping
     **{'3-LED-1 (457/540/605)', '3-LED-2 (473/545/616)', '3-LED-2 Yellow',
     '3-LED-3 (465/546/614)', '3-LED-4 (455/547/623)', '4-LED No Yellow',
     '4-LED Yellow', '4-LED-1 (461/526/576/624)', '4-LED-2 (447/512/573/627)',
@@ -4820,93 +4863,115 @@ DATA_LIGHT_SOURCES_NIST_PHILIPS = {
     }
 }
 
-SDS_LIGHT_SOURCES_NIST_PHILIPS = CaseInsensitiveMapping({
+SDS_LIGHT_SOURCES_NIST_PHILIPS = LazyCaseInsensitiveMapping({
     '60 A/W (Soft White)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['60 A/W (Soft White)'],
             name='60 A/W (Soft White)'),
     'C100S54 (HPS)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['C100S54 (HPS)'],
             name='C100S54 (HPS)'),
     'C100S54C (HPS)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['C100S54C (HPS)'],
             name='C100S54C (HPS)'),
     'F32T8/TL830 (Triphosphor)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F32T8/TL830 (Triphosphor)'],
             name='F32T8/TL830 (Triphosphor)'),
     'F32T8/TL835 (Triphosphor)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F32T8/TL835 (Triphosphor)'],
             name='F32T8/TL835 (Triphosphor)'),
     'F32T8/TL841 (Triphosphor)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F32T8/TL841 (Triphosphor)'],
             name='F32T8/TL841 (Triphosphor)'),
     'F32T8/TL850 (Triphosphor)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F32T8/TL850 (Triphosphor)'],
             name='F32T8/TL850 (Triphosphor)'),
     'F32T8/TL865 /PLUS (Triphosphor)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F32T8/TL865 /PLUS (Triphosphor)'],
             name='F32T8/TL865 /PLUS (Triphosphor)'),
     'F34/CW/RS/EW (Cool White FL)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F34/CW/RS/EW (Cool White FL)'],
             name='F34/CW/RS/EW (Cool White FL)'),
     'F34T12/LW/RS /EW':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F34T12/LW/RS /EW'],
             name='F34T12/LW/RS /EW'),
     'F34T12WW/RS /EW (Warm White FL)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F34T12WW/RS /EW (Warm White FL)'],
             name='F34T12WW/RS /EW (Warm White FL)'),
     'F40/C50 (Broadband FL)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F40/C50 (Broadband FL)'],
             name='F40/C50 (Broadband FL)'),
     'F40/C75 (Broadband FL)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F40/C75 (Broadband FL)'],
             name='F40/C75 (Broadband FL)'),
     'F40/CWX (Broadband FL)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F40/CWX (Broadband FL)'],
             name='F40/CWX (Broadband FL)'),
     'F40/DX (Broadband FL)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F40/DX (Broadband FL)'],
             name='F40/DX (Broadband FL)'),
     'F40/DXTP (Delux FL)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F40/DXTP (Delux FL)'],
             name='F40/DXTP (Delux FL)'),
     'F40/N (Natural FL)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['F40/N (Natural FL)'],
             name='F40/N (Natural FL)'),
     'H38HT-100 (Mercury)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['H38HT-100 (Mercury)'],
             name='H38HT-100 (Mercury)'),
     'H38JA-100/DX (Mercury DX)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['H38JA-100/DX (Mercury DX)'],
             name='H38JA-100/DX (Mercury DX)'),
     'MHC100/U/MP /3K':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['MHC100/U/MP /3K'],
             name='MHC100/U/MP /3K'),
     'MHC100/U/MP /4K':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['MHC100/U/MP /4K'],
             name='MHC100/U/MP /4K'),
     'SDW-T 100W/LV (Super HPS)':
-        SpectralDistribution(
+        partial(
+            SpectralDistribution,
             DATA_LIGHT_SOURCES_NIST_PHILIPS['SDW-T 100W/LV (Super HPS)'],
             name='SDW-T 100W/LV (Super HPS)')
 })
@@ -4914,7 +4979,7 @@ SDS_LIGHT_SOURCES_NIST_PHILIPS = CaseInsensitiveMapping({
 Spectral distributions of the Philips light sources from the *NIST*
 *NIST CQS simulation 7.4.xls* spreadsheet.
 
-SDS_LIGHT_SOURCES_NIST_PHILIPS : CaseInsensitiveMapping
+SDS_LIGHT_SOURCES_NIST_PHILIPS : LazyCaseInsensitiveMapping
     **{'60 A/W (Soft White)', 'C100S54 (HPS)', 'C100S54C (HPS)',
     'F32T8/TL830 (Triphosphor)', 'F32T8/TL835 (Triphosphor)',
     'F32T8/TL841 (Triphosphor)', 'F32T8/TL850 (Triphosphor)',
@@ -5132,10 +5197,12 @@ DATA_LIGHT_SOURCES_COMMON = {
     }
 }
 
-SDS_LIGHT_SOURCES_COMMON = CaseInsensitiveMapping({
+SDS_LIGHT_SOURCES_COMMON = LazyCaseInsensitiveMapping({
     'Kinoton 75P':
-        SpectralDistribution(
-            DATA_LIGHT_SOURCES_COMMON['Kinoton 75P'], name='Kinoton 75P')
+        partial(
+            SpectralDistribution,
+            DATA_LIGHT_SOURCES_COMMON['Kinoton 75P'],
+            name='Kinoton 75P')
 })
 """
 Spectral distributions of the common light sources.
@@ -5144,11 +5211,11 @@ References
 ----------
 :cite:`Houston2015a`
 
-SDS_LIGHT_SOURCES_COMMON : CaseInsensitiveMapping
+SDS_LIGHT_SOURCES_COMMON : LazyCaseInsensitiveMapping
     **{'Kinoton 75P', }**
 """
 
-SDS_LIGHT_SOURCES = CaseInsensitiveMapping(SDS_LIGHT_SOURCES_RIT)
+SDS_LIGHT_SOURCES = LazyCaseInsensitiveMapping(SDS_LIGHT_SOURCES_RIT)
 SDS_LIGHT_SOURCES.__doc__ = """
 Spectral distributions of the light sources.
 
@@ -5156,7 +5223,7 @@ References
 ----------
 :cite:`Houston2015a`, :cite:`Ohno2008a`, :cite:`Pointer1980a`
 
-SDS_LIGHT_SOURCES : CaseInsensitiveMapping
+SDS_LIGHT_SOURCES : LazyCaseInsensitiveMapping
 """
 
 SDS_LIGHT_SOURCES.update(SDS_LIGHT_SOURCES_NIST_TRADITIONAL)
@@ -5167,5 +5234,8 @@ SDS_LIGHT_SOURCES.update(SDS_LIGHT_SOURCES_COMMON)
 # *CIE 15:2004* recommends using linear interpolation for
 # *CIE Standard Illuminant D Series*, for consistency all the light sources are
 # using a linear interpolator.
-for _sd in SDS_LIGHT_SOURCES.values():
-    _sd.interpolator = LinearInterpolator
+for _sds in (SDS_LIGHT_SOURCES_RIT, SDS_LIGHT_SOURCES_NIST_TRADITIONAL,
+             SDS_LIGHT_SOURCES_NIST_LED, SDS_LIGHT_SOURCES_NIST_PHILIPS,
+             SDS_LIGHT_SOURCES_COMMON):
+    for _name, _sd in list(_sds.data.values()):
+        _sds[_name] = partial(_sd, interpolator=LinearInterpolator)
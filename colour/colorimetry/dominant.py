@@ -23,13 +23,13 @@ whitepaper_howtocalculateluminositywavelengthandpurity.pdf
 """
 
 import numpy as np
-import scipy.spatial.distance
+from scipy.spatial import cKDTree
 
 from colour.algebra import (euclidean_distance, extend_line_segment,
                             intersect_line_segments)
 from colour.colorimetry import MSDS_CMFS
 from colour.models import XYZ_to_xy
-from colour.utilities import as_float_array
+from colour.utilities import CACHE_REGISTRY, as_float_array, full, tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -39,10 +39,199 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'closest_spectral_locus_wavelength', 'dominant_wavelength',
-    'complementary_wavelength', 'excitation_purity', 'colorimetric_purity'
+    'SpectralLocusIndex', 'closest_spectral_locus_wavelength',
+    'dominant_wavelength', 'complementary_wavelength', 'excitation_purity',
+    'colorimetric_purity'
 ]
 
+_CACHE_SPECTRAL_LOCUS_INDEXES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_SPECTRAL_LOCUS_INDEXES'.format(__name__), 32)
+
+
+class SpectralLocusIndex:
+    """
+    Defines an index of the spectral locus segments sorted by hue angle around
+    given achromatic stimulus :math:`xy_n` *CIE xy* chromaticity coordinates.
+
+    The intersection of the line defined by the achromatic stimulus and a
+    colour stimulus with the spectral locus is found by searching the hue
+    angle of the colour stimulus in the index and intersecting the line with
+    the single segment returned. The closest spectral locus wavelength index
+    to the intersection point is found with a *k-d* tree.
+
+    Parameters
+    ----------
+    xy_s : array_like
+        Spectral locus *CIE xy* chromaticity coordinates.
+    xy_n : array_like
+        Achromatic stimulus *CIE xy* chromaticity coordinates.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.colorimetry.SpectralLocusIndex.xy_s`
+    -   :attr:`~colour.colorimetry.SpectralLocusIndex.xy_n`
+
+    Methods
+    -------
+    -   :meth:`~colour.colorimetry.SpectralLocusIndex.__init__`
+    -   :meth:`~colour.colorimetry.SpectralLocusIndex.intersect`
+
+    Notes
+    -----
+    -   The spectral locus is closed with the line of purples.
+    -   The spectral locus points whose hue angle does not progress around
+        the achromatic stimulus, e.g. the long wavelengths folding back on
+        themselves, are not indexed, the segments are then joining their
+        neighbours.
+
+    Examples
+    --------
+    >>> cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> xy_s = XYZ_to_xy(cmfs.values)
+    >>> xy_n = np.array([0.31270000, 0.32900000])
+    >>> index = SpectralLocusIndex(xy_s, xy_n)
+    >>> ix, intersect = index.intersect(np.array([0.54369557, 0.32107944]))
+    >>> print(ix)
+    256
+    >>> print(intersect)  # doctest: +ELLIPSIS
+    [ 0.6835474...  0.3162840...]
+    """
+
+    def __init__(self, xy_s, xy_n):
+        self._xy_s = as_float_array(xy_s)
+        self._xy_n = as_float_array(xy_n)
+
+        self._orientation = 1
+        self._hues = None
+        self._vertices = None
+        self._indexes = None
+        self._tree = None
+
+        self._index()
+
+    @property
+    def xy_s(self):
+        """
+        Getter property for the spectral locus *CIE xy* chromaticity
+        coordinates.
+
+        Returns
+        -------
+        ndarray
+            Spectral locus *CIE xy* chromaticity coordinates.
+        """
+
+        return self._xy_s
+
+    @property
+    def xy_n(self):
+        """
+        Getter property for the achromatic stimulus *CIE xy* chromaticity
+        coordinates.
+
+        Returns
+        -------
+        ndarray
+            Achromatic stimulus *CIE xy* chromaticity coordinates.
+        """
+
+        return self._xy_n
+
+    def _index(self):
+        """
+        Indexes the spectral locus segments by hue angle.
+        """
+
+        finite = np.all(np.isfinite(self._xy_s), axis=-1)
+        xy_s = self._xy_s[finite]
+
+        x, y = tsplit(xy_s - self._xy_n)
+        hues = np.unwrap(np.arctan2(y, x))
+        if hues[-1] > hues[0]:
+            self._orientation = -1
+            hues = -hues
+
+        # The hue angles decrease along the spectral locus, the points not
+        # decreasing them below their predecessors or beyond the last point,
+        # i.e. the line of purples end, are discarded.
+        progress = hues < np.minimum.accumulate(np.hstack([np.inf, hues[:-1]]))
+        progress &= hues > max(hues[-1], hues[0] - 2 * np.pi)
+        progress[-1] = hues[-1] > hues[0] - 2 * np.pi
+
+        self._vertices = np.vstack([xy_s[progress], xy_s[0]])
+        self._hues = -np.hstack([hues[progress], hues[0] - 2 * np.pi])
+
+        _xy_s, indexes = np.unique(xy_s, axis=0, return_index=True)
+        self._indexes = np.arange(len(self._xy_s))[finite][indexes]
+        self._tree = cKDTree(_xy_s)
+
+    def intersect(self, xy, inverse=False):
+        """
+        Returns the coordinates and closest spectral locus wavelength index to
+        the point where the line defined by the achromatic stimulus
+        :math:`xy_n` to given colour stimulus :math:`xy` *CIE xy* chromaticity
+        coordinates intersects the spectral locus.
+
+        Parameters
+        ----------
+        xy : array_like
+            Colour stimulus *CIE xy* chromaticity coordinates.
+        inverse : bool, optional
+            The intersection will be computed using the colour stimulus
+            :math:`xy` to achromatic stimulus :math:`xy_n` inverse direction.
+
+        Returns
+        -------
+        tuple
+            Closest wavelength index, intersection point *CIE xy*
+            chromaticity coordinates. The index is set to -1 and the
+            coordinates to *NaN* where the intersection is undefined, e.g.
+            when the colour stimulus is equal to the achromatic stimulus.
+        """
+
+        xy = as_float_array(xy)
+
+        u = (self._xy_n - xy) if inverse else (xy - self._xy_n)
+        u_x, u_y = tsplit(u)
+
+        hues = -self._orientation * np.arctan2(u_y, u_x)
+        hues = self._hues[0] + np.mod(hues - self._hues[0], 2 * np.pi)
+
+        i_s = np.clip(
+            np.searchsorted(self._hues, hues, side='right') - 1, 0,
+            len(self._hues) - 2)
+        e_x, e_y = tsplit(self._vertices[i_s + 1] - self._vertices[i_s])
+        a_x, a_y = tsplit(self._vertices[i_s] - self._xy_n)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = (a_x * e_y - a_y * e_x) / (u_x * e_y - u_y * e_x)
+            xy_wl = self._xy_n + t[..., np.newaxis] * u
+
+        defined = np.all(np.isfinite(xy_wl), axis=-1)
+        xy_wl[~defined] = np.nan
+
+        i_wl = np.full(defined.shape, -1)
+        i_wl[defined] = self._indexes[self._tree.query(xy_wl[defined])[1]]
+
+        return i_wl, xy_wl
+
+
+def _spectral_locus_index(xy_s, xy_n):
+    """
+    Returns the :class:`colour.colorimetry.SpectralLocusIndex` class instance
+    for given spectral locus and achromatic stimulus *CIE xy* chromaticity
+    coordinates and caches it if not existing.
+    """
+
+    key = (xy_s.shape, xy_s.tobytes(), xy_n.tobytes())
+
+    index = _CACHE_SPECTRAL_LOCUS_INDEXES.get(key)
+    if index is None:
+        _CACHE_SPECTRAL_LOCUS_INDEXES[key] = index = SpectralLocusIndex(
+            xy_s, xy_n)
+
+    return index
+
 
 def closest_spectral_locus_wavelength(xy, xy_n, xy_s, inverse=False):
     """
@@ -67,13 +256,20 @@ def closest_spectral_locus_wavelength(xy, xy_n, xy_s, inverse=False):
     -------
     tuple
         Closest wavelength index, intersection point *CIE xy* chromaticity
-        coordinates.
+        coordinates. The index is set to -1 and the coordinates to *NaN*
+        where the intersection is undefined.
 
     Raises
     ------
     ValueError
         If no closest spectral locus wavelength index and coordinates found.
 
+    Notes
+    -----
+    -   The intersections are computed with a
+        :class:`colour.colorimetry.SpectralLocusIndex` class instance cached
+        per spectral locus and achromatic stimulus.
+
     Examples
     --------
     >>> cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
@@ -91,24 +287,32 @@ def closest_spectral_locus_wavelength(xy, xy_n, xy_s, inverse=False):
     xy_n = np.resize(xy_n, xy.shape)
     xy_s = as_float_array(xy_s)
 
-    xy_e = (extend_line_segment(xy, xy_n)
-            if inverse else extend_line_segment(xy_n, xy))
+    xy_p = np.reshape(xy, (-1, 2))
+    xy_n_p = np.reshape(xy_n, (-1, 2))
 
-    # Closing horse-shoe shape to handle line of purples intersections.
-    xy_s = np.vstack([xy_s, xy_s[0, :]])
+    # The achromatic stimuli are typically shared by all the colour stimuli,
+    # the costlier grouping is only performed when they are not.
+    if np.all(xy_n_p == xy_n_p[0]):
+        xy_n_u, groups = xy_n_p[:1], np.zeros(len(xy_n_p), np.int_)
+    else:
+        xy_n_u, groups = np.unique(xy_n_p, axis=0, return_inverse=True)
 
-    xy_wl = intersect_line_segments(
-        np.concatenate((xy_n, xy_e), -1),
-        np.hstack([xy_s, np.roll(xy_s, 1, axis=0)])).xy
-    xy_wl = xy_wl[~np.isnan(xy_wl).any(axis=-1)]
-    if not len(xy_wl):
+    i_wl = np.full(len(xy_p), -1)
+    xy_wl = full(xy_p.shape, np.nan)
+    for i, xy_n_i in enumerate(xy_n_u):
+        if not np.all(np.isfinite(xy_n_i)):
+            continue
+
+        group = groups == i
+        i_wl[group], xy_wl[group] = _spectral_locus_index(
+            xy_s, xy_n_i).intersect(xy_p[group], inverse)
+
+    if not np.any(i_wl >= 0):
         raise ValueError(
             'No closest spectral locus wavelength index and coordinates found '
             'for "{0}" colour stimulus and "{1}" achromatic stimulus "xy" '
             'chromaticity coordinates!'.format(xy, xy_n))
 
-    i_wl = np.argmin(scipy.spatial.distance.cdist(xy_wl, xy_s), axis=-1)
-
     i_wl = np.reshape(i_wl, xy.shape[0:-1])
     xy_wl = np.reshape(xy_wl, xy.shape)
 
@@ -187,7 +391,7 @@ def dominant_wavelength(xy,
 
     i_wl, xy_wl = closest_spectral_locus_wavelength(xy, xy_n, xy_s, inverse)
     xy_cwl = xy_wl
-    wl = cmfs.wavelengths[i_wl]
+    wl = np.where(i_wl >= 0, cmfs.wavelengths[i_wl], np.nan)
 
     xy_e = (extend_line_segment(xy, xy_n)
             if inverse else extend_line_segment(xy_n, xy))
@@ -198,7 +402,7 @@ def dominant_wavelength(xy,
 
     i_wl_r, xy_cwl_r = closest_spectral_locus_wavelength(
         xy, xy_n, xy_s, not inverse)
-    wl_r = -cmfs.wavelengths[i_wl_r]
+    wl_r = np.where(i_wl_r >= 0, -cmfs.wavelengths[i_wl_r], np.nan)
 
     wl = np.where(intersect, wl_r, wl)
     xy_cwl = np.where(intersect[..., np.newaxis], xy_cwl_r, xy_cwl)
@@ -27,12 +27,12 @@ References
 import numpy as np
 
 from colour.algebra import (Extrapolator, CubicSplineInterpolator,
-                            SpragueInterpolator)
+                            LinearInterpolator, SpragueInterpolator)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import Signal, MultiSignals
-from colour.utilities import (as_float, as_int, first_item, is_iterable,
-                              is_numeric, is_string, is_uniform, interval,
-                              runtime_warning, tstack)
+from colour.utilities import (CACHE_REGISTRY, as_float, as_float_array, as_int,
+                              is_iterable, is_numeric, is_string, is_uniform,
+                              interval, runtime_warning, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -43,7 +43,8 @@ __status__ = 'Production'
 
 __all__ = [
     'SpectralShape', 'SPECTRAL_SHAPE_DEFAULT', 'SpectralDistribution',
-    'MultiSpectralDistributions', 'sds_and_msds_to_sds', 'sds_and_msds_to_msds'
+    'MultiSpectralDistributions', 'resample_spectral_values',
+    'sds_and_msds_to_sds', 'sds_and_msds_to_msds'
 ]
 
 
@@ -486,6 +487,168 @@ Default spectral shape according to *ASTM E308-15* practise shape.
 SPECTRAL_SHAPE_DEFAULT : SpectralShape
 """
 
+_CACHE_RESAMPLING_MATRICES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_RESAMPLING_MATRICES'.format(__name__), 128)
+
+_LINEAR_INTERPOLATORS = (CubicSplineInterpolator, LinearInterpolator,
+                         SpragueInterpolator)
+"""
+Interpolator class types whose interpolated values are linear in the
+interpolated values, i.e. which can be expressed with a resampling matrix.
+
+_LINEAR_INTERPOLATORS : tuple
+"""
+
+
+def _resampling_matrix(wavelengths,
+                       wavelengths_r,
+                       interpolator,
+                       interpolator_kwargs,
+                       extrapolator=None,
+                       extrapolator_kwargs=None):
+    """
+    Returns the matrix resampling the values of spectral data with given
+    wavelengths at given resampling wavelengths.
+
+    The interpolation with the interpolator class types from
+    :attr:`colour.colorimetry.spectrum._LINEAR_INTERPOLATORS` attribute and
+    the extrapolation with :class:`colour.Extrapolator` class without
+    ``left`` and ``right`` values are linear in the spectral data values: the
+    resampling matrix is thus the resampled identity matrix and is cached for
+    given wavelengths and resampling arguments.
+
+    Parameters
+    ----------
+    wavelengths : ndarray
+        Wavelengths of the spectral data.
+    wavelengths_r : ndarray
+        Resampling wavelengths.
+    interpolator : object
+        Interpolator class type.
+    interpolator_kwargs : dict_like
+        Arguments to use when instantiating the interpolating function.
+    extrapolator : object, optional
+        Extrapolator class type.
+    extrapolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the extrapolating function.
+
+    Returns
+    -------
+    ndarray
+        Resampling matrix with shape (resampling wavelengths, wavelengths).
+    """
+
+    hash_key = hash((wavelengths.tobytes(), wavelengths_r.tobytes(),
+                     interpolator, str(interpolator_kwargs), extrapolator,
+                     str(extrapolator_kwargs)))
+    if hash_key in _CACHE_RESAMPLING_MATRICES:
+        return _CACHE_RESAMPLING_MATRICES[hash_key]
+
+    function = interpolator(wavelengths, np.identity(len(wavelengths)),
+                            **interpolator_kwargs)
+    if extrapolator is not None:
+        function = extrapolator(function, **extrapolator_kwargs)
+
+    M = function(wavelengths_r)
+
+    # The interpolators are interpolating the spectral data values, the
+    # resampling wavelengths matching the wavelengths are exactly resampled.
+    indexes = np.clip(
+        np.searchsorted(wavelengths, wavelengths_r), 0,
+        len(wavelengths) - 1)
+    matching = wavelengths[indexes] == wavelengths_r
+    M[matching] = 0
+    M[matching, indexes[matching]] = 1
+
+    _CACHE_RESAMPLING_MATRICES[hash_key] = M
+
+    return M
+
+
+def resample_spectral_values(values,
+                             shape,
+                             shape_r,
+                             interpolator=SpragueInterpolator,
+                             interpolator_kwargs=None):
+    """
+    Resamples given spectral values from given spectral shape to given
+    resampling spectral shape using given interpolator.
+
+    The spectral values are resampled at once: with the interpolator class
+    types linear in the spectral values, i.e.
+    :class:`colour.LinearInterpolator`, :class:`colour.SpragueInterpolator`
+    and :class:`colour.CubicSplineInterpolator` classes, the resampling matrix
+    is computed once for given spectral shapes and interpolation arguments,
+    then cached and applied with a single matrix product.
+
+    Parameters
+    ----------
+    values : array_like
+        Spectral values, the wavelengths are expected to be in the last axis,
+        e.g. for 1000 spectral distributions with 81 bins, ``values`` shape
+        should be (1000, 81).
+    shape : SpectralShape
+        Spectral shape of the spectral values.
+    shape_r : SpectralShape
+        Resampling spectral shape, must be within given spectral shape.
+    interpolator : object, optional
+        Interpolator class type.
+    interpolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+
+    Returns
+    -------
+    ndarray
+        Resampled spectral values, the resampling wavelengths are in the last
+        axis.
+
+    Notes
+    -----
+    -   The resampled spectral values are equal to those of the
+        :meth:`colour.SpectralDistribution.interpolate` method with the same
+        interpolator and interpolation arguments, no extrapolation is
+        performed.
+
+    Examples
+    --------
+    >>> values = np.array([
+    ...     [0.0651, 0.0705, 0.0772, 0.0870, 0.1128, 0.1360],
+    ...     [0.1360, 0.1128, 0.0870, 0.0772, 0.0705, 0.0651],
+    ... ])
+    >>> resample_spectral_values(
+    ...     values, SpectralShape(500, 600, 20), SpectralShape(500, 600, 10),
+    ...     LinearInterpolator)
+    array([[ 0.0651 ,  0.0678 ,  0.0705 ,  0.07385,  0.0772 ,  0.0821 ,
+             0.087  ,  0.0999 ,  0.1128 ,  0.1244 ,  0.136  ],
+           [ 0.136  ,  0.1244 ,  0.1128 ,  0.0999 ,  0.087  ,  0.0821 ,
+             0.0772 ,  0.07385,  0.0705 ,  0.0678 ,  0.0651 ]])
+    """
+
+    values = as_float_array(values)
+
+    if interpolator_kwargs is None:
+        interpolator_kwargs = {}
+
+    wavelengths, wavelengths_r = shape.range(), shape_r.range()
+
+    assert values.shape[-1] == len(wavelengths), (
+        'Spectral values with {0} wavelengths are not compatible with '
+        'spectral shape with {1} wavelengths!'.format(values.shape[-1],
+                                                      len(wavelengths)))
+
+    if interpolator in _LINEAR_INTERPOLATORS:
+        M = _resampling_matrix(wavelengths, wavelengths_r, interpolator,
+                               interpolator_kwargs)
+
+        return np.dot(values, np.transpose(M))
+
+    values_r = interpolator(
+        wavelengths, np.transpose(np.reshape(values, (-1, len(wavelengths)))),
+        **interpolator_kwargs)(wavelengths_r)
+
+    return np.reshape(
+        np.transpose(values_r), values.shape[:-1] + wavelengths_r.shape)
+
 
 class SpectralDistribution(Signal):
     """
@@ -1104,11 +1267,17 @@ dict_like, optional
             else:
                 interpolator_kwargs = {}
 
-        interpolator = interpolator(self.wavelengths, self.values,
-                                    **interpolator_kwargs)
+        wavelengths = shape.range()
+        if interpolator in _LINEAR_INTERPOLATORS:
+            M = _resampling_matrix(self.wavelengths, wavelengths, interpolator,
+                                   interpolator_kwargs)
+            values = np.dot(M, self.values)
+        else:
+            values = interpolator(self.wavelengths, self.values,
+                                  **interpolator_kwargs)(wavelengths)
 
-        self.domain = shape.range()
-        self.range = interpolator(self.domain)
+        self.domain = wavelengths
+        self.range = values
 
         return self
 
@@ -1187,6 +1356,16 @@ dict_like, optional
                 'right': None
             }
 
+        if (extrapolator is Extrapolator and
+                extrapolator_kwargs.get('left') is None and
+                extrapolator_kwargs.get('right') is None):
+            self[wavelengths] = np.dot(
+                _resampling_matrix(self.wavelengths, wavelengths,
+                                   LinearInterpolator, {}, extrapolator,
+                                   extrapolator_kwargs), self.values)
+
+            return self
+
         self_extrapolator = self.extrapolator
         self_extrapolator_kwargs = self.extrapolator_kwargs
 
@@ -1650,9 +1829,9 @@ MultiSpectralDistributions or array_like or dict_like, optional
     def __init__(self, data=None, domain=None, labels=None, **kwargs):
         domain = (domain.range()
                   if isinstance(domain, SpectralShape) else domain)
-        signals = self.multi_signals_unpack_data(data, domain, labels)
+        domain, range_, labels = self.multi_signals_unpack_columns(
+            data, domain, labels)
 
-        domain = signals[list(signals.keys())[0]].domain if signals else None
         uniform = is_uniform(domain) if domain is not None else True
 
         # Initialising with *CIE 15:2004* and *CIE 167:2005* recommendations
@@ -1670,7 +1849,10 @@ MultiSpectralDistributions or array_like or dict_like, optional
         })
 
         super(MultiSpectralDistributions, self).__init__(
-            signals, domain, signal_type=SpectralDistribution, **kwargs)
+            signal_type=SpectralDistribution, **kwargs)
+
+        self.domain, self.range, self.labels = domain, range_, labels
+        self._create_function()
 
         self._strict_name = None
         self.strict_name = kwargs.get('strict_name')
@@ -1847,8 +2029,16 @@ MultiSpectralDistributions or array_like or dict_like, optional
         SpectralShape(500.0, 560.0, 1.0)
         """
 
-        if self.signals:
-            return first_item(self._signals.values()).shape
+        if self._domain is not None:
+            wavelengths_interval = interval(self._domain)
+            if wavelengths_interval.size != 1:
+                runtime_warning(
+                    ('"{0}" multi-spectral distributions is not uniform, '
+                     'using minimum interval!'.format(self.name)))
+
+            return SpectralShape(
+                min(self._domain), max(self._domain),
+                as_float(min(wavelengths_interval)))
 
     def interpolate(self, shape, interpolator=None, interpolator_kwargs=None):
         """
@@ -2060,8 +2250,55 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 560.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.interpolate(shape, interpolator, interpolator_kwargs)
+        self_shape = self.shape
+        s_e_i = zip((shape.start, shape.end, shape.interval),
+                    (self_shape.start, self_shape.end, self_shape.interval))
+        shape = SpectralShape(
+            *[x[0] if x[0] is not None else x[1] for x in s_e_i])
+
+        # Defining proper interpolation bounds.
+        # TODO: Provide support for fractional interval like 0.1, etc...
+        if (round(self_shape.start) != self_shape.start or
+                round(self_shape.end) != self_shape.end):
+            runtime_warning(
+                'Fractional bound encountered, rounding will occur!')
+
+        shape.start = max(shape.start, np.ceil(self_shape.start))
+        shape.end = min(shape.end, np.floor(self_shape.end))
+
+        if interpolator is None:
+            # User has specifically chosen the interpolator thus it is used
+            # instead of those from *CIE 167:2005* recommendation.
+            if self.interpolator not in (SpragueInterpolator,
+                                         CubicSplineInterpolator):
+                interpolator = self.interpolator
+            elif self.is_uniform():
+                interpolator = SpragueInterpolator
+            else:
+                interpolator = CubicSplineInterpolator
+
+        if interpolator_kwargs is None:
+            # User has specifically chosen the interpolator thus its keyword
+            # arguments are used.
+            if self.interpolator not in (SpragueInterpolator,
+                                         CubicSplineInterpolator):
+                interpolator_kwargs = self.interpolator_kwargs
+            else:
+                interpolator_kwargs = {}
+
+        # All the columns are interpolated at once, either by a single
+        # resampling matrix product or a single interpolator class instance.
+        wavelengths = shape.range()
+        if interpolator in _LINEAR_INTERPOLATORS:
+            M = _resampling_matrix(self.wavelengths, wavelengths, interpolator,
+                                   interpolator_kwargs)
+            values = np.dot(M, self.values)
+        else:
+            values = self._create_interpolator(
+                interpolator, interpolator_kwargs)(wavelengths)
+
+        self._range = None
+        self.domain, self.range = wavelengths, values
 
         return self
 
@@ -2139,8 +2376,45 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 700.         0.5945     0.995      0.0039 ]]
         """
 
-        for signal in self.signals.values():
-            signal.extrapolate(shape, extrapolator, extrapolator_kwargs)
+        self_shape = self.shape
+        wavelengths = np.hstack([
+            np.arange(shape.start, self_shape.start, self_shape.interval),
+            np.arange(self_shape.end + self_shape.interval,
+                      shape.end + self_shape.interval, self_shape.interval)
+        ])
+
+        if extrapolator is None:
+            extrapolator = Extrapolator
+
+        if extrapolator_kwargs is None:
+            extrapolator_kwargs = {
+                'method': 'Constant',
+                'left': None,
+                'right': None
+            }
+
+        if (extrapolator is Extrapolator and
+                extrapolator_kwargs.get('left') is None and
+                extrapolator_kwargs.get('right') is None):
+            self[wavelengths] = np.dot(
+                _resampling_matrix(self.wavelengths, wavelengths,
+                                   LinearInterpolator, {}, extrapolator,
+                                   extrapolator_kwargs), self.values)
+
+            return self
+
+        self_extrapolator = self.extrapolator
+        self_extrapolator_kwargs = self.extrapolator_kwargs
+
+        self.extrapolator = extrapolator
+        self.extrapolator_kwargs = extrapolator_kwargs
+
+        # The following self-assignment is written as intended and triggers the
+        # extrapolation.
+        self[wavelengths] = self[wavelengths]
+
+        self.extrapolator = self_extrapolator
+        self.extrapolator_kwargs = self_extrapolator_kwargs
 
         return self
 
@@ -2279,9 +2553,8 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 565.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.align(shape, interpolator, interpolator_kwargs,
-                         extrapolator, extrapolator_kwargs)
+        self.interpolate(shape, interpolator, interpolator_kwargs)
+        self.extrapolate(shape, extrapolator, extrapolator_kwargs)
 
         return self
 
@@ -2359,8 +2632,17 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 560.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.trim(shape)
+        start = max(shape.start, self.shape.start)
+        end = min(shape.end, self.shape.end)
+
+        indexes = np.where(
+            np.logical_and(self._domain >= start, self._domain <= end))
+
+        wavelengths = self.wavelengths[indexes]
+        values = self.values[indexes]
+
+        self._range = None
+        self.wavelengths, self.values = wavelengths, values
 
         return self
 
@@ -2408,8 +2690,7 @@ MultiSpectralDistributions or array_like or dict_like, optional
          [ 560.            1.       ...    1.       ...    0.0143382...]]
         """
 
-        for signal in self.signals.values():
-            signal.normalise(factor)
+        self.values = self._range * (1 / np.max(self._range, axis=0) * factor)
 
         return self
 
@@ -2465,10 +2746,9 @@ MultiSpectralDistributions or array_like or dict_like, optional
 
         sds = []
         for i, signal in enumerate(self.signals.values()):
-            signal = signal.copy()
-            signal.name = '{0} - {1}'.format(self.labels[i], signal.name)
+            signal.name = '{0} - {1}'.format(self.labels[i], self.name)
             signal.strict_name = '{0} - {1}'.format(self.strict_labels[i],
-                                                    signal.strict_name)
+                                                    self.strict_name)
 
             sds.append(signal)
 
@@ -2640,7 +2920,7 @@ def sds_and_msds_to_msds(sds):
         labels = []
         strict_labels = []
         for sd_u in sds_u:
-            sd_u.align(shape)
+            sd_u = sd_u.copy().align(shape)
             values.append(sd_u.values)
             labels.append(sd_u.name)
             strict_labels.append(sd_u.strict_name)
@@ -10,7 +10,8 @@ from itertools import permutations
 from colour.colorimetry import (MSDS_CMFS, CCS_ILLUMINANTS,
                                 dominant_wavelength, complementary_wavelength,
                                 excitation_purity, colorimetric_purity)
-from colour.colorimetry.dominant import (closest_spectral_locus_wavelength)
+from colour.colorimetry.dominant import (SpectralLocusIndex,
+                                         closest_spectral_locus_wavelength)
 from colour.models import XYZ_to_xy
 from colour.utilities import ignore_numpy_errors
 
@@ -23,9 +24,9 @@ __status__ = 'Production'
 
 __all__ = [
     'CMFS_STANDARD_OBSERVER_2_DEGREE_CIE1931', 'CCS_D65',
-    'TestClosestSpectralLocusWavelength', 'TestDominantWavelength',
-    'TestComplementaryWavelength', 'TestExcitationPurity',
-    'TestColorimetricPurity'
+    'TestSpectralLocusIndex', 'TestClosestSpectralLocusWavelength',
+    'TestDominantWavelength', 'TestComplementaryWavelength',
+    'TestExcitationPurity', 'TestColorimetricPurity'
 ]
 
 CMFS_STANDARD_OBSERVER_2_DEGREE_CIE1931 = MSDS_CMFS[
@@ -33,6 +34,83 @@ CMFS_STANDARD_OBSERVER_2_DEGREE_CIE1931 = MSDS_CMFS[
 CCS_D65 = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
 
 
+class TestSpectralLocusIndex(unittest.TestCase):
+    """
+    Defines :class:`colour.colorimetry.dominant.SpectralLocusIndex` class
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._xy_s = XYZ_to_xy(CMFS_STANDARD_OBSERVER_2_DEGREE_CIE1931.values)
+        self._index = SpectralLocusIndex(self._xy_s, CCS_D65)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('xy_s', 'xy_n')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(SpectralLocusIndex))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'intersect')
+
+        for method in required_methods:
+            self.assertIn(method, dir(SpectralLocusIndex))
+
+    def test_intersect(self):
+        """
+        Tests :meth:`colour.colorimetry.dominant.SpectralLocusIndex.intersect`
+        method.
+        """
+
+        xy = np.array([
+            [0.54369557, 0.32107944],
+            [0.37605506, 0.24452225],
+            [0.31270000, 0.32900000],
+        ])
+
+        i_wl, xy_wl = self._index.intersect(xy)
+        np.testing.assert_equal(i_wl, np.array([256, 248, -1]))
+        np.testing.assert_almost_equal(
+            xy_wl,
+            np.array([
+                [0.68354746, 0.31628409],
+                [0.45723147, 0.13628148],
+                [np.nan, np.nan],
+            ]),
+            decimal=7)
+
+        i_wl, xy_wl = self._index.intersect(xy, inverse=True)
+        np.testing.assert_equal(i_wl, np.array([132, 149, -1]))
+        np.testing.assert_almost_equal(
+            xy_wl,
+            np.array([
+                [0.03647950, 0.33847127],
+                [0.01040962, 0.73207453],
+                [np.nan, np.nan],
+            ]),
+            decimal=7)
+
+        # The long wavelengths spectral locus points fold back on themselves
+        # around the achromatic stimulus, a single intersection is returned.
+        xy = self._xy_s[-1] + (self._xy_s[-1] - CCS_D65) * 1e-6
+        i_wl, xy_wl = self._index.intersect(xy)
+        self.assertGreater(
+            CMFS_STANDARD_OBSERVER_2_DEGREE_CIE1931.wavelengths[i_wl], 700)
+        np.testing.assert_almost_equal(xy_wl, self._xy_s[-1], decimal=7)
+
+
 class TestClosestSpectralLocusWavelength(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.dominant.\
@@ -96,6 +174,33 @@ closest_spectral_locus_wavelength` definition n-dimensional arrays support.
         np.testing.assert_almost_equal(i_wl, i_wl_r)
         np.testing.assert_almost_equal(xy_wl, xy_wl_r, decimal=7)
 
+    def test_achromatic_stimuli_closest_spectral_locus_wavelength(self):
+        """
+        Tests :func:`colour.colorimetry.dominant.\
+closest_spectral_locus_wavelength` definition with different achromatic
+        stimuli.
+        """
+
+        xy = np.array([
+            [0.54369557, 0.32107944],
+            [0.54369557, 0.32107944],
+            [0.37605506, 0.24452225],
+        ])
+        xy_n = np.array([
+            CCS_D65,
+            [0.34570000, 0.35850000],
+            CCS_D65,
+        ])
+
+        i_wl, xy_wl = closest_spectral_locus_wavelength(xy, xy_n, self._xy_s)
+        for i in range(len(xy)):
+            i_wl_r, xy_wl_r = closest_spectral_locus_wavelength(
+                xy[i], xy_n[i], self._xy_s)
+            self.assertEqual(i_wl[i], i_wl_r)
+            np.testing.assert_almost_equal(xy_wl[i], xy_wl_r, decimal=7)
+
+        self.assertNotEqual(i_wl[0], i_wl[1])
+
     @ignore_numpy_errors
     def test_nan_closest_spectral_locus_wavelength(self):
         """
@@ -145,6 +250,13 @@ class TestDominantWavelength(unittest.TestCase):
         np.testing.assert_almost_equal(
             xy_cwl, np.array([0.01040962, 0.73207453]), decimal=7)
 
+        xy = np.array([[0.54369557, 0.32107944], CCS_D65])
+        wl, xy_wl, xy_cwl = dominant_wavelength(
+            xy, xy_n, CMFS_STANDARD_OBSERVER_2_DEGREE_CIE1931)
+
+        np.testing.assert_equal(wl, np.array([616.0, np.nan]))
+        np.testing.assert_equal(np.isnan(xy_wl[1]), [True, True])
+
     def test_n_dimensional_dominant_wavelength(self):
         """
         Tests :func:`colour.colorimetry.dominant.dominant_wavelength`
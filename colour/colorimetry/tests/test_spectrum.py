@@ -8,9 +8,11 @@ import unittest
 import scipy
 from distutils.version import LooseVersion
 
+from colour.algebra import (CubicSplineInterpolator, LinearInterpolator,
+                            PchipInterpolator, SpragueInterpolator)
 from colour.colorimetry.spectrum import (
     SpectralShape, SpectralDistribution, MultiSpectralDistributions,
-    sds_and_msds_to_sds, sds_and_msds_to_msds)
+    resample_spectral_values, sds_and_msds_to_sds, sds_and_msds_to_msds)
 from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
@@ -1361,6 +1363,48 @@ class TestSpectralShape(unittest.TestCase):
         self.assertRaises(RuntimeError, SpectralShape().range)
 
 
+class TestResampleSpectralValues(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.spectrum.resample_spectral_values`
+    definition unit tests methods.
+    """
+
+    def test_resample_spectral_values(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.resample_spectral_values`
+        definition.
+        """
+
+        sd = SpectralDistribution(DATA_SAMPLE)
+        values = np.reshape(
+            np.vstack([sd.values, sd.values * 0.5, sd.values[::-1]] * 2),
+            (2, 3, -1))
+        shape_r = SpectralShape(350, 800, 1)
+
+        for interpolator in (SpragueInterpolator, CubicSplineInterpolator,
+                             LinearInterpolator, PchipInterpolator):
+            values_r = resample_spectral_values(values, sd.shape, shape_r,
+                                                interpolator)
+
+            self.assertTupleEqual(values_r.shape, (2, 3, 451))
+
+            for i, j in np.ndindex(2, 3):
+                sd_r = SpectralDistribution(values[i, j], sd.wavelengths)
+                sd_r.interpolate(shape_r, interpolator)
+                np.testing.assert_almost_equal(
+                    values_r[i, j], sd_r.values, decimal=7)
+
+    def test_raise_exception_resample_spectral_values(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.resample_spectral_values`
+        definition raised exception.
+        """
+
+        self.assertRaises(AssertionError, resample_spectral_values,
+                          np.ones([2, 10]), SpectralShape(340, 830, 5),
+                          SpectralShape(340, 830, 1))
+
+
 class TestSpectralDistribution(unittest.TestCase):
     """
     Defines :class:`colour.colorimetry.spectrum.SpectralDistribution`
@@ -1674,6 +1718,13 @@ MultiSpectralDistributions.__init__` method.
                 SpectralShape(380, 780, 5),
             ).wavelengths)
 
+        self.assertRaises(AssertionError, MultiSpectralDistributions, {
+            400: [1, 1],
+            500: [1, 1],
+            600: [1, 1],
+            700: [1, 1]
+        })
+
     def test_interpolate(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -1745,6 +1796,13 @@ MultiSpectralDistributions.align` method.
         shape = SpectralShape(600, 650, 1)
         self.assertEqual(msds.align(shape).shape, shape)
 
+        msds = self._sample_msds.copy().align(SpectralShape(300, 800, 1))
+        for i, sd in enumerate(self._sample_msds.to_sds()):
+            np.testing.assert_almost_equal(
+                msds.values[..., i],
+                sd.align(SpectralShape(300, 800, 1)).values,
+                decimal=7)
+
     def test_trim(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
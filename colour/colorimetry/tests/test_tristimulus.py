@@ -1106,6 +1106,34 @@ class TestMsds_to_XYZ_ASTME308(unittest.TestCase):
             TVS_D65_ASTME308_K1_MSDS,
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            msds_to_XYZ_ASTME308(
+                np.reshape(np.transpose(msds.values), (2, 6, 16)),
+                cmfs,
+                SDS_ILLUMINANTS['D65'],
+                shape=msds.shape),
+            np.reshape(TVS_D65_ASTME308_MSDS, (2, 6, 3)),
+            decimal=7)
+
+        for shape in [
+                SpectralShape(400, 700, 1),
+                SpectralShape(360, 780, 5),
+                SpectralShape(340, 830, 10),
+                SpectralShape(380, 780, 20),
+        ]:
+            msds = MSDS_TWO.copy().align(shape)
+            for method in ((True, True, True), (False, False, False)):
+                np.testing.assert_almost_equal(
+                    msds_to_XYZ_ASTME308(
+                        np.transpose(msds.values),
+                        cmfs,
+                        SDS_ILLUMINANTS['D65'],
+                        *method,
+                        shape=shape),
+                    msds_to_XYZ_ASTME308(msds, cmfs, SDS_ILLUMINANTS['D65'],
+                                         *method),
+                    decimal=7)
+
     def test_domain_range_scale_msds_to_XYZ_ASTME308(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_ASTME308`
@@ -1129,7 +1157,11 @@ class TestMsds_to_XYZ_ASTME308(unittest.TestCase):
         definition raise exception.
         """
 
-        self.assertRaises(ValueError, msds_to_XYZ_ASTME308, DATA_TWO)
+        self.assertRaises(
+            ValueError,
+            msds_to_XYZ_ASTME308,
+            DATA_TWO,
+            shape=SpectralShape(400, 700, 60))
 
 
 class TestWavelength_to_XYZ(unittest.TestCase):
@@ -41,8 +41,8 @@ from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
                                 MultiSpectralDistributions, SpectralShape,
                                 MSDS_CMFS_STANDARD_OBSERVER, sd_ones)
 from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              filter_kwargs, from_range_100,
+from colour.utilities import (CACHE_REGISTRY, CaseInsensitiveMapping,
+                              as_float_array, filter_kwargs, from_range_100,
                               get_domain_range_scale, runtime_warning, tsplit)
 
 __author__ = 'Colour Developers'
@@ -73,11 +73,17 @@ References
 SPECTRAL_SHAPE_ASTME308 : SpectralShape
 """
 
-_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = None
+_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS'.format(__name__), 64)
 
-_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = None
+_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TRISTIMULUS_WEIGHTING_FACTORS'.format(__name__), 256)
 
-_CACHE_SD_TO_XYZ = None
+_CACHE_SD_TO_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_SD_TO_XYZ'.format(__name__), 4096)
+
+_CACHE_MSDS_TO_XYZ_ASTME308 = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MSDS_TO_XYZ_ASTME308'.format(__name__), 64)
 
 
 def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
@@ -129,13 +135,10 @@ def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
            [ 0.05...,  0.99..., -0.04...]])
     """
 
-    global _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS
-    if _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS is None:
-        _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = {}
-
     hash_key = tuple([hash(arg) for arg in (interval, interval_type)])
-    if hash_key in _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS:
-        return np.copy(_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS[hash_key])
+    lica = _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS.get(hash_key)
+    if lica is not None:
+        return np.copy(lica)
 
     r_n = np.linspace(1 / interval, 1 - (1 / interval), interval - 1)
     d = 3
@@ -251,16 +254,13 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
-    global _CACHE_TRISTIMULUS_WEIGHTING_FACTORS
-    if _CACHE_TRISTIMULUS_WEIGHTING_FACTORS is None:
-        _CACHE_TRISTIMULUS_WEIGHTING_FACTORS = {}
-
     hash_key = tuple([
         hash(arg) for arg in (cmfs, illuminant, shape, k,
                               get_domain_range_scale())
     ])
-    if hash_key in _CACHE_TRISTIMULUS_WEIGHTING_FACTORS:
-        return np.copy(_CACHE_TRISTIMULUS_WEIGHTING_FACTORS[hash_key])
+    W = _CACHE_TRISTIMULUS_WEIGHTING_FACTORS.get(hash_key)
+    if W is not None:
+        return np.copy(W)
 
     Y = cmfs.values
     S = illuminant.values
@@ -903,16 +903,13 @@ def sd_to_XYZ(
     array([ 10.8404805...,   9.6838697...,   6.2115722...])
     """
 
-    global _CACHE_SD_TO_XYZ
-    if _CACHE_SD_TO_XYZ is None:
-        _CACHE_SD_TO_XYZ = {}
-
     hash_key = tuple([
         hash(arg) for arg in (sd, cmfs, illuminant, k, method,
                               tuple(kwargs.items()), get_domain_range_scale())
     ])
-    if hash_key in _CACHE_SD_TO_XYZ:
-        return np.copy(_CACHE_SD_TO_XYZ[hash_key])
+    XYZ = _CACHE_SD_TO_XYZ.get(hash_key)
+    if XYZ is not None:
+        return np.copy(XYZ)
 
     function = SD_TO_XYZ_METHODS[method]
 
@@ -1102,6 +1099,139 @@ def msds_to_XYZ_integration(
         return from_range_100(np.rollaxis(XYZ, 0, msds.ndim))
 
 
+def _tristimulus_weighting_factors_msds_ASTME308(
+        shape, cmfs, illuminant, use_practice_range, mi_5nm_omission_method,
+        mi_20nm_interpolation_method, k):
+    """
+    Returns the table of weighting factors converting multi-spectral
+    distributions with given spectral shape to *CIE XYZ* tristimulus values
+    according to practise *ASTM E308-15* method, i.e. the linear operator
+    equivalent to :func:`colour.colorimetry.sd_to_XYZ_ASTME308` definition.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the multi-spectral distributions.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    use_practice_range : bool
+        Whether to trim the colour matching functions to the practise
+        *ASTM E308-15* working wavelengths range.
+    mi_5nm_omission_method : bool
+        Whether to use a 5 nm version of the colour matching functions for 5 nm
+        measurement intervals.
+    mi_20nm_interpolation_method : bool
+        Whether to use the dedicated interpolation method for 20 nm
+        measurement intervals.
+    k : numeric
+        Normalisation constant :math:`k`.
+
+    Returns
+    -------
+    ndarray, (n, 3)
+        Weighting factors table with a row per wavelength of given spectral
+        shape.
+    """
+
+    hash_key = tuple([
+        hash(arg)
+        for arg in (shape, cmfs, illuminant, use_practice_range,
+                    mi_5nm_omission_method, mi_20nm_interpolation_method, k)
+    ])
+    if hash_key in _CACHE_MSDS_TO_XYZ_ASTME308:
+        return np.copy(_CACHE_MSDS_TO_XYZ_ASTME308[hash_key])
+
+    wavelengths = shape.range()
+    count = len(wavelengths)
+
+    if use_practice_range:
+        cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_ASTME308)
+
+    if shape.interval == 1 or (shape.interval == 5 and mi_5nm_omission_method):
+        if shape.interval == 5 and cmfs.shape.interval != 5:
+            cmfs = cmfs.copy().interpolate(SpectralShape(interval=5))
+
+        if illuminant.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+            illuminant = illuminant.copy().align(cmfs.shape)
+
+        S = illuminant.values
+        dw = cmfs.shape.interval
+
+        k = 100 / (np.sum(cmfs.values[..., 1] * S) * dw) if k is None else k
+
+        W = k * cmfs.values * S[..., np.newaxis] * dw
+
+        # The alignment of the multi-spectral distributions to the colour
+        # matching functions is linear, the table is thus aligned by aligning
+        # the identity matrix.
+        if shape != cmfs.shape:
+            runtime_warning(
+                'Aligning multi-spectral distributions shape to "{0}" colour '
+                'matching functions shape.'.format(cmfs.name))
+            A = MultiSpectralDistributions(np.identity(count),
+                                           wavelengths).align(cmfs.shape)
+            W = np.dot(np.transpose(A.values), W)
+    else:
+        indexes = np.where(
+            np.logical_and(wavelengths >= cmfs.shape.start,
+                           wavelengths <= cmfs.shape.end))[0]
+        if len(indexes) != count:
+            runtime_warning('Trimming multi-spectral distributions shape to '
+                            '"{0}" colour matching functions shape.'.format(
+                                cmfs.name))
+        wavelengths_t = wavelengths[indexes]
+        count_t = len(wavelengths_t)
+
+        interval = shape.interval
+        T = np.identity(count_t)
+        if shape.interval == 20 and mi_20nm_interpolation_method:
+            interval = 10
+
+            # Extrapolation of additional 20nm padding intervals.
+            E = np.zeros([count_t + 2, count_t])
+            E[0, :3] = [3, -3, 1]
+            E[1:-1] = np.identity(count_t)
+            E[-1, -3:] = [1, -3, 3]
+
+            # Interpolating every odd numbered values.
+            T = np.zeros([count_t * 2 - 1, count_t])
+            T[0::2] = np.identity(count_t)
+            T[1::2] = (-0.0625 * E[:-3] + 0.5625 * E[1:-2] + 0.5625 * E[2:-1] -
+                       0.0625 * E[3:])
+
+        if cmfs.shape.interval != 1:
+            runtime_warning('Interpolating "{0}" cmfs to 1nm interval.'.format(
+                cmfs.name))
+            cmfs = cmfs.copy().interpolate(SpectralShape(interval=1))
+
+        if illuminant.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+            illuminant = illuminant.copy().align(cmfs.shape)
+
+        W_t = tristimulus_weighting_factors_ASTME2022(
+            cmfs, illuminant,
+            SpectralShape(cmfs.shape.start, cmfs.shape.end, interval), k)
+        start_w = cmfs.shape.start
+        end_w = cmfs.shape.start + interval * (W_t.shape[0] - 1)
+        W_t = adjust_tristimulus_weighting_factors_ASTME308(
+            W_t, SpectralShape(start_w, end_w, interval),
+            SpectralShape(wavelengths_t[0], wavelengths_t[-1], interval))
+
+        W = np.zeros([count, 3])
+        W[indexes] = np.dot(np.transpose(T), W_t)
+
+    _CACHE_MSDS_TO_XYZ_ASTME308[hash_key] = np.copy(W)
+
+    return W
+
+
 def msds_to_XYZ_ASTME308(
         msds,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -1110,7 +1240,8 @@ def msds_to_XYZ_ASTME308(
         use_practice_range=True,
         mi_5nm_omission_method=True,
         mi_20nm_interpolation_method=True,
-        k=None):
+        k=None,
+        shape=SPECTRAL_SHAPE_DEFAULT):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
     using given colour matching functions and illuminant according to practise
@@ -1119,7 +1250,9 @@ def msds_to_XYZ_ASTME308(
     Parameters
     ----------
     msds : MultiSpectralDistributions or array_like
-        Multi-spectral distributions.
+        Multi-spectral distributions, if an *array_like* the wavelengths are
+        expected to be in the last axis, e.g. for a 512x384 multi-spectral
+        image with 31 bins, ``msds`` shape should be (384, 512, 31).
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
@@ -1152,13 +1285,13 @@ def msds_to_XYZ_ASTME308(
         be the spectral concentration of the radiometric quantity corresponding
         to the photometric quantity required.
     shape : SpectralShape, optional
-        Spectral shape of the multi-spectral distributions, ``cmfs`` and
-        ``illuminant`` will be aligned to it.
+        Spectral shape of the multi-spectral distributions array :math:`msds`.
 
     Returns
     -------
     array_like
-        *CIE XYZ* tristimulus values.
+        *CIE XYZ* tristimulus values, for a 512x384 multi-spectral image with
+        31 bins, the output shape will be (384, 512, 3).
 
     Notes
     -----
@@ -1170,16 +1303,17 @@ def msds_to_XYZ_ASTME308(
     +-----------+-----------------------+---------------+
 
     -   The code path using the *array_like* multi-spectral distributions
-        produces results different to the code path using a
-        :class:`colour.MultiSpectralDistributions` class instance: the former
-        favours execution speed by aligning the colour matching functions and
-        illuminant to the given spectral shape while the latter favours
-        precision by aligning the multi-spectral distributions to the colour
-        matching functions.
+        computes, once per spectral shape, a table of weighting factors
+        equivalent to the processing of the
+        :func:`colour.colorimetry.sd_to_XYZ_ASTME308` definition, i.e.
+        trimming, alignment, 20 nm interpolation and tristimulus weighting
+        factors, and converts all the distributions with a single dot product.
+        It produces the same results as the code path using a
+        :class:`colour.MultiSpectralDistributions` class instance.
 
     References
     ----------
-    :cite:`Wyszecki2000bf`
+    :cite:`ASTMInternational2015b`
 
     Examples
     --------
@@ -1216,6 +1350,22 @@ def msds_to_XYZ_ASTME308(
            [ 43.9113380...,  28.0003541...,  11.6852531...],
            [  8.5496209...,  19.6913570...,  17.7400079...],
            [ 23.8866733...,  26.2147704...,  30.6297684...]])
+    >>> data = np.reshape(np.transpose(msds.values), (2, 6, 16))
+    >>> msds_to_XYZ_ASTME308(data, illuminant=D65, shape=msds.shape)
+    ... # doctest: +ELLIPSIS
+    array([[[  7.5052758...,   3.9557516...,   8.38929  ...],
+            [ 26.9408494...,  15.0987746...,  28.6631260...],
+            [ 16.7047370...,  28.2089815...,  25.6556751...],
+            [ 11.5711808...,   8.6445071...,   6.5587827...],
+            [ 18.7428858...,  35.0626352...,  30.1778517...],
+            [ 45.1224886...,  39.6238997...,  43.5813345...]],
+    <BLANKLINE>
+           [[  8.1786985...,  13.0950215...,  25.9326459...],
+            [ 22.4462888...,  19.3115133...,   7.9304333...],
+            [  6.5764361...,   2.5305945...,  11.07253  ...],
+            [ 43.9113380...,  28.0003541...,  11.6852531...],
+            [  8.5496209...,  19.6913570...,  17.7400079...],
+            [ 23.8866733...,  26.2147704...,  30.6297684...]]])
     """
 
     if isinstance(msds, MultiSpectralDistributions):
@@ -1226,8 +1376,27 @@ def msds_to_XYZ_ASTME308(
             for sd in msds.to_sds()
         ])
     else:
-        raise ValueError('"ASTM E308-15" method does not support "array_like" '
-                         'multi-spectral distributions!')
+        msds = as_float_array(msds)
+
+        msd_shape_m_1, shape_wl_count = msds.shape[-1], len(shape.range())
+        assert msd_shape_m_1 == shape_wl_count, (
+            'Multi-spectral distributions array with {0} wavelengths '
+            'is not compatible with spectral shape with {1} wavelengths!'.
+            format(msd_shape_m_1, shape_wl_count))
+
+        if shape.interval not in (1, 5, 10, 20):
+            raise ValueError(
+                'Tristimulus values conversion from spectral data according '
+                'to practise "ASTM E308-15" should be performed on spectral '
+                'data with measurement interval of 1, 5, 10 or 20nm!')
+
+        W = _tristimulus_weighting_factors_msds_ASTME308(
+            shape, cmfs, illuminant, use_practice_range,
+            mi_5nm_omission_method, mi_20nm_interpolation_method, k)
+
+        XYZ = np.dot(msds, W)
+
+        return from_range_100(XYZ)
 
 
 MSDS_TO_XYZ_METHODS = CaseInsensitiveMapping({
@@ -1315,9 +1484,11 @@ def msds_to_XYZ(
         tristimulus values will use a dedicated interpolation method instead
         of a table of tristimulus weighting factors.
     shape : SpectralShape, optional
-        {:func:`colour.colorimetry.msds_to_XYZ_integration`},
+        {:func:`colour.colorimetry.msds_to_XYZ_integration`,
+        :func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
         Spectral shape of the multi-spectral distributions array :math:`msds`,
-        ``cmfs`` and ``illuminant`` will be aligned to it.
+        with the *Integration* method, ``cmfs`` and ``illuminant`` will be
+        aligned to it.
 
     Returns
     -------
@@ -1334,13 +1505,13 @@ def msds_to_XYZ(
     | ``XYZ``   | [0, 100]              | [0, 1]        |
     +-----------+-----------------------+---------------+
 
-    -   The code path using the *array_like* multi-spectral distributions
-        produces results different to the code path using a
-        :class:`colour.MultiSpectralDistributions` class instance: the former
-        favours execution speed by aligning the colour matching functions and
-        illuminant to the given spectral shape while the latter favours
-        precision by aligning the multi-spectral distributions to the colour
-        matching functions.
+    -   With the *Integration* method, the code path using the *array_like*
+        multi-spectral distributions produces results different to the code
+        path using a :class:`colour.MultiSpectralDistributions` class
+        instance: the former favours execution speed by aligning the colour
+        matching functions and illuminant to the given spectral shape while the
+        latter favours precision by aligning the multi-spectral distributions
+        to the colour matching functions.
 
     References
     ----------
@@ -1416,8 +1587,8 @@ def msds_to_XYZ(
 
     function = MSDS_TO_XYZ_METHODS[method]
 
-    return function(msds, cmfs, illuminant, k,
-                    **filter_kwargs(function, **kwargs))
+    return function(
+        msds, cmfs, illuminant, k=k, **filter_kwargs(function, **kwargs))
 
 
 def wavelength_to_XYZ(wavelength,
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 
-from .abstract import AbstractContinuousFunction
-from .signal import Signal
-from .multi_signals import MultiSignals
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'abstract': ['AbstractContinuousFunction'],
+        'signal': ['Signal'],
+        'multi_signals': ['MultiSignals']
+    })
+del lazy_module_attributes
 
 __all__ = []
 __all__ += ['AbstractContinuousFunction']
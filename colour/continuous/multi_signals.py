@@ -9,13 +9,17 @@ Defines the class implementing support for multi-continuous signals:
 """
 
 import numpy as np
+from operator import (add, mul, pow, sub, truediv, iadd, imul, ipow, isub,
+                      itruediv)
 from collections import OrderedDict
 from collections.abc import Iterator, KeysView, Mapping, Sequence, ValuesView
 
+from colour.algebra import Extrapolator, KernelInterpolator
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import AbstractContinuousFunction, Signal
-from colour.utilities import (as_float_array, first_item, is_pandas_installed,
-                              required, tsplit, tstack)
+from colour.utilities import (as_float_array, fill_nan, filter_kwargs,
+                              first_item, full, is_pandas_installed, required,
+                              runtime_warning, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -32,6 +36,11 @@ class MultiSignals(AbstractContinuousFunction):
     Defines the base class for multi-continuous signals, a container for
     multiple :class:`colour.continuous.Signal` sub-class instances.
 
+    The multi-continuous signals are stored column-wise: a single independent
+    domain :math:`x` variable is shared by the columns of a 2-dimensional
+    corresponding range :math:`y` variable and a single interpolator class
+    instance evaluates all the columns at once.
+
     .. important::
 
         Specific documentation about getting, setting, indexing and slicing the
@@ -103,6 +112,7 @@ dict_like, optional
     -   :meth:`~colour.continuous.MultiSignals.__ne__`
     -   :meth:`~colour.continuous.MultiSignals.arithmetical_operation`
     -   :meth:`~colour.continuous.MultiSignals.multi_signals_unpack_data`
+    -   :meth:`~colour.continuous.MultiSignals.multi_signals_unpack_columns`
     -   :meth:`~colour.continuous.MultiSignals.fill_nan`
     -   :meth:`~colour.continuous.MultiSignals.to_dataframe`
 
@@ -258,10 +268,43 @@ dict_like, optional
     def __init__(self, data=None, domain=None, labels=None, **kwargs):
         super(MultiSignals, self).__init__(kwargs.get('name'))
 
+        self._dtype = DEFAULT_FLOAT_DTYPE
+        self._domain = None
+        self._range = None
+        self._labels = None
+        self._interpolator = KernelInterpolator
+        self._interpolator_kwargs = {}
+        self._extrapolator = Extrapolator
+        self._extrapolator_kwargs = {
+            'method': 'Constant',
+            'left': np.nan,
+            'right': np.nan
+        }
+        self._function = None
+        self._hash = None
+
         self._signal_type = kwargs.get('signal_type', Signal)
 
-        self._signals = self.multi_signals_unpack_data(data, domain, labels,
-                                                       **kwargs)
+        # Unless explicitly given, the attributes are inherited from the
+        # multi-continuous signals being copied.
+        if isinstance(data, MultiSignals):
+            for attribute in ('dtype', 'interpolator', 'interpolator_kwargs',
+                              'extrapolator', 'extrapolator_kwargs'):
+                kwargs[attribute] = kwargs.get(attribute,
+                                               getattr(data, attribute))
+
+        self.dtype = kwargs.get('dtype')
+
+        self.domain, self.range, self.labels = (
+            self.multi_signals_unpack_columns(data, domain, labels,
+                                              self._dtype))
+
+        self.interpolator = kwargs.get('interpolator')
+        self.interpolator_kwargs = kwargs.get('interpolator_kwargs')
+        self.extrapolator = kwargs.get('extrapolator')
+        self.extrapolator_kwargs = kwargs.get('extrapolator_kwargs')
+
+        self._create_function()
 
     @property
     def dtype(self):
@@ -279,8 +322,7 @@ dict_like, optional
             Continuous signal dtype.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).dtype
+        return self._dtype
 
     @dtype.setter
     def dtype(self, value):
@@ -289,8 +331,16 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.dtype = value
+            assert value in np.sctypes['float'], (
+                '"dtype" must be one of the following types: {0}'.format(
+                    np.sctypes['float']))
+
+            self._dtype = value
+
+            # The following self-assignments are written as intended and
+            # triggers the rebuild of the underlying function.
+            self.domain = self.domain
+            self.range = self.range
 
     @property
     def domain(self):
@@ -311,8 +361,8 @@ dict_like, optional
             domain :math:`x` variable.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).domain
+        if self._domain is not None:
+            return np.copy(self._domain)
 
     @domain.setter
     def domain(self, value):
@@ -321,8 +371,27 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.domain = value
+            if not np.all(np.isfinite(value)):
+                runtime_warning(
+                    '"{0}" new "domain" variable is not finite: {1}, '
+                    'unpredictable results may occur!'.format(
+                        self.name, value))
+
+            value = np.copy(value).astype(self._dtype)
+
+            if self._range is not None:
+                if value.size != self._range.shape[0]:
+                    runtime_warning(
+                        '"{0}" new "domain" and current "range" variables '
+                        'have different size, "range" variable will be '
+                        'resized to "domain" variable shape!'.format(
+                            self.name))
+                    self._range = np.resize(
+                        self._range, (value.size, self._range.shape[-1]))
+
+            self._domain = value
+            self._function = None
+            self._hash = None
 
     @property
     def range(self):
@@ -343,8 +412,8 @@ dict_like, optional
             range :math:`y` variable.
         """
 
-        if self._signals:
-            return tstack([signal.range for signal in self._signals.values()])
+        if self._range is not None:
+            return np.copy(self._range)
 
     @range.setter
     def range(self, value):
@@ -353,18 +422,31 @@ dict_like, optional
         """
 
         if value is not None:
-            value = as_float_array(value)
+            value = as_float_array(value, self._dtype)
+
+            if not np.all(np.isfinite(value)):
+                runtime_warning(
+                    '"{0}" new "range" variable is not finite: {1}, '
+                    'unpredictable results may occur!'.format(
+                        self.name, value))
 
             if value.ndim in (0, 1):
-                for signal in self._signals.values():
-                    signal.range = value
-            else:
-                assert value.shape[-1] == len(self._signals), (
+                value = np.tile(
+                    np.reshape(value, (-1, 1)),
+                    (1, self._range.shape[-1]
+                     if self._range is not None else 1))
+            elif self._range is not None:
+                assert value.shape[-1] == self._range.shape[-1], (
                     'Corresponding "y" variable columns must have '
                     'same count than underlying "Signal" components!')
 
-                for signal, y in zip(self._signals.values(), tsplit(value)):
-                    signal.range = y
+            if self._domain is not None:
+                assert value.shape[0] == self._domain.size, (
+                    '"domain" and "range" variables must have same size!')
+
+            self._range = np.copy(value)
+            self._function = None
+            self._hash = None
 
     @property
     def interpolator(self):
@@ -385,8 +467,7 @@ dict_like, optional
             type.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).interpolator
+        return self._interpolator
 
     @interpolator.setter
     def interpolator(self, value):
@@ -395,8 +476,10 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.interpolator = value
+            # TODO: Check for interpolator capabilities.
+            self._interpolator = value
+            self._function = None
+            self._hash = None
 
     @property
     def interpolator_kwargs(self):
@@ -417,8 +500,7 @@ dict_like, optional
             instantiation time arguments.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).interpolator_kwargs
+        return self._interpolator_kwargs
 
     @interpolator_kwargs.setter
     def interpolator_kwargs(self, value):
@@ -427,8 +509,13 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.interpolator_kwargs = value
+            assert isinstance(value, (dict, OrderedDict)), (
+                '"{0}" attribute: "{1}" type is not "dict" or '
+                '"OrderedDict"!').format('interpolator_kwargs', value)
+
+            self._interpolator_kwargs = value
+            self._function = None
+            self._hash = None
 
     @property
     def extrapolator(self):
@@ -449,8 +536,7 @@ dict_like, optional
             type.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).extrapolator
+        return self._extrapolator
 
     @extrapolator.setter
     def extrapolator(self, value):
@@ -459,8 +545,10 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.extrapolator = value
+            # TODO: Check for extrapolator capabilities.
+            self._extrapolator = value
+            self._function = None
+            self._hash = None
 
     @property
     def extrapolator_kwargs(self):
@@ -481,8 +569,7 @@ dict_like, optional
             instantiation time arguments.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).extrapolator_kwargs
+        return self._extrapolator_kwargs
 
     @extrapolator_kwargs.setter
     def extrapolator_kwargs(self, value):
@@ -491,23 +578,39 @@ dict_like, optional
         """
 
         if value is not None:
-            for signal in self._signals.values():
-                signal.extrapolator_kwargs = value
+            assert isinstance(value, (dict, OrderedDict)), (
+                '"{0}" attribute: "{1}" type is not "dict" or '
+                '"OrderedDict"!').format('extrapolator_kwargs', value)
+
+            self._extrapolator_kwargs = value
+            self._function = None
+            self._hash = None
 
     @property
     def function(self):
         """
-        Getter property for the :class:`colour.continuous.Signal` sub-class
-        instances callable.
+        Getter property for the multi-continuous signals callable.
 
         Returns
         -------
         callable
-            :class:`colour.continuous.Signal` sub-class instances callable.
+            Multi-continuous signals callable evaluating all the columns at
+            once.
+
+        Notes
+        -----
+        -   The callable is created at initialisation, thus the interpolator
+            and extrapolator are validated with the initial data. It is then
+            created lazily and cached until the multi-continuous signals are
+            modified: invalid data for the interpolator or extrapolator set
+            after initialisation are only reported when the multi-continuous
+            signals are evaluated.
         """
 
-        if self._signals:
-            return first_item(self._signals.values()).function
+        if self._function is None:
+            self._create_function()
+
+        return self._function
 
     @property
     def signals(self):
@@ -525,9 +628,30 @@ or dict_like
         -------
         OrderedDict
             :class:`colour.continuous.Signal` sub-class instances.
+
+        Notes
+        -----
+        -   The :class:`colour.continuous.Signal` sub-class instances are
+            created on demand from the columns of the multi-continuous
+            signals, modifying them does not affect the multi-continuous
+            signals.
         """
 
-        return self._signals
+        signals = OrderedDict()
+
+        if self._range is not None:
+            for label, range_ in zip(self._labels, tsplit(self._range)):
+                signals[label] = self._signal_type(
+                    range_,
+                    self._domain,
+                    name=self.name,
+                    dtype=self._dtype,
+                    interpolator=self._interpolator,
+                    interpolator_kwargs=self._interpolator_kwargs,
+                    extrapolator=self._extrapolator,
+                    extrapolator_kwargs=self._extrapolator_kwargs)
+
+        return signals
 
     @signals.setter
     def signals(self, value):
@@ -536,8 +660,10 @@ or dict_like
         """
 
         if value is not None:
-            self._signals = self.multi_signals_unpack_data(
-                value, signal_type=self._signal_type)
+            self._domain, self._range, self._labels = None, None, None
+
+            self.domain, self.range, self.labels = (
+                self.multi_signals_unpack_columns(value, dtype=self._dtype))
 
     @property
     def labels(self):
@@ -557,8 +683,8 @@ or dict_like
             :class:`colour.continuous.Signal` sub-class instance name.
         """
 
-        if self._signals:
-            return list(self._signals.keys())
+        if self._labels is not None:
+            return list(self._labels)
 
     @labels.setter
     def labels(self, value):
@@ -567,11 +693,11 @@ or dict_like
         """
 
         if value is not None:
-            assert len(value) == len(self._signals), (
+            columns = self._range.shape[-1] if self._range is not None else 0
+            assert len(value) == columns, (
                 '"labels" length does not match "signals" length!')
-            self._signals = OrderedDict(
-                [(value[i], signal)
-                 for i, (_key, signal) in enumerate(self._signals.items())])
+
+            self._labels = list(value)
 
     @property
     def signal_type(self):
@@ -690,16 +816,27 @@ or dict_like
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is computed lazily and cached until the *domain*,
+            *range*, *interpolator*, *interpolator_kwargs*, *extrapolator* or
+            *extrapolator_kwargs* attributes are set, mutating the
+            *interpolator_kwargs* or *extrapolator_kwargs* attributes in place
+            does not invalidate it.
         """
 
-        return hash((
-            self.domain.tobytes(),
-            self.range.tobytes(),
-            self.interpolator.__name__,
-            repr(self.interpolator_kwargs),
-            self.extrapolator.__name__,
-            repr(self.extrapolator_kwargs),
-        ))
+        if self._hash is None:
+            self._hash = hash((
+                self._domain.tobytes(),
+                self._range.tobytes(),
+                self._interpolator.__name__,
+                repr(self._interpolator_kwargs),
+                self._extrapolator.__name__,
+                repr(self._extrapolator_kwargs),
+            ))
+
+        return self._hash
 
     def __getitem__(self, x):
         """
@@ -763,12 +900,18 @@ or dict_like
 
         x_r, x_c = (x[0], x[1]) if isinstance(x, tuple) else (x, slice(None))
 
-        if self._signals:
-            return tstack(
-                [signal[x_r] for signal in self._signals.values()])[..., x_c]
-        else:
+        if self._range is None:
             raise RuntimeError('No underlying "Signal" defined!')
 
+        if isinstance(x_r, slice):
+            return np.copy(self._range[x_r, x_c])
+        else:
+            y = self.function(np.ravel(x_r))
+
+            shape = np.shape(x_r) + (self._range.shape[-1], )
+
+            return np.reshape(y, shape)[..., x_c]
+
     def __setitem__(self, x, y):
         """
         Sets the corresponding range :math:`y` variable for independent domain
@@ -882,17 +1025,46 @@ or dict_like
             'Corresponding "y" variable must be a numeric or a 1-dimensional '
             'or 2-dimensional array!')
 
+        columns = self._range.shape[-1] if self._range is not None else 0
+
         if y.ndim == 0:
-            y = np.tile(y, len(self._signals))
+            y = np.tile(y, columns)
         elif y.ndim == 1:
             y = y[np.newaxis, :]
 
-        assert y.shape[-1] == len(self._signals), (
+        assert y.shape[-1] == columns, (
             'Corresponding "y" variable columns must have same count than '
             'underlying "Signal" components!')
 
-        for signal, y in list(zip(self._signals.values(), tsplit(y)))[x_c]:
-            signal[x_r] = y
+        if isinstance(x_r, slice):
+            self._range[x_r, x_c] = y[..., x_c]
+        else:
+            x_r = np.ravel(x_r).astype(self._dtype)
+            y = np.resize(y, (x_r.size, columns))
+
+            # Matching domain, updating existing `self._range` values.
+            mask = np.in1d(x_r, self._domain)
+            x_m = x_r[mask]
+            indexes = np.searchsorted(self._domain, x_m)
+            self._range[indexes, x_c] = y[mask][..., x_c]
+
+            # Non matching domain, inserting into existing `self.domain`
+            # and `self.range`, the columns not being set are evaluated at
+            # the inserted domain values.
+            x_nm = x_r[~mask]
+            indexes = np.searchsorted(self._domain, x_nm)
+            if indexes.size != 0:
+                y_nm = y[~mask]
+                if not (isinstance(x_c, slice) and x_c == slice(None)):
+                    y_i = self[x_nm]
+                    y_i[..., x_c] = y_nm[..., x_c]
+                    y_nm = y_i
+
+                self._domain = np.insert(self._domain, indexes, x_nm)
+                self._range = np.insert(self._range, indexes, y_nm, axis=0)
+
+        self._function = None
+        self._hash = None
 
     def __contains__(self, x):
         """
@@ -921,11 +1093,17 @@ or dict_like
         False
         """
 
-        if self._signals:
-            return x in first_item(self._signals.values())
-        else:
+        if self._domain is None:
             raise RuntimeError('No underlying "Signal" defined!')
 
+        return np.all(
+            np.where(
+                np.logical_and(x >= np.min(self._domain),
+                               x <= np.max(self._domain)),
+                True,
+                False,
+            ))
+
     def __eq__(self, other):
         """
         Returns whether the multi-continuous signals is equal to given other
@@ -1012,6 +1190,82 @@ or dict_like
 
         return not (self == other)
 
+    def _create_interpolator(self, interpolator, interpolator_kwargs):
+        """
+        Creates given interpolator class instance for the multi-continuous
+        signals columns.
+
+        Parameters
+        ----------
+        interpolator : object
+            Interpolator class type.
+        interpolator_kwargs : dict_like
+            Arguments to use when instantiating the interpolating function.
+
+        Returns
+        -------
+        object
+            Interpolator class instance.
+
+        Notes
+        -----
+        -   The interpolator class instance is given the 2-dimensional range
+            :math:`y` variable, interpolator class types that only support a
+            1-dimensional :math:`y` variable are instantiated once per column.
+        -   The interpolator class types accepting a ``dtype`` argument are
+            given the multi-continuous signals dtype so that the lazily
+            created callable does not depend on the float precision at the
+            time of its creation.
+        """
+
+        interpolator_kwargs = dict(
+            filter_kwargs(interpolator, dtype=self.dtype),
+            **interpolator_kwargs)
+
+        try:
+            return interpolator(self._domain, self._range,
+                                **interpolator_kwargs)
+        except (AssertionError, IndexError, TypeError, ValueError):
+            return _ColumnsInterpolator(interpolator, self._domain,
+                                        self._range, **interpolator_kwargs)
+
+    def _create_function(self):
+        """
+        Creates the multi-continuous signals underlying function.
+        """
+
+        if self._domain is not None and self._range is not None:
+            self._function = self._extrapolator(
+                self._create_interpolator(self._interpolator,
+                                          self._interpolator_kwargs),
+                **dict(
+                    filter_kwargs(self._extrapolator, dtype=self.dtype),
+                    **self._extrapolator_kwargs))
+        else:
+
+            def _undefined_function(*args, **kwargs):
+                """
+                Raises a :class:`RuntimeError` exception.
+
+                Other Parameters
+                ----------------
+                \\*args : list, optional
+                    Arguments.
+                \\**kwargs : dict, optional
+                    Keywords arguments.
+
+                Raises
+                ------
+                RuntimeError
+                """
+
+                raise RuntimeError(
+                    'Underlying signal interpolator function does not exists, '
+                    'please ensure you defined both '
+                    '"domain" and "range" variables!')
+
+            self._function = _undefined_function
+
     def arithmetical_operation(self, a, operation, in_place=False):
         """
         Performs given arithmetical operation with :math:`a` operand, the
@@ -1120,15 +1374,27 @@ or dict_like
          [   9.  347.  378.  409.]]
         """
 
+        operation, ioperator = {
+            '+': (add, iadd),
+            '-': (sub, isub),
+            '*': (mul, imul),
+            '/': (truediv, itruediv),
+            '**': (pow, ipow)
+        }[operation]
+
         multi_signals = self if in_place else self.copy()
 
         if isinstance(a, MultiSignals):
-            assert len(self.signals) == len(a.signals), (
+            assert len(self.labels) == len(a.labels), (
                 '"MultiSignals" operands must have same count than '
                 'underlying "Signal" components!')
-            for signal_a, signal_b in zip(multi_signals.signals.values(),
-                                          a.signals.values()):
-                signal_a.arithmetical_operation(signal_b, operation, True)
+
+            domain = multi_signals._domain
+            multi_signals[domain] = operation(multi_signals._range, a[domain])
+
+            exclusive_or = np.setxor1d(domain, a.domain)
+            multi_signals[exclusive_or] = full(
+                exclusive_or.shape + (len(a.labels), ), np.nan)
         else:
             a = as_float_array(a)
 
@@ -1137,16 +1403,13 @@ or dict_like
                 '2-dimensional array!')
 
             if a.ndim in (0, 1):
-                for signal in multi_signals.signals.values():
-                    signal.arithmetical_operation(a, operation, True)
+                a = a[..., np.newaxis]
             else:
-                assert a.shape[-1] == len(multi_signals.signals), (
+                assert a.shape[-1] == len(multi_signals.labels), (
                     'Operand "a" variable columns must have same count than '
                     'underlying "Signal" components!')
 
-                for signal, y in zip(multi_signals.signals.values(),
-                                     tsplit(a)):
-                    signal.arithmetical_operation(y, operation, True)
+            multi_signals.range = ioperator(multi_signals.range, a)
 
         return multi_signals
 
@@ -1335,33 +1598,102 @@ dict_like, optional
         if dtype is None:
             dtype = DEFAULT_FLOAT_DTYPE
 
-        # domain_u, range_u, signals = None, None, None
+        domain_u, range_u, labels_u = (
+            MultiSignals.multi_signals_unpack_columns(data, domain, labels,
+                                                      dtype))
 
         signals = OrderedDict()
 
+        if range_u is not None:
+            for label, range_ in zip(labels_u, tsplit(range_u)):
+                signals[label] = signal_type(
+                    range_, domain_u, dtype=dtype, **kwargs)
+
+        return signals
+
+    @staticmethod
+    def multi_signals_unpack_columns(data=None,
+                                     domain=None,
+                                     labels=None,
+                                     dtype=None):
+        """
+        Unpack given data for multi-continuous signals instantiation into
+        a shared independent domain :math:`x` variable, a 2-dimensional
+        corresponding range :math:`y` variable and labels.
+
+        Parameters
+        ----------
+        data : Series or Dataframe or Signal or MultiSignals or array_like or \
+dict_like, optional
+            Data to unpack for multi-continuous signals instantiation.
+        domain : array_like, optional
+            Values to initialise the independent domain :math:`x` variable
+            with. If both ``data`` and ``domain`` arguments are defined, the
+            latter will be used to initialise the independent domain
+            :math:`x` variable.
+        labels : array_like, optional
+            Names to use for the range :math:`y` variable columns.
+        dtype : type, optional
+            **{np.float16, np.float32, np.float64, np.float128}**,
+            Floating point data type.
+
+        Returns
+        -------
+        tuple
+            Independent domain :math:`x` variable, corresponding range
+            :math:`y` variable and labels.
+
+        Examples
+        --------
+        >>> domain = np.arange(100, 1100, 100)
+        >>> range_ = tstack([np.linspace(10, 100, 10)] * 3)
+        >>> range_ += np.array([0, 10, 20])
+        >>> domain, range_, labels = MultiSignals.multi_signals_unpack_columns(
+        ...     dict(zip(domain, range_)))
+        >>> print(domain)
+        [  100.   200.   300.   400.   500.   600.   700.   800.   900.  1000.]
+        >>> print(range_)
+        [[  10.   20.   30.]
+         [  20.   30.   40.]
+         [  30.   40.   50.]
+         [  40.   50.   60.]
+         [  50.   60.   70.]
+         [  60.   70.   80.]
+         [  70.   80.   90.]
+         [  80.   90.  100.]
+         [  90.  100.  110.]
+         [ 100.  110.  120.]]
+        >>> labels
+        [0, 1, 2]
+        """
+
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
+        domain_u, range_u, labels_u = None, None, None
+
         domain = list(domain) if isinstance(domain, KeysView) else domain
 
         # TODO: Implement support for Signal class passing.
         if isinstance(data, MultiSignals):
-            signals = data.signals
+            domain_u, range_u, labels_u = data.domain, data.range, data.labels
         elif (issubclass(type(data), Sequence) or
               isinstance(data,
                          (tuple, list, np.ndarray, Iterator, ValuesView))):
-            data = tsplit(
-                list(data) if isinstance(data, (Iterator,
-                                                ValuesView)) else data)
-            assert data.ndim in (1, 2), (
+            range_u = as_float_array(
+                list(data)
+                if isinstance(data, (Iterator, ValuesView)) else data, dtype)
+            assert range_u.ndim in (1, 2), (
                 'User "data" must be 1-dimensional or 2-dimensional!')
-            if data.ndim == 1:
-                data = data[np.newaxis, :]
-            for i, range_u in enumerate(data):
-                signals[i] = signal_type(
-                    range_u, domain, dtype=dtype, **kwargs)
+            if range_u.ndim == 1:
+                range_u = range_u[:, np.newaxis]
+
+            domain_u = np.arange(0, range_u.shape[0], dtype=dtype)
         elif (issubclass(type(data), Mapping) or
               isinstance(data, (dict, OrderedDict))):
 
             # Handling `MultiSignals.multi_signals_unpack_data` method output
-            # used as argument to `MultiSignals.multi_signals_unpack_data`
+            # used as argument to `MultiSignals.multi_signals_unpack_columns`
             # method.
             is_signal = all([
                 True if isinstance(i, Signal) else False
@@ -1369,43 +1701,52 @@ dict_like, optional
             ])
 
             if is_signal:
-                for label, signal in data.items():
-                    signals[label] = signal_type(
-                        signal.range, signal.domain, dtype=dtype, **kwargs)
+                if data:
+                    domain_u = first_item(data.values()).domain
+                    assert all([
+                        np.array_equal(signal.domain, domain_u)
+                        for signal in data.values()
+                    ]), ('"Signal" sub-class instances must have the same '
+                         '"domain" variable!')
+
+                    range_u = tstack(
+                        [signal.range for signal in data.values()])
+                    labels_u = list(data.keys())
             else:
                 domain_u, range_u = zip(*sorted(data.items()))
-                for i, range_u in enumerate(tsplit(range_u)):
-                    signals[i] = signal_type(
-                        range_u, domain_u, dtype=dtype, **kwargs)
+                range_u = as_float_array(range_u, dtype)
+                if range_u.ndim == 1:
+                    range_u = range_u[:, np.newaxis]
         elif is_pandas_installed():
             from pandas import DataFrame, Series
 
             if isinstance(data, Series):
-                signals[0] = signal_type(data, dtype=dtype, **kwargs)
+                domain_u = data.index.values
+                range_u = data.values[:, np.newaxis]
             elif isinstance(data, DataFrame):
                 domain_u = data.index.values
-                signals = OrderedDict(((label,
-                                        signal_type(
-                                            data[label],
-                                            domain_u,
-                                            name=label,
-                                            dtype=dtype,
-                                            **kwargs)) for label in data))
-
-        if domain is not None and signals is not None:
-            for signal in signals.values():
-                assert len(domain) == len(signal.domain), (
+                range_u = data.values
+                labels_u = list(data.columns)
+
+        if range_u is not None:
+            if domain is not None:
+                assert len(domain) == len(range_u), (
                     'User "domain" is not compatible with unpacked signals!')
-                signal.domain = domain
+                domain_u = domain
 
-        if labels is not None and signals is not None:
-            assert len(labels) == len(signals), (
-                'User "labels" is not compatible with unpacked signals!')
-            signals = OrderedDict(
-                [(labels[i], signal)
-                 for i, (_key, signal) in enumerate(signals.items())])
+            if labels is not None:
+                assert len(labels) == range_u.shape[-1], (
+                    'User "labels" is not compatible with unpacked signals!')
+                labels_u = labels
 
-        return signals
+            if labels_u is None:
+                labels_u = list(range(range_u.shape[-1]))
+
+            domain_u = as_float_array(domain_u, dtype)
+            range_u = as_float_array(range_u, dtype)
+            labels_u = list(labels_u)
+
+        return domain_u, range_u, labels_u
 
     def fill_nan(self, method='Interpolation', default=0):
         """
@@ -1467,8 +1808,19 @@ dict_like, optional
          [   9.  100.  110.  120.]]
         """
 
-        for signal in self._signals.values():
-            signal.fill_nan(method, default)
+        if self._range is not None:
+            self._domain = fill_nan(self._domain, method, default)
+
+            # Only the columns with NaNs are filled, each one independently.
+            mask = np.any(np.isnan(self._range), axis=0)
+            if np.any(mask):
+                self._range[:, mask] = np.transpose([
+                    fill_nan(range_, method, default)
+                    for range_ in np.transpose(self._range[:, mask])
+                ])
+
+            self._function = None
+            self._hash = None
 
         return self
 
@@ -1508,3 +1860,89 @@ dict_like, optional
 
         return DataFrame(
             data=self.range, index=self.domain, columns=self.labels)
+
+
+class _ColumnsInterpolator:
+    """
+    Wraps an interpolator class type only supporting a 1-dimensional
+    :math:`y` variable so that the columns of a 2-dimensional :math:`y`
+    variable are interpolated at once.
+
+    Parameters
+    ----------
+    interpolator : object
+        Interpolator class type.
+    x : array_like
+        Independent :math:`x` variable values corresponding with :math:`y`
+        variable.
+    y : array_like
+        Dependent and already known 2-dimensional :math:`y` variable values
+        to interpolate.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Arguments to use when instantiating the interpolator class type.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.continuous.multi_signals._ColumnsInterpolator.x`
+    -   :attr:`~colour.continuous.multi_signals._ColumnsInterpolator.y`
+
+    Methods
+    -------
+    -   :meth:`~colour.continuous.multi_signals._ColumnsInterpolator.__init__`
+    -   :meth:`~colour.continuous.multi_signals._ColumnsInterpolator.__call__`
+    """
+
+    def __init__(self, interpolator, x, y, **kwargs):
+        self._x = x
+        self._y = y
+        self._interpolators = [
+            interpolator(x, y_c, **kwargs) for y_c in tsplit(y)
+        ]
+
+    @property
+    def x(self):
+        """
+        Getter property for the independent :math:`x` variable.
+
+        Returns
+        -------
+        array_like
+            Independent :math:`x` variable.
+        """
+
+        return self._x
+
+    @property
+    def y(self):
+        """
+        Getter property for the dependent and already known :math:`y`
+        variable.
+
+        Returns
+        -------
+        array_like
+            Dependent and already known :math:`y` variable.
+        """
+
+        return self._y
+
+    def __call__(self, x):
+        """
+        Evaluates the interpolators at given point(s).
+
+        Parameters
+        ----------
+        x : numeric or array_like
+            Point(s) to evaluate the interpolants at.
+
+        Returns
+        -------
+        ndarray
+            Interpolated value(s).
+        """
+
+        return tstack(
+            [interpolator(x) for interpolator in self._interpolators])
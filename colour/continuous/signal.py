@@ -206,6 +206,8 @@ class Signal(AbstractContinuousFunction):
             'left': np.nan,
             'right': np.nan
         }
+        self._function = None
+        self._hash = None
 
         self.domain, self.range = self.signal_unpack_data(data, domain)
 
@@ -301,7 +303,8 @@ class Signal(AbstractContinuousFunction):
                         self._range = np.resize(self._range, value.shape)
 
                 self._domain = value
-                self._create_function()
+                self._function = None
+                self._hash = None
 
     @property
     def range(self):
@@ -344,7 +347,8 @@ class Signal(AbstractContinuousFunction):
                         '"domain" and "range" variables must have same size!')
 
                 self._range = value
-                self._create_function()
+                self._function = None
+                self._hash = None
 
     @property
     def interpolator(self):
@@ -374,7 +378,8 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for interpolator capabilities.
             self._interpolator = value
-            self._create_function()
+            self._function = None
+            self._hash = None
 
     @property
     def interpolator_kwargs(self):
@@ -409,7 +414,8 @@ class Signal(AbstractContinuousFunction):
             ).format('interpolator_kwargs', value)
 
             self._interpolator_kwargs = value
-            self._create_function()
+            self._function = None
+            self._hash = None
 
     @property
     def extrapolator(self):
@@ -439,7 +445,8 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for extrapolator capabilities.
             self._extrapolator = value
-            self._create_function()
+            self._function = None
+            self._hash = None
 
     @property
     def extrapolator_kwargs(self):
@@ -474,7 +481,8 @@ class Signal(AbstractContinuousFunction):
                 format('extrapolator_kwargs', value))
 
             self._extrapolator_kwargs = value
-            self._create_function()
+            self._function = None
+            self._hash = None
 
     @property
     def function(self):
@@ -485,8 +493,20 @@ class Signal(AbstractContinuousFunction):
         -------
         callable
             Continuous signal callable.
+
+        Notes
+        -----
+        -   The callable is created at initialisation, thus the interpolator
+            and extrapolator are validated with the initial data. It is then
+            created lazily and cached until the continuous signal is modified:
+            invalid data for the interpolator or extrapolator set after
+            initialisation are only reported when the continuous signal is
+            evaluated.
         """
 
+        if self._function is None:
+            self._create_function()
+
         return self._function
 
     def __str__(self):
@@ -579,16 +599,27 @@ class Signal(AbstractContinuousFunction):
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is computed lazily and cached until the *domain*,
+            *range*, *interpolator*, *interpolator_kwargs*, *extrapolator* or
+            *extrapolator_kwargs* attributes are set, mutating the
+            *interpolator_kwargs* or *extrapolator_kwargs* attributes in place
+            does not invalidate it.
         """
 
-        return hash((
-            self.domain.tobytes(),
-            self.range.tobytes(),
-            self.interpolator.__name__,
-            repr(self.interpolator_kwargs),
-            self.extrapolator.__name__,
-            repr(self.extrapolator_kwargs),
-        ))
+        if self._hash is None:
+            self._hash = hash((
+                self._domain.tobytes(),
+                self._range.tobytes(),
+                self._interpolator.__name__,
+                repr(self._interpolator_kwargs),
+                self._extrapolator.__name__,
+                repr(self._extrapolator_kwargs),
+            ))
+
+        return self._hash
 
     def __getitem__(self, x):
         """
@@ -634,7 +665,7 @@ class Signal(AbstractContinuousFunction):
         if isinstance(x, slice):
             return self._range[x]
         else:
-            return self._function(x)
+            return self.function(x)
 
     def __setitem__(self, x, y):
         """
@@ -724,7 +755,8 @@ class Signal(AbstractContinuousFunction):
                 self._domain = np.insert(self._domain, indexes, x_nm)
                 self._range = np.insert(self._range, indexes, y[~mask])
 
-        self._create_function()
+        self._function = None
+        self._hash = None
 
     def __contains__(self, x):
         """
@@ -899,7 +931,8 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._domain = fill_nan(self._domain, method, default)
-        self._create_function()
+        self._function = None
+        self._hash = None
 
     def _fill_range_nan(self, method='Interpolation', default=0):
         """
@@ -922,7 +955,8 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._range = fill_nan(self._range, method, default)
-        self._create_function()
+        self._function = None
+        self._hash = None
 
     def arithmetical_operation(self, a, operation, in_place=False):
         """
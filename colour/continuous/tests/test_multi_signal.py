@@ -10,7 +10,7 @@ import re
 import textwrap
 
 from colour.algebra import (CubicSplineInterpolator, Extrapolator,
-                            KernelInterpolator)
+                            KernelInterpolator, SpragueInterpolator)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import MultiSignals, Signal
 from colour.utilities import (ColourRuntimeWarning, is_pandas_installed,
@@ -65,7 +65,8 @@ class TestMultiSignals(unittest.TestCase):
         required_methods = ('__init__', '__str__', '__repr__', '__hash__',
                             '__getitem__', '__setitem__', '__contains__',
                             '__eq__', '__ne__', 'arithmetical_operation',
-                            'multi_signals_unpack_data', 'fill_nan',
+                            'multi_signals_unpack_data',
+                            'multi_signals_unpack_columns', 'fill_nan',
                             'domain_distance', 'to_dataframe')
 
         for method in required_methods:
@@ -261,6 +262,17 @@ extrapolator_kwargs` property.
         self.assertRaises((RuntimeError, TypeError),
                           MultiSignals().function, 0)
 
+        self.assertRaises(
+            AssertionError,
+            MultiSignals,
+            self._range_2[:4],
+            interpolator=SpragueInterpolator)
+
+        multi_signals = MultiSignals(
+            self._range_2, interpolator=SpragueInterpolator)
+        multi_signals.domain = self._domain_2[:4]
+        self.assertRaises(AssertionError, multi_signals.__getitem__, 0)
+
     def test_signals(self):
         """
         Tests :func:`colour.continuous.multi_signals.MultiSignals.signals`
@@ -361,6 +373,25 @@ extrapolator_kwargs` property.
 
         self.assertIsInstance(hash(self._multi_signals), int)
 
+        signal = self._multi_signals.copy()
+        signal_hash = hash(signal)
+        self.assertEqual(hash(signal), signal_hash)
+
+        signal[0] = 0
+        self.assertNotEqual(hash(signal), signal_hash)
+
+        attributes = (
+            ('domain', signal.domain + 1),
+            ('range', signal.range + 1),
+            ('interpolator_kwargs', dict(window=2)),
+            ('interpolator', CubicSplineInterpolator),
+            ('extrapolator_kwargs', dict(left=0)),
+        )
+        for attribute, value in attributes:
+            signal_hash = hash(signal)
+            setattr(signal, attribute, value)
+            self.assertNotEqual(hash(signal), signal_hash)
+
     def test__str__(self):
         """
         Tests :func:`colour.continuous.multi_signals.MultiSignals.__str__`
@@ -880,6 +911,72 @@ multi_signals_unpack_data` method.
             np.testing.assert_array_equal(signals['c'].range,
                                           self._range_1 + 20)
 
+    def test_multi_signals_unpack_columns(self):
+        """
+        Tests :func:`colour.continuous.multi_signals.MultiSignals.\
+multi_signals_unpack_columns` method.
+        """
+
+        domain, range_, labels = MultiSignals.multi_signals_unpack_columns(
+            self._range_1)
+        np.testing.assert_array_equal(domain, self._domain_1)
+        np.testing.assert_array_equal(range_, self._range_1[:, np.newaxis])
+        self.assertListEqual(labels, [0])
+
+        domain, range_, labels = MultiSignals.multi_signals_unpack_columns(
+            self._range_2, self._domain_2)
+        np.testing.assert_array_equal(domain, self._domain_2)
+        np.testing.assert_array_equal(range_, self._range_2)
+        self.assertListEqual(labels, [0, 1, 2])
+
+        domain, range_, labels = MultiSignals.multi_signals_unpack_columns(
+            dict(zip(self._domain_2, self._range_2)), labels=['a', 'b', 'c'])
+        np.testing.assert_array_equal(domain, self._domain_2)
+        np.testing.assert_array_equal(range_, self._range_2)
+        self.assertListEqual(labels, ['a', 'b', 'c'])
+
+        domain, range_, labels = MultiSignals.multi_signals_unpack_columns(
+            MultiSignals(self._range_2, self._domain_2))
+        np.testing.assert_array_equal(domain, self._domain_2)
+        np.testing.assert_array_equal(range_, self._range_2)
+        self.assertListEqual(labels, [0, 1, 2])
+
+    def test_columns_interpolation(self):
+        """
+        Tests :class:`colour.continuous.multi_signals.MultiSignals` class
+        columns interpolation consistency with
+        :class:`colour.continuous.signal.Signal` class.
+        """
+
+        x = np.linspace(0, 9, 37)
+        for interpolator in (CubicSplineInterpolator, KernelInterpolator):
+            multi_signals = MultiSignals(
+                self._range_2, interpolator=interpolator)
+            np.testing.assert_almost_equal(
+                multi_signals[x],
+                tstack([
+                    Signal(range_, interpolator=interpolator)[x]
+                    for range_ in tsplit(self._range_2)
+                ]),
+                decimal=7)
+
+        class _Interpolator1D(KernelInterpolator):
+            """
+            Interpolator only supporting a 1-dimensional :math:`y` variable.
+            """
+
+            def __init__(self, x, y, **kwargs):
+                assert np.asarray(y).ndim == 1
+
+                super(_Interpolator1D, self).__init__(x, y, **kwargs)
+
+        multi_signals = MultiSignals(
+            self._range_2, interpolator=_Interpolator1D)
+        np.testing.assert_almost_equal(
+            multi_signals[x],
+            MultiSignals(self._range_2, interpolator=KernelInterpolator)[x],
+            decimal=7)
+
     def test_fill_nan(self):
         """
         Tests :func:`colour.continuous.multi_signals.MultiSignals.fill_nan`
@@ -9,7 +9,7 @@ import re
 import textwrap
 
 from colour.algebra import (CubicSplineInterpolator, Extrapolator,
-                            KernelInterpolator)
+                            KernelInterpolator, SpragueInterpolator)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import Signal
 from colour.utilities import ColourRuntimeWarning, is_pandas_installed
@@ -216,6 +216,16 @@ class TestSignal(unittest.TestCase):
 
         self.assertRaises(RuntimeError, Signal().function, 0)
 
+        self.assertRaises(
+            AssertionError,
+            Signal,
+            self._range[:4],
+            interpolator=SpragueInterpolator)
+
+        signal = Signal(self._range, interpolator=SpragueInterpolator)
+        signal.domain = self._domain[:4]
+        self.assertRaises(AssertionError, signal.__getitem__, 0)
+
     def test__init__(self):
         """
         Tests :func:`colour.continuous.signal.Signal.__init__` method.
@@ -251,6 +261,25 @@ class TestSignal(unittest.TestCase):
 
         self.assertIsInstance(hash(self._signal), int)
 
+        signal = self._signal.copy()
+        signal_hash = hash(signal)
+        self.assertEqual(hash(signal), signal_hash)
+
+        signal[0] = 0
+        self.assertNotEqual(hash(signal), signal_hash)
+
+        attributes = (
+            ('domain', signal.domain + 1),
+            ('range', signal.range + 1),
+            ('interpolator_kwargs', dict(window=2)),
+            ('interpolator', CubicSplineInterpolator),
+            ('extrapolator_kwargs', dict(left=0)),
+        )
+        for attribute, value in attributes:
+            signal_hash = hash(signal)
+            setattr(signal, attribute, value)
+            self.assertNotEqual(hash(signal), signal_hash)
+
     def test__str__(self):
         """
         Tests :func:`colour.continuous.signal.Signal.__str__` method.
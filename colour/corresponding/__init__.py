@@ -1,15 +1,25 @@
 # -*- coding: utf-8 -*-
 
-from .datasets import *  # noqa
-from . import datasets
-from .prediction import (CorrespondingColourDataset,
-                         CorrespondingChromaticitiesPrediction,
-                         corresponding_chromaticities_prediction_CIE1994,
-                         corresponding_chromaticities_prediction_CMCCAT2000,
-                         corresponding_chromaticities_prediction_Fairchild1990,
-                         corresponding_chromaticities_prediction_VonKries,
-                         CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS,
-                         corresponding_chromaticities_prediction)
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'datasets':
+            None,
+        'prediction': [
+            'CorrespondingColourDataset',
+            'CorrespondingChromaticitiesPrediction',
+            'corresponding_chromaticities_prediction_CIE1994',
+            'corresponding_chromaticities_prediction_CMCCAT2000',
+            'corresponding_chromaticities_prediction_Fairchild1990',
+            'corresponding_chromaticities_prediction_VonKries',
+            'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
+            'corresponding_chromaticities_prediction'
+        ]
+    })
+del lazy_module_attributes
+
+from . import datasets  # noqa
 
 __all__ = []
 __all__ += datasets.__all__
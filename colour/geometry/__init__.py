@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 
-from .primitives import PLANE_TO_AXIS_MAPPING, primitive_grid, primitive_cube
-from .primitives import PRIMITIVE_METHODS, primitive
+from colour.utilities import lazy_module_attributes
 
-from .vertices import (primitive_vertices_quad_mpl,
-                       primitive_vertices_grid_mpl,
-                       primitive_vertices_cube_mpl, primitive_vertices_sphere)
-from .vertices import PRIMITIVE_VERTICES_METHODS, primitive_vertices
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'primitives': [
+            'PLANE_TO_AXIS_MAPPING', 'primitive_grid', 'primitive_cube',
+            'PRIMITIVE_METHODS', 'primitive'
+        ],
+        'vertices': [
+            'primitive_vertices_quad_mpl', 'primitive_vertices_grid_mpl',
+            'primitive_vertices_cube_mpl', 'primitive_vertices_sphere',
+            'PRIMITIVE_VERTICES_METHODS', 'primitive_vertices'
+        ]
+    })
+del lazy_module_attributes
 
 __all__ = ['PLANE_TO_AXIS_MAPPING', 'primitive_grid', 'primitive_cube']
 __all__ += ['PRIMITIVE_METHODS', 'primitive']
@@ -131,16 +131,15 @@ def primitive_grid(width=1,
     uvs[1::2] = np.repeat(1 - np.arange(y_grid1) / y_grid, x_grid1)
 
     # Faces and outline.
-    faces, outline = [], []
-    for i_y in range(y_grid):
-        for i_x in range(x_grid):
-            a = i_x + x_grid1 * i_y
-            b = i_x + x_grid1 * (i_y + 1)
-            c = (i_x + 1) + x_grid1 * (i_y + 1)
-            d = (i_x + 1) + x_grid1 * i_y
-
-            faces.extend([(a, b, d), (b, c, d)])
-            outline.extend([(a, b), (b, c), (c, d), (d, a)])
+    i_y, i_x = np.meshgrid(np.arange(y_grid), np.arange(x_grid), indexing='ij')
+
+    a = i_x + x_grid1 * i_y
+    b = i_x + x_grid1 * (i_y + 1)
+    c = (i_x + 1) + x_grid1 * (i_y + 1)
+    d = (i_x + 1) + x_grid1 * i_y
+
+    faces = np.stack([a, b, d, b, c, d], axis=-1)
+    outline = np.stack([a, b, b, c, c, d, d, a], axis=-1)
 
     positions = np.reshape(positions, (-1, 3))
     uvs = np.reshape(uvs, (-1, 2))
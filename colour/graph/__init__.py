@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 
 from .conversion import (CONVERSION_GRAPH, CONVERSION_GRAPH_NODE_LABELS,
+                         Conversion_Plan, compile_conversion,
                          describe_conversion_path, convert)
 
 __all__ = [
-    'CONVERSION_GRAPH', 'CONVERSION_GRAPH_NODE_LABELS',
-    'describe_conversion_path', 'convert'
+    'CONVERSION_GRAPH', 'CONVERSION_GRAPH_NODE_LABELS', 'Conversion_Plan',
+    'compile_conversion', 'describe_conversion_path', 'convert'
 ]
@@ -5,11 +5,14 @@ Automatic Colour Conversion Graph
 
 Defines the automatic colour conversion graph objects:
 
+-   :class:`colour.graph.Conversion_Plan`
+-   :func:`colour.compile_conversion`
 -   :func:`colour.describe_conversion_path`
 -   :func:`colour.convert`
 """
 
 import inspect
+import numpy as np
 import textwrap
 from collections import namedtuple
 from copy import copy
@@ -24,7 +27,8 @@ from colour.colorimetry import (colorimetric_purity, complementary_wavelength,
                                 luminous_efficiency, luminous_flux, sd_to_XYZ,
                                 whiteness, yellowness, wavelength_to_XYZ)
 from colour.recovery import XYZ_to_sd
-from colour.models import RGB_COLOURSPACE_sRGB
+from colour.adaptation import matrix_chromatic_adaptation_VonKries
+from colour.models import RGB_COLOURSPACES, RGB_COLOURSPACE_sRGB
 from colour.models import (
     CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
     CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
@@ -44,7 +48,8 @@ from colour.models import (
     XYZ_to_hdr_CIELab, XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY,
     YCbCr_to_RGB, YCoCg_to_RGB, YcCbcCrc_to_RGB, cctf_decoding, cctf_encoding,
     hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ, sRGB_to_XYZ, uv_to_Luv, uv_to_UCS,
-    xyY_to_XYZ, xyY_to_xy, xy_to_Luv_uv, xy_to_UCS_uv, xy_to_XYZ, xy_to_xyY)
+    matrix_RGB_to_RGB, xyY_to_XYZ, xyY_to_xy, xy_to_Luv_uv, xy_to_UCS_uv,
+    xy_to_XYZ, xy_to_xyY)
 from colour.notation import (HEX_to_RGB, RGB_to_HEX, munsell_value,
                              munsell_colour_to_xyY, xyY_to_munsell_colour)
 from colour.quality import colour_quality_scale, colour_rendering_index
@@ -54,8 +59,10 @@ from colour.appearance import (
     XYZ_to_LLAB, XYZ_to_Nayatani95, XYZ_to_RLAB)
 from colour.appearance.ciecam02 import CAM_KWARGS_CIECAM02_sRGB
 from colour.temperature import CCT_to_uv, uv_to_CCT
-from colour.utilities import (domain_range_scale, filter_kwargs, message_box,
-                              required, tsplit, tstack, usage_warning)
+from colour.utilities import (CACHE_REGISTRY, as_float_array,
+                              domain_range_scale, filter_kwargs, matrix_dot,
+                              message_box, required, tsplit, tstack,
+                              usage_warning, vector_dot)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -69,8 +76,9 @@ __all__ = [
     'JMh_CIECAM02_to_CIECAM02', 'CAM16_to_JMh_CAM16', 'JMh_CAM16_to_CAM16',
     'XYZ_to_luminance', 'RGB_luminance_to_RGB',
     'CONVERSION_SPECIFICATIONS_DATA', 'CONVERSION_GRAPH_NODE_LABELS',
-    'CONVERSION_SPECIFICATIONS', 'CONVERSION_GRAPH',
-    'describe_conversion_path', 'convert'
+    'CONVERSION_SPECIFICATIONS', 'CONVERSION_GRAPH', 'Conversion_Step',
+    'Conversion_Plan', 'compile_conversion', 'describe_conversion_path',
+    'convert'
 ]
 
 
@@ -648,6 +656,698 @@ def _lower_order_function(callable_):
     return callable_.func if isinstance(callable_, partial) else callable_
 
 
+class Conversion_Step(
+        namedtuple('Conversion_Step',
+                   ('name', 'conversion_function', 'kwargs', 'fused'))):
+    """
+    Conversion step of a *Colour* graph conversion plan describing an edge
+    of the conversion path and the keyword arguments bound to it.
+
+    Parameters
+    ----------
+    name : unicode
+        Name of the lower order conversion function, i.e. the name used to
+        pass keyword arguments explicitly to the conversion function.
+    conversion_function : callable
+        Callable converting from the edge source node to the edge target
+        node.
+    kwargs : dict
+        Filtered keyword arguments bound to the conversion function.
+    fused : tuple
+        Names of the conversion functions fused into the conversion step if
+        it results from the fusion of adjacent linear edges.
+    """
+
+    def __new__(cls, name, conversion_function, kwargs=None, fused=()):
+        if kwargs is None:
+            kwargs = {}
+
+        return super(Conversion_Step, cls).__new__(cls, name,
+                                                   conversion_function, kwargs,
+                                                   tuple(fused))
+
+
+def _decompose_XYZ_to_RGB(illuminant_XYZ,
+                          illuminant_RGB,
+                          matrix_XYZ_to_RGB,
+                          chromatic_adaptation_transform='CAT02',
+                          cctf_encoding=None,
+                          **kwargs):
+    """
+    Decomposes :func:`colour.XYZ_to_RGB` definition into its linear and
+    non-linear parts.
+    """
+
+    M = matrix_XYZ_to_RGB
+
+    if chromatic_adaptation_transform is not None:
+        M_CAT = matrix_chromatic_adaptation_VonKries(
+            xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
+            xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
+            transform=chromatic_adaptation_transform)
+
+        M = matrix_dot(matrix_XYZ_to_RGB, M_CAT)
+
+    return None, M, cctf_encoding
+
+
+def _decompose_RGB_to_XYZ(illuminant_RGB,
+                          illuminant_XYZ,
+                          matrix_RGB_to_XYZ,
+                          chromatic_adaptation_transform='CAT02',
+                          cctf_decoding=None,
+                          **kwargs):
+    """
+    Decomposes :func:`colour.RGB_to_XYZ` definition into its linear and
+    non-linear parts.
+    """
+
+    M = matrix_RGB_to_XYZ
+
+    if chromatic_adaptation_transform is not None:
+        M_CAT = matrix_chromatic_adaptation_VonKries(
+            xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
+            xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
+            transform=chromatic_adaptation_transform)
+
+        M = matrix_dot(M_CAT, matrix_RGB_to_XYZ)
+
+    return cctf_decoding, M, None
+
+
+def _decompose_XYZ_to_sRGB(illuminant,
+                           chromatic_adaptation_transform='CAT02',
+                           apply_cctf_encoding=True,
+                           **kwargs):
+    """
+    Decomposes :func:`colour.XYZ_to_sRGB` definition into its linear and
+    non-linear parts.
+    """
+
+    sRGB = RGB_COLOURSPACES['sRGB']
+    cctf_encoding = sRGB.cctf_encoding if apply_cctf_encoding else None
+
+    return _decompose_XYZ_to_RGB(illuminant, sRGB.whitepoint,
+                                 sRGB.matrix_XYZ_to_RGB,
+                                 chromatic_adaptation_transform, cctf_encoding)
+
+
+def _decompose_sRGB_to_XYZ(illuminant,
+                           chromatic_adaptation_transform='CAT02',
+                           apply_cctf_decoding=True,
+                           **kwargs):
+    """
+    Decomposes :func:`colour.sRGB_to_XYZ` definition into its linear and
+    non-linear parts.
+    """
+
+    sRGB = RGB_COLOURSPACES['sRGB']
+    cctf_decoding = sRGB.cctf_decoding if apply_cctf_decoding else None
+
+    return _decompose_RGB_to_XYZ(sRGB.whitepoint, illuminant,
+                                 sRGB.matrix_RGB_to_XYZ,
+                                 chromatic_adaptation_transform, cctf_decoding)
+
+
+def _decompose_RGB_to_RGB(input_colourspace,
+                          output_colourspace,
+                          chromatic_adaptation_transform='CAT02',
+                          apply_cctf_decoding=False,
+                          apply_cctf_encoding=False,
+                          **kwargs):
+    """
+    Decomposes :func:`colour.RGB_to_RGB` definition into its linear and
+    non-linear parts.
+    """
+
+    prologue = epilogue = None
+
+    if apply_cctf_decoding:
+        prologue = partial(
+            input_colourspace.cctf_decoding,
+            **filter_kwargs(input_colourspace.cctf_decoding, **kwargs))
+
+    if apply_cctf_encoding:
+        epilogue = partial(
+            output_colourspace.cctf_encoding,
+            **filter_kwargs(output_colourspace.cctf_encoding, **kwargs))
+
+    return prologue, matrix_RGB_to_RGB(
+        input_colourspace, output_colourspace,
+        chromatic_adaptation_transform), epilogue
+
+
+_LINEAR_CONVERSION_DECOMPOSITIONS = {
+    XYZ_to_RGB:
+        _decompose_XYZ_to_RGB,
+    RGB_to_XYZ:
+        _decompose_RGB_to_XYZ,
+    XYZ_to_sRGB:
+        _decompose_XYZ_to_sRGB,
+    sRGB_to_XYZ:
+        _decompose_sRGB_to_XYZ,
+    RGB_to_RGB:
+        _decompose_RGB_to_RGB,
+    XYZ_to_UCS:
+        lambda **kwargs: (None, np.array([
+            [2 / 3, 0, 0],
+            [0, 1, 0],
+            [-1 / 2, 3 / 2, 1 / 2],
+        ]), None),
+    UCS_to_XYZ:
+        lambda **kwargs: (None, np.array([
+            [3 / 2, 0, 0],
+            [0, 1, 0],
+            [3 / 2, -3, 2],
+        ]), None),
+}
+"""
+Conversion functions that can be decomposed into an optional non-linear
+prologue, a :math:`3 \\times 3` matrix and an optional non-linear epilogue,
+the decompositions being used to fuse adjacent linear edges.
+
+_LINEAR_CONVERSION_DECOMPOSITIONS : dict
+"""
+
+
+def _linear_decomposition(step):
+    """
+    Returns the linear decomposition of given conversion step, i.e. an
+    optional non-linear prologue, a :math:`3 \\times 3` matrix and an
+    optional non-linear epilogue.
+
+    Parameters
+    ----------
+    step : Conversion_Step
+        Conversion step to decompose.
+
+    Returns
+    -------
+    tuple or None
+        Linear decomposition or *None* if the conversion step cannot be
+        decomposed.
+    """
+
+    decomposition = _LINEAR_CONVERSION_DECOMPOSITIONS.get(
+        _lower_order_function(step.conversion_function))
+
+    if decomposition is None:
+        return None
+
+    parameters = inspect.signature(step.conversion_function).parameters
+    kwargs = {
+        name: parameter.default
+        for name, parameter in parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+    kwargs.update(step.kwargs)
+
+    try:
+        return decomposition(**kwargs)
+    except TypeError:
+        return None
+
+
+def _fused_conversion_function(prologue, M, epilogue):
+    """
+    Returns a conversion function applying given non-linear prologue,
+    :math:`3 \\times 3` matrix and non-linear epilogue.
+
+    Parameters
+    ----------
+    prologue : callable or None
+        Non-linear prologue applied before the matrix.
+    M : array_like
+        :math:`3 \\times 3` matrix.
+    epilogue : callable or None
+        Non-linear epilogue applied after the matrix.
+
+    Returns
+    -------
+    callable
+        Fused conversion function.
+    """
+
+    def fused_conversion_function(a):
+        """
+        Converts given array :math:`a` with the fused linear edges.
+        """
+
+        a = as_float_array(a)
+
+        if prologue is not None:
+            with domain_range_scale('ignore'):
+                a = prologue(a)
+
+        a = vector_dot(M, a)
+
+        if epilogue is not None:
+            with domain_range_scale('ignore'):
+                a = epilogue(a)
+
+        return a
+
+    return fused_conversion_function
+
+
+def _fuse_linear_conversion_steps(steps):
+    """
+    Fuses the runs of adjacent linear conversion steps into single conversion
+    steps performing one matrix multiplication.
+
+    A run starts with a linear conversion step whose non-linear prologue is
+    kept, and stops after a linear conversion step with a non-linear
+    epilogue, or before a non-linear conversion step.
+
+    Parameters
+    ----------
+    steps : array_like
+        Conversion steps to optimise.
+
+    Returns
+    -------
+    list
+        Optimised conversion steps.
+    """
+
+    optimised_steps, run = [], []
+
+    def fuse_run():
+        """
+        Fuses the current run of linear conversion steps.
+        """
+
+        if len(run) > 1:
+            M = np.identity(3)
+            for _step, (_prologue, M_s, _epilogue) in run:
+                M = matrix_dot(M_s, M)
+
+            names = tuple(step.name for step, _decomposition in run)
+            optimised_steps.append(
+                Conversion_Step(
+                    ' + '.join(names),
+                    _fused_conversion_function(run[0][1][0], M, run[-1][1][2]),
+                    fused=names))
+        else:
+            optimised_steps.extend(step for step, _decomposition in run)
+
+        del run[:]
+
+    for step in steps:
+        decomposition = _linear_decomposition(step)
+
+        if decomposition is None:
+            fuse_run()
+            optimised_steps.append(step)
+            continue
+
+        prologue, _M, epilogue = decomposition
+        if prologue is not None:
+            fuse_run()
+
+        run.append((step, decomposition))
+
+        if epilogue is not None:
+            fuse_run()
+
+    fuse_run()
+
+    return optimised_steps
+
+
+class Conversion_Plan:
+    """
+    Defines a compiled conversion plan from a source colour representation to
+    a target colour representation in the automatic colour conversion graph.
+
+    The conversion path is resolved and the keyword arguments are filtered
+    once at instantiation so that calling the plan only evaluates the
+    conversion functions.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+    steps : array_like
+        Conversion steps, i.e. a list of
+        :class:`colour.graph.Conversion_Step` class instances.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.graph.Conversion_Plan.source`
+    -   :attr:`~colour.graph.Conversion_Plan.target`
+    -   :attr:`~colour.graph.Conversion_Plan.steps`
+
+    Methods
+    -------
+    -   :meth:`~colour.graph.Conversion_Plan.__init__`
+    -   :meth:`~colour.graph.Conversion_Plan.__call__`
+    -   :meth:`~colour.graph.Conversion_Plan.__repr__`
+
+    Examples
+    --------
+    >>> plan = compile_conversion('CIE XYZ', 'CIE LCHab')
+    >>> plan  # doctest: +ELLIPSIS
+    Conversion_Plan('cie xyz', 'cie lchab', ['XYZ_to_Lab', 'Lab_to_LCHab'])
+    >>> plan(np.array([0.20654008, 0.12197225, 0.05136952]))
+    ... # doctest: +ELLIPSIS
+    array([ 0.4152787...,  0.5912425...,  0.0752458...])
+    """
+
+    def __init__(self, source, target, steps):
+        self._source = source
+        self._target = target
+        self._steps = tuple(steps)
+
+    @property
+    def source(self):
+        """
+        Getter property for the conversion plan source colour representation.
+
+        Returns
+        -------
+        unicode
+            Source colour representation.
+        """
+
+        return self._source
+
+    @property
+    def target(self):
+        """
+        Getter property for the conversion plan target colour representation.
+
+        Returns
+        -------
+        unicode
+            Target colour representation.
+        """
+
+        return self._target
+
+    @property
+    def steps(self):
+        """
+        Getter property for the conversion plan steps.
+
+        Returns
+        -------
+        tuple
+            Conversion steps.
+        """
+
+        return self._steps
+
+    def __call__(self, a):
+        """
+        Converts given object :math:`a` along the conversion plan.
+
+        Parameters
+        ----------
+        a : array_like or numeric or SpectralDistribution
+            Object :math:`a` to convert, it is expected to be *soft*
+            normalised to the **'1'** domain-range scale.
+
+        Returns
+        -------
+        ndarray or numeric or SpectralDistribution
+            Converted object :math:`a`.
+        """
+
+        with domain_range_scale('1'):
+            for step in self._steps:
+                a = step.conversion_function(a, **step.kwargs)
+
+        return a
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the conversion plan.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return '{0}({1!r}, {2!r}, {3!r})'.format(
+            self.__class__.__name__, self._source, self._target,
+            [step.name for step in self._steps])
+
+
+_CACHE_CONVERSION_PLANS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_CONVERSION_PLANS'.format(__name__), 128)
+"""
+Least recently used cache of compiled conversion plans.
+
+_CACHE_CONVERSION_PLANS : Cache
+"""
+
+
+def _freeze_kwargs(value):
+    """
+    Returns a hashable representation of given keyword arguments value so that
+    it can be used as a cache key.
+
+    Parameters
+    ----------
+    value : object
+        Value to freeze.
+
+    Returns
+    -------
+    object
+        Hashable representation of the value.
+
+    Raises
+    ------
+    TypeError
+        If the value cannot be represented in a hashable form.
+    """
+
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze_kwargs(item)) for key, item in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze_kwargs(item) for item in value)
+    elif isinstance(value, np.ndarray):
+        return (value.shape, value.dtype.str, value.tobytes())
+
+    hash(value)
+
+    return value
+
+
+def _copy_kwargs(value):
+    """
+    Returns a copy of given keyword arguments value whose arrays, dictionaries
+    and lists are copied so that it does not share any mutable state with the
+    caller.
+
+    Parameters
+    ----------
+    value : object
+        Value to copy.
+
+    Returns
+    -------
+    object
+        Value copy.
+    """
+
+    if isinstance(value, dict):
+        return {key: _copy_kwargs(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [_copy_kwargs(item) for item in value]
+    elif type(value) is tuple:
+        return tuple(_copy_kwargs(item) for item in value)
+    elif isinstance(value, np.ndarray):
+        return np.copy(value)
+
+    return value
+
+
+def _conversion_steps(source, target, kwargs):
+    """
+    Returns the conversion steps from given lower-cased source node to target
+    node with the keyword arguments filtered, copied and bound to the
+    conversion functions.
+
+    Parameters
+    ----------
+    source : unicode
+        Lower-cased source node.
+    target : unicode
+        Lower-cased target node.
+    kwargs : dict
+        Keyword arguments to bind to the conversion functions.
+
+    Returns
+    -------
+    list
+        Conversion steps.
+    """
+
+    steps = []
+    for conversion_function in _conversion_path(source, target):
+        conversion_function_name = _lower_order_function(
+            conversion_function).__name__
+
+        # Filtering compatible keyword arguments passed directly and
+        # irrespective of any conversion function name.
+        filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
+
+        # Filtering keyword arguments passed as dictionary with the
+        # conversion function name.
+        filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
+
+        # The steps are cached with a key built from the keyword arguments
+        # values: they must not share the caller arrays or dictionaries that
+        # could be mutated afterwards.
+        steps.append(
+            Conversion_Step(conversion_function_name, conversion_function,
+                            _copy_kwargs(filtered_kwargs)))
+
+    return steps
+
+
+def _compile_conversion(source, target, kwargs, optimise=False):
+    """
+    Builds the conversion plan from given lower-cased source node to target
+    node, the least recently used cache of compiled plans is used if the
+    keyword arguments are hashable.
+
+    Parameters
+    ----------
+    source : unicode
+        Lower-cased source node.
+    target : unicode
+        Lower-cased target node.
+    kwargs : dict
+        Keyword arguments to bind to the conversion functions.
+    optimise : bool, optional
+        Whether to fuse the adjacent linear edges of the conversion path.
+
+    Returns
+    -------
+    Conversion_Plan
+        Compiled conversion plan.
+    """
+
+    try:
+        key = (source, target, optimise, _freeze_kwargs(kwargs))
+        hash(key)
+    except TypeError:
+        key = None
+
+    if key is not None:
+        plan = _CACHE_CONVERSION_PLANS.get(key)
+        if plan is not None:
+            return plan
+
+    steps = _conversion_steps(source, target, kwargs)
+
+    if optimise:
+        steps = _fuse_linear_conversion_steps(steps)
+
+    plan = Conversion_Plan(source, target, steps)
+
+    if key is not None:
+        _CACHE_CONVERSION_PLANS[key] = plan
+
+    return plan
+
+
+def compile_conversion(source, target, optimise=True, **kwargs):
+    """
+    Compiles the conversion from source colour representation to target
+    colour representation using the automatic colour conversion graph into a
+    reusable conversion plan.
+
+    The conversion path is resolved once and the keyword arguments are
+    filtered and bound to the conversion functions once, making the returned
+    plan suitable for converting a large number of small batches. Compiled
+    plans are kept in a least recently used cache keyed by the source, the
+    target and the keyword arguments.
+
+    With optimisation enabled, the runs of adjacent edges of the conversion
+    path that are :math:`3 \\times 3` linear transformations, e.g.
+    :func:`colour.RGB_to_XYZ` definition followed by the matrix part of
+    :func:`colour.XYZ_to_sRGB` definition, are fused into a single matrix so
+    that only one :func:`colour.utilities.vector_dot` definition call and
+    intermediate array are required per run.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+    optimise : bool, optional
+        Whether to fuse the adjacent linear edges of the conversion path.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {'\\*'},
+        Please refer to the documentation of the supported conversion
+        definitions and :func:`colour.convert` definition for the keyword
+        arguments passing mechanism.
+
+    Returns
+    -------
+    Conversion_Plan
+        Compiled conversion plan.
+
+    Warnings
+    --------
+    The domain-range scale is **'1'** and cannot be changed.
+
+    Notes
+    -----
+    -   The keyword arguments are copied and bound at compile time: mutating
+        an array, a dictionary or a list passed as keyword argument after
+        compilation does not affect the compiled plan nor the cached plans.
+    -   Plans whose keyword arguments cannot be hashed are compiled on each
+        call and not cached.
+    -   The fused edges are reported by the
+        :func:`colour.describe_conversion_path` definition and are available
+        with the :attr:`colour.graph.Conversion_Step.fused` attribute of the
+        plan steps.
+
+    Examples
+    --------
+    >>> plan = compile_conversion('CIE XYZ', 'sRGB')
+    >>> plan(np.array([0.20654008, 0.12197225, 0.05136952]))
+    ... # doctest: +ELLIPSIS
+    array([ 0.7057393...,  0.1924826...,  0.2235416...])
+    >>> compile_conversion('CIE XYZ', 'sRGB') is plan
+    True
+    >>> compile_conversion('RGB', 'sRGB')  # doctest: +ELLIPSIS
+    Conversion_Plan('rgb', 'srgb', ['RGB_to_XYZ + XYZ_to_sRGB'])
+    """
+
+    # TODO: Remove the following warning whenever the automatic colour
+    # conversion graph implementation is considered stable.
+    usage_warning(
+        'The "Automatic Colour Conversion Graph" is a beta feature, be '
+        'mindful of this when using it. Please report any unexpected '
+        'behaviour and do not hesitate to ask any questions should they arise.'
+        '\nThis warning can be disabled with the '
+        '"colour.utilities.suppress_warnings" context manager as follows:\n'
+        'with colour.utilities.suppress_warnings(colour_usage_warnings=True): '
+        '\n    compile_conversion(*args, **kwargs)')
+
+    return _compile_conversion(source.lower(), target.lower(), kwargs,
+                               optimise)
+
+
 def describe_conversion_path(source,
                              target,
                              mode='Short',
@@ -685,6 +1385,12 @@ def describe_conversion_path(source,
         {:func:`colour.convert`},
         Please refer to the documentation of the previously listed definition.
 
+    Notes
+    -----
+    -   The runs of adjacent linear edges fused by the compiled conversion
+        plans returned by the :func:`colour.compile_conversion` definition are
+        reported in a dedicated *Fused Linear Stages* message box.
+
     Examples
     --------
     >>> describe_conversion_path('Spectral Distribution', 'sRGB', width=75)
@@ -695,6 +1401,21 @@ def describe_conversion_path(source,
     *   "sd_to_XYZ" --> "XYZ_to_sRGB"                                         *
     *                                                                         *
     ===========================================================================
+    >>> describe_conversion_path('RGB', 'sRGB', width=75)
+    ===========================================================================
+    *                                                                         *
+    *   [ Conversion Path ]                                                   *
+    *                                                                         *
+    *   "RGB_to_XYZ" --> "XYZ_to_sRGB"                                        *
+    *                                                                         *
+    ===========================================================================
+    ===========================================================================
+    *                                                                         *
+    *   [ Fused Linear Stages ]                                               *
+    *                                                                         *
+    *   "RGB_to_XYZ" --> "XYZ_to_sRGB"                                        *
+    *                                                                         *
+    ===========================================================================
     """
 
     try:  # pragma: no cover
@@ -714,6 +1435,28 @@ def describe_conversion_path(source,
             for conversion_function in conversion_path
         ])), width, padding, print_callable)
 
+    # Reporting the adjacent linear edges fused by the compiled conversion
+    # plans, the conversion outputs passed by :func:`colour.convert` definition
+    # are not conversion function arguments and are discarded.
+    fused_steps = [
+        step for step in _fuse_linear_conversion_steps(
+            _conversion_steps(
+                source, target, {
+                    key: ({
+                        name: argument
+                        for name, argument in value.items() if name != 'return'
+                    } if isinstance(value, dict) else value)
+                    for key, value in kwargs.items()
+                })) if step.fused
+    ]
+
+    if fused_steps:
+        message_box(
+            '[ Fused Linear Stages ]\n\n{0}'.format('\n'.join([
+                ' --> '.join(['"{0}"'.format(name) for name in step.fused])
+                for step in fused_steps
+            ])), width, padding, print_callable)
+
     for conversion_function in conversion_path:
         conversion_function_name = _lower_order_function(
             conversion_function).__name__
@@ -959,27 +1702,16 @@ verbose={'mode': 'Long'})
 
     source, target = source.lower(), target.lower()
 
-    conversion_path = _conversion_path(source, target)
+    plan = _compile_conversion(source, target, kwargs)
 
     verbose_kwargs = copy(kwargs)
-    for conversion_function in conversion_path:
-        conversion_function_name = _lower_order_function(
-            conversion_function).__name__
-
-        # Filtering compatible keyword arguments passed directly and
-        # irrespective of any conversion function name.
-        filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
-
-        # Filtering keyword arguments passed as dictionary with the
-        # conversion function name.
-        filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
-
-        a = conversion_function(a, **filtered_kwargs)
+    for step in plan.steps:
+        a = step.conversion_function(a, **step.kwargs)
 
-        if conversion_function_name in verbose_kwargs:
-            verbose_kwargs[conversion_function_name]['return'] = a
+        if step.name in verbose_kwargs:
+            verbose_kwargs[step.name]['return'] = a
         else:
-            verbose_kwargs[conversion_function_name] = {'return': a}
+            verbose_kwargs[step.name] = {'return': a}
 
     if 'verbose' in verbose_kwargs:
         verbose_kwargs.update(verbose_kwargs.pop('verbose'))
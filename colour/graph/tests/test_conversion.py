@@ -9,7 +9,8 @@ import unittest
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import CCS_ILLUMINANTS, SDS_ILLUMINANTS
 from colour.models import COLOURSPACE_MODELS, RGB_COLOURSPACE_ACES2065_1
-from colour.graph import describe_conversion_path, convert
+from colour.graph import (compile_conversion, describe_conversion_path,
+                          convert)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -18,7 +19,144 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestDescribeConversionPath', 'TestConvert']
+__all__ = [
+    'TestCompileConversion', 'TestDescribeConversionPath', 'TestConvert'
+]
+
+
+class TestCompileConversion(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.compile_conversion` definition unit
+    tests methods.
+    """
+
+    def test_compile_conversion(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition.
+        """
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+
+        plan = compile_conversion('CIE XYZ', 'sRGB')
+        self.assertEqual(plan.source, 'cie xyz')
+        self.assertEqual(plan.target, 'srgb')
+        self.assertListEqual([step.name for step in plan.steps],
+                             ['XYZ_to_sRGB'])
+        np.testing.assert_almost_equal(
+            plan(a), convert(a, 'CIE XYZ', 'sRGB'), decimal=7)
+
+        a = np.tile(a, (4, 3, 1))
+        np.testing.assert_almost_equal(
+            plan(a), convert(a, 'CIE XYZ', 'sRGB'), decimal=7)
+
+        illuminant = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50']
+        plan = compile_conversion(
+            'CIE XYZ', 'CIE LCHab', XYZ_to_Lab={'illuminant': illuminant})
+        np.testing.assert_almost_equal(
+            plan(a),
+            convert(
+                a,
+                'CIE XYZ',
+                'CIE LCHab',
+                XYZ_to_Lab={'illuminant': illuminant}),
+            decimal=7)
+
+    def test_compile_conversion_optimise(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition
+        fusion of adjacent linear edges.
+        """
+
+        a = np.array([0.45620519, 0.03081071, 0.04091952])
+        a = np.tile(a, (4, 3, 1))
+
+        plan = compile_conversion('RGB', 'sRGB')
+        self.assertTupleEqual(plan.steps[0].fused,
+                              ('RGB_to_XYZ', 'XYZ_to_sRGB'))
+        np.testing.assert_almost_equal(
+            plan(a), convert(a, 'RGB', 'sRGB'), decimal=7)
+
+        plan = compile_conversion('RGB', 'sRGB', optimise=False)
+        self.assertTupleEqual(plan.steps[0].fused, ())
+        self.assertEqual(len(plan.steps), 2)
+
+        plan = compile_conversion('sRGB', 'Output-Referred RGB')
+        self.assertListEqual([step.fused for step in plan.steps],
+                             [('sRGB_to_XYZ', 'XYZ_to_RGB'), ()])
+        np.testing.assert_almost_equal(
+            plan(a), convert(a, 'sRGB', 'Output-Referred RGB'), decimal=7)
+
+        plan = compile_conversion(
+            'Scene-Referred RGB',
+            'CIE UCS',
+            RGB_to_RGB={'output_colourspace': RGB_COLOURSPACE_ACES2065_1})
+        self.assertTupleEqual(plan.steps[0].fused,
+                              ('RGB_to_RGB', 'RGB_to_XYZ', 'XYZ_to_UCS'))
+        np.testing.assert_almost_equal(
+            plan(a),
+            convert(
+                a,
+                'Scene-Referred RGB',
+                'CIE UCS',
+                RGB_to_RGB={'output_colourspace': RGB_COLOURSPACE_ACES2065_1}),
+            decimal=7)
+
+        plan = compile_conversion(
+            'RGB',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'apply_cctf_encoding': True})
+        self.assertTupleEqual(plan.steps[0].fused, ())
+
+    def test_compile_conversion_cache(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition
+        plans caching.
+        """
+
+        illuminant = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50']
+
+        self.assertIs(
+            compile_conversion('CIE XYZ', 'CIE Lab', illuminant=illuminant),
+            compile_conversion(
+                'CIE XYZ', 'CIE Lab', illuminant=np.copy(illuminant)))
+
+        self.assertIsNot(
+            compile_conversion('CIE XYZ', 'CIE Lab', illuminant=illuminant),
+            compile_conversion('CIE XYZ', 'CIE Lab'))
+
+    def test_compile_conversion_mutated_kwargs(self):
+        """
+        Tests :func:`colour.graph.conversion.compile_conversion` definition
+        independence from the keyword arguments mutated after compilation.
+        """
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+        Lab = np.array([0.41527875, 0.51193542, 0.19918431])
+        xy = np.array([0.3457, 0.3585])
+
+        illuminant = np.copy(xy)
+        plan = compile_conversion('CIE XYZ', 'CIE Lab', illuminant=illuminant)
+        illuminant *= 0.5
+        np.testing.assert_almost_equal(plan(a), Lab, decimal=7)
+
+        illuminant = np.copy(xy)
+        convert(a, 'CIE XYZ', 'CIE Lab', illuminant=illuminant)
+        illuminant *= 0.5
+        np.testing.assert_almost_equal(
+            convert(a, 'CIE XYZ', 'CIE Lab', illuminant=np.copy(xy)),
+            Lab,
+            decimal=7)
+
+        XYZ_to_Lab = {'illuminant': np.copy(xy)}
+        convert(a, 'CIE XYZ', 'CIE Lab', XYZ_to_Lab=XYZ_to_Lab)
+        XYZ_to_Lab['illuminant'] *= 0.5
+        XYZ_to_Lab = {'illuminant': np.copy(xy)}
+        np.testing.assert_almost_equal(
+            convert(a, 'CIE XYZ', 'CIE Lab', XYZ_to_Lab=XYZ_to_Lab),
+            Lab,
+            decimal=7)
 
 
 class TestDescribeConversionPath(unittest.TestCase):
@@ -1,16 +1,32 @@
 # -*- coding: utf-8 -*-
 
-from .luts import *  # noqa
-from . import luts
-from .image import ImageAttribute_Specification, convert_bit_depth
-from .image import read_image_OpenImageIO, write_image_OpenImageIO
-from .image import read_image_Imageio, write_image_Imageio
-from .image import READ_IMAGE_METHODS, WRITE_IMAGE_METHODS
-from .image import read_image, write_image
-from .tabular import (read_spectral_data_from_csv_file, read_sds_from_csv_file,
-                      write_sds_to_csv_file)
-from .tm2714 import SpectralDistribution_IESTM2714
-from .xrite import read_sds_from_xrite_file
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'luts':
+            None,
+        'image': [
+            'ImageAttribute_Specification', 'convert_bit_depth',
+            'read_image_OpenImageIO', 'write_image_OpenImageIO',
+            'read_image_Imageio', 'write_image_Imageio', 'READ_IMAGE_METHODS',
+            'WRITE_IMAGE_METHODS', 'read_image', 'write_image'
+        ],
+        'spectral_image': [
+            'SPECTRAL_IMAGE_INTERLEAVES', 'SPECTRAL_IMAGE_TILE_MEMORY',
+            'read_spectral_image', 'spectral_image_to_XYZ',
+            'spectral_image_to_RGB'
+        ],
+        'tabular': [
+            'read_spectral_data_from_csv_file', 'read_sds_from_csv_file',
+            'write_sds_to_csv_file'
+        ],
+        'tm2714': ['SpectralDistribution_IESTM2714'],
+        'xrite': ['read_sds_from_xrite_file']
+    })
+del lazy_module_attributes
+
+from . import luts  # noqa
 
 __all__ = []
 __all__ += luts.__all__
@@ -19,6 +35,10 @@ __all__ += ['read_image_OpenImageIO', 'write_image_OpenImageIO']
 __all__ += ['read_image_Imageio', 'write_image_Imageio']
 __all__ += ['READ_IMAGE_METHODS', 'WRITE_IMAGE_METHODS']
 __all__ += ['read_image', 'write_image']
+__all__ += [
+    'SPECTRAL_IMAGE_INTERLEAVES', 'SPECTRAL_IMAGE_TILE_MEMORY',
+    'read_spectral_image', 'spectral_image_to_XYZ', 'spectral_image_to_RGB'
+]
 __all__ += [
     'read_spectral_data_from_csv_file', 'read_sds_from_csv_file',
     'write_sds_to_csv_file'
@@ -22,6 +22,7 @@ from .resolve_cube import read_LUT_ResolveCube, write_LUT_ResolveCube
 from .sony_spi1d import read_LUT_SonySPI1D, write_LUT_SonySPI1D
 from .sony_spi3d import read_LUT_SonySPI3D, write_LUT_SonySPI3D
 from .cinespace_csp import read_LUT_Cinespace, write_LUT_Cinespace
+from .bake import LUT_BAKING_SHAPERS, LUTBaking_Specification, bake_LUT
 
 __all__ = [
     'AbstractLUTSequenceOperator', 'LUT1D', 'LUT3x1D', 'LUT3D', 'LUTSequence',
@@ -32,6 +33,7 @@ __all__ += ['read_LUT_ResolveCube', 'write_LUT_ResolveCube']
 __all__ += ['read_LUT_SonySPI1D', 'write_LUT_SonySPI1D']
 __all__ += ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
 __all__ += ['read_LUT_Cinespace', 'write_LUT_Cinespace']
+__all__ += ['LUT_BAKING_SHAPERS', 'LUTBaking_Specification', 'bake_LUT']
 
 EXTENSION_TO_LUT_FORMAT_MAPPING = CaseInsensitiveMapping({
     '.cube': 'Iridas Cube',
@@ -79,6 +81,15 @@ def read_LUT(path, method=None, **kwargs):
         'Sony SPI3D'}**, Reading method, if *None*, the method will be
         auto-detected according to extension.
 
+    Other Parameters
+    ----------------
+    cache : bool, optional
+        {:func:`colour.io.read_LUT_Cinespace`,
+        :func:`colour.io.read_LUT_IridasCube`,
+        :func:`colour.io.read_LUT_SonySPI3D`},
+        Whether to read the table from a binary sidecar cache, written next to
+        the *LUT* file on the first read.
+
     Returns
     -------
     LUT1D or LUT3x1D or LUT3D
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+LUT Baking
+==========
+
+Defines the objects baking a colour conversion into a *LUT* sequence:
+
+-   :attr:`colour.io.LUT_BAKING_SHAPERS`
+-   :class:`colour.io.LUTBaking_Specification`
+-   :func:`colour.io.bake_LUT`
+"""
+
+import numpy as np
+from collections import namedtuple
+
+from colour.algebra import table_interpolation_trilinear
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
+from colour.io.luts import LUT3x1D, LUT3D, LUTSequence
+from colour.models import eotf_inverse_ST2084, log_encoding_Log2
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              as_int_array, is_string)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['LUT_BAKING_SHAPERS', 'LUTBaking_Specification', 'bake_LUT']
+
+LUT_BAKING_SHAPERS = CaseInsensitiveMapping({
+    'Log2': log_encoding_Log2,
+    'ST 2084': eotf_inverse_ST2084,
+})
+LUT_BAKING_SHAPERS.__doc__ = """
+Supported *LUT* baking shaper encodings.
+
+LUT_BAKING_SHAPERS : CaseInsensitiveMapping
+    **{'Log2', 'ST 2084'}**
+"""
+
+
+class LUTBaking_Specification(
+        namedtuple('LUTBaking_Specification',
+                   ('LUT', 'samples', 'error_maximum', 'error_mean'))):
+    """
+    Defines the *LUT* baking specification.
+
+    Parameters
+    ----------
+    LUT : LUTSequence
+        Baked *LUT* sequence.
+    samples : ndarray
+        Validation samples.
+    error_maximum : numeric
+        Maximum absolute error of the baked *LUT* sequence against the exact
+        conversion on the validation samples.
+    error_mean : numeric
+        Mean absolute error of the baked *LUT* sequence against the exact
+        conversion on the validation samples.
+    """
+
+
+def _evaluate_chunked(function, samples, chunk_size):
+    """
+    Evaluates given function on given samples by contiguous chunks of given
+    size.
+
+    Parameters
+    ----------
+    function : callable
+        Function to evaluate, must return an array with the same shape than
+        the chunk it is called with.
+    samples : array_like
+        Samples to evaluate the function on.
+    chunk_size : int
+        Number of samples evaluated per function call.
+
+    Returns
+    -------
+    ndarray
+        Function values.
+    """
+
+    samples = as_float_array(samples)
+    flat = np.reshape(samples, (-1, 3))
+
+    values = np.empty(flat.shape, dtype=DEFAULT_FLOAT_DTYPE)
+    for i in range(0, len(flat), chunk_size):
+        chunk = flat[i:i + chunk_size]
+        value = as_float_array(function(chunk))
+
+        assert value.size == chunk.size, (
+            'The conversion must return an array with the same shape than '
+            'its input!')
+
+        values[i:i + chunk_size] = np.reshape(value, chunk.shape)
+
+    return np.reshape(values, samples.shape)
+
+
+def bake_LUT(conversion,
+             size=33,
+             domain=np.array([[0, 0, 0], [1, 1, 1]]),
+             shaper=None,
+             shaper_size=4096,
+             shaper_kwargs=None,
+             chunk_size=65536,
+             validation=4096,
+             interpolator_3D=table_interpolation_trilinear,
+             name=None,
+             additional_data=False,
+             **kwargs):
+    """
+    Bakes given conversion into a *LUT* sequence made of a shaper
+    :class:`colour.LUT3x1D` class instance followed by a
+    :class:`colour.LUT3D` class instance and measures its error against the
+    exact conversion.
+
+    Parameters
+    ----------
+    conversion : callable or tuple
+        Conversion to bake, either a callable converting an array of shape
+        (..., 3) to an array of the same shape or a (source, target) tuple of
+        colour representations compiled with the automatic colour conversion
+        graph, i.e. with :func:`colour.graph.compile_conversion` definition.
+    size : int, optional
+        :class:`colour.LUT3D` class instance size.
+    domain : array_like, optional
+        Input domain of the *LUT* sequence.
+    shaper : unicode or callable, optional
+        **{None, 'Log2', 'ST 2084'}**,
+        Monotonically increasing shaper encoding distributing the
+        :class:`colour.LUT3D` class instance samples over the domain, if
+        *None*, the samples are evenly spaced.
+    shaper_size : int, optional
+        Shaper :class:`colour.LUT3x1D` class instance size.
+    shaper_kwargs : dict_like, optional
+        Arguments to use when calling the shaper encoding.
+    chunk_size : int, optional
+        Number of samples per conversion call.
+    validation : int or array_like, optional
+        Validation samples count, randomly distributed in the shaper encoded
+        space, or validation samples, the error of the baked *LUT* sequence
+        against the exact conversion is measured on the validation samples
+        and reported in the :class:`colour.LUT3D` class instance comments.
+    interpolator_3D : object, optional
+        Interpolator object used to apply the :class:`colour.LUT3D` class
+        instance on the validation samples.
+    name : unicode, optional
+        *LUT* sequence name.
+    additional_data : bool, optional
+        Whether to output additional data.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.graph.compile_conversion`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    LUTSequence or LUTBaking_Specification
+        Baked *LUT* sequence or *LUT* baking specification.
+
+    Notes
+    -----
+    -   The shaper encoding is sampled over the domain and normalised to
+        domain [0, 1], the :class:`colour.LUT3D` class instance samples are
+        placed with the exact inverse of the resulting piecewise linear
+        shaper so that the baked *LUT* sequence reproduces the conversion at
+        the nodes of its grid.
+    -   The domain of the shaper :class:`colour.LUT3x1D` class instance is
+        implicit and the baked *LUT* sequence can be written with
+        :func:`colour.write_LUT` definition, e.g. in the *Resolve Cube*
+        format, provided that the domain is the same for the three channels.
+    -   With a (source, target) tuple conversion, the domain-range scale is
+        **'1'**.
+
+    Examples
+    --------
+    >>> domain = np.array([[0.001, 0.001, 0.001], [1, 1, 1]])
+    >>> LUT = bake_LUT(lambda RGB: RGB ** (1 / 2.2), 17, domain, 'Log2')
+    >>> LUT.apply(np.array([0.18, 0.18, 0.18]))  # doctest: +ELLIPSIS
+    array([ 0.4589134...,  0.4589134...,  0.4589134...])
+    >>> LUT[1].comments
+    ['Maximum error: 4.3686696e-03', 'Mean error: 9.7572127e-04']
+    >>> specification = bake_LUT(
+    ...     ('sRGB', 'CIE XYZ'), 17, additional_data=True)
+    >>> specification.error_maximum  # doctest: +ELLIPSIS
+    0.0015574...
+    """
+
+    if name is None:
+        name = 'Baked LUT'
+
+    if shaper_kwargs is None:
+        shaper_kwargs = {}
+
+    if not callable(conversion):
+        from colour.graph import compile_conversion
+
+        conversion = compile_conversion(*conversion, **kwargs)
+
+    domain = as_float_array(domain)
+    chunk_size = DEFAULT_INT_DTYPE(chunk_size)
+
+    if shaper is None:
+        shaper_samples = domain
+        shaper_table = LUT3x1D.linear_table(2)
+    else:
+        if is_string(shaper):
+            shaper = LUT_BAKING_SHAPERS[shaper]
+
+        shaper_samples = LUT3x1D.linear_table(shaper_size, domain)
+        shaper_table = as_float_array(shaper(shaper_samples, **shaper_kwargs))
+
+        assert np.all(np.isfinite(shaper_table)), (
+            '"shaper" must be finite over the "domain"!')
+
+        shaper_table = ((shaper_table - shaper_table[0]) /
+                        (shaper_table[-1] - shaper_table[0]))
+
+        assert np.all(np.diff(shaper_table, axis=0) >= 0), (
+            '"shaper" must be monotonically increasing over the "domain"!')
+
+    def shaper_decoding(encoded):
+        """
+        Decodes given shaper encoded values with the exact inverse of the
+        piecewise linear shaper.
+        """
+
+        return np.stack(
+            [
+                np.interp(encoded[..., i], shaper_table[..., i],
+                          shaper_samples[..., i]) for i in range(3)
+            ],
+            axis=-1)
+
+    shaper_LUT = LUT3x1D(shaper_table, '{0} - Shaper'.format(name),
+                         domain[[0, -1]])
+    cube_samples = shaper_decoding(LUT3D.linear_table(size))
+    cube_LUT = LUT3D(
+        _evaluate_chunked(conversion, cube_samples, chunk_size), name)
+
+    LUT = LUTSequence(shaper_LUT, cube_LUT)
+
+    if np.ndim(validation) == 0:
+        random_state = np.random.RandomState(4)
+        samples = shaper_decoding(
+            random_state.uniform(0, 1, (as_int_array(validation), 3)))
+    else:
+        samples = np.reshape(as_float_array(validation), (-1, 3))
+
+    differences = np.abs(
+        _evaluate_chunked(
+            lambda a: LUT.apply(a, interpolator_3D=interpolator_3D), samples,
+            chunk_size) - _evaluate_chunked(conversion, samples, chunk_size))
+    error_maximum = np.nanmax(differences)
+    error_mean = np.nanmean(differences)
+
+    cube_LUT.comments = [
+        'Maximum error: {0:.7e}'.format(error_maximum),
+        'Mean error: {0:.7e}'.format(error_mean),
+    ]
+
+    if additional_data:
+        return LUTBaking_Specification(LUT, samples, error_maximum, error_mean)
+    else:
+        return LUT
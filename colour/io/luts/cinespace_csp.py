@@ -19,6 +19,8 @@ References
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
+from colour.io.luts.common import (read_LUT_body, read_LUT_header,
+                                   read_LUT_table)
 from colour.utilities import tsplit, tstack, as_float_array, as_int_array
 
 __author__ = 'Colour Developers'
@@ -31,7 +33,7 @@ __status__ = 'Production'
 __all__ = ['read_LUT_Cinespace', 'write_LUT_Cinespace']
 
 
-def read_LUT_Cinespace(path):
+def read_LUT_Cinespace(path, cache=False):
     """
     Reads given *Cinespace* *.csp* *LUT* file.
 
@@ -39,6 +41,11 @@ def read_LUT_Cinespace(path):
     ----------
     path : unicode
         *LUT* path.
+    cache : bool, optional
+        Whether to read the table from a binary sidecar cache, written next to
+        the *LUT* file on the first read, see
+        :func:`colour.io.luts.common.read_LUT_table` definition. The cached
+        table is memory-mapped in copy-on-write mode.
 
     Returns
     -------
@@ -115,104 +122,112 @@ def read_LUT_Cinespace(path):
 
         return pre_LUT
 
-    def _parse_table_section(lines):
+    def _is_table_line(line, lines):
         """
-        Parses the table at given lines.
+        Returns whether given line is the first table line, i.e. the line
+        following the pre-LUT and table size lines.
         """
 
-        size = as_int_array(lines[0].split())
-        table = as_float_array([line.split() for line in lines[1:]])
-
-        return size, table
-
-    with open(path) as csp_file:
-        lines = csp_file.readlines()
-        assert len(lines) > 0, 'LUT file empty!'
-        lines = [line.strip() for line in lines if line.strip()]
-
-        header = lines[0]
-        assert header == 'CSPLUTV100', 'Invalid header!'
-
-        kind = lines[1]
-        assert kind in ('1D', '3D'), 'Invalid kind!'
-
-        is_3D = kind == '3D'
-
-        seek = 2
-        metadata = []
-        is_metadata = False
-        for i, line in enumerate(lines[2:]):
-            line = line.strip()
-            if line == 'BEGIN METADATA':
-                is_metadata = True
-                continue
-            elif line == 'END METADATA':
-                seek += i
-                break
-
-            if is_metadata:
-                metadata.append(line)
-
-        title, comments = _parse_metadata_section(metadata)
-
-        seek += 1
-        pre_LUT = _parse_domain_section(lines[seek:seek + 9])
-
-        seek += 9
-        size, table = _parse_table_section(lines[seek:])
-
-        assert np.product(size) == len(table), 'Invalid table size!'
-
-        if (is_3D and pre_LUT.shape == (6, 2) and np.array_equal(
-                pre_LUT.reshape(3, 4).transpose()[2:4], unity_range)):
-            table = table.reshape([size[0], size[1], size[2], 3], order='F')
-            LUT = LUT3D(
-                domain=pre_LUT.reshape(3, 4).transpose()[0:2],
-                name=title,
-                comments=comments,
-                table=table)
-            return LUT
-
-        if (not is_3D and pre_LUT.shape == (6, 2) and np.array_equal(
-                pre_LUT.reshape(3, 4).transpose()[2:4], unity_range)):
-            LUT = LUT3x1D(
-                domain=pre_LUT.reshape(3, 4).transpose()[0:2],
-                name=title,
-                comments=comments,
-                table=table)
-
-            return LUT
-
-        if is_3D:
-            pre_domain = tstack((pre_LUT[0], pre_LUT[2], pre_LUT[4]))
-            pre_table = tstack((pre_LUT[1], pre_LUT[3], pre_LUT[5]))
-            shaper_name = '{0} - Shaper'.format(title)
-            cube_name = '{0} - Cube'.format(title)
-            table = table.reshape([size[0], size[1], size[2], 3], order='F')
-            LUT_A = LUT3x1D(pre_table, shaper_name, pre_domain)
-            LUT_B = LUT3D(table, cube_name, comments=comments)
+        if 'END METADATA' not in lines:
+            return False
+
+        return len(lines) - lines.index('END METADATA') - 1 == 10
+
+    # The header, i.e. the lines preceding the table, is parsed line by line
+    # whereas the table is parsed in bulk.
+    header, offset = read_LUT_header(path, _is_table_line)
+    assert len(header) > 0, 'LUT file empty!'
+    lines = header
+
+    assert lines[0] == 'CSPLUTV100', 'Invalid header!'
+
+    kind = lines[1]
+    assert kind in ('1D', '3D'), 'Invalid kind!'
+
+    is_3D = kind == '3D'
+
+    seek = 2
+    metadata = []
+    is_metadata = False
+    for i, line in enumerate(lines[2:]):
+        line = line.strip()
+        if line == 'BEGIN METADATA':
+            is_metadata = True
+            continue
+        elif line == 'END METADATA':
+            seek += i
+            break
+
+        if is_metadata:
+            metadata.append(line)
+
+    title, comments = _parse_metadata_section(metadata)
+
+    seek += 1
+    pre_LUT = _parse_domain_section(lines[seek:seek + 9])
+
+    seek += 9
+    size = as_int_array(lines[seek].split())
+    table = read_LUT_table(
+        path, header, (np.product(size), 3), offset, cache=cache)
+    if table is None:
+        table = as_float_array([
+            line.split() for line in lines[seek + 1:] +
+            read_LUT_body(path, offset).splitlines() if line.strip()
+        ])
+
+    assert np.product(size) == len(table), 'Invalid table size!'
+
+    if (is_3D and pre_LUT.shape == (6, 2) and np.array_equal(
+            pre_LUT.reshape(3, 4).transpose()[2:4], unity_range)):
+        table = table.reshape([size[0], size[1], size[2], 3], order='F')
+        LUT = LUT3D(
+            domain=pre_LUT.reshape(3, 4).transpose()[0:2],
+            name=title,
+            comments=comments,
+            table=table)
+        return LUT
+
+    if (not is_3D and pre_LUT.shape == (6, 2) and np.array_equal(
+            pre_LUT.reshape(3, 4).transpose()[2:4], unity_range)):
+        LUT = LUT3x1D(
+            domain=pre_LUT.reshape(3, 4).transpose()[0:2],
+            name=title,
+            comments=comments,
+            table=table)
+
+        return LUT
+
+    if is_3D:
+        pre_domain = tstack((pre_LUT[0], pre_LUT[2], pre_LUT[4]))
+        pre_table = tstack((pre_LUT[1], pre_LUT[3], pre_LUT[5]))
+        shaper_name = '{0} - Shaper'.format(title)
+        cube_name = '{0} - Cube'.format(title)
+        table = table.reshape([size[0], size[1], size[2], 3], order='F')
+        LUT_A = LUT3x1D(pre_table, shaper_name, pre_domain)
+        LUT_B = LUT3D(table, cube_name, comments=comments)
+
+        return LUTSequence(LUT_A, LUT_B)
+
+    if not is_3D:
+        pre_domain = tstack((pre_LUT[0], pre_LUT[2], pre_LUT[4]))
+        pre_table = tstack((pre_LUT[1], pre_LUT[3], pre_LUT[5]))
+
+        if table.shape == (2, 3):
+            table_max = table[1]
+            table_min = table[0]
+            pre_table *= (table_max - table_min)
+            pre_table += table_min
+
+            return LUT3x1D(pre_table, title, pre_domain, comments=comments)
+        else:
+            pre_name = '{0} - PreLUT'.format(title)
+            table_name = '{0} - Table'.format(title)
+            LUT_A = LUT3x1D(pre_table, pre_name, pre_domain)
+            LUT_B = LUT3x1D(table, table_name, comments=comments)
 
             return LUTSequence(LUT_A, LUT_B)
 
-        if not is_3D:
-            pre_domain = tstack((pre_LUT[0], pre_LUT[2], pre_LUT[4]))
-            pre_table = tstack((pre_LUT[1], pre_LUT[3], pre_LUT[5]))
-
-            if table.shape == (2, 3):
-                table_max = table[1]
-                table_min = table[0]
-                pre_table *= (table_max - table_min)
-                pre_table += table_min
-
-                return LUT3x1D(pre_table, title, pre_domain, comments=comments)
-            else:
-                pre_name = '{0} - PreLUT'.format(title)
-                table_name = '{0} - Table'.format(title)
-                LUT_A = LUT3x1D(pre_table, pre_name, pre_domain)
-                LUT_B = LUT3x1D(table, table_name, comments=comments)
-
-                return LUTSequence(LUT_A, LUT_B)
-
 
 def write_LUT_Cinespace(LUT, path, decimals=7):
     """
@@ -7,8 +7,15 @@ Defines LUT Processing common utilities objects that don't fall in any specific
 category.
 """
 
+import glob
+import hashlib
+import numpy as np
 import os
 import re
+import tempfile
+import warnings
+
+from colour.utilities import runtime_warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -17,7 +24,18 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['path_to_title']
+__all__ = [
+    'path_to_title', 'read_LUT_header', 'read_LUT_footer', 'read_LUT_body',
+    'parse_table', 'table_cache_path', 'read_table_cache', 'write_table_cache',
+    'read_LUT_table'
+]
+
+_LUT_FOOTER_CHUNK_SIZE = 8192
+"""
+Chunk size in bytes used to read the footer of *LUT* files backwards.
+
+_LUT_FOOTER_CHUNK_SIZE : int
+"""
 
 
 def path_to_title(path):
@@ -43,3 +61,343 @@ def path_to_title(path):
     """
 
     return re.sub('_|-|\\.', ' ', os.path.splitext(os.path.basename(path))[0])
+
+
+def read_LUT_header(path, is_table_line):
+    """
+    Reads the header of given *LUT* file, i.e. its non-empty lines preceding
+    the first table line.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    is_table_line : callable
+        Callable receiving a stripped non-empty line and the header lines read
+        so far and returning whether the line is the first table line.
+
+    Returns
+    -------
+    tuple
+        Stripped non-empty header lines and offset of the first table line in
+        bytes.
+
+    Examples
+    --------
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'iridas_cube',
+    ...     'Colour_Correct.cube')
+    >>> read_LUT_header(path, lambda line, lines: line[0].isdigit())
+    (['TITLE "Generated by Foundry::LUT"', 'LUT_3D_SIZE 4'], 48)
+    """
+
+    header = []
+    with open(path, 'rb') as LUT_file:
+        while True:
+            offset = LUT_file.tell()
+            line = LUT_file.readline()
+            if not line:
+                break
+
+            line = line.decode('utf-8').strip()
+            if len(line) == 0:
+                continue
+
+            if is_table_line(line, header):
+                break
+
+            header.append(line)
+
+    return header, offset
+
+
+def read_LUT_footer(path, is_footer_line, offset=0):
+    """
+    Reads the footer of given *LUT* file, i.e. its non-empty lines following
+    the last table line.
+
+    The file is read backwards so that the table is not read.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    is_footer_line : callable
+        Callable receiving a stripped non-empty line and returning whether the
+        line is a footer line.
+    offset : int, optional
+        Offset of the first table line in bytes, the footer is not searched
+        before it.
+
+    Returns
+    -------
+    tuple
+        Stripped non-empty footer lines and offset of the first footer line in
+        bytes, i.e. the end of the table.
+
+    Examples
+    --------
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'sony_spi3d',
+    ...     'Colour_Correct.spi3d')
+    >>> read_LUT_footer(path, lambda line: line.startswith('#'))
+    ... # doctest: +ELLIPSIS
+    (['# Adapted from a LUT generated by Foundry::LUT.'], 2...)
+    """
+
+    footer = []
+    with open(path, 'rb') as LUT_file:
+        size = position = LUT_file.seek(0, os.SEEK_END)
+        # Offset of the line following the line being read, the last line is
+        # followed by a virtual line.
+        end = size + 1
+        buffer = b''
+        while position > offset:
+            chunk_size = min(_LUT_FOOTER_CHUNK_SIZE, position - offset)
+            position -= chunk_size
+            LUT_file.seek(position)
+            lines = (LUT_file.read(chunk_size) + buffer).split(b'\n')
+
+            # The first line is possibly partial unless the offset is reached.
+            buffer = lines.pop(0) if position > offset else b''
+            for line in reversed(lines):
+                stripped_line = line.decode('utf-8').strip()
+                if len(stripped_line) != 0:
+                    if not is_footer_line(stripped_line):
+                        return footer[::-1], min(end, size)
+
+                    footer.append(stripped_line)
+
+                end -= len(line) + 1
+
+    return footer[::-1], offset
+
+
+def read_LUT_body(path, offset, end=None):
+    """
+    Reads the body of given *LUT* file from given offset.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    offset : int
+        Offset of the body in bytes.
+    end : int, optional
+        Offset of the end of the body in bytes, the body extends to the end of
+        the file if *None*.
+
+    Returns
+    -------
+    unicode
+        *LUT* body.
+    """
+
+    with open(path, 'rb') as LUT_file:
+        LUT_file.seek(offset)
+
+        size = -1 if end is None else end - offset
+
+        return LUT_file.read(size).decode('utf-8')
+
+
+def parse_table(text, shape):
+    """
+    Parses given whitespace separated numbers in bulk into a table with given
+    shape.
+
+    Parameters
+    ----------
+    text : unicode
+        Text to parse.
+    shape : array_like
+        Table shape.
+
+    Returns
+    -------
+    ndarray or None
+        Table or *None* if the text contains anything else than numbers, e.g.
+        comments or keywords, or if the numbers count does not match the table
+        shape.
+
+    Examples
+    --------
+    >>> parse_table('0 0 0\\n0.5 1 1.5\\n1 1 1', (3, 3))
+    array([[ 0. ,  0. ,  0. ],
+           [ 0.5,  1. ,  1.5],
+           [ 1. ,  1. ,  1. ]])
+    >>> parse_table('0 0 0\\n# Comment\\n1 1 1', (2, 3)) is None
+    True
+    """
+
+    # "np.fromstring" definition stops parsing at the first unexpected token
+    # and issues a "DeprecationWarning", a "ValueError" exception will be
+    # raised in the future.
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            table = np.fromstring(text, sep=' ')
+        except (DeprecationWarning, ValueError):
+            return None
+
+    if table.size != np.product(shape):
+        return None
+
+    return np.reshape(table, shape)
+
+
+def table_cache_path(path, header):
+    """
+    Returns the path of the binary sidecar cache of given *LUT* file table.
+
+    The path contains a digest of the *LUT* file header, size and modification
+    time so that a cache written for a different version of the *LUT* file is
+    never read.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    header : list
+        *LUT* file header lines.
+
+    Returns
+    -------
+    unicode
+        Binary sidecar cache path.
+    """
+
+    stat = os.stat(path)
+
+    digest = hashlib.sha256()
+    digest.update('\n'.join(header).encode('utf-8'))
+    digest.update('{0} {1}'.format(stat.st_size,
+                                   stat.st_mtime_ns).encode('utf-8'))
+
+    return '{0}.{1}.npy'.format(path, digest.hexdigest()[:16])
+
+
+def read_table_cache(path, header):
+    """
+    Reads the binary sidecar cache of given *LUT* file table if it exists.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    header : list
+        *LUT* file header lines.
+
+    Returns
+    -------
+    memmap or None
+        Copy-on-write memory-mapped table or *None* if the cache does not
+        exist.
+    """
+
+    cache_path = table_cache_path(path, header)
+
+    if not os.path.exists(cache_path):
+        return None
+
+    return np.load(cache_path, mmap_mode='c')
+
+
+def write_table_cache(path, header, table):
+    """
+    Writes the binary sidecar cache of given *LUT* file table and removes the
+    stale ones.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    header : list
+        *LUT* file header lines.
+    table : array_like
+        *LUT* file table.
+
+    Returns
+    -------
+    unicode
+        Binary sidecar cache path.
+    """
+
+    cache_path = table_cache_path(path, header)
+
+    for stale_path in glob.glob('{0}.*.npy'.format(glob.escape(path))):
+        if (stale_path != cache_path and
+                re.match('^[0-9a-f]{16}\\.npy$', stale_path[len(path) + 1:])):
+            os.remove(stale_path)
+
+    # The cache is written in a temporary file and then renamed so that a
+    # concurrent reader never reads a partially written cache.
+    descriptor, temporary_path = tempfile.mkstemp(
+        suffix='.npy', dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(descriptor, 'wb') as cache_file:
+            np.save(cache_file, table)
+
+        os.replace(temporary_path, cache_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+    return cache_path
+
+
+def read_LUT_table(path, header, shape, offset, end=None, cache=False):
+    """
+    Reads the table of given *LUT* file in bulk, optionally using a binary
+    sidecar cache.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    header : list
+        *LUT* file header lines, as returned by
+        :func:`colour.io.luts.common.read_LUT_header` definition.
+    shape : array_like
+        Table shape.
+    offset : int
+        Offset of the table in bytes, as returned by
+        :func:`colour.io.luts.common.read_LUT_header` definition.
+    end : int, optional
+        Offset of the end of the table in bytes, as returned by
+        :func:`colour.io.luts.common.read_LUT_footer` definition, the table
+        extends to the end of the file if *None*.
+    cache : bool, optional
+        Whether to read the table from the binary sidecar cache, and to write
+        it if it does not exist. The cached table is memory-mapped in
+        copy-on-write mode: it can be modified in place like an uncached
+        table, the modifications being kept in memory and never written to
+        the cache. If the cache cannot be written, e.g. because the *LUT*
+        directory is not writable, a warning is issued and the uncached table
+        is returned.
+
+    Returns
+    -------
+    ndarray or None
+        Table or *None* if the table cannot be parsed in bulk, in which case
+        the *LUT* file must be parsed line by line.
+    """
+
+    if cache:
+        table = read_table_cache(path, header)
+        if table is not None and table.shape == tuple(shape):
+            return table
+
+    table = parse_table(read_LUT_body(path, offset, end), shape)
+
+    if table is not None and cache:
+        try:
+            return np.load(
+                write_table_cache(path, header, table), mmap_mode='c')
+        except (IOError, OSError) as error:
+            runtime_warning(
+                'The "{0}" LUT table binary sidecar cache could not be '
+                'written: {1}, the uncached table is used!'.format(
+                    path, error))
+
+    return table
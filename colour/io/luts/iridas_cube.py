@@ -18,7 +18,9 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import (path_to_title, read_LUT_body,
+                                   read_LUT_footer, read_LUT_header,
+                                   read_LUT_table)
 from colour.utilities import as_float_array, usage_warning
 
 __author__ = 'Colour Developers'
@@ -30,8 +32,16 @@ __status__ = 'Production'
 
 __all__ = ['read_LUT_IridasCube', 'write_LUT_IridasCube']
 
+_KEYWORDS_IRIDAS_CUBE = ('TITLE', 'DOMAIN_MIN', 'DOMAIN_MAX', 'LUT_1D_SIZE',
+                         'LUT_3D_SIZE')
+"""
+*Iridas* *.cube* *LUT* keywords.
+
+_KEYWORDS_IRIDAS_CUBE : tuple
+"""
+
 
-def read_LUT_IridasCube(path):
+def read_LUT_IridasCube(path, cache=False):
     """
     Reads given *Iridas* *.cube* *LUT* file.
 
@@ -39,6 +49,11 @@ def read_LUT_IridasCube(path):
     ----------
     path : unicode
         *LUT* path.
+    cache : bool, optional
+        Whether to read the table from a binary sidecar cache, written next to
+        the *LUT* file on the first read, see
+        :func:`colour.io.luts.common.read_LUT_table` definition. The cached
+        table is memory-mapped in copy-on-write mode.
 
     Returns
     -------
@@ -103,8 +118,13 @@ def read_LUT_IridasCube(path):
     table = []
     comments = []
 
-    with open(path) as cube_file:
-        lines = cube_file.readlines()
+    def parse_lines(lines):
+        """
+        Parses given lines, table lines are appended to the table.
+        """
+
+        nonlocal title, domain_min, domain_max, dimensions, size
+
         for line in lines:
             line = line.strip()
 
@@ -131,6 +151,30 @@ def read_LUT_IridasCube(path):
             else:
                 table.append(tokens)
 
+    # The keywords precede the table and the comments possibly follow it, thus,
+    # the header and footer are parsed line by line whereas the table is
+    # parsed in bulk unless it contains comments.
+    def is_table_line(line, lines):
+        """
+        Returns whether given line is the first line of the table.
+        """
+
+        return not (line.startswith('#') or
+                    line.split()[0] in _KEYWORDS_IRIDAS_CUBE)
+
+    header, offset = read_LUT_header(path, is_table_line)
+    footer, end = read_LUT_footer(path, lambda line: line.startswith('#'),
+                                  offset)
+    parse_lines(header)
+
+    shape = (size ** 3 if dimensions == 3 else size, 3)
+    table = read_LUT_table(path, header, shape, offset, end, cache)
+    if table is None:
+        table = []
+        parse_lines(read_LUT_body(path, offset, end).splitlines())
+
+    parse_lines(footer)
+
     table = as_float_array(table)
     if dimensions == 2:
         return LUT3x1D(
@@ -20,7 +20,8 @@ from copy import deepcopy
 from operator import (add, mul, pow, sub, truediv, iadd, imul, ipow, isub,
                       itruediv)
 
-from colour.algebra import LinearInterpolator, table_interpolation_trilinear
+from colour.algebra import (LinearInterpolator, TableInterpolator,
+                            table_interpolation_trilinear)
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.utilities import (as_float_array, is_numeric, is_iterable,
                               is_string, full, linear_conversion,
@@ -1471,6 +1472,7 @@ class LUT3D(AbstractLUT):
     -   :meth:`~colour.LUT3D.is_domain_explicit`
     -   :meth:`~colour.LUT3D.linear_table`
     -   :meth:`~colour.LUT3D.apply`
+    -   :meth:`~colour.LUT3D.prepare`
     -   :meth:`~colour.LUT3D.as_LUT`
 
     Examples
@@ -1815,6 +1817,70 @@ class LUT3D(AbstractLUT):
 
         R, G, B = tsplit(RGB)
 
+        domain_min, domain_max = self._implicit_domain()
+
+        RGB_l = [
+            linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
+            for i, j in enumerate((R, G, B))
+        ]
+
+        return interpolator(tstack(RGB_l), self._table, **interpolator_kwargs)
+
+    def prepare(self, method='Trilinear', chunk_size=65536):
+        """
+        Prepares the *LUT* to be applied repeatedly, e.g. to video frames.
+
+        The returned interpolator flattens the table once and interpolates in
+        chunks with bounded scratch memory, it is called with the *RGB*
+        colourspace array to apply the *LUT* onto and optionally an ``out``
+        array and a number of ``threads``.
+
+        Parameters
+        ----------
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method.
+        chunk_size : int, optional
+            Number of *RGB* colourspace array values interpolated at once.
+
+        Returns
+        -------
+        TableInterpolator
+            Prepared interpolator.
+
+        Examples
+        --------
+        >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2))
+        >>> RGB = np.array([0.18, 0.18, 0.18])
+        >>> apply = LUT.prepare()
+        >>> apply(RGB)  # doctest: +ELLIPSIS
+        array([ 0.4583277...,  0.4583277...,  0.4583277...])
+        >>> out = np.zeros([4, 3])
+        >>> apply = LUT.prepare('Tetrahedral')
+        >>> apply(np.tile(RGB, [4, 1]), out=out)  # doctest: +ELLIPSIS
+        array([[ 0.4583277...,  0.4583277...,  0.4583277...],
+               [ 0.4583277...,  0.4583277...,  0.4583277...],
+               [ 0.4583277...,  0.4583277...,  0.4583277...],
+               [ 0.4583277...,  0.4583277...,  0.4583277...]])
+        """
+
+        return TableInterpolator(
+            self._table,
+            np.vstack(self._implicit_domain()),
+            method=method,
+            chunk_size=chunk_size)
+
+    def _implicit_domain(self):
+        """
+        Returns the *LUT* implicit domain minimum and maximum, an explicit
+        domain is reduced to its first and last values.
+
+        Returns
+        -------
+        tuple
+            *LUT* implicit domain minimum and maximum.
+        """
+
         if self.is_domain_explicit():
             domain_min = self.domain[0, ...]
             domain_max = [
@@ -1829,12 +1895,7 @@ class LUT3D(AbstractLUT):
         else:
             domain_min, domain_max = self.domain
 
-        RGB_l = [
-            linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
-            for i, j in enumerate((R, G, B))
-        ]
-
-        return interpolator(tstack(RGB_l), self._table, **interpolator_kwargs)
+        return domain_min, domain_max
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
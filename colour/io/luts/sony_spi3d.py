@@ -13,7 +13,9 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import (path_to_title, read_LUT_body,
+                                   read_LUT_footer, read_LUT_header,
+                                   read_LUT_table)
 from colour.utilities import as_int_array, usage_warning, as_float_array
 
 __author__ = 'Colour Developers'
@@ -26,7 +28,7 @@ __status__ = 'Production'
 __all__ = ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
 
 
-def read_LUT_SonySPI3D(path):
+def read_LUT_SonySPI3D(path, cache=False):
     """
     Reads given *Sony* *.spi3d* *LUT* file.
 
@@ -34,6 +36,11 @@ def read_LUT_SonySPI3D(path):
     ----------
     path : unicode
         *LUT* path.
+    cache : bool, optional
+        Whether to read the table from a binary sidecar cache, written next to
+        the *LUT* file on the first read, see
+        :func:`colour.io.luts.common.read_LUT_table` definition. The cached
+        table is memory-mapped in copy-on-write mode.
 
     Returns
     -------
@@ -78,9 +85,19 @@ def read_LUT_SonySPI3D(path):
     table = []
     comments = []
 
-    with open(path) as spi3d_file:
-        lines = filter(None, (line.strip() for line in spi3d_file.readlines()))
+    def parse_lines(lines):
+        """
+        Parses given lines, table lines are appended to the indexes and table.
+        """
+
+        nonlocal size
+
         for line in lines:
+            line = line.strip()
+
+            if len(line) == 0:
+                continue
+
             if line.startswith('#'):
                 comments.append(line[1:].strip())
                 continue
@@ -95,17 +112,47 @@ def read_LUT_SonySPI3D(path):
                 indexes.append(as_int_array(tokens[:3]))
                 table.append(as_float_array(tokens[3:]))
 
-    indexes = as_int_array(indexes)
-    sorting_indexes = np.lexsort((indexes[:, 2], indexes[:, 1], indexes[:, 0]))
+    # The header, i.e. the lines preceding the first line with 6 tokens, and
+    # the footer, i.e. the comments following the table, are parsed line by
+    # line whereas the table is parsed in bulk unless it contains comments.
+    def is_table_line(line, lines):
+        """
+        Returns whether given line is the first line of the table.
+        """
+
+        return not line.startswith('#') and len(line.split()) == 6
+
+    header, offset = read_LUT_header(path, is_table_line)
+    footer, end = read_LUT_footer(path, lambda line: line.startswith('#'),
+                                  offset)
+    parse_lines(header)
+
+    data = read_LUT_table(path, header, (size ** 3, 6), offset, end, cache)
+    if data is None:
+        parse_lines(read_LUT_body(path, offset, end).splitlines())
+        indexes = as_int_array(indexes)
+        table = as_float_array(table)
+    else:
+        indexes = as_int_array(data[:, :3])
+        table = data[:, 3:]
+
+    parse_lines(footer)
+
+    linear_indexes = DEFAULT_INT_DTYPE(
+        np.around(LUT3D.linear_table(size) * (size - 1))).reshape((-1, 3))
+
+    # Ordered tables, i.e. the most common ones, are reshaped without sorting.
+    if not np.array_equal(indexes, linear_indexes):
+        sorting_indexes = np.lexsort((indexes[:, 2], indexes[:, 1],
+                                      indexes[:, 0]))
+
+        assert np.array_equal(
+            indexes[sorting_indexes],
+            linear_indexes), ('Indexes do not match expected "LUT3D" indexes!')
 
-    assert np.array_equal(
-        indexes[sorting_indexes],
-        DEFAULT_INT_DTYPE(np.around(
-            LUT3D.linear_table(size) * (size - 1))).reshape(
-                (-1, 3))), 'Indexes do not match expected "LUT3D" indexes!'
+        table = table[sorting_indexes]
 
-    table = as_float_array(table)[sorting_indexes].reshape(
-        [size, size, size, 3])
+    table = table.reshape([size, size, size, 3])
 
     return LUT3D(
         table, title, np.vstack([domain_min, domain_max]), comments=comments)
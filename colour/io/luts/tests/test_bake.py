@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.bake` module.
+"""
+
+import numpy as np
+import os
+import unittest
+import shutil
+import tempfile
+
+from colour.io import (LUT3x1D, LUT3D, LUTSequence, LUTBaking_Specification,
+                       bake_LUT, read_LUT, write_LUT)
+from colour.models import eotf_ST2084, log_encoding_Log2
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['DOMAIN', 'gamma_function', 'TestBakeLUT']
+
+DOMAIN = np.array([[0.001, 0.001, 0.001], [1, 1, 1]])
+
+
+def gamma_function(RGB):
+    """
+    Encodes given *RGB* colourspace array with a 2.2 gamma.
+    """
+
+    return RGB ** (1 / 2.2)
+
+
+class TestBakeLUT(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.bake.bake_LUT` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_bake_LUT(self):
+        """
+        Tests :func:`colour.io.luts.bake.bake_LUT` definition.
+        """
+
+        LUT = bake_LUT(lambda RGB: RGB * 0.5, 5)
+
+        self.assertIsInstance(LUT, LUTSequence)
+        self.assertIsInstance(LUT[0], LUT3x1D)
+        self.assertIsInstance(LUT[1], LUT3D)
+        np.testing.assert_almost_equal(
+            LUT[0].table, LUT3x1D.linear_table(2), decimal=7)
+        np.testing.assert_almost_equal(
+            LUT[1].table, LUT3D.linear_table(5) * 0.5, decimal=7)
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (16, 3))
+        np.testing.assert_almost_equal(LUT.apply(RGB), RGB * 0.5, decimal=7)
+
+        LUT = bake_LUT(gamma_function, 9, DOMAIN, chunk_size=7)
+        np.testing.assert_almost_equal(
+            LUT[1].table,
+            gamma_function(LUT3D.linear_table(9, DOMAIN)),
+            decimal=7)
+
+        LUT = bake_LUT(('CIE XYZ', 'CIE XYZ'), 3)
+        np.testing.assert_almost_equal(
+            LUT[1].table, LUT3D.linear_table(3), decimal=7)
+
+    def test_shaper_bake_LUT(self):
+        """
+        Tests :func:`colour.io.luts.bake.bake_LUT` definition shaper
+        support.
+        """
+
+        LUT = bake_LUT(gamma_function, 9, DOMAIN, 'Log2', 256, chunk_size=100)
+
+        np.testing.assert_almost_equal(LUT[0].domain, DOMAIN, decimal=7)
+        np.testing.assert_almost_equal(
+            LUT[0].table[[0, -1]], LUT3x1D.linear_table(2), decimal=7)
+
+        samples = LUT3x1D.linear_table(256, DOMAIN)
+        encoded = log_encoding_Log2(samples)
+        encoded = (encoded - encoded[0]) / (encoded[-1] - encoded[0])
+        np.testing.assert_almost_equal(LUT[0].table, encoded, decimal=7)
+        self.assertLess(
+            np.max(np.abs(LUT.apply(samples) - gamma_function(samples))), 0.02)
+
+        LUT_p = bake_LUT(
+            gamma_function,
+            9,
+            DOMAIN,
+            log_encoding_Log2,
+            256,
+            shaper_kwargs={'middle_grey': 0.18})
+        np.testing.assert_almost_equal(LUT_p[0].table, LUT[0].table)
+        np.testing.assert_almost_equal(LUT_p[1].table, LUT[1].table)
+
+        domain = np.array([[0, 0, 0], [10000, 10000, 10000]])
+        LUT = bake_LUT(lambda C: C / 10000, 17, domain, 'ST 2084')
+        self.assertEqual(LUT[0].size, 4096)
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([100, 100, 100])),
+            np.array([0.01, 0.01, 0.01]),
+            decimal=3)
+
+    def test_validation_bake_LUT(self):
+        """
+        Tests :func:`colour.io.luts.bake.bake_LUT` definition validation.
+        """
+
+        specification = bake_LUT(
+            gamma_function, 17, DOMAIN, 'Log2', additional_data=True)
+
+        self.assertIsInstance(specification, LUTBaking_Specification)
+        self.assertTupleEqual(specification.samples.shape, (4096, 3))
+        self.assertGreater(specification.error_maximum, 0)
+        self.assertLess(specification.error_maximum, 0.01)
+        self.assertLess(specification.error_mean, specification.error_maximum)
+        self.assertListEqual(specification.LUT[1].comments, [
+            'Maximum error: {0:.7e}'.format(specification.error_maximum),
+            'Mean error: {0:.7e}'.format(specification.error_mean)
+        ])
+
+        # The log shaper reduces the error of a gamma function.
+        self.assertLess(
+            specification.error_maximum,
+            bake_LUT(gamma_function, 17, DOMAIN,
+                     additional_data=True).error_maximum)
+
+        samples = LUT3D.linear_table(5, DOMAIN)
+        specification = bake_LUT(
+            gamma_function,
+            5,
+            DOMAIN,
+            validation=samples,
+            additional_data=True)
+        self.assertTupleEqual(specification.samples.shape, (125, 3))
+        self.assertAlmostEqual(specification.error_maximum, 0, places=7)
+
+        specification = bake_LUT(
+            eotf_ST2084, 5, validation=16, additional_data=True)
+        self.assertTupleEqual(specification.samples.shape, (16, 3))
+
+    def test_write_LUT_bake_LUT(self):
+        """
+        Tests :func:`colour.io.luts.bake.bake_LUT` definition baked *LUT*
+        writing.
+        """
+
+        LUT = bake_LUT(gamma_function, 9, DOMAIN, 'Log2', 64, name='Gamma')
+
+        path = os.path.join(self._temporary_directory, 'Gamma.cube')
+        write_LUT(LUT, path)
+        LUT_r = read_LUT(path)
+
+        self.assertEqual(LUT_r[1].name, 'Gamma - Cube')
+        self.assertListEqual(LUT_r[1].comments, LUT[1].comments)
+        np.testing.assert_almost_equal(LUT_r[0].domain, DOMAIN, decimal=7)
+        np.testing.assert_almost_equal(LUT_r[0].table, LUT[0].table, decimal=7)
+        np.testing.assert_almost_equal(LUT_r[1].table, LUT[1].table, decimal=7)
+
+    def test_raise_exception_bake_LUT(self):
+        """
+        Tests :func:`colour.io.luts.bake.bake_LUT` definition raised
+        exception.
+        """
+
+        self.assertRaises(
+            AssertionError,
+            bake_LUT,
+            gamma_function,
+            shaper='Log2',
+            shaper_size=16)
+
+        self.assertRaises(AssertionError, bake_LUT, lambda RGB: RGB[..., 0], 3)
+
+        self.assertRaises(
+            KeyError, bake_LUT, gamma_function, shaper='Undefined')
+
+
+if __name__ == '__main__':
+    unittest.main()
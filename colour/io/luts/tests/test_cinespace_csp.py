@@ -3,13 +3,14 @@
 Defines unit tests for :mod:`colour.io.luts.cinespace_csp` module.
 """
 
+import glob
 import numpy as np
 import os
 import unittest
 import shutil
 import tempfile
 
-from colour.io import LUT1D, LUT3x1D
+from colour.io import LUT1D, LUT3x1D, LUTSequence
 from colour.io import read_LUT_Cinespace, write_LUT_Cinespace
 from colour.utilities import tstack
 
@@ -32,6 +33,20 @@ class TestReadLUTCinespace(unittest.TestCase):
     unit tests methods.
     """
 
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
     def test_read_LUT_Cinespace(self):
         """
         Tests :func:`colour.io.luts.cinespace_csp.read_LUT_Cinespace`
@@ -105,6 +120,40 @@ class TestReadLUTCinespace(unittest.TestCase):
         self.assertIsInstance(LUT_5[0], LUT3x1D)
         self.assertIsInstance(LUT_5[1], LUT3x1D)
 
+    def test_read_LUT_Cinespace_cache(self):
+        """
+        Tests :func:`colour.io.luts.cinespace_csp.read_LUT_Cinespace`
+        definition binary sidecar cache.
+        """
+
+        for name in [
+                'Three_Dimensional_Table.csp',
+                'Three_Dimensional_Table_With_Shaper.csp',
+                'ACES_Proxy_10_to_ACES.csp'
+        ]:
+            path = os.path.join(self._temporary_directory, name)
+            shutil.copyfile(os.path.join(LUTS_DIRECTORY, name), path)
+
+            LUT = read_LUT_Cinespace(path)
+            for _i in range(2):
+                LUT_c = read_LUT_Cinespace(path, cache=True)
+                self.assertEqual(LUT_c, LUT)
+
+                # The cached table is copy-on-write: in-place operations must
+                # not raise nor be written back to the cache.
+                if isinstance(LUT_c, LUTSequence):
+                    LUTs, LUTs_c = LUT, LUT_c
+                else:
+                    LUTs, LUTs_c = [LUT], [LUT_c]
+
+                for LUT_s, LUT_s_c in zip(LUTs, LUTs_c):
+                    LUT_s_c += 1
+                    np.testing.assert_almost_equal(
+                        LUT_s_c.table, LUT_s.table + 1, decimal=7)
+                    LUT_s_c.table[...] = 0
+
+            self.assertEqual(len(glob.glob('{0}.*.npy'.format(path))), 1)
+
 
 class TestWriteLUTCinespace(unittest.TestCase):
     """
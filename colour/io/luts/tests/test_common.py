@@ -3,9 +3,22 @@
 Defines unit tests for :mod:`colour.io.luts.common` module.
 """
 
+import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
 
-from colour.io.luts.common import path_to_title
+from colour.io.luts import common
+from colour.io.luts.common import (path_to_title, read_LUT_header,
+                                   read_LUT_footer, read_LUT_body, parse_table,
+                                   table_cache_path, read_table_cache,
+                                   write_table_cache, read_LUT_table)
+from colour.utilities import ColourRuntimeWarning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -14,7 +27,22 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestPathToTitle']
+__all__ = [
+    'LUTS_DIRECTORY', 'TestPathToTitle', 'TestReadLUTHeader',
+    'TestReadLUTFooter', 'TestReadLUTBody', 'TestParseTable', 'TestTableCache',
+    'TestReadLUTTable'
+]
+
+LUTS_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), 'resources', 'iridas_cube')
+
+
+def _is_table_line(line, lines):
+    """
+    Returns whether given *Iridas* *.cube* *LUT* line is a table line.
+    """
+
+    return line[0].isdigit() or line[0] == '-'
 
 
 class TestPathToTitle(unittest.TestCase):
@@ -34,5 +62,246 @@ class TestPathToTitle(unittest.TestCase):
             'RGB 1 0 5 0 25')
 
 
+class TestReadLUTHeader(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.read_LUT_header` definition unit
+    tests methods.
+    """
+
+    def test_read_LUT_header(self):
+        """
+        Tests :func:`colour.io.luts.common.read_LUT_header` definition.
+        """
+
+        path = os.path.join(LUTS_DIRECTORY, 'Colour_Correct.cube')
+        header, offset = read_LUT_header(path, _is_table_line)
+
+        self.assertListEqual(
+            header, ['TITLE "Generated by Foundry::LUT"', 'LUT_3D_SIZE 4'])
+
+        with open(path, 'rb') as cube_file:
+            cube_file.seek(offset)
+            self.assertTrue(cube_file.readline().strip()[0:1].isdigit())
+
+        header, offset = read_LUT_header(path, lambda line, lines: False)
+
+        self.assertEqual(offset, os.path.getsize(path))
+
+
+class TestReadLUTFooter(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.read_LUT_footer` definition unit
+    tests methods.
+    """
+
+    def test_read_LUT_footer(self):
+        """
+        Tests :func:`colour.io.luts.common.read_LUT_footer` definition.
+        """
+
+        path = os.path.join(
+            os.path.dirname(__file__), 'resources', 'sony_spi3d',
+            'Colour_Correct.spi3d')
+
+        with open(path, 'rb') as spi3d_file:
+            content = spi3d_file.read()
+
+        chunk_size = common._LUT_FOOTER_CHUNK_SIZE
+        try:
+            for common._LUT_FOOTER_CHUNK_SIZE in (1, 7, 8192):
+                footer, end = read_LUT_footer(
+                    path, lambda line: line.startswith('#'))
+
+                self.assertListEqual(
+                    footer,
+                    ['# Adapted from a LUT generated by Foundry::LUT.'])
+                self.assertEqual(end, content.index(b'#'))
+
+                footer, end = read_LUT_footer(
+                    path, lambda line: line.startswith('#'), end)
+                self.assertEqual(end, content.index(b'#'))
+
+                footer, end = read_LUT_footer(path, lambda line: False)
+                self.assertListEqual(footer, [])
+                self.assertEqual(end, len(content))
+
+                footer, end = read_LUT_footer(path, lambda line: True, 11)
+                self.assertEqual(len(footer), 67)
+                self.assertEqual(end, 11)
+        finally:
+            common._LUT_FOOTER_CHUNK_SIZE = chunk_size
+
+
+class TestReadLUTBody(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.read_LUT_body` definition unit tests
+    methods.
+    """
+
+    def test_read_LUT_body(self):
+        """
+        Tests :func:`colour.io.luts.common.read_LUT_body` definition.
+        """
+
+        path = os.path.join(LUTS_DIRECTORY, 'Colour_Correct.cube')
+        _header, offset = read_LUT_header(path, _is_table_line)
+
+        self.assertEqual(len(read_LUT_body(path, offset).split()), 4 ** 3 * 3)
+        self.assertEqual(read_LUT_body(path, offset, offset + 8), '0.000000')
+
+
+class TestParseTable(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.parse_table` definition unit tests
+    methods.
+    """
+
+    def test_parse_table(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_table` definition.
+        """
+
+        np.testing.assert_equal(
+            parse_table('0 0 0\n0.5 1 1.5\r\n\n-1e-3 1 1\n', (3, 3)),
+            np.array([[0, 0, 0], [0.5, 1, 1.5], [-1e-3, 1, 1]]))
+
+        self.assertIsNone(parse_table('0 0 0\n# Comment\n1 1 1', (2, 3)))
+
+        self.assertIsNone(parse_table('0 0 0\nLUT_3D_SIZE 2\n', (2, 3)))
+
+        self.assertIsNone(parse_table('0 0 0\n1 1 1', (3, 3)))
+
+
+class TestTableCache(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.table_cache_path`,
+    :func:`colour.io.luts.common.read_table_cache` and
+    :func:`colour.io.luts.common.write_table_cache` definitions unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._path = os.path.join(self._temporary_directory, 'LUT.cube')
+        shutil.copyfile(
+            os.path.join(LUTS_DIRECTORY, 'Colour_Correct.cube'), self._path)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_table_cache(self):
+        """
+        Tests :func:`colour.io.luts.common.table_cache_path`,
+        :func:`colour.io.luts.common.read_table_cache` and
+        :func:`colour.io.luts.common.write_table_cache` definitions.
+        """
+
+        header = ['LUT_3D_SIZE 2']
+        table = np.random.random((8, 3))
+
+        self.assertIsNone(read_table_cache(self._path, header))
+
+        cache_path = write_table_cache(self._path, header, table)
+        self.assertEqual(cache_path, table_cache_path(self._path, header))
+        self.assertTrue(os.path.exists(cache_path))
+
+        cached_table = read_table_cache(self._path, header)
+        self.assertIsInstance(cached_table, np.memmap)
+        np.testing.assert_equal(cached_table, table)
+        del cached_table
+
+        self.assertNotEqual(
+            table_cache_path(self._path, ['LUT_3D_SIZE 3']), cache_path)
+
+        # Modifying the "LUT" file invalidates the cache.
+        with open(self._path, 'a') as cube_file:
+            cube_file.write('\n')
+
+        self.assertIsNone(read_table_cache(self._path, header))
+
+        stale_cache_path = cache_path
+        cache_path = write_table_cache(self._path, header, table)
+        self.assertNotEqual(cache_path, stale_cache_path)
+        self.assertFalse(os.path.exists(stale_cache_path))
+        self.assertListEqual(
+            sorted(os.listdir(self._temporary_directory)),
+            ['LUT.cube', os.path.basename(cache_path)])
+
+
+class TestReadLUTTable(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.read_LUT_table` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_LUT_table(self):
+        """
+        Tests :func:`colour.io.luts.common.read_LUT_table` definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LUT.cube')
+        shutil.copyfile(
+            os.path.join(LUTS_DIRECTORY, 'Colour_Correct.cube'), path)
+
+        header, offset = read_LUT_header(path, _is_table_line)
+
+        table = read_LUT_table(path, header, (64, 3), offset)
+        self.assertNotIsInstance(table, np.memmap)
+        self.assertListEqual(
+            os.listdir(self._temporary_directory), ['LUT.cube'])
+
+        cached_table = read_LUT_table(
+            path, header, (64, 3), offset, cache=True)
+        self.assertIsInstance(cached_table, np.memmap)
+        np.testing.assert_equal(cached_table, table)
+        self.assertEqual(len(os.listdir(self._temporary_directory)), 2)
+
+        np.testing.assert_equal(
+            read_LUT_table(path, header, (64, 3), offset, cache=True), table)
+
+        self.assertIsNone(
+            read_LUT_table(path, header, (27, 3), offset, cache=True))
+
+        os.remove(table_cache_path(path, header))
+        with mock.patch(
+                'colour.io.luts.common.tempfile.mkstemp',
+                side_effect=PermissionError('Permission denied')):
+            with self.assertWarns(ColourRuntimeWarning):
+                uncached_table = read_LUT_table(
+                    path, header, (64, 3), offset, cache=True)
+        self.assertNotIsInstance(uncached_table, np.memmap)
+        np.testing.assert_equal(uncached_table, table)
+        self.assertListEqual(
+            os.listdir(self._temporary_directory), ['LUT.cube'])
+
+        path = os.path.join(LUTS_DIRECTORY, 'Demo.cube')
+        header, offset = read_LUT_header(path, _is_table_line)
+
+        self.assertIsNone(read_LUT_table(path, header, (3, 3), offset))
+
+
 if __name__ == '__main__':
     unittest.main()
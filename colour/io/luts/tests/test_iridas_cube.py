@@ -3,6 +3,7 @@
 Defines unit tests for :mod:`colour.io.luts.iridas_cube` module.
 """
 
+import glob
 import numpy as np
 import os
 import unittest
@@ -31,6 +32,20 @@ class TestReadLUTIridasCube(unittest.TestCase):
     unit tests methods.
     """
 
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
     def test_read_LUT_IridasCube(self):
         """
         Tests :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube`
@@ -93,6 +108,30 @@ class TestReadLUTIridasCube(unittest.TestCase):
         self.assertEqual(LUT_3.dimensions, 3)
         self.assertEqual(LUT_3.size, 2)
 
+    def test_read_LUT_IridasCube_cache(self):
+        """
+        Tests :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube` definition
+        binary sidecar cache.
+        """
+
+        for name in ['Colour_Correct.cube', 'ACES_Proxy_10_to_ACES.cube']:
+            path = os.path.join(self._temporary_directory, name)
+            shutil.copyfile(os.path.join(LUTS_DIRECTORY, name), path)
+
+            LUT = read_LUT_IridasCube(path)
+            for _i in range(2):
+                LUT_c = read_LUT_IridasCube(path, cache=True)
+                self.assertEqual(LUT_c, LUT)
+
+                # The cached table is copy-on-write: in-place operations must
+                # not raise nor be written back to the cache.
+                LUT_c += 1
+                np.testing.assert_almost_equal(
+                    LUT_c.table, LUT.table + 1, decimal=7)
+                LUT_c.table[...] = 0
+
+            self.assertEqual(len(glob.glob('{0}.*.npy'.format(path))), 1)
+
 
 class TestWriteLUTIridasCube(unittest.TestCase):
     """
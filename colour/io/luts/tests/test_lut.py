@@ -8,7 +8,8 @@ import os
 import textwrap
 import unittest
 
-from colour.algebra import random_triplet_generator, spow
+from colour.algebra import (random_triplet_generator, spow,
+                            table_interpolation_tetrahedral)
 from colour.io.luts.lut import AbstractLUT
 from colour.io.luts import (AbstractLUTSequenceOperator, LUT1D, LUT3x1D, LUT3D,
                             LUTSequence, LUT_to_LUT)
@@ -774,6 +775,34 @@ class TestLUT3D(TestLUT):
              [0.02408419, 0.81991814, 0.94597809]],
         ])
 
+    def test_prepare(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT3D.prepare` method.
+        """
+
+        LUT_1 = LUT3D(self._table_2)
+
+        np.testing.assert_almost_equal(
+            LUT_1.prepare()(RANDOM_TRIPLETS), self._applied_1, decimal=7)
+
+        LUT_2 = LUT3D(domain=self._domain_2)
+        LUT_2.table = spow(LUT_2.table, 1 / 2.2)
+
+        np.testing.assert_almost_equal(
+            LUT_2.prepare(chunk_size=3)(RANDOM_TRIPLETS),
+            self._applied_2,
+            decimal=7)
+
+        LUT_3 = LUT3D(self._table_3, domain=self._domain_3)
+
+        np.testing.assert_almost_equal(
+            LUT_3.prepare()(RANDOM_TRIPLETS), self._applied_3, decimal=7)
+
+        np.testing.assert_almost_equal(
+            LUT_1.prepare('Tetrahedral')(RANDOM_TRIPLETS),
+            LUT_1.apply(RANDOM_TRIPLETS, table_interpolation_tetrahedral),
+            decimal=7)
+
 
 class TestAbstractLUTSequenceOperator(unittest.TestCase):
     """
@@ -3,6 +3,7 @@
 Defines unit tests for :mod:`colour.io.luts.sony_spi3d` module.
 """
 
+import glob
 import numpy as np
 import os
 import shutil
@@ -32,6 +33,20 @@ class TestReadLUTSonySPI3D(unittest.TestCase):
     unit tests methods.
     """
 
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
     def test_read_LUT_SonySPI3D(self):
         """
         Tests :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D` definition.
@@ -166,6 +181,30 @@ class TestReadLUTSonySPI3D(unittest.TestCase):
         self.assertListEqual(LUT_2.comments,
                              ['Adapted from a LUT generated by Foundry::LUT.'])
 
+    def test_read_LUT_SonySPI3D_cache(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D` definition
+        binary sidecar cache.
+        """
+
+        for name in ['Colour_Correct.spi3d', 'Colour_Correct_Unordered.spi3d']:
+            path = os.path.join(self._temporary_directory, name)
+            shutil.copyfile(os.path.join(LUTS_DIRECTORY, name), path)
+
+            LUT = read_LUT_SonySPI3D(path)
+            for _i in range(2):
+                LUT_c = read_LUT_SonySPI3D(path, cache=True)
+                self.assertEqual(LUT_c, LUT)
+
+                # The cached table is copy-on-write: in-place operations must
+                # not raise nor be written back to the cache.
+                LUT_c += 1
+                np.testing.assert_almost_equal(
+                    LUT_c.table, LUT.table + 1, decimal=7)
+                LUT_c.table[...] = 0
+
+            self.assertEqual(len(glob.glob('{0}.*.npy'.format(path))), 1)
+
 
 class TestWriteLUTSonySPI3D(unittest.TestCase):
     """
@@ -0,0 +1,458 @@
+# -*- coding: utf-8 -*-
+"""
+Spectral Image Input / Output Utilities
+=======================================
+
+Defines spectral image related input / output utilities objects:
+
+-   :func:`colour.io.read_spectral_image`
+-   :func:`colour.io.spectral_image_to_XYZ`
+-   :func:`colour.io.spectral_image_to_RGB`
+
+The spectral images are processed by tiles of rows so that the memory used is
+bounded irrespective of the image size: Both the spectral images read with
+:func:`colour.io.read_spectral_image` definition and the output images can be
+memory-mapped files.
+"""
+
+import numpy as np
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER,
+                                SPECTRAL_SHAPE_DEFAULT, msds_to_XYZ, sd_ones)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.models import RGB_COLOURSPACE_sRGB, XYZ_to_RGB, XYZ_to_xy
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              domain_range_scale, filter_kwargs, from_range_1)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'SPECTRAL_IMAGE_INTERLEAVES', 'SPECTRAL_IMAGE_TILE_MEMORY',
+    'read_spectral_image', 'spectral_image_to_XYZ', 'spectral_image_to_RGB'
+]
+
+SPECTRAL_IMAGE_INTERLEAVES = CaseInsensitiveMapping({
+    'BIP': (0, 1, 2),
+    'BIL': (0, 2, 1),
+    'BSQ': (2, 0, 1),
+})
+SPECTRAL_IMAGE_INTERLEAVES.__doc__ = """
+Supported spectral image interleaves, i.e. the order of the rows, columns and
+bands axes in the spectral image files.
+
+SPECTRAL_IMAGE_INTERLEAVES : CaseInsensitiveMapping
+    **{'BIP', 'BIL', 'BSQ'}**
+"""
+
+SPECTRAL_IMAGE_TILE_MEMORY = 2 ** 26
+"""
+Memory in bytes of a tile of rows of a spectral image when the tile size is
+not given.
+
+SPECTRAL_IMAGE_TILE_MEMORY : int
+"""
+
+
+def read_spectral_image(path,
+                        shape=None,
+                        dtype=np.float32,
+                        interleave='BIP',
+                        offset=0):
+    """
+    Reads given spectral image file as a memory-mapped array with the bands in
+    the last axis.
+
+    Parameters
+    ----------
+    path : unicode
+        Spectral image path, either a *\\*.npy* file or a raw file.
+    shape : array_like, optional
+        Spectral image shape, i.e. rows, columns and bands count, required for
+        a raw file.
+    dtype : object, optional
+        Type of the spectral image raw file values.
+    interleave : unicode, optional
+        **{'BIP', 'BIL', 'BSQ'}**,
+        Spectral image interleave, i.e. band interleaved by pixel, band
+        interleaved by line or band sequential.
+    offset : int, optional
+        Offset in bytes of the spectral image raw file values, e.g. to skip a
+        header.
+
+    Returns
+    -------
+    memmap
+        Memory-mapped spectral image with shape (rows, columns, bands).
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'image.raw')
+    >>> np.arange(24, dtype=np.float32).reshape([2, 4, 3]).tofile(path)
+    >>> image = read_spectral_image(path, (2, 3, 4), interleave='BIL')
+    >>> image.shape
+    (2, 3, 4)
+    >>> image[0, 0]
+    memmap([ 0.,  3.,  6.,  9.], dtype=float32)
+    """
+
+    order = SPECTRAL_IMAGE_INTERLEAVES[interleave]
+
+    if str(path).lower().endswith('.npy'):
+        image = np.load(path, mmap_mode='r')
+    else:
+        assert shape is not None, (
+            '"shape" must be given to read a raw spectral image!')
+
+        image = np.memmap(
+            path,
+            dtype,
+            'r',
+            offset,
+            shape=tuple(int(shape[axis]) for axis in order))
+
+    return np.transpose(image, np.argsort(order))
+
+
+def _process_spectral_image(image,
+                            M,
+                            output,
+                            tile_size,
+                            threads,
+                            callback,
+                            process=None):
+    """
+    Processes given spectral image by tiles of rows with given weighting
+    factors table into given output image.
+
+    Parameters
+    ----------
+    image : array_like
+        Spectral image with shape (rows, columns, bands).
+    M : ndarray
+        Weighting factors table with shape (bands, 3).
+    output : unicode or array_like
+        Output image path or array with shape (rows, columns, 3).
+    tile_size : int
+        Rows count of the tiles.
+    threads : int
+        Number of threads processing the tiles.
+    callback : callable
+        Callable called after each tile.
+    process : callable, optional
+        Callable processing each output tile after the weighting factors table
+        is applied.
+
+    Returns
+    -------
+    ndarray
+        Output image.
+    """
+
+    image = image if isinstance(image, np.ndarray) else as_float_array(image)
+    height, width, bands = image.shape
+
+    assert bands == M.shape[0], (
+        'Spectral image with {0} bands is not compatible with spectral shape '
+        'with {1} wavelengths!'.format(bands, M.shape[0]))
+
+    shape = (height, width, 3)
+    if output is None:
+        output = np.empty(shape, DEFAULT_FLOAT_DTYPE)
+    elif isinstance(output, str):
+        output = np.lib.format.open_memmap(output, 'w+', DEFAULT_FLOAT_DTYPE,
+                                           shape)
+    else:
+        assert output.shape == shape, (
+            '"output" shape must be {0}!'.format(shape))
+
+    if tile_size is None:
+        tile_size = SPECTRAL_IMAGE_TILE_MEMORY // (
+            width * bands * np.dtype(DEFAULT_FLOAT_DTYPE).itemsize)
+    tile_size = max(int(tile_size), 1)
+
+    M = M.astype(DEFAULT_FLOAT_DTYPE)
+
+    def process_tile(i):
+        """
+        Processes the tile starting at given row and returns its processing
+        time.
+        """
+
+        t = time.perf_counter()
+
+        a = np.dot(as_float_array(image[i:i + tile_size]), M)
+        if process is not None:
+            a = process(a)
+
+        output[i:i + tile_size] = a
+
+        return time.perf_counter() - t
+
+    tiles = range(0, height, tile_size)
+
+    def durations():
+        """
+        Processes the tiles and yields their processing time as they complete.
+        """
+
+        if threads is None or threads == 1 or len(tiles) == 1:
+            for i in tiles:
+                yield process_tile(i)
+        else:
+            with ThreadPoolExecutor(threads) as executor:
+                futures = [executor.submit(process_tile, i) for i in tiles]
+                for future in as_completed(futures):
+                    yield future.result()
+
+    for completed, duration in enumerate(durations(), 1):
+        if callback is not None:
+            callback(completed, len(tiles), duration)
+
+    if isinstance(output, np.memmap):
+        output.flush()
+
+    return output
+
+
+def spectral_image_to_XYZ(
+        image,
+        shape=SPECTRAL_SHAPE_DEFAULT,
+        output=None,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().trim(SPECTRAL_SHAPE_DEFAULT),
+        illuminant=sd_ones(),
+        k=None,
+        method='ASTM E308',
+        tile_size=None,
+        threads=None,
+        callback=None,
+        **kwargs):
+    """
+    Converts given spectral image to *CIE XYZ* tristimulus values by tiles of
+    rows using given colour matching functions and illuminant.
+
+    Parameters
+    ----------
+    image : array_like
+        Spectral image with shape (rows, columns, bands), e.g. a memory-mapped
+        array returned by the :func:`colour.io.read_spectral_image` definition.
+    shape : SpectralShape, optional
+        Spectral shape of the spectral image bands.
+    output : unicode or array_like, optional
+        Output image, either a *\\*.npy* file path the *CIE XYZ* tristimulus
+        values are written to as a memory-mapped array or an array with shape
+        (rows, columns, 3), e.g. a memory-mapped array.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    k : numeric, optional
+        Normalisation constant :math:`k`.
+    method : unicode, optional
+        **{'ASTM E308', 'Integration'}**,
+        Computation method.
+    tile_size : int, optional
+        Rows count of the tiles, if *None* it is chosen so that a tile uses
+        :attr:`colour.io.SPECTRAL_IMAGE_TILE_MEMORY` bytes.
+    threads : int, optional
+        Number of threads processing the tiles, the tiles are processed in the
+        calling thread if *None* or 1.
+    callback : callable, optional
+        Callable called in the calling thread after each processed tile with
+        the count of processed tiles, the count of tiles and the tile
+        processing time in seconds, e.g. to report the progress.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.msds_to_XYZ`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values with shape (rows, columns, 3).
+
+    Notes
+    -----
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``XYZ``   | [0, 100]              | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    -   The conversion of multi-spectral distributions to *CIE XYZ*
+        tristimulus values being linear, the table converting each band to
+        *CIE XYZ* tristimulus values is computed once by converting the
+        identity matrix with the :func:`colour.msds_to_XYZ` definition and is
+        then applied onto each tile.
+
+    Examples
+    --------
+    >>> from colour import SDS_ILLUMINANTS, SpectralShape
+    >>> shape = SpectralShape(400, 700, 60)
+    >>> image = np.reshape(np.linspace(0, 1, 24), (2, 2, 6))
+    >>> spectral_image_to_XYZ(
+    ...     image, shape, illuminant=SDS_ILLUMINANTS['D65'],
+    ...     method='Integration', tile_size=1)  # doctest: +ELLIPSIS
+    array([[[ 11.2421588...,  11.2683086...,   5.1641232...],
+            [ 35.6412173...,  37.3552651...,  35.7271828...]],
+    <BLANKLINE>
+           [[ 60.0402758...,  63.4422216...,  66.2902425...],
+            [ 84.4393342...,  89.5291782...,  96.8533022...]]])
+    """
+
+    M = msds_to_XYZ(
+        np.identity(len(shape.range())),
+        cmfs,
+        illuminant,
+        k,
+        method,
+        shape=shape,
+        **filter_kwargs(msds_to_XYZ, **kwargs))
+
+    return _process_spectral_image(image, M, output, tile_size, threads,
+                                   callback)
+
+
+def spectral_image_to_RGB(
+        image,
+        shape=SPECTRAL_SHAPE_DEFAULT,
+        output=None,
+        colourspace=RGB_COLOURSPACE_sRGB,
+        apply_cctf_encoding=True,
+        chromatic_adaptation_transform='CAT02',
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().trim(SPECTRAL_SHAPE_DEFAULT),
+        illuminant=sd_ones(),
+        k=None,
+        method='ASTM E308',
+        tile_size=None,
+        threads=None,
+        callback=None,
+        **kwargs):
+    """
+    Converts given spectral image to given *RGB* colourspace by tiles of rows
+    using given colour matching functions and illuminant.
+
+    Parameters
+    ----------
+    image : array_like
+        Spectral image with shape (rows, columns, bands), e.g. a memory-mapped
+        array returned by the :func:`colour.io.read_spectral_image` definition.
+    shape : SpectralShape, optional
+        Spectral shape of the spectral image bands.
+    output : unicode or array_like, optional
+        Output image, either a *\\*.npy* file path the *RGB* colourspace array
+        is written to as a memory-mapped array or an array with shape
+        (rows, columns, 3), e.g. a memory-mapped array.
+    colourspace : RGB_Colourspace, optional
+        *RGB* colourspace to convert the spectral image to.
+    apply_cctf_encoding : bool, optional
+        Apply the *RGB* colourspace encoding colour component transfer
+        function / opto-electronic transfer function, i.e. output display
+        *RGB* values.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02 Brill 2008', 'CAT16',
+        'Bianco 2010', 'Bianco PC 2010'}**,
+        *Chromatic adaptation* transform from the illuminant to the *RGB*
+        colourspace whitepoint.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    k : numeric, optional
+        Normalisation constant :math:`k`.
+    method : unicode, optional
+        **{'ASTM E308', 'Integration'}**,
+        Computation method.
+    tile_size : int, optional
+        Rows count of the tiles, if *None* it is chosen so that a tile uses
+        :attr:`colour.io.SPECTRAL_IMAGE_TILE_MEMORY` bytes.
+    threads : int, optional
+        Number of threads processing the tiles, the tiles are processed in the
+        calling thread if *None* or 1.
+    callback : callable, optional
+        Callable called in the calling thread after each processed tile with
+        the count of processed tiles, the count of tiles and the tile
+        processing time in seconds, e.g. to report the progress.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.msds_to_XYZ`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    ndarray
+        *RGB* colourspace array with shape (rows, columns, 3).
+
+    Notes
+    -----
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``RGB``   | [0, 1]                | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    -   The conversion to linear *RGB* colourspace values being linear, the
+        table converting each band to linear *RGB* colourspace values is
+        computed once and is then applied onto each tile.
+
+    Examples
+    --------
+    >>> from colour import SDS_ILLUMINANTS, SpectralShape
+    >>> shape = SpectralShape(400, 700, 60)
+    >>> image = np.reshape(np.linspace(0, 1, 24), (2, 2, 6))
+    >>> spectral_image_to_RGB(
+    ...     image, shape, illuminant=SDS_ILLUMINANTS['D65'],
+    ...     method='Integration', tile_size=1)  # doctest: +ELLIPSIS
+    array([[[ 0.457353 ...,  0.3533957...,  0.2027236...],
+            [ 0.6925823...,  0.6369662...,  0.5792378...]],
+    <BLANKLINE>
+           [[ 0.8533993...,  0.8119648...,  0.7709394...],
+            [ 0.9818266...,  0.9477362...,  0.9146067...]]])
+    """
+
+    with domain_range_scale('1'):
+        M = msds_to_XYZ(
+            np.identity(len(shape.range())),
+            cmfs,
+            illuminant,
+            k,
+            method,
+            shape=shape,
+            **filter_kwargs(msds_to_XYZ, **kwargs))
+
+        M = XYZ_to_RGB(M, XYZ_to_xy(np.sum(M, axis=0)), colourspace.whitepoint,
+                       colourspace.matrix_XYZ_to_RGB,
+                       chromatic_adaptation_transform)
+
+    def process(RGB):
+        """
+        Scales given linear *RGB* colourspace values tile and applies the
+        encoding colour component transfer function.
+        """
+
+        RGB = from_range_1(RGB)
+
+        if apply_cctf_encoding:
+            RGB = colourspace.cctf_encoding(RGB)
+
+        return RGB
+
+    return _process_spectral_image(image, M, output, tile_size, threads,
+                                   callback, process)
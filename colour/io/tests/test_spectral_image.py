@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.spectral_image` module.
+"""
+
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+
+from colour.colorimetry import SDS_ILLUMINANTS, SpectralShape, msds_to_XYZ
+from colour.io import (read_spectral_image, spectral_image_to_XYZ,
+                       spectral_image_to_RGB)
+from colour.models import RGB_COLOURSPACE_sRGB
+from colour.utilities import domain_range_scale
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'SHAPE', 'IMAGE', 'TestReadSpectralImage', 'TestSpectralImageToXYZ',
+    'TestSpectralImageToRGB'
+]
+
+SHAPE = SpectralShape(400, 700, 10)
+
+IMAGE = np.random.RandomState(4).uniform(0, 1, (7, 5, 31))
+
+
+class TestReadSpectralImage(unittest.TestCase):
+    """
+    Defines :func:`colour.io.spectral_image.read_spectral_image` definition
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_spectral_image(self):
+        """
+        Tests :func:`colour.io.spectral_image.read_spectral_image` definition.
+        """
+
+        image = IMAGE.astype(np.float32)
+
+        path = os.path.join(self._temporary_directory, 'image.npy')
+        np.save(path, image)
+        spectral_image = read_spectral_image(path)
+        self.assertIsInstance(spectral_image, np.memmap)
+        np.testing.assert_equal(spectral_image, image)
+
+        path = os.path.join(self._temporary_directory, 'image.raw')
+        for interleave, axes in (('BIP', (0, 1, 2)), ('BIL', (0, 2, 1)),
+                                 ('BSQ', (2, 0, 1))):
+            with open(path, 'wb') as raw_file:
+                raw_file.write(b'\x00' * 16)
+                np.transpose(image, axes).tofile(raw_file)
+
+            spectral_image = read_spectral_image(
+                path, image.shape, interleave=interleave, offset=16)
+            self.assertIsInstance(spectral_image, np.memmap)
+            np.testing.assert_equal(spectral_image, image)
+
+    def test_raise_exception_read_spectral_image(self):
+        """
+        Tests :func:`colour.io.spectral_image.read_spectral_image` definition
+        raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'image.raw')
+        IMAGE.tofile(path)
+
+        self.assertRaises(AssertionError, read_spectral_image, path)
+
+        self.assertRaises(
+            KeyError,
+            read_spectral_image,
+            path,
+            IMAGE.shape,
+            interleave='Undefined')
+
+
+class TestSpectralImageToXYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.io.spectral_image.spectral_image_to_XYZ` definition
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_spectral_image_to_XYZ(self):
+        """
+        Tests :func:`colour.io.spectral_image.spectral_image_to_XYZ`
+        definition.
+        """
+
+        D65 = SDS_ILLUMINANTS['D65']
+        for method in ('ASTM E308', 'Integration'):
+            XYZ = msds_to_XYZ(
+                IMAGE, illuminant=D65, method=method, shape=SHAPE)
+
+            np.testing.assert_almost_equal(
+                spectral_image_to_XYZ(
+                    IMAGE, SHAPE, illuminant=D65, method=method),
+                XYZ,
+                decimal=7)
+
+            np.testing.assert_almost_equal(
+                spectral_image_to_XYZ(
+                    IMAGE,
+                    SHAPE,
+                    illuminant=D65,
+                    method=method,
+                    tile_size=2,
+                    threads=2),
+                XYZ,
+                decimal=7)
+
+        path = os.path.join(self._temporary_directory, 'XYZ.npy')
+        tiles = []
+        XYZ = spectral_image_to_XYZ(
+            IMAGE,
+            SHAPE,
+            path,
+            illuminant=D65,
+            tile_size=3,
+            callback=lambda *args: tiles.append(args))
+        self.assertIsInstance(XYZ, np.memmap)
+        np.testing.assert_almost_equal(
+            np.load(path),
+            msds_to_XYZ(IMAGE, illuminant=D65, shape=SHAPE),
+            decimal=7)
+        counts = [tile[:2] for tile in tiles]
+        self.assertListEqual(counts, [(1, 3), (2, 3), (3, 3)])
+
+    def test_domain_range_scale_spectral_image_to_XYZ(self):
+        """
+        Tests :func:`colour.io.spectral_image.spectral_image_to_XYZ`
+        definition domain and range scale support.
+        """
+
+        XYZ = spectral_image_to_XYZ(IMAGE, SHAPE)
+
+        d_r = (('reference', 1), (1, 0.01), (100, 1))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    spectral_image_to_XYZ(IMAGE, SHAPE),
+                    XYZ * factor,
+                    decimal=7)
+
+    def test_raise_exception_spectral_image_to_XYZ(self):
+        """
+        Tests :func:`colour.io.spectral_image.spectral_image_to_XYZ`
+        definition raised exception.
+        """
+
+        self.assertRaises(AssertionError, spectral_image_to_XYZ, IMAGE)
+
+        self.assertRaises(
+            AssertionError,
+            spectral_image_to_XYZ,
+            IMAGE,
+            SHAPE,
+            output=np.zeros([7, 5, 4]))
+
+
+class TestSpectralImageToRGB(unittest.TestCase):
+    """
+    Defines :func:`colour.io.spectral_image.spectral_image_to_RGB` definition
+    units tests methods.
+    """
+
+    def test_spectral_image_to_RGB(self):
+        """
+        Tests :func:`colour.io.spectral_image.spectral_image_to_RGB`
+        definition.
+        """
+
+        D65 = SDS_ILLUMINANTS['D65']
+        np.testing.assert_almost_equal(
+            spectral_image_to_RGB(np.ones([2, 2, 31]), SHAPE, illuminant=D65),
+            np.ones([2, 2, 3]),
+            decimal=3)
+
+        RGB = spectral_image_to_RGB(
+            IMAGE, SHAPE, illuminant=D65, apply_cctf_encoding=False)
+        np.testing.assert_almost_equal(
+            RGB_COLOURSPACE_sRGB.cctf_encoding(RGB),
+            spectral_image_to_RGB(
+                IMAGE, SHAPE, illuminant=D65, tile_size=1, threads=2),
+            decimal=7)
+
+    def test_domain_range_scale_spectral_image_to_RGB(self):
+        """
+        Tests :func:`colour.io.spectral_image.spectral_image_to_RGB`
+        definition domain and range scale support.
+        """
+
+        RGB = spectral_image_to_RGB(IMAGE, SHAPE)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    spectral_image_to_RGB(IMAGE, SHAPE),
+                    RGB * factor,
+                    decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
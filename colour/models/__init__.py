@@ -4,43 +4,68 @@ import sys
 
 from colour.utilities.deprecation import ModuleAPI, build_API_changes
 from colour.utilities.documentation import is_documentation_building
+from colour.utilities import lazy_module_attributes
 
-from .common import (Jab_to_JCh, JCh_to_Jab, COLOURSPACE_MODELS,
-                     COLOURSPACE_MODELS_AXIS_LABELS)
-from .cam02_ucs import (JMh_CIECAM02_to_CAM02LCD, CAM02LCD_to_JMh_CIECAM02,
-                        JMh_CIECAM02_to_CAM02SCD, CAM02SCD_to_JMh_CIECAM02,
-                        JMh_CIECAM02_to_CAM02UCS, CAM02UCS_to_JMh_CIECAM02,
-                        XYZ_to_CAM02LCD, CAM02LCD_to_XYZ, XYZ_to_CAM02SCD,
-                        CAM02SCD_to_XYZ, XYZ_to_CAM02UCS, CAM02UCS_to_XYZ)
-from .cam16_ucs import (JMh_CAM16_to_CAM16LCD, CAM16LCD_to_JMh_CAM16,
-                        JMh_CAM16_to_CAM16SCD, CAM16SCD_to_JMh_CAM16,
-                        JMh_CAM16_to_CAM16UCS, CAM16UCS_to_JMh_CAM16,
-                        XYZ_to_CAM16LCD, CAM16LCD_to_XYZ, XYZ_to_CAM16SCD,
-                        CAM16SCD_to_XYZ, XYZ_to_CAM16UCS, CAM16UCS_to_XYZ)
-from .cie_xyy import (XYZ_to_xyY, xyY_to_XYZ, xy_to_xyY, xyY_to_xy, xy_to_XYZ,
-                      XYZ_to_xy)
-from .cie_lab import XYZ_to_Lab, Lab_to_XYZ, Lab_to_LCHab, LCHab_to_Lab
-from .cie_luv import (XYZ_to_Luv, Luv_to_XYZ, Luv_to_uv, uv_to_Luv,
-                      Luv_uv_to_xy, xy_to_Luv_uv, Luv_to_LCHuv, LCHuv_to_Luv)
-from .cie_ucs import (XYZ_to_UCS, UCS_to_XYZ, UCS_to_uv, uv_to_UCS,
-                      UCS_uv_to_xy, xy_to_UCS_uv)
-from .cie_uvw import XYZ_to_UVW, UVW_to_XYZ
-from .din99 import Lab_to_DIN99, DIN99_to_Lab
-from .hdr_cie_lab import (HDR_CIELAB_METHODS, XYZ_to_hdr_CIELab,
-                          hdr_CIELab_to_XYZ)
-from .hunter_lab import (XYZ_to_K_ab_HunterLab1966, XYZ_to_Hunter_Lab,
-                         Hunter_Lab_to_XYZ)
-from .hunter_rdab import XYZ_to_Hunter_Rdab, Hunter_Rdab_to_XYZ
-from .igpgtg import XYZ_to_IgPgTg, IgPgTg_to_XYZ
-from .ipt import XYZ_to_IPT, IPT_to_XYZ, IPT_hue_angle
-from .jzazbz import XYZ_to_JzAzBz, JzAzBz_to_XYZ
-from .hdr_ipt import HDR_IPT_METHODS, XYZ_to_hdr_IPT, hdr_IPT_to_XYZ
-from .oklab import XYZ_to_Oklab, Oklab_to_XYZ
-from .osa_ucs import XYZ_to_OSA_UCS, OSA_UCS_to_XYZ
-from .datasets import *  # noqa
-from . import datasets
-from .rgb import *  # noqa
-from . import rgb
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'common': [
+            'Jab_to_JCh', 'JCh_to_Jab', 'COLOURSPACE_MODELS',
+            'COLOURSPACE_MODELS_AXIS_LABELS'
+        ],
+        'cam02_ucs': [
+            'JMh_CIECAM02_to_CAM02LCD', 'CAM02LCD_to_JMh_CIECAM02',
+            'JMh_CIECAM02_to_CAM02SCD', 'CAM02SCD_to_JMh_CIECAM02',
+            'JMh_CIECAM02_to_CAM02UCS', 'CAM02UCS_to_JMh_CIECAM02',
+            'XYZ_to_CAM02LCD', 'CAM02LCD_to_XYZ', 'XYZ_to_CAM02SCD',
+            'CAM02SCD_to_XYZ', 'XYZ_to_CAM02UCS', 'CAM02UCS_to_XYZ'
+        ],
+        'cam16_ucs': [
+            'JMh_CAM16_to_CAM16LCD', 'CAM16LCD_to_JMh_CAM16',
+            'JMh_CAM16_to_CAM16SCD', 'CAM16SCD_to_JMh_CAM16',
+            'JMh_CAM16_to_CAM16UCS', 'CAM16UCS_to_JMh_CAM16',
+            'XYZ_to_CAM16LCD', 'CAM16LCD_to_XYZ', 'XYZ_to_CAM16SCD',
+            'CAM16SCD_to_XYZ', 'XYZ_to_CAM16UCS', 'CAM16UCS_to_XYZ'
+        ],
+        'cie_xyy': [
+            'XYZ_to_xyY', 'xyY_to_XYZ', 'xy_to_xyY', 'xyY_to_xy', 'xy_to_XYZ',
+            'XYZ_to_xy'
+        ],
+        'cie_lab': [
+            'XYZ_to_Lab', 'Lab_to_XYZ', 'Lab_to_LCHab', 'LCHab_to_Lab'
+        ],
+        'cie_luv': [
+            'XYZ_to_Luv', 'Luv_to_XYZ', 'Luv_to_uv', 'uv_to_Luv',
+            'Luv_uv_to_xy', 'xy_to_Luv_uv', 'Luv_to_LCHuv', 'LCHuv_to_Luv'
+        ],
+        'cie_ucs': [
+            'XYZ_to_UCS', 'UCS_to_XYZ', 'UCS_to_uv', 'uv_to_UCS',
+            'UCS_uv_to_xy', 'xy_to_UCS_uv'
+        ],
+        'cie_uvw': ['XYZ_to_UVW', 'UVW_to_XYZ'],
+        'din99': ['Lab_to_DIN99', 'DIN99_to_Lab'],
+        'hdr_cie_lab': [
+            'HDR_CIELAB_METHODS', 'XYZ_to_hdr_CIELab', 'hdr_CIELab_to_XYZ'
+        ],
+        'hunter_lab': [
+            'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Hunter_Lab',
+            'Hunter_Lab_to_XYZ'
+        ],
+        'hunter_rdab': ['XYZ_to_Hunter_Rdab', 'Hunter_Rdab_to_XYZ'],
+        'igpgtg': ['XYZ_to_IgPgTg', 'IgPgTg_to_XYZ'],
+        'ipt': ['XYZ_to_IPT', 'IPT_to_XYZ', 'IPT_hue_angle'],
+        'jzazbz': ['XYZ_to_JzAzBz', 'JzAzBz_to_XYZ'],
+        'hdr_ipt': ['HDR_IPT_METHODS', 'XYZ_to_hdr_IPT', 'hdr_IPT_to_XYZ'],
+        'oklab': ['XYZ_to_Oklab', 'Oklab_to_XYZ'],
+        'osa_ucs': ['XYZ_to_OSA_UCS', 'OSA_UCS_to_XYZ'],
+        'datasets':
+            None,
+        'rgb':
+            None
+    })
+del lazy_module_attributes
+
+from . import datasets  # noqa
+from . import rgb  # noqa
 
 __all__ = [
     'Jab_to_JCh', 'JCh_to_Jab', 'COLOURSPACE_MODELS',
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from .macadam_ellipses import DATA_MACADAM_1942_ELLIPSES
-from .pointer_gamut import (CCS_ILLUMINANT_POINTER_GAMUT,
-                            DATA_POINTER_GAMUT_VOLUME,
-                            CCS_POINTER_GAMUT_BOUNDARY)
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'macadam_ellipses': ['DATA_MACADAM_1942_ELLIPSES'],
+        'pointer_gamut': [
+            'CCS_ILLUMINANT_POINTER_GAMUT', 'DATA_POINTER_GAMUT_VOLUME',
+            'CCS_POINTER_GAMUT_BOUNDARY'
+        ]
+    })
+del lazy_module_attributes
 
 __all__ = ['DATA_MACADAM_1942_ELLIPSES']
 __all__ += [
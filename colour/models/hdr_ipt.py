@@ -196,7 +196,7 @@ def XYZ_to_hdr_IPT(XYZ, Y_s=0.2, Y_abs=100, method='Fairchild 2011'):
     else:
         lightness_callable = lightness_Fairchild2011
 
-    e = exponent_hdr_IPT(Y_s, Y_abs, method)[..., np.newaxis]
+    e = as_float_array(exponent_hdr_IPT(Y_s, Y_abs, method))[..., np.newaxis]
 
     LMS = vector_dot(MATRIX_IPT_XYZ_TO_LMS, XYZ)
 
@@ -280,7 +280,7 @@ def hdr_IPT_to_XYZ(IPT_hdr, Y_s=0.2, Y_abs=100, method='Fairchild 2011'):
     else:
         luminance_callable = luminance_Fairchild2011
 
-    e = exponent_hdr_IPT(Y_s, Y_abs, method)[..., np.newaxis]
+    e = as_float_array(exponent_hdr_IPT(Y_s, Y_abs, method))[..., np.newaxis]
 
     LMS = vector_dot(MATRIX_IPT_IPT_TO_LMS, IPT_hdr)
 
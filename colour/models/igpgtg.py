@@ -18,7 +18,8 @@ References
 import numpy as np
 
 from colour.algebra import spow
-from colour.utilities import (from_range_1, to_domain_1, vector_dot)
+from colour.utilities import (as_float_array, from_range_1, to_domain_1,
+                              vector_dot)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -121,7 +122,7 @@ def XYZ_to_IgPgTg(XYZ):
     XYZ = to_domain_1(XYZ)
 
     LMS = vector_dot(MATRIX_IGPGTG_XYZ_TO_LMS, XYZ)
-    LMS_prime = spow(LMS / np.array([18.36, 21.46, 19435]), 0.427)
+    LMS_prime = spow(LMS / as_float_array([18.36, 21.46, 19435]), 0.427)
     IgPgTg = vector_dot(MATRIX_IGPGTG_LMS_TO_IGPGTG, LMS_prime)
 
     return from_range_1(IgPgTg)
@@ -175,7 +176,7 @@ def IgPgTg_to_XYZ(IgPgTg):
     IgPgTg = to_domain_1(IgPgTg)
 
     LMS = vector_dot(MATRIX_IGPGTG_IGPGTG_TO_LMS, IgPgTg)
-    LMS_prime = spow(LMS, 1 / 0.427) * np.array([18.36, 21.46, 19435])
+    LMS_prime = spow(LMS, 1 / 0.427) * as_float_array([18.36, 21.46, 19435])
     XYZ = vector_dot(MATRIX_IGPGTG_LMS_TO_XYZ, LMS_prime)
 
     return from_range_1(XYZ)
@@ -119,8 +119,8 @@ def XYZ_to_OSA_UCS(XYZ):
 
     C = Lambda / (5.9 * Y_0_es)
     L = (Lambda - 14.4) / spow(2, 1 / 2)
-    j = C * np.dot(RGB_3, np.array([1.7, 8, -9.7]))
-    g = C * np.dot(RGB_3, np.array([-13.7, 17.7, -4]))
+    j = C * np.dot(RGB_3, as_float_array([1.7, 8, -9.7]))
+    g = C * np.dot(RGB_3, as_float_array([-13.7, 17.7, -4]))
 
     Ljg = tstack([L, j, g])
 
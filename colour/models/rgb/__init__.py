@@ -1,23 +1,40 @@
 # -*- coding: utf-8 -*-
 
-from .derivation import (normalised_primary_matrix,
-                         chromatically_adapted_primaries, primaries_whitepoint,
-                         RGB_luminance_equation, RGB_luminance)
-from .rgb_colourspace import RGB_Colourspace
-from .rgb_colourspace import XYZ_to_RGB, RGB_to_XYZ
-from .rgb_colourspace import matrix_RGB_to_RGB, RGB_to_RGB
-from .transfer_functions import *  # noqa
-from . import transfer_functions
-from .datasets import *  # noqa
-from . import datasets
-from .common import XYZ_to_sRGB, sRGB_to_XYZ
-from .cylindrical import RGB_to_HSV, HSV_to_RGB, RGB_to_HSL, HSL_to_RGB
-from .cmyk import RGB_to_CMY, CMY_to_RGB, CMY_to_CMYK, CMYK_to_CMY
-from .prismatic import RGB_to_Prismatic, Prismatic_to_RGB
-from .ycbcr import (WEIGHTS_YCBCR, matrix_YCbCr, offset_YCbCr, RGB_to_YCbCr,
-                    YCbCr_to_RGB, RGB_to_YcCbcCrc, YcCbcCrc_to_RGB)
-from .ycocg import RGB_to_YCoCg, YCoCg_to_RGB
-from .ictcp import RGB_to_ICtCp, ICtCp_to_RGB, XYZ_to_ICtCp, ICtCp_to_XYZ
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'derivation': [
+            'normalised_primary_matrix', 'chromatically_adapted_primaries',
+            'primaries_whitepoint', 'RGB_luminance_equation', 'RGB_luminance'
+        ],
+        'rgb_colourspace': [
+            'RGB_Colourspace', 'XYZ_to_RGB', 'RGB_to_XYZ', 'matrix_RGB_to_RGB',
+            'RGB_to_RGB'
+        ],
+        'transfer_functions':
+            None,
+        'datasets':
+            None,
+        'common': ['XYZ_to_sRGB', 'sRGB_to_XYZ'],
+        'cylindrical': [
+            'RGB_to_HSV', 'HSV_to_RGB', 'RGB_to_HSL', 'HSL_to_RGB'
+        ],
+        'cmyk': ['RGB_to_CMY', 'CMY_to_RGB', 'CMY_to_CMYK', 'CMYK_to_CMY'],
+        'prismatic': ['RGB_to_Prismatic', 'Prismatic_to_RGB'],
+        'ycbcr': [
+            'WEIGHTS_YCBCR', 'matrix_YCbCr', 'offset_YCbCr', 'RGB_to_YCbCr',
+            'YCbCr_to_RGB', 'RGB_to_YcCbcCrc', 'YcCbcCrc_to_RGB'
+        ],
+        'ycocg': ['RGB_to_YCoCg', 'YCoCg_to_RGB'],
+        'ictcp': [
+            'RGB_to_ICtCp', 'ICtCp_to_RGB', 'XYZ_to_ICtCp', 'ICtCp_to_XYZ'
+        ]
+    })
+del lazy_module_attributes
+
+from . import transfer_functions  # noqa
+from . import datasets  # noqa
 
 __all__ = [
     'normalised_primary_matrix', 'chromatically_adapted_primaries',
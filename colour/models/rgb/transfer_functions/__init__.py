@@ -2,8 +2,10 @@
 
 from functools import partial
 
-from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
-                              usage_warning)
+import numpy as np
+
+from colour.utilities import (CaseInsensitiveMapping, as_float, filter_kwargs,
+                              from_range_1, usage_warning)
 
 from .common import CV_range, legal_to_full, full_to_legal
 from .gamma import gamma_function
@@ -62,6 +64,8 @@ from .sony_slog import (log_encoding_SLog, log_decoding_SLog,
                         log_encoding_SLog3, log_decoding_SLog3)
 from .srgb import eotf_inverse_sRGB, eotf_sRGB
 from .viper_log import log_encoding_ViperLog, log_decoding_ViperLog
+from .tabulation import (DOMAIN_TABULATION, TOLERANCE_TABULATION,
+                         TransferFunctionTable, tabulate_transfer_function)
 
 __all__ = ['CV_range', 'legal_to_full', 'full_to_legal']
 __all__ += ['gamma_function']
@@ -127,6 +131,52 @@ __all__ += [
 ]
 __all__ += ['eotf_inverse_sRGB', 'eotf_sRGB']
 __all__ += ['log_encoding_ViperLog', 'log_decoding_ViperLog']
+__all__ += [
+    'DOMAIN_TABULATION', 'TOLERANCE_TABULATION', 'TransferFunctionTable',
+    'tabulate_transfer_function'
+]
+
+
+def _tabulate_transfer_function(function,
+                                tolerance,
+                                function_inverse=None,
+                                **kwargs):
+    """
+    Returns given transfer function tabulated on the code values or, if given
+    its inverse, on the values decoded from the code values.
+
+    Parameters
+    ----------
+    function : callable
+        Transfer function.
+    tolerance : numeric
+        Maximum error of the tabulated transfer function values.
+    function_inverse : callable, optional
+        Inverse transfer function.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the transfer function and its inverse.
+
+    Returns
+    -------
+    TransferFunctionTable
+        Tabulated transfer function.
+    """
+
+    minimum, maximum = DOMAIN_TABULATION[0], from_range_1(1)
+
+    if function_inverse is not None:
+        maximum_d = as_float(
+            function_inverse(maximum,
+                             **filter_kwargs(function_inverse, **kwargs)))
+        if np.isfinite(maximum_d) and maximum_d > minimum:
+            maximum = maximum_d
+
+    return tabulate_transfer_function(function, (minimum, maximum), tolerance,
+                                      **filter_kwargs(function, **kwargs))
+
 
 LOG_ENCODINGS = CaseInsensitiveMapping({
     'ACEScc': log_encoding_ACEScc,
@@ -169,7 +219,11 @@ LOG_ENCODINGS : CaseInsensitiveMapping
 """
 
 
-def log_encoding(value, function='Cineon', **kwargs):
+def log_encoding(value,
+                 function='Cineon',
+                 tabulate=False,
+                 tolerance=TOLERANCE_TABULATION,
+                 **kwargs):
     """
     Encodes linear-light values to :math:`R'G'B'` video component signal
     value using given *log* function.
@@ -185,6 +239,13 @@ def log_encoding(value, function='Cineon', **kwargs):
         'PLog', 'Protune', 'REDLog', 'REDLogFilm', 'S-Log', 'S-Log2', 'S-Log3',
         'T-Log', 'V-Log', 'ViperLog'}**,
         Computation function.
+    tabulate : bool, optional
+        Whether to evaluate the transfer function by interpolating a dense
+        table baked on first use and cached, see the
+        :class:`colour.models.TransferFunctionTable` class.
+    tolerance : numeric, optional
+        Maximum error of the tabulated transfer function values, absolute for
+        the values with a magnitude lower than 1 and relative otherwise.
 
     Other Parameters
     ----------------
@@ -268,6 +329,11 @@ def log_encoding(value, function='Cineon', **kwargs):
     0.3849708...
     """
 
+    if tabulate:
+        return _tabulate_transfer_function(LOG_ENCODINGS[function], tolerance,
+                                           LOG_DECODINGS.get(function),
+                                           **kwargs)(value)
+
     function = LOG_ENCODINGS[function]
 
     return function(value, **filter_kwargs(function, **kwargs))
@@ -314,7 +380,11 @@ LOG_DECODINGS : CaseInsensitiveMapping
 """
 
 
-def log_decoding(value, function='Cineon', **kwargs):
+def log_decoding(value,
+                 function='Cineon',
+                 tabulate=False,
+                 tolerance=TOLERANCE_TABULATION,
+                 **kwargs):
     """
     Decodes :math:`R'G'B'` video component signal value to linear-light values
     using given *log* function.
@@ -330,6 +400,13 @@ def log_decoding(value, function='Cineon', **kwargs):
         'PLog', 'Protune', 'REDLog', 'REDLogFilm', 'S-Log', 'S-Log2', 'S-Log3',
         'T-Log', 'V-Log', 'ViperLog'}**,
         Computation function.
+    tabulate : bool, optional
+        Whether to evaluate the transfer function by interpolating a dense
+        table baked on first use and cached, see the
+        :class:`colour.models.TransferFunctionTable` class.
+    tolerance : numeric, optional
+        Maximum error of the tabulated transfer function values, absolute for
+        the values with a magnitude lower than 1 and relative otherwise.
 
     Other Parameters
     ----------------
@@ -415,6 +492,10 @@ def log_decoding(value, function='Cineon', **kwargs):
     0.1...
     """
 
+    if tabulate:
+        return _tabulate_transfer_function(LOG_DECODINGS[function], tolerance,
+                                           **kwargs)(value)
+
     function = LOG_DECODINGS[function]
 
     return function(value, **filter_kwargs(function, **kwargs))
@@ -441,7 +522,11 @@ OETFS : CaseInsensitiveMapping
 """
 
 
-def oetf(value, function='ITU-R BT.709', **kwargs):
+def oetf(value,
+         function='ITU-R BT.709',
+         tabulate=False,
+         tolerance=TOLERANCE_TABULATION,
+         **kwargs):
     """
     Encodes estimated tristimulus values in a scene to :math:`R'G'B'` video
     component signal value using given opto-electronic transfer function
@@ -456,6 +541,13 @@ def oetf(value, function='ITU-R BT.709', **kwargs):
         'ITU-R BT.2100 HLG', 'ITU-R BT.2100 PQ', 'ITU-R BT.601',
         'SMPTE 240M'}**,
         Opto-electronic transfer function (OETF / OECF).
+    tabulate : bool, optional
+        Whether to evaluate the transfer function by interpolating a dense
+        table baked on first use and cached, see the
+        :class:`colour.models.TransferFunctionTable` class.
+    tolerance : numeric, optional
+        Maximum error of the tabulated transfer function values, absolute for
+        the values with a magnitude lower than 1 and relative otherwise.
 
     Other Parameters
     ----------------
@@ -476,6 +568,11 @@ def oetf(value, function='ITU-R BT.709', **kwargs):
     0.4090077...
     """
 
+    if tabulate:
+        return _tabulate_transfer_function(OETFS[function], tolerance,
+                                           OETF_INVERSES.get(function),
+                                           **kwargs)(value)
+
     function = OETFS[function]
 
     return function(value, **filter_kwargs(function, **kwargs))
@@ -498,7 +595,11 @@ OETF_INVERSES : CaseInsensitiveMapping
 """
 
 
-def oetf_inverse(value, function='ITU-R BT.709', **kwargs):
+def oetf_inverse(value,
+                 function='ITU-R BT.709',
+                 tabulate=False,
+                 tolerance=TOLERANCE_TABULATION,
+                 **kwargs):
     """
     Decodes :math:`R'G'B'` video component signal value to tristimulus values
     at the display using given inverse opto-electronic transfer function
@@ -513,6 +614,13 @@ def oetf_inverse(value, function='ITU-R BT.709', **kwargs):
         'ITU-R BT.2100 HLG', 'ITU-R BT.2100 PQ', 'ITU-R BT.601',
         'SMPTE 240M'}**,
         Inverse opto-electronic transfer function (OETF / OECF).
+    tabulate : bool, optional
+        Whether to evaluate the transfer function by interpolating a dense
+        table baked on first use and cached, see the
+        :class:`colour.models.TransferFunctionTable` class.
+    tolerance : numeric, optional
+        Maximum error of the tabulated transfer function values, absolute for
+        the values with a magnitude lower than 1 and relative otherwise.
 
     Other Parameters
     ----------------
@@ -534,6 +642,10 @@ def oetf_inverse(value, function='ITU-R BT.709', **kwargs):
     0.1...
     """
 
+    if tabulate:
+        return _tabulate_transfer_function(OETF_INVERSES[function], tolerance,
+                                           **kwargs)(value)
+
     function = OETF_INVERSES[function]
 
     return function(value, **filter_kwargs(function, **kwargs))
@@ -559,7 +671,11 @@ EOTFS : CaseInsensitiveMapping
 """
 
 
-def eotf(value, function='ITU-R BT.1886', **kwargs):
+def eotf(value,
+         function='ITU-R BT.1886',
+         tabulate=False,
+         tolerance=TOLERANCE_TABULATION,
+         **kwargs):
     """
     Decodes :math:`R'G'B'` video component signal value to tristimulus values
     at the display using given electro-optical transfer function (EOTF / EOCF).
@@ -573,6 +689,13 @@ def eotf(value, function='ITU-R BT.1886', **kwargs):
         'ITU-R BT.2100 HLG', 'ITU-R BT.2100 PQ', 'SMPTE 240M', 'ST 2084',
         'sRGB'}**,
         Electro-optical transfer function (EOTF / EOCF).
+    tabulate : bool, optional
+        Whether to evaluate the transfer function by interpolating a dense
+        table baked on first use and cached, see the
+        :class:`colour.models.TransferFunctionTable` class.
+    tolerance : numeric, optional
+        Maximum error of the tabulated transfer function values, absolute for
+        the values with a magnitude lower than 1 and relative otherwise.
 
     Other Parameters
     ----------------
@@ -621,6 +744,10 @@ def eotf(value, function='ITU-R BT.1886', **kwargs):
     0.1...
     """
 
+    if tabulate:
+        return _tabulate_transfer_function(EOTFS[function], tolerance,
+                                           **kwargs)(value)
+
     function = EOTFS[function]
 
     return function(value, **filter_kwargs(function, **kwargs))
@@ -645,7 +772,11 @@ EOTF_INVERSES : CaseInsensitiveMapping
 """
 
 
-def eotf_inverse(value, function='ITU-R BT.1886', **kwargs):
+def eotf_inverse(value,
+                 function='ITU-R BT.1886',
+                 tabulate=False,
+                 tolerance=TOLERANCE_TABULATION,
+                 **kwargs):
     """
     Encodes estimated tristimulus values in a scene to :math:`R'G'B'` video
     component signal value using given inverse electro-optical transfer
@@ -659,6 +790,13 @@ def eotf_inverse(value, function='ITU-R BT.1886', **kwargs):
         **{'ITU-R BT.1886', 'DCDM', 'DICOM GSDF', 'ITU-R BT.2020',
         'ITU-R BT.2100 HLG', 'ITU-R BT.2100 PQ', 'ST 2084', 'sRGB'}**,
         Inverse electro-optical transfer function (EOTF / EOCF).
+    tabulate : bool, optional
+        Whether to evaluate the transfer function by interpolating a dense
+        table baked on first use and cached, see the
+        :class:`colour.models.TransferFunctionTable` class.
+    tolerance : numeric, optional
+        Maximum error of the tabulated transfer function values, absolute for
+        the values with a magnitude lower than 1 and relative otherwise.
 
     Other Parameters
     ----------------
@@ -705,6 +843,11 @@ def eotf_inverse(value, function='ITU-R BT.1886', **kwargs):
     0.4090077...
     """
 
+    if tabulate:
+        return _tabulate_transfer_function(EOTF_INVERSES[function], tolerance,
+                                           EOTFS.get(function),
+                                           **kwargs)(value)
+
     function = EOTF_INVERSES[function]
 
     return function(value, **filter_kwargs(function, **kwargs))
@@ -746,7 +889,11 @@ CCTF_ENCODINGS : CaseInsensitiveMapping
 """
 
 
-def cctf_encoding(value, function='sRGB', **kwargs):
+def cctf_encoding(value,
+                  function='sRGB',
+                  tabulate=False,
+                  tolerance=TOLERANCE_TABULATION,
+                  **kwargs):
     """
     Encodes linear :math:`RGB` values to non linear :math:`R'G'B'` values using
     given encoding colour component transfer function (Encoding CCTF).
@@ -758,6 +905,13 @@ def cctf_encoding(value, function='sRGB', **kwargs):
     function : unicode, optional
         {:attr:`colour.CCTF_ENCODINGS`},
         Computation function.
+    tabulate : bool, optional
+        Whether to evaluate the transfer function by interpolating a dense
+        table baked on first use and cached, see the
+        :class:`colour.models.TransferFunctionTable` class.
+    tolerance : numeric, optional
+        Maximum error of the tabulated transfer function values, absolute for
+        the values with a magnitude lower than 1 and relative otherwise.
 
     Other Parameters
     ----------------
@@ -797,6 +951,11 @@ def cctf_encoding(value, function='sRGB', **kwargs):
             'by this definition, please refer to the "colour.oetf" definition '
             'for the opto-electronic transfer functions (OETF / OECF).')
 
+    if tabulate:
+        return _tabulate_transfer_function(CCTF_ENCODINGS[function], tolerance,
+                                           CCTF_DECODINGS.get(function),
+                                           **kwargs)(value)
+
     function = CCTF_ENCODINGS[function]
 
     return function(value, **filter_kwargs(function, **kwargs))
@@ -840,7 +999,11 @@ CCTF_DECODINGS : CaseInsensitiveMapping
 """
 
 
-def cctf_decoding(value, function='sRGB', **kwargs):
+def cctf_decoding(value,
+                  function='sRGB',
+                  tabulate=False,
+                  tolerance=TOLERANCE_TABULATION,
+                  **kwargs):
     """
     Decodes non-linear :math:`R'G'B'` values to linear :math:`RGB` values using
     given decoding colour component transfer function (Decoding CCTF).
@@ -852,6 +1015,13 @@ def cctf_decoding(value, function='sRGB', **kwargs):
     function : unicode, optional
         {:attr:`colour.CCTF_DECODINGS`},
         Computation function.
+    tabulate : bool, optional
+        Whether to evaluate the transfer function by interpolating a dense
+        table baked on first use and cached, see the
+        :class:`colour.models.TransferFunctionTable` class.
+    tolerance : numeric, optional
+        Maximum error of the tabulated transfer function values, absolute for
+        the values with a magnitude lower than 1 and relative otherwise.
 
     Other Parameters
     ----------------
@@ -892,6 +1062,10 @@ def cctf_decoding(value, function='sRGB', **kwargs):
             'for the inverse opto-electronic transfer functions (OETF / OECF).'
         )
 
+    if tabulate:
+        return _tabulate_transfer_function(CCTF_DECODINGS[function], tolerance,
+                                           **kwargs)(value)
+
     function = CCTF_DECODINGS[function]
 
     return function(value, **filter_kwargs(function, **kwargs))
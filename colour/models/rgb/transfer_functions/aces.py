@@ -192,7 +192,7 @@ def log_encoding_ACESproxy(lin_AP1,
         lin_AP1 > 2 ** -9.72,
         float_2_cv((np.log2(lin_AP1) + constants.mid_log_offset) *
                    constants.steps_per_stop + constants.mid_CV_offset),
-        np.resize(CV_min, lin_AP1.shape),
+        np.resize(as_float(CV_min), lin_AP1.shape),
     )
 
     if out_int:
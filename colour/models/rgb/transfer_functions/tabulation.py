@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+"""
+Tabulated Transfer Functions
+============================
+
+Defines the objects baking transfer functions into dense tables evaluated by
+linear interpolation:
+
+-   :attr:`colour.models.DOMAIN_TABULATION`
+-   :attr:`colour.models.TOLERANCE_TABULATION`
+-   :class:`colour.models.TransferFunctionTable`
+-   :func:`colour.models.tabulate_transfer_function`
+
+The transfer functions are sampled between two powers of two on a grid of the
+positive *float32* values with a fixed count of mantissa bits: the grid has a
+constant count of samples per octave, i.e. it is log-spaced across the octaves
+and uniform within them, and the interval containing a value is found by
+shifting its *float32* bit pattern. Log-spaced samples suit both the
+logarithmic encodings of scene-referred values and the power functions, while
+the indexing costs a few integer operations per value.
+"""
+
+import numpy as np
+
+from colour.utilities import (CACHE_REGISTRY, as_float, as_float_array,
+                              get_domain_range_scale, usage_warning)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'DOMAIN_TABULATION', 'TOLERANCE_TABULATION', 'TransferFunctionTable',
+    'tabulate_transfer_function'
+]
+
+DOMAIN_TABULATION = (2 ** -16, 1)
+"""
+Default domain of the tabulated transfer functions, i.e. the code values of
+the decoding transfer functions.
+
+DOMAIN_TABULATION : tuple
+"""
+
+TOLERANCE_TABULATION = 1e-6
+"""
+Default maximum error of the tabulated transfer functions, absolute for the
+values with a magnitude lower than 1 and relative otherwise.
+
+TOLERANCE_TABULATION : numeric
+"""
+
+_MANTISSA_BITS_TABULATION = (4, 14)
+"""
+Minimum and maximum mantissa bits count, i.e. the base 2 logarithm of the
+intervals count per octave, of the tabulated transfer functions.
+
+_MANTISSA_BITS_TABULATION : tuple
+"""
+
+_CACHE_TRANSFER_FUNCTION_TABLES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TRANSFER_FUNCTION_TABLES'.format(__name__), 32)
+
+
+def _keys_float32(x):
+    """
+    Returns the *float32* bit patterns of given values as integers.
+    """
+
+    return np.asarray(x, dtype=np.float32).view(np.int32)
+
+
+class TransferFunctionTable:
+    """
+    Defines a transfer function tabulated on the positive values with a
+    maximum error and evaluated by linear interpolation.
+
+    The table resolution is increased until the error estimated in each
+    interval is lower than the tolerance. The values in the intervals
+    exceeding it at the maximum resolution, e.g. around a discontinuity, the
+    values out of the tabulated domain and the non-finite values are computed
+    with the transfer function.
+
+    Parameters
+    ----------
+    function : callable
+        Transfer function, it must be applied independently to each value and
+        return floating point values.
+    domain : array_like, optional
+        Positive domain of the table, extended to the enclosing powers of two.
+    tolerance : numeric, optional
+        Maximum error of the interpolated values, absolute for the values
+        with a magnitude lower than 1 and relative otherwise.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the transfer function.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.models.TransferFunctionTable.function`
+    -   :attr:`~colour.models.TransferFunctionTable.domain`
+    -   :attr:`~colour.models.TransferFunctionTable.tolerance`
+    -   :attr:`~colour.models.TransferFunctionTable.kwargs`
+    -   :attr:`~colour.models.TransferFunctionTable.mantissa_bits`
+    -   :attr:`~colour.models.TransferFunctionTable.size`
+    -   :attr:`~colour.models.TransferFunctionTable.is_tabulated`
+
+    Methods
+    -------
+    -   :meth:`~colour.models.TransferFunctionTable.__init__`
+    -   :meth:`~colour.models.TransferFunctionTable.__call__`
+
+    Notes
+    -----
+    -   The error is estimated at the eighth points of each interval.
+    -   The transfer functions that cannot be tabulated, i.e. returning
+        integer values or not applied independently to each value, are
+        computed directly.
+    -   The table is computed with the domain-range scale at the time of the
+        instantiation.
+
+    Examples
+    --------
+    >>> from colour.models import eotf_inverse_ST2084
+    >>> table = TransferFunctionTable(
+    ...     eotf_inverse_ST2084, (2 ** -16, 1000), L_p=1000)
+    >>> table(100)  # doctest: +ELLIPSIS
+    0.751827...
+    >>> eotf_inverse_ST2084(100, L_p=1000)  # doctest: +ELLIPSIS
+    0.751827...
+    """
+
+    def __init__(self,
+                 function,
+                 domain=DOMAIN_TABULATION,
+                 tolerance=TOLERANCE_TABULATION,
+                 **kwargs):
+        self._function = function
+        self._domain = as_float_array(domain)
+        self._tolerance = tolerance
+        self._kwargs = kwargs
+
+        self._mantissa_bits = None
+        self._key_minimum = None
+        self._intercepts = None
+        self._slopes = None
+
+        self._tabulate()
+
+    @property
+    def function(self):
+        """
+        Getter property for the transfer function.
+
+        Returns
+        -------
+        callable
+            Transfer function.
+        """
+
+        return self._function
+
+    @property
+    def domain(self):
+        """
+        Getter property for the positive domain of the table.
+
+        Returns
+        -------
+        ndarray
+            Positive domain of the table.
+        """
+
+        return self._domain
+
+    @property
+    def tolerance(self):
+        """
+        Getter property for the maximum error of the interpolated values.
+
+        Returns
+        -------
+        numeric
+            Maximum error.
+        """
+
+        return self._tolerance
+
+    @property
+    def kwargs(self):
+        """
+        Getter property for the keywords arguments of the transfer function.
+
+        Returns
+        -------
+        dict
+            Keywords arguments.
+        """
+
+        return self._kwargs
+
+    @property
+    def mantissa_bits(self):
+        """
+        Getter property for the table mantissa bits count, i.e. the base 2
+        logarithm of the intervals count per octave.
+
+        Returns
+        -------
+        int
+            Mantissa bits count.
+        """
+
+        return self._mantissa_bits
+
+    @property
+    def size(self):
+        """
+        Getter property for the table intervals count.
+
+        Returns
+        -------
+        int
+            Table intervals count.
+        """
+
+        return 0 if self._slopes is None else len(self._slopes) - 1
+
+    @property
+    def is_tabulated(self):
+        """
+        Getter property for whether the transfer function is tabulated.
+
+        Returns
+        -------
+        bool
+            Whether the transfer function is tabulated.
+        """
+
+        return self._slopes is not None
+
+    def _evaluate(self, x):
+        """
+        Evaluates the transfer function at given values.
+        """
+
+        return as_float_array(self._function(x, **self._kwargs))
+
+    def _is_tabulable(self):
+        """
+        Returns whether the transfer function returns floating point values
+        and is applied independently to each value.
+        """
+
+        x = np.linspace(0.01, 1, 12)
+
+        try:
+            y = np.asarray(self._function(x, **self._kwargs))
+            y_RGB = np.asarray(
+                self._function(np.reshape(x, (4, 3)), **self._kwargs))
+        except Exception:
+            return False
+
+        return (np.issubdtype(y.dtype, np.floating) and y.shape == x.shape and
+                np.allclose(np.ravel(y_RGB), y, equal_nan=True))
+
+    def _tabulate(self):
+        """
+        Tabulates the transfer function.
+        """
+
+        if not self._is_tabulable():
+            usage_warning(
+                '"{0}" transfer function cannot be tabulated, it will be '
+                'computed directly!'.format(
+                    getattr(self._function, '__name__', self._function)))
+            return
+
+        exponent_minimum, exponent_maximum = (np.floor(
+            np.log2(self._domain[0])), np.ceil(np.log2(self._domain[1])))
+        bits_minimum, bits_maximum = _MANTISSA_BITS_TABULATION
+        eighths = np.linspace(0, 1, 9)[1:-1]
+
+        for bits in range(bits_minimum, bits_maximum + 1):
+            shift = 23 - bits
+            key_minimum, key_maximum = _keys_float32(
+                [2.0 ** exponent_minimum, 2.0 ** exponent_maximum]) >> shift
+
+            x = (np.arange(key_minimum, key_maximum + 1, dtype=np.int32) <<
+                 shift).view(np.float32).astype(np.float64)
+            y = self._evaluate(x)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                slopes = np.diff(y) / np.diff(x)
+                intercepts = y[:-1] - slopes * x[:-1]
+
+                x_q = x[:-1, np.newaxis] + np.diff(x)[:, np.newaxis] * eighths
+                y_q = np.reshape(self._evaluate(np.ravel(x_q)), x_q.shape)
+                y_l = intercepts[:, np.newaxis] + slopes[:, np.newaxis] * x_q
+                error = np.max(
+                    np.abs(y_q - y_l) / np.maximum(np.abs(y_q), 1), axis=-1)
+
+            # The non-finite intervals, e.g. out of the transfer function
+            # domain, do not drive the resolution.
+            invalid = ~(error <= self._tolerance)
+            if not np.any(invalid[np.isfinite(error)]):
+                break
+
+        # The intervals exceeding the tolerance and the sentinel interval
+        # appended for the values out of the tabulated range are flagged with
+        # *NaN* so that they are computed with the transfer function.
+        intercepts[invalid] = np.nan
+        self._mantissa_bits = bits
+        self._key_minimum = key_minimum
+        self._intercepts = np.append(intercepts, np.nan)
+        self._slopes = np.append(slopes, np.nan)
+
+    def __call__(self, value):
+        """
+        Evaluates the tabulated transfer function at given values.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Value.
+
+        Returns
+        -------
+        numeric or ndarray
+            Transfer function value.
+        """
+
+        if not self.is_tabulated:
+            return self._function(value, **self._kwargs)
+
+        value = as_float_array(value)
+        shape = value.shape
+        x = np.ravel(value)
+
+        size = self.size
+        shift = 23 - self._mantissa_bits
+        index = (_keys_float32(x) >> shift) - self._key_minimum
+        index[(index < 0) | (index >= size)] = size
+
+        y = (as_float_array(self._intercepts[index]) +
+             as_float_array(self._slopes[index]) * x)
+
+        direct = np.isnan(y)
+        if np.any(direct):
+            y[direct] = self._evaluate(x[direct])
+
+        return as_float(np.reshape(y, shape))
+
+
+def tabulate_transfer_function(function,
+                               domain=DOMAIN_TABULATION,
+                               tolerance=TOLERANCE_TABULATION,
+                               **kwargs):
+    """
+    Returns the :class:`colour.models.TransferFunctionTable` class instance
+    tabulating given transfer function and caches it if not existing.
+
+    Parameters
+    ----------
+    function : callable
+        Transfer function, it must be applied independently to each value and
+        return floating point values.
+    domain : array_like, optional
+        Positive domain of the table, extended to the enclosing powers of two.
+    tolerance : numeric, optional
+        Maximum error of the interpolated values, absolute for the values
+        with a magnitude lower than 1 and relative otherwise.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the transfer function.
+
+    Returns
+    -------
+    TransferFunctionTable
+        Tabulated transfer function.
+
+    Notes
+    -----
+    -   The tabulated transfer functions are cached per transfer function,
+        domain, tolerance, keywords arguments and domain-range scale.
+
+    Examples
+    --------
+    >>> from colour.models import log_encoding_ALEXALogC
+    >>> domain = (2 ** -16, 64)
+    >>> table = tabulate_transfer_function(log_encoding_ALEXALogC, domain)
+    >>> table(0.18)  # doctest: +ELLIPSIS
+    0.391006...
+    >>> table is tabulate_transfer_function(log_encoding_ALEXALogC, domain)
+    True
+    """
+
+    key = (function, tuple(np.ravel(domain)), tolerance,
+           str(sorted(kwargs.items())), get_domain_range_scale())
+
+    table = _CACHE_TRANSFER_FUNCTION_TABLES.get(key)
+    if table is None:
+        _CACHE_TRANSFER_FUNCTION_TABLES[key] = table = TransferFunctionTable(
+            function, domain, tolerance, **kwargs)
+
+    return table
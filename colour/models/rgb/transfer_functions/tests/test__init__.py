@@ -9,9 +9,10 @@ import unittest
 
 from colour.models.rgb.transfer_functions import (
     CCTF_DECODINGS, CCTF_ENCODINGS, EOTFS, EOTF_INVERSES, LOG_DECODINGS,
-    LOG_ENCODINGS, OETFS, OETF_INVERSES, OOTFS, OOTF_INVERSES, cctf_encoding,
-    cctf_decoding)
-from colour.utilities import ColourUsageWarning, as_int
+    LOG_ENCODINGS, OETFS, OETF_INVERSES, OOTFS, OOTF_INVERSES,
+    TOLERANCE_TABULATION, cctf_encoding, cctf_decoding, eotf, eotf_inverse,
+    log_decoding, log_encoding, oetf, oetf_inverse)
+from colour.utilities import ColourUsageWarning, as_int, suppress_warnings
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -110,6 +111,41 @@ class TestTransferFunctions(unittest.TestCase):
                 np.testing.assert_almost_equal(
                     samples, decoded_s, decimal=decimals.get(name, 7))
 
+    def test_tabulated_transfer_functions(self):
+        """
+        Tests tabulated transfer functions accuracy.
+        """
+
+        definitions = [
+            (log_encoding, LOG_ENCODINGS),
+            (log_decoding, LOG_DECODINGS),
+            (oetf, OETFS),
+            (oetf_inverse, OETF_INVERSES),
+            (eotf, EOTFS),
+            (eotf_inverse, EOTF_INVERSES),
+            (cctf_encoding, CCTF_ENCODINGS),
+            (cctf_decoding, CCTF_DECODINGS),
+        ]
+
+        samples = np.linspace(0, 1, as_int(1e4))
+
+        with suppress_warnings(colour_usage_warnings=True):
+            for definition, mapping in definitions:
+                for name in mapping:
+                    value = definition(samples, name)
+                    value_t = definition(samples, name, tabulate=True)
+
+                    finite = np.isfinite(value)
+                    np.testing.assert_equal(np.isfinite(value_t), finite)
+
+                    # The error is estimated at a few points of each table
+                    # interval, thus allowing for a small overshoot.
+                    self.assertLessEqual(
+                        np.max(
+                            np.abs(value_t[finite] - value[finite]) /
+                            np.maximum(np.abs(value[finite]), 1)),
+                        TOLERANCE_TABULATION * 2)
+
 
 if __name__ == '__main__':
     unittest.main()
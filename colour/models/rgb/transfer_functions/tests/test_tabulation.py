@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.rgb.transfer_functions.tabulation`
+module.
+"""
+
+import numpy as np
+import unittest
+from itertools import permutations
+
+from colour.models.rgb.transfer_functions import (
+    TransferFunctionTable, eotf_ST2084, eotf_inverse_DCDM, eotf_inverse_ST2084,
+    log_encoding_ALEXALogC, tabulate_transfer_function)
+from colour.utilities import (ColourUsageWarning, domain_range_scale,
+                              ignore_numpy_errors)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestTransferFunctionTable', 'TestTabulateTransferFunction']
+
+
+class TestTransferFunctionTable(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.transfer_functions.tabulation.\
+TransferFunctionTable` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('function', 'domain', 'tolerance', 'kwargs',
+                               'mantissa_bits', 'size', 'is_tabulated')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(TransferFunctionTable))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(TransferFunctionTable))
+
+    def test__call__(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.tabulation.\
+TransferFunctionTable.__call__` method.
+        """
+
+        samples = np.linspace(-0.5, 1.5, 10000)
+
+        table = TransferFunctionTable(eotf_ST2084, L_p=1000)
+        self.assertTrue(table.is_tabulated)
+        np.testing.assert_allclose(
+            table(samples), eotf_ST2084(samples, L_p=1000), rtol=2e-6)
+
+        table = TransferFunctionTable(
+            eotf_inverse_ST2084, (2 ** -16, 10000), tolerance=1e-3)
+        np.testing.assert_allclose(
+            table(samples * 10000),
+            eotf_inverse_ST2084(samples * 10000),
+            atol=2e-3)
+        self.assertLess(
+            table.size,
+            TransferFunctionTable(eotf_inverse_ST2084, (2 ** -16, 10000)).size)
+
+    def test_is_tabulated(self):
+        """
+        Tests :attr:`colour.models.rgb.transfer_functions.tabulation.\
+TransferFunctionTable.is_tabulated` property.
+        """
+
+        self.assertWarns(
+            ColourUsageWarning,
+            TransferFunctionTable,
+            eotf_inverse_DCDM,
+            out_int=True)
+
+        table = TransferFunctionTable(eotf_inverse_DCDM, out_int=True)
+        self.assertFalse(table.is_tabulated)
+        self.assertEqual(table.size, 0)
+        np.testing.assert_equal(
+            table(np.array([0.18, 0.5])),
+            eotf_inverse_DCDM(np.array([0.18, 0.5]), out_int=True))
+
+    def test_n_dimensional_TransferFunctionTable(self):
+        """
+        Tests :class:`colour.models.rgb.transfer_functions.tabulation.\
+TransferFunctionTable` class n-dimensional arrays support.
+        """
+
+        table = TransferFunctionTable(eotf_ST2084)
+
+        N = 0.5
+        C = table(N)
+
+        N = np.tile(N, 6)
+        C = np.tile(C, 6)
+        np.testing.assert_almost_equal(table(N), C, decimal=7)
+
+        N = np.reshape(N, (2, 3))
+        C = np.reshape(C, (2, 3))
+        np.testing.assert_almost_equal(table(N), C, decimal=7)
+
+        N = np.reshape(N, (2, 3, 1))
+        C = np.reshape(C, (2, 3, 1))
+        np.testing.assert_almost_equal(table(N), C, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_TransferFunctionTable(self):
+        """
+        Tests :class:`colour.models.rgb.transfer_functions.tabulation.\
+TransferFunctionTable` class nan support.
+        """
+
+        cases = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        table = TransferFunctionTable(log_encoding_ALEXALogC, (2 ** -16, 64))
+        np.testing.assert_equal(table(cases), log_encoding_ALEXALogC(cases))
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            table(case)
+
+
+class TestTabulateTransferFunction(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.tabulation.\
+tabulate_transfer_function` definition unit tests methods.
+    """
+
+    def test_tabulate_transfer_function(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.tabulation.\
+tabulate_transfer_function` definition.
+        """
+
+        table = tabulate_transfer_function(eotf_ST2084, L_p=1000)
+        self.assertIs(table, tabulate_transfer_function(eotf_ST2084, L_p=1000))
+        self.assertIsNot(table,
+                         tabulate_transfer_function(eotf_ST2084, L_p=2000))
+        self.assertIsNot(
+            table,
+            tabulate_transfer_function(eotf_ST2084, tolerance=1e-3, L_p=1000))
+
+    def test_domain_range_scale_tabulate_transfer_function(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.tabulation.\
+tabulate_transfer_function` definition domain and range scale support.
+        """
+
+        N = 0.5
+        C = tabulate_transfer_function(eotf_ST2084)(N)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    tabulate_transfer_function(eotf_ST2084,
+                                               (2 ** -16, factor))(N * factor),
+                    C * factor,
+                    decimal=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
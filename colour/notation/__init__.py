@@ -1,15 +1,24 @@
 # -*- coding: utf-8 -*-
 
-from .datasets import *  # noqa
-from . import datasets
-from .munsell import MUNSELL_VALUE_METHODS
-from .munsell import munsell_value
-from .munsell import (munsell_value_Priest1920, munsell_value_Munsell1933,
-                      munsell_value_Moon1943, munsell_value_Saunderson1944,
-                      munsell_value_Ladd1955, munsell_value_McCamy1987,
-                      munsell_value_ASTMD1535)
-from .munsell import munsell_colour_to_xyY, xyY_to_munsell_colour
-from .hexadecimal import RGB_to_HEX, HEX_to_RGB
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'datasets':
+            None,
+        'munsell': [
+            'MUNSELL_VALUE_METHODS', 'munsell_value',
+            'munsell_value_Priest1920', 'munsell_value_Munsell1933',
+            'munsell_value_Moon1943', 'munsell_value_Saunderson1944',
+            'munsell_value_Ladd1955', 'munsell_value_McCamy1987',
+            'munsell_value_ASTMD1535', 'munsell_colour_to_xyY',
+            'xyY_to_munsell_colour'
+        ],
+        'hexadecimal': ['RGB_to_HEX', 'HEX_to_RGB']
+    })
+del lazy_module_attributes
+
+from . import datasets  # noqa
 
 __all__ = []
 __all__ += datasets.__all__
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
-from .munsell import *  # noqa
-from . import munsell
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(globals(), {'munsell': None})
+del lazy_module_attributes
+
+from . import munsell  # noqa
 
 __all__ = []
 __all__ += munsell.__all__
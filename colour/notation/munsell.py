@@ -119,8 +119,8 @@ import re
 from collections import OrderedDict
 
 from colour.algebra import (Extrapolator, LinearInterpolator,
-                            cartesian_to_cylindrical, euclidean_distance,
-                            polar_to_cartesian, spow)
+                            cartesian_to_cylindrical, cartesian_to_polar,
+                            euclidean_distance, polar_to_cartesian, spow)
 from colour.colorimetry import CCS_ILLUMINANTS, luminance_ASTMD1535
 from colour.constants import (DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE,
                               INTEGER_THRESHOLD, FLOATING_POINT_NUMBER_PATTERN)
@@ -128,10 +128,10 @@ from colour.models import Lab_to_LCHab, XYZ_to_Lab, XYZ_to_xy, xyY_to_XYZ
 from colour.volume import is_within_macadam_limits
 from colour.notation import MUNSELL_COLOURS_ALL
 from colour.utilities import (
-    CaseInsensitiveMapping, Lookup, as_float_array, as_float, as_int,
-    as_numeric, domain_range_scale, from_range_1, from_range_10,
-    get_domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
-    is_integer, is_numeric, tsplit, usage_warning)
+    CACHE_REGISTRY, CaseInsensitiveMapping, Lookup, as_float_array, as_float,
+    as_int, as_numeric, domain_range_scale, from_range_1, from_range_10,
+    get_domain_range_scale, ignore_numpy_errors, to_domain_1, to_domain_10,
+    to_domain_100, is_integer, is_numeric, tsplit, tstack, usage_warning)
 
 __author__ = 'Colour Developers, Paul Centore'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -194,9 +194,16 @@ ILLUMINANT_NAME_MUNSELL = 'C'
 CCS_ILLUMINANT_MUNSELL = (CCS_ILLUMINANTS[
     'CIE 1931 2 Degree Standard Observer'][ILLUMINANT_NAME_MUNSELL])
 
-_MUNSELL_SPECIFICATIONS_CACHE = None
-_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
-_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_CACHE_MUNSELL_SPECIFICATIONS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MUNSELL_SPECIFICATIONS'.format(__name__))
+_CACHE_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR = (
+    CACHE_REGISTRY.register_cache('{0}.{1}'.format(
+        __name__, '_CACHE_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR')))
+_CACHE_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION = (
+    CACHE_REGISTRY.register_cache('{0}.{1}'.format(
+        __name__, '_CACHE_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION')))
+_CACHE_MUNSELL_RENOTATION_TABLES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MUNSELL_RENOTATION_TABLES'.format(__name__))
 
 
 def _munsell_specifications():
@@ -224,15 +231,16 @@ def _munsell_specifications():
         *Munsell Renotation System* specifications.
     """
 
-    global _MUNSELL_SPECIFICATIONS_CACHE
+    specifications = _CACHE_MUNSELL_SPECIFICATIONS.get('All')
 
-    if _MUNSELL_SPECIFICATIONS_CACHE is None:
-        _MUNSELL_SPECIFICATIONS_CACHE = np.array([
+    if specifications is None:
+        _CACHE_MUNSELL_SPECIFICATIONS['All'] = specifications = np.array([
             munsell_colour_to_munsell_specification(
                 MUNSELL_COLOUR_FORMAT.format(*colour[0]))
             for colour in MUNSELL_COLOURS_ALL
         ])
-    return _MUNSELL_SPECIFICATIONS_CACHE
+
+    return specifications
 
 
 def _munsell_value_ASTMD1535_interpolator():
@@ -246,15 +254,17 @@ def _munsell_value_ASTMD1535_interpolator():
         *Munsell* value interpolator for *ASTM D1535-08e1* method.
     """
 
-    global _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
+    interpolator = _CACHE_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR.get(
+        'Extrapolator')
 
-    munsell_values = np.arange(0, 10, 0.001)
-    if _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE is None:
-        _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = Extrapolator(
-            LinearInterpolator(
-                luminance_ASTMD1535(munsell_values), munsell_values))
+    if interpolator is None:
+        munsell_values = np.arange(0, 10, 0.001)
+        _CACHE_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR['Extrapolator'] = \
+            interpolator = Extrapolator(
+                LinearInterpolator(
+                    luminance_ASTMD1535(munsell_values), munsell_values))
 
-    return _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
+    return interpolator
 
 
 def _munsell_maximum_chromas_from_renotation():
@@ -268,9 +278,10 @@ def _munsell_maximum_chromas_from_renotation():
         Maximum *Munsell* chromas.
     """
 
-    global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+    maximum_chromas = _CACHE_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION.get(
+        'Maximum Chromas')
 
-    if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
+    if maximum_chromas is None:
         chromas = OrderedDict()
         for munsell_colour in MUNSELL_COLOURS_ALL:
             hue, value, chroma, code = munsell_colour_to_munsell_specification(
@@ -281,9 +292,11 @@ def _munsell_maximum_chromas_from_renotation():
 
             chromas[index] = chroma
 
-        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
-    return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+        maximum_chromas = tuple(zip(chromas.keys(), chromas.values()))
+        _CACHE_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION[
+            'Maximum Chromas'] = maximum_chromas
+
+    return maximum_chromas
 
 
 def munsell_value_Priest1920(Y):
@@ -714,6 +727,101 @@ def munsell_value(Y, method='ASTM D1535'):
     return MUNSELL_VALUE_METHODS.get(method)(Y)
 
 
+def _munsell_renotation_indexes(hue, value, chroma, code):
+    """
+    Returns the indexes of given *Munsell* *Colorlab* specification components
+    in the *Munsell Renotation System* lookup tables.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    tuple
+        Hue, value and chroma indexes, they are not integers if the given
+        specification components are not in the *Munsell Renotation System*
+        data.
+    """
+
+    hue, code = as_float_array(hue), as_float_array(code)
+
+    index_hue = 4 * ((7 - code) % 10) + hue / 2.5 - 1
+
+    return index_hue, as_float_array(value), as_float_array(chroma) / 2
+
+
+def _munsell_renotation_tables():
+    """
+    Returns the *Munsell Renotation System* lookup tables used by the
+    vectorised *Munsell* *Colorlab* specification conversions and caches them
+    if not existing.
+
+    The tables are indexed by *ASTM* hue, integer value and even chroma, i.e.
+    a specification such as (2.5, 5.0, 12.0, 4) is stored at the indexes
+    returned by
+    :func:`colour.notation.munsell._munsell_renotation_indexes` definition.
+
+    Returns
+    -------
+    tuple
+        *CIE xy* chromaticity coordinates, maximum chromas and interpolation
+        methods tables. Missing *CIE xy* chromaticity coordinates and maximum
+        chromas are set to *nan*, interpolation methods are encoded with 0, 1
+        and 2 for *None*, *Linear* and *Radial* respectively and are indexed
+        by *ASTM* hue interval instead of *ASTM* hue.
+    """
+
+    tables = _CACHE_MUNSELL_RENOTATION_TABLES.get('Tables')
+
+    if tables is None:
+        shape = (40, 11, 26)
+
+        specifications = _munsell_specifications()
+        is_integer_value = specifications[..., 1] % 1 == 0
+        index_hue, index_value, index_chroma = [
+            as_int(index) for index in _munsell_renotation_indexes(
+                *tsplit(specifications[is_integer_value]))
+        ]
+
+        xy = np.full(shape + (2, ), np.nan)
+        xy[index_hue, index_value, index_chroma] = as_float_array([
+            colour[1][0:2] for colour in MUNSELL_COLOURS_ALL
+        ])[is_integer_value]
+
+        maximum_chromas = np.full(shape[0:2], np.nan)
+        np.fmax.at(maximum_chromas, (index_hue, index_value),
+                   specifications[is_integer_value][..., 2])
+
+        # The interpolation method boundaries in
+        # :func:`interpolation_method_from_renotation_ovoid` definition are all
+        # multiples of 2.5 *ASTM* hue, the method is thus constant within a
+        # given *ASTM* hue interval and can be sampled at its center.
+        interpolation_methods = np.zeros(shape, dtype=np.int8)
+        methods = {None: 0, 'Linear': 1, 'Radial': 2}
+        for index_hue in range(shape[0]):
+            ASTM_hue = 2.5 * index_hue + 1.25
+            code = (7 - ASTM_hue // 10) % 10
+            hue, code = ASTM_hue % 10, 10 if code == 0 else code
+            for value in range(1, 10):
+                for index_chroma in range(1, shape[2]):
+                    interpolation_methods[index_hue, value, index_chroma] = (
+                        methods[interpolation_method_from_renotation_ovoid(
+                            (hue, value, 2 * index_chroma, code))])
+
+        _CACHE_MUNSELL_RENOTATION_TABLES['Tables'] = tables = (
+            xy, maximum_chromas, interpolation_methods)
+
+    return tables
+
+
 def _domain_range_scale_factor():
     """
     Returns the domain-range scale factor for *Munsell Renotation System*.
@@ -1196,6 +1304,10 @@ def xyY_to_munsell_specification(xyY):
     |                   | ``code``   : [0, 10]  | [0, 1]        |
     +-------------------+-----------------------+---------------+
 
+    -   The convergence loop is run on all the samples at once, the samples
+        that cannot be resolved that way, e.g. the samples raising an
+        exception, are converted one at a time.
+
     References
     ----------
     :cite:`Centore2014p`
@@ -1209,14 +1321,24 @@ def xyY_to_munsell_specification(xyY):
 
     xyY = as_float_array(xyY)
     shape = list(xyY.shape)
+    xyY = xyY.reshape([-1, 3])
 
-    specification = [
-        _xyY_to_munsell_specification(a) for a in xyY.reshape([-1, 3])
-    ]
+    specification, is_unresolved = _xyY_to_munsell_specification_vectorised(
+        xyY)
+
+    # The unresolved samples are converted with the scalar definition that
+    # raises the relevant exceptions and warnings.
+    xyY_r = xyY[~is_unresolved]
+    for a in xyY_r[~is_within_macadam_limits(xyY_r, ILLUMINANT_NAME_MUNSELL)]:
+        usage_warning('"{0}" is not within "MacAdam" limits for illuminant '
+                      '"{1}"!'.format(a, ILLUMINANT_NAME_MUNSELL))
+
+    for i in np.where(is_unresolved)[0]:
+        specification[i] = _xyY_to_munsell_specification(xyY[i])
 
     shape[-1] = 4
 
-    return as_float_array(specification).reshape(shape)
+    return specification.reshape(shape)
 
 
 def xyY_to_munsell_colour(xyY,
@@ -1606,31 +1728,29 @@ def bounding_hues_from_renotation(hue, code):
            [ 10.,   2.]])
     """
 
-    if hue % 2.5 == 0:
-        if hue == 0:
-            hue_cw = 10
-            code_cw = (code + 1) % 10
-        else:
-            hue_cw = hue
-            code_cw = code
-        hue_ccw = hue_cw
-        code_ccw = code_cw
-    else:
-        hue_cw = 2.5 * np.floor(hue / 2.5)
-        hue_ccw = (hue_cw + 2.5) % 10
-        if hue_ccw == 0:
-            hue_ccw = 10
-
-        if hue_cw == 0:
-            hue_cw = 10
-            code_cw = (code + 1) % 10
-            if code_cw == 0:
-                code_cw = 10
-        else:
-            code_cw = code
-        code_ccw = code
+    hue = as_float_array(hue)
+    code = as_float_array(code)
 
-    return as_float_array([(hue_cw, code_cw), (hue_ccw, code_ccw)])
+    is_standard_hue = hue % 2.5 == 0
+
+    hue_cw = 2.5 * np.floor(hue / 2.5)
+    hue_ccw = (hue_cw + 2.5) % 10
+    hue_ccw = np.where(hue_ccw == 0, 10, hue_ccw)
+
+    is_zero_hue = hue_cw == 0
+    code_cw = np.where(is_zero_hue, (code + 1) % 10, code)
+    code_cw = np.where(
+        np.logical_and(is_zero_hue, ~is_standard_hue),
+        np.where(code_cw == 0, 10, code_cw), code_cw)
+    hue_cw = np.where(is_zero_hue, 10, hue_cw)
+
+    hue_ccw = np.where(is_standard_hue, hue_cw, hue_ccw)
+    code_ccw = np.where(is_standard_hue, code_cw, code)
+
+    return as_float_array(
+        np.stack(
+            [tstack([hue_cw, code_cw]),
+             tstack([hue_ccw, code_ccw])], axis=-2))
 
 
 def hue_to_hue_angle(hue, code):
@@ -1693,37 +1813,20 @@ def hue_angle_to_hue(hue_angle):
     array([ 3.216,  4.   ])
     """
 
-    single_hue = LinearInterpolator((0, 45, 70, 135, 160, 225, 255, 315, 360),
-                                    (0, 2, 3, 4, 5, 6, 8, 9, 10))(hue_angle)
-
-    if single_hue <= 0.5:
-        code = 7
-    elif single_hue <= 1.5:
-        code = 6
-    elif single_hue <= 2.5:
-        code = 5
-    elif single_hue <= 3.5:
-        code = 4
-    elif single_hue <= 4.5:
-        code = 3
-    elif single_hue <= 5.5:
-        code = 2
-    elif single_hue <= 6.5:
-        code = 1
-    elif single_hue <= 7.5:
-        code = 10
-    elif single_hue <= 8.5:
-        code = 9
-    elif single_hue <= 9.5:
-        code = 8
-    else:
-        code = 7
+    single_hue = np.reshape(
+        LinearInterpolator((0, 45, 70, 135, 160, 225, 255, 315, 360),
+                           (0, 2, 3, 4, 5, 6, 8, 9, 10))(hue_angle),
+        np.shape(hue_angle))
+
+    # Codes for the single hue intervals (-inf, 0.5], (0.5, 1.5], ...,
+    # (9.5, +inf).
+    code = as_float_array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8, 7])[np.searchsorted(
+        np.arange(0.5, 10, 1), single_hue)]
 
     hue = (10 * (single_hue % 1) + 5) % 10
-    if hue == 0:
-        hue = 10
+    hue = np.where(hue == 0, 10, hue)
 
-    return as_float_array([hue, code])
+    return tstack([hue, code])
 
 
 def hue_to_ASTM_hue(hue, code):
@@ -1753,9 +1856,9 @@ def hue_to_ASTM_hue(hue, code):
     33.2...
     """
 
-    ASTM_hue = 10 * ((7 - code) % 10) + hue
+    ASTM_hue = 10 * ((7 - as_float_array(code)) % 10) + hue
 
-    return 100 if ASTM_hue == 0 else ASTM_hue
+    return as_numeric(np.where(ASTM_hue == 0, 100, ASTM_hue))
 
 
 def interpolation_method_from_renotation_ovoid(specification):
@@ -2208,37 +2311,20 @@ def LCHab_to_munsell_specification(LCHab):
 
     L, C, Hab = tsplit(LCHab)
 
-    if Hab == 0:
-        code = 8
-    elif Hab <= 36:
-        code = 7
-    elif Hab <= 72:
-        code = 6
-    elif Hab <= 108:
-        code = 5
-    elif Hab <= 144:
-        code = 4
-    elif Hab <= 180:
-        code = 3
-    elif Hab <= 216:
-        code = 2
-    elif Hab <= 252:
-        code = 1
-    elif Hab <= 288:
-        code = 10
-    elif Hab <= 324:
-        code = 9
-    else:
-        code = 8
+    # Codes for the hue angle intervals (-inf, 36], (36, 72], ...,
+    # (324, +inf).
+    codes = as_float_array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8])
+    code = codes[np.searchsorted(np.arange(36, 360, 36), Hab)]
+    code = np.where(Hab == 0, 8, code)
 
-    hue = LinearInterpolator((0, 36), (0, 10))(Hab % 36)
-    if hue == 0:
-        hue = 10
+    hue = np.reshape(
+        LinearInterpolator((0, 36), (0, 10))(Hab % 36), np.shape(Hab))
+    hue = np.where(hue == 0, 10, hue)
 
     value = L / 10
     chroma = C / 5
 
-    return as_float_array([hue, value, chroma, code])
+    return tstack([hue, value, chroma, code])
 
 
 def maximum_chroma_from_renotation(hue, value, code):
@@ -2387,3 +2473,706 @@ def munsell_specification_to_xy(specification):
                                    (y_minus, y_plus))(chroma)
 
         return as_float_array([x, y])
+
+
+def _interpolate_linear(x, x_0, x_1, y_0, y_1):
+    """
+    Performs the linear interpolation of given points, element-wise, in the
+    same way as a :class:`colour.LinearInterpolator` class instance built on
+    the two given samples.
+
+    Parameters
+    ----------
+    x : ndarray
+        Points to interpolate at.
+    x_0 : ndarray
+        First samples independent :math:`x` variable values.
+    x_1 : ndarray
+        Second samples independent :math:`x` variable values.
+    y_0 : ndarray
+        First samples dependent :math:`y` variable values.
+    y_1 : ndarray
+        Second samples dependent :math:`y` variable values.
+
+    Returns
+    -------
+    ndarray
+        Interpolated points, points outside the interpolation range are set to
+        *nan* where :class:`colour.LinearInterpolator` class would raise an
+        exception.
+    """
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = (y_1 - y_0) / (x_1 - x_0) * (x - x_0) + y_0
+
+    y = np.where(x == x_1, y_1, y)
+
+    return np.where(np.logical_or(x < x_0, x > x_1), np.nan, y)
+
+
+def _lookup_renotation_table(table, indexes, code):
+    """
+    Looks up given *Munsell Renotation System* table at given indexes.
+
+    Parameters
+    ----------
+    table : ndarray
+        *Munsell Renotation System* table as returned by
+        :func:`colour.notation.munsell._munsell_renotation_tables` definition.
+    indexes : tuple
+        Table indexes as returned by
+        :func:`colour.notation.munsell._munsell_renotation_indexes`
+        definition.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    ndarray
+        Table values, they are set to *nan* for the indexes not existing in
+        the table.
+    """
+
+    exists = np.logical_and(code >= 1, code <= 10)
+    for index, size in zip(indexes, table.shape):
+        exists = np.logical_and.reduce(
+            [exists, index % 1 == 0, index >= 0, index < size])
+
+    values = table[tuple(
+        np.where(exists, index, 0).astype(DEFAULT_INT_DTYPE)
+        for index in indexes)]
+
+    return np.where(
+        np.reshape(exists, exists.shape + (1, ) * (values.ndim - exists.ndim)),
+        values, np.nan)
+
+
+def _xy_from_renotation_vectorised(hue, value, chroma, code):
+    """
+    Returns given existing *Munsell* *Colorlab* specifications *CIE xy*
+    chromaticity coordinates from *Munsell Renotation System* data.
+
+    This definition is the vectorised counterpart of
+    :func:`colour.notation.munsell.xyY_from_renotation` definition.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chroma.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    tuple
+        *CIE xy* chromaticity coordinates, they are set to *nan* for the
+        specifications not existing in *Munsell Renotation System* data.
+    """
+
+    # 0YR is equivalent to 10R.
+    hue, code = np.where(hue == 0, 10, hue), np.where(hue == 0,
+                                                      (code + 1) % 10, code)
+
+    return tsplit(
+        _lookup_renotation_table(
+            _munsell_renotation_tables()[0],
+            _munsell_renotation_indexes(hue, value, chroma, code), code))
+
+
+def _xy_from_renotation_ovoid_vectorised(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *CIE xy*
+    chromaticity coordinates on *Munsell Renotation System* ovoid.
+
+    This definition is the vectorised counterpart of
+    :func:`colour.notation.munsell.xy_from_renotation_ovoid` definition for
+    chromatic specifications.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chroma.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    tuple
+        *CIE xy* chromaticity coordinates, they are set to *nan* where
+        :func:`colour.notation.munsell.xy_from_renotation_ovoid` definition
+        would raise an exception.
+    """
+
+    interpolation_methods = _munsell_renotation_tables()[2]
+
+    hue, code = np.where(hue == 0, 10, hue), np.where(hue == 0,
+                                                      (code + 1) % 10, code)
+
+    is_valid = np.logical_and.reduce([
+        value >= 1, value <= 9,
+        is_integer(value), chroma >= 2, chroma <= 50,
+        abs(2 * (chroma / 2 - np.around(chroma / 2))) <= INTEGER_THRESHOLD
+    ])
+
+    value = np.around(value)
+    chroma = 2 * np.around(chroma / 2)
+
+    # Renotation data is available without interpolation within given
+    # threshold.
+    threshold = 1e-7
+    is_standard_hue = np.logical_and.reduce([
+        abs(hue - 2.5 * np.around(hue / 2.5)) < threshold, hue > -threshold,
+        hue < 10 + threshold
+    ])
+    x_s, y_s = _xy_from_renotation_vectorised(2.5 * np.around(hue / 2.5),
+                                              value, chroma, code)
+
+    hue_cw, hue_ccw = np.moveaxis(
+        bounding_hues_from_renotation(hue, code), -2, 0)
+    hue_minus, code_minus = tsplit(hue_cw)
+    hue_plus, code_plus = tsplit(hue_ccw)
+
+    x_grey, y_grey = CCS_ILLUMINANT_MUNSELL
+
+    x_minus, y_minus = _xy_from_renotation_vectorised(hue_minus, value, chroma,
+                                                      code_minus)
+    rho_minus, phi_minus = tsplit(
+        cartesian_to_polar(tstack([x_minus - x_grey, y_minus - y_grey])))
+    phi_minus = np.degrees(phi_minus)
+
+    x_plus, y_plus = _xy_from_renotation_vectorised(hue_plus, value, chroma,
+                                                    code_plus)
+    rho_plus, phi_plus = tsplit(
+        cartesian_to_polar(tstack([x_plus - x_grey, y_plus - y_grey])))
+    phi_plus = np.degrees(phi_plus)
+
+    lower_hue_angle = np.reshape(
+        hue_to_hue_angle(hue_minus, code_minus), hue.shape)
+    hue_angle = np.reshape(hue_to_hue_angle(hue, code), hue.shape)
+    upper_hue_angle = np.reshape(
+        hue_to_hue_angle(hue_plus, code_plus), hue.shape)
+
+    phi_plus = np.where(phi_minus - phi_plus > 180, phi_plus + 360, phi_plus)
+
+    lower_hue_angle = np.where(lower_hue_angle == 0, 360, lower_hue_angle)
+
+    is_wrapped = lower_hue_angle > upper_hue_angle
+    hue_angle = np.where(
+        np.logical_and(is_wrapped, lower_hue_angle <= hue_angle),
+        hue_angle - 360, hue_angle)
+    lower_hue_angle = np.where(is_wrapped, lower_hue_angle - 360,
+                               lower_hue_angle)
+
+    index_ASTM_hue = np.clip(
+        np.nan_to_num(np.floor(hue_to_ASTM_hue(hue, code) / 2.5)), 0,
+        interpolation_methods.shape[0] - 1)
+    interpolation_method = interpolation_methods[tuple(
+        np.where(is_valid, index, 0).astype(DEFAULT_INT_DTYPE)
+        for index in (index_ASTM_hue, value, chroma / 2))]
+
+    x_l = _interpolate_linear(hue_angle, lower_hue_angle, upper_hue_angle,
+                              x_minus, x_plus)
+    y_l = _interpolate_linear(hue_angle, lower_hue_angle, upper_hue_angle,
+                              y_minus, y_plus)
+
+    theta = _interpolate_linear(hue_angle, lower_hue_angle, upper_hue_angle,
+                                phi_minus, phi_plus)
+    rho = _interpolate_linear(hue_angle, lower_hue_angle, upper_hue_angle,
+                              rho_minus, rho_plus)
+    x_r, y_r = tsplit(
+        polar_to_cartesian(tstack([rho, np.radians(theta)])) +
+        as_float_array([x_grey, y_grey]))
+
+    x = np.select([interpolation_method == 1, interpolation_method == 2],
+                  [x_l, x_r], np.nan)
+    y = np.select([interpolation_method == 1, interpolation_method == 2],
+                  [y_l, y_r], np.nan)
+
+    x, y = np.where(is_standard_hue, x_s, x), np.where(is_standard_hue, y_s, y)
+
+    return np.where(is_valid, x, np.nan), np.where(is_valid, y, np.nan)
+
+
+def _munsell_specification_to_xy_vectorised(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *CIE xy*
+    chromaticity coordinates by interpolating over
+    *Munsell Renotation System* data.
+
+    This definition is the vectorised counterpart of
+    :func:`colour.notation.munsell.munsell_specification_to_xy` definition
+    for specifications with an integer value.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chroma.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    tuple
+        *CIE xy* chromaticity coordinates, they are set to *nan* where
+        :func:`colour.notation.munsell.munsell_specification_to_xy` definition
+        would raise an exception.
+    """
+
+    x_grey, y_grey = CCS_ILLUMINANT_MUNSELL
+
+    is_even_chroma = chroma % 2 == 0
+    chroma_minus = np.where(is_even_chroma, chroma, 2 * np.floor(chroma / 2))
+    chroma_plus = np.where(is_even_chroma, chroma, chroma_minus + 2)
+
+    # Smallest chroma ovoid collapses to illuminant chromaticity coordinates.
+    x_minus, y_minus = _xy_from_renotation_ovoid_vectorised(
+        hue, value, chroma_minus, code)
+    x_minus = np.where(chroma_minus == 0, x_grey, x_minus)
+    y_minus = np.where(chroma_minus == 0, y_grey, y_minus)
+
+    x_plus, y_plus = _xy_from_renotation_ovoid_vectorised(
+        hue, value, chroma_plus, code)
+
+    x = np.where(
+        is_even_chroma, x_minus,
+        _interpolate_linear(chroma, chroma_minus, chroma_plus, x_minus,
+                            x_plus))
+    y = np.where(
+        is_even_chroma, y_minus,
+        _interpolate_linear(chroma, chroma_minus, chroma_plus, y_minus,
+                            y_plus))
+
+    # Grey colours, i.e. null chroma specifications.
+    return np.where(chroma == 0, x_grey, x), np.where(chroma == 0, y_grey, y)
+
+
+def _munsell_specification_to_xyY_vectorised(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *CIE xyY*
+    colourspace.
+
+    This definition is the vectorised counterpart of
+    :func:`colour.notation.munsell._munsell_specification_to_xyY` definition
+    for specifications in reference domain-range scale.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chroma, grey specifications have
+        a null chroma.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    tuple
+        *CIE xyY* colourspace values, they are set to *nan* where
+        :func:`colour.notation.munsell._munsell_specification_to_xyY`
+        definition would raise an exception.
+    """
+
+    x_grey, y_grey = CCS_ILLUMINANT_MUNSELL
+
+    hue, code = np.where(hue == 0, 10, hue), np.where(hue == 0,
+                                                      (code + 1) % 10, code)
+
+    is_valid = np.logical_and.reduce(
+        [hue >= 0, hue <= 10, value >= 0, value <= 10])
+
+    is_integer_value = is_integer(value)
+    value_minus = np.where(is_integer_value, np.around(value), np.floor(value))
+    value_plus = np.where(is_integer_value, value_minus, value_minus + 1)
+
+    with domain_range_scale('ignore'):
+        Y = luminance_ASTMD1535(value)
+        Y_minus = luminance_ASTMD1535(value_minus)
+        Y_plus = luminance_ASTMD1535(value_plus)
+
+    x_minus, y_minus = _munsell_specification_to_xy_vectorised(
+        hue, value_minus, chroma, code)
+
+    x_plus, y_plus = _munsell_specification_to_xy_vectorised(
+        hue, value_plus, chroma, code)
+    x_plus = np.where(value_plus == 10, x_grey, x_plus)
+    y_plus = np.where(value_plus == 10, y_grey, y_plus)
+
+    x = np.where(value_minus == value_plus, x_minus,
+                 _interpolate_linear(Y, Y_minus, Y_plus, x_minus, x_plus))
+    y = np.where(value_minus == value_plus, y_minus,
+                 _interpolate_linear(Y, Y_minus, Y_plus, y_minus, y_plus))
+
+    is_grey = chroma == 0
+    x = np.where(is_grey, x_grey, np.where(is_valid, x, np.nan))
+    y = np.where(is_grey, y_grey, np.where(is_valid, y, np.nan))
+
+    return x, y, Y / 100
+
+
+def _maximum_chroma_from_renotation_vectorised(hue, value, code):
+    """
+    Returns the maximum *Munsell* chromas from *Munsell Renotation System*
+    data using given *Munsell* *Colorlab* specifications hue, value and code.
+
+    This definition is the vectorised counterpart of
+    :func:`colour.notation.munsell.maximum_chroma_from_renotation`
+    definition.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* value code.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    ndarray
+        Maximum chromas, they are set to *nan* where
+        :func:`colour.notation.munsell.maximum_chroma_from_renotation`
+        definition would raise an exception.
+    """
+
+    maximum_chromas = _munsell_renotation_tables()[1]
+
+    is_integer_value = value % 1 == 0
+    value_minus = np.where(is_integer_value, value, np.floor(value))
+    value_plus = np.where(is_integer_value, value, value_minus + 1)
+
+    hue_cw, hue_ccw = np.moveaxis(
+        bounding_hues_from_renotation(hue, code), -2, 0)
+    hue_cw, code_cw = tsplit(hue_cw)
+    hue_ccw, code_ccw = tsplit(hue_ccw)
+
+    def _maximum_chroma(hue, value, code):
+        """
+        Looks up the maximum chromas for given hue, value and code.
+        """
+
+        return _lookup_renotation_table(
+            maximum_chromas,
+            _munsell_renotation_indexes(hue, value, 0, code)[0:2], code)
+
+    ma_limit_mcw = _maximum_chroma(hue_cw, value_minus, code_cw)
+    ma_limit_mccw = _maximum_chroma(hue_ccw, value_minus, code_ccw)
+    ma_limit_pcw = _maximum_chroma(hue_cw, value_plus, code_cw)
+    ma_limit_pccw = _maximum_chroma(hue_ccw, value_plus, code_ccw)
+
+    L = luminance_ASTMD1535(value)
+    L9 = luminance_ASTMD1535(9)
+    L10 = luminance_ASTMD1535(10)
+
+    maximum_chroma = np.where(
+        value_plus <= 9,
+        np.minimum.reduce(
+            [ma_limit_mcw, ma_limit_mccw, ma_limit_pcw, ma_limit_pccw]),
+        np.minimum(
+            _interpolate_linear(L, L9, L10, ma_limit_mcw, 0),
+            _interpolate_linear(L, L9, L10, ma_limit_mccw, 0)))
+
+    maximum_chroma = np.where(
+        np.logical_and(value >= 1, value <= 10), maximum_chroma, np.nan)
+
+    # Ideal white, no chroma.
+    return np.where(value >= 9.99, 0, maximum_chroma)
+
+
+@ignore_numpy_errors
+def _xyY_to_munsell_specification_vectorised(xyY):
+    """
+    Converts from *CIE xyY* colourspace to *Munsell* *Colorlab* specification
+    by running the convergence loop of
+    :func:`colour.notation.munsell._xyY_to_munsell_specification` definition
+    on all the given samples at once.
+
+    Parameters
+    ----------
+    xyY : array_like, (N, 3)
+        *CIE xyY* colourspace array.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specification array and mask of the samples that
+        could not be resolved, i.e. the samples for which
+        :func:`colour.notation.munsell._xyY_to_munsell_specification`
+        definition would raise an exception or that did not converge within
+        the iterations count.
+
+    Notes
+    -----
+    -   The samples are iterated on while they have not converged, converged
+        and unresolved samples are masked out from the subsequent iterations.
+    """
+
+    xyY = as_float_array(xyY)
+
+    x, y, Y = tsplit(xyY)
+    Y = to_domain_1(Y)
+
+    with domain_range_scale('ignore'):
+        value = np.reshape(munsell_value_ASTMD1535(Y * 100), Y.shape)
+
+    value = np.where(is_integer(value), np.around(value), value)
+
+    x_center, y_center = CCS_ILLUMINANT_MUNSELL
+
+    rho_input, phi_input = tsplit(
+        cartesian_to_polar(tstack([x - x_center, y - y_center])))
+    phi_input = np.degrees(phi_input)
+
+    specification = tstack([np.full(value.shape, np.nan), value] +
+                           [np.full(value.shape, np.nan)] * 2)
+
+    grey_threshold = 1e-7
+    is_grey = rho_input < grey_threshold
+
+    X, Y, Z = tsplit(xyY_to_XYZ(tstack([x, y, Y])))
+    xi, yi = CCS_ILLUMINANT_MUNSELL
+    Xr, Yr, Zr = tsplit(
+        xyY_to_XYZ(tstack([np.full(Y.shape, xi),
+                           np.full(Y.shape, yi), Y])))
+
+    XYZ = tstack([X, Y, Z])
+    XYZr = tstack([(1 / Yr) * Xr, np.ones(Y.shape), (1 / Yr) * Zr])
+
+    Lab = XYZ_to_Lab(XYZ, XYZ_to_xy(XYZr))
+    LCHab = Lab_to_LCHab(Lab)
+
+    hue, _value, chroma, code = [
+        np.reshape(a, value.shape)
+        for a in tsplit(LCHab_to_munsell_specification(LCHab))
+    ]
+    chroma = (5 / 5.5) * chroma
+
+    convergence_threshold = 1e-7
+    iterations_maximum = 64
+
+    is_unresolved = np.zeros(value.shape, dtype=np.bool_)
+    indexes = np.arange(value.size)[~is_grey]
+    for _iteration in range(iterations_maximum + 1):
+        if indexes.size == 0:
+            break
+
+        x_i, y_i, value_i = x[indexes], y[indexes], value[indexes]
+        rho_input_i, phi_input_i = rho_input[indexes], phi_input[indexes]
+        hue_current, chroma_current, code_current = (hue[indexes],
+                                                     chroma[indexes],
+                                                     code[indexes])
+
+        hue_angle_current = np.reshape(
+            hue_to_hue_angle(hue_current, code_current), indexes.shape)
+
+        chroma_maximum = _maximum_chroma_from_renotation_vectorised(
+            hue_current, value_i, code_current)
+        chroma_current = np.where(chroma_current > chroma_maximum,
+                                  chroma_maximum, chroma_current)
+
+        x_current, y_current, _Y_current = (
+            _munsell_specification_to_xyY_vectorised(
+                hue_current, value_i, chroma_current, code_current))
+
+        is_failed = np.isnan(chroma_maximum) | np.isnan(x_current)
+
+        phi_current = np.degrees(
+            tsplit(
+                cartesian_to_polar(
+                    tstack([x_current - x_center, y_current - y_center])))[1])
+        phi_current_difference = (360 - phi_input_i + phi_current) % 360
+        phi_current_difference = np.where(phi_current_difference > 180,
+                                          phi_current_difference - 360,
+                                          phi_current_difference)
+
+        # The inner hue loop is iterated twice at most: the second iteration
+        # only happens when the phi differences have the same sign and then
+        # triggers the extrapolation, its *CIE xy* chromaticity coordinates
+        # are discarded but may still fail to be computed.
+        hue_angle_inner = (hue_angle_current +
+                           (phi_input_i - phi_current)) % 360
+        hue_angle_difference_inner = (phi_input_i - phi_current) % 360
+        hue_angle_difference_inner = np.where(hue_angle_difference_inner > 180,
+                                              hue_angle_difference_inner - 360,
+                                              hue_angle_difference_inner)
+
+        hue_inner, code_inner = tsplit(hue_angle_to_hue(hue_angle_inner))
+
+        x_inner, y_inner, _Y_inner = _munsell_specification_to_xyY_vectorised(
+            hue_inner, value_i, chroma_current, code_inner)
+
+        phi_inner = np.degrees(
+            tsplit(
+                cartesian_to_polar(
+                    tstack([x_inner - x_center, y_inner - y_center])))[1])
+        phi_inner_difference = (360 - phi_input_i + phi_inner) % 360
+        phi_inner_difference = np.where(phi_inner_difference > 180,
+                                        phi_inner_difference - 360,
+                                        phi_inner_difference)
+
+        phi_difference_minimum = np.minimum(phi_current_difference,
+                                            phi_inner_difference)
+        phi_difference_maximum = np.maximum(phi_current_difference,
+                                            phi_inner_difference)
+        is_extrapolated = (
+            np.sign(phi_difference_minimum) == np.sign(phi_difference_maximum))
+        if np.any(is_extrapolated):
+            hue_angle_extrapolated = (
+                hue_angle_current[is_extrapolated] + 2 *
+                (phi_input_i - phi_current)[is_extrapolated]) % 360
+            hue_extrapolated, code_extrapolated = tsplit(
+                hue_angle_to_hue(hue_angle_extrapolated))
+            is_failed[is_extrapolated] |= np.isnan(
+                _munsell_specification_to_xyY_vectorised(
+                    hue_extrapolated, value_i[is_extrapolated],
+                    chroma_current[is_extrapolated], code_extrapolated)[0])
+
+        is_failed |= np.isnan(x_inner)
+        is_failed |= phi_current_difference == phi_inner_difference
+
+        # Linear interpolation or extrapolation of the hue angle differences
+        # at null phi difference.
+        hue_angle_difference_new = (
+            (-phi_current_difference) * hue_angle_difference_inner /
+            (phi_inner_difference - phi_current_difference)) % 360
+        hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
+
+        hue_new, code_new = tsplit(hue_angle_to_hue(hue_angle_new))
+
+        x_current, y_current, _Y_current = (
+            _munsell_specification_to_xyY_vectorised(hue_new, value_i,
+                                                     chroma_current, code_new))
+
+        difference = np.reshape(
+            euclidean_distance(
+                tstack([x_i, y_i]), tstack([x_current, y_current])),
+            indexes.shape)
+        is_converged = difference < convergence_threshold
+        is_failed |= np.isnan(x_current)
+
+        chroma_maximum = _maximum_chroma_from_renotation_vectorised(
+            hue_new, value_i, code_new)
+        chroma_current = np.where(
+            np.logical_and(~is_converged, chroma_current > chroma_maximum),
+            chroma_maximum, chroma_current)
+        is_failed |= np.logical_and(~is_converged, np.isnan(chroma_maximum))
+
+        x_current, y_current, _Y_current = (
+            _munsell_specification_to_xyY_vectorised(hue_new, value_i,
+                                                     chroma_current, code_new))
+        rho_current = tsplit(
+            cartesian_to_polar(
+                tstack([x_current - x_center, y_current - y_center])))[0]
+
+        # Chroma bounds, the first column stores the current chroma, the
+        # subsequent columns the inner loop chromas.
+        iterations_maximum_inner = 16
+        rho_bounds = np.full((indexes.size, iterations_maximum_inner + 1),
+                             np.nan)
+        chroma_bounds = np.full((indexes.size, iterations_maximum_inner + 1),
+                                np.nan)
+        rho_bounds[..., 0] = rho_current
+        chroma_bounds[..., 0] = chroma_current
+
+        is_bounded = np.logical_or.reduce(
+            [is_converged, is_failed,
+             np.isnan(rho_current)])
+        is_failed |= np.logical_and(~is_converged, np.isnan(rho_current))
+        for iterations_inner in range(1, iterations_maximum_inner + 1):
+            is_pending = ~is_bounded
+            if not np.any(is_pending):
+                break
+
+            chroma_inner = ((rho_input_i[is_pending] / rho_current[is_pending])
+                            ** iterations_inner * chroma_current[is_pending])
+            chroma_inner = np.where(chroma_inner > chroma_maximum[is_pending],
+                                    chroma_maximum[is_pending], chroma_inner)
+
+            x_inner, y_inner, _Y_inner = (
+                _munsell_specification_to_xyY_vectorised(
+                    hue_new[is_pending], value_i[is_pending], chroma_inner,
+                    code_new[is_pending]))
+            rho_inner = tsplit(
+                cartesian_to_polar(
+                    tstack([x_inner - x_center, y_inner - y_center])))[0]
+
+            rho_bounds[is_pending, iterations_inner] = rho_inner
+            chroma_bounds[is_pending, iterations_inner] = chroma_inner
+
+            is_failed[is_pending] |= np.isnan(rho_inner)
+            is_bounded = np.logical_or.reduce([
+                is_bounded, is_failed,
+                np.logical_and(
+                    np.fmin.reduce(rho_bounds, axis=-1) < rho_input_i,
+                    rho_input_i < np.fmax.reduce(rho_bounds, axis=-1))
+            ])
+
+        # Reaching the maximum inner iterations count without bounding the
+        # input rho raises an exception in the scalar definition.
+        is_failed |= ~is_bounded
+
+        is_interpolated = ~np.logical_or(is_converged, is_failed)
+        rho_bounds = rho_bounds[is_interpolated]
+        chroma_bounds = chroma_bounds[is_interpolated]
+        rho_input_b = rho_input_i[is_interpolated]
+
+        rhos_bounds_indexes = rho_bounds.argsort(axis=-1)
+        rho_bounds = np.take_along_axis(rho_bounds, rhos_bounds_indexes, -1)
+        chroma_bounds = np.take_along_axis(chroma_bounds, rhos_bounds_indexes,
+                                           -1)
+
+        index = np.sum(rho_bounds <= rho_input_b[..., np.newaxis], axis=-1) - 1
+        index = np.clip(index, 0, rho_bounds.shape[-1] - 2)[..., np.newaxis]
+        rho_0 = np.take_along_axis(rho_bounds, index, -1)[..., 0]
+        rho_1 = np.take_along_axis(rho_bounds, index + 1, -1)[..., 0]
+        chroma_0 = np.take_along_axis(chroma_bounds, index, -1)[..., 0]
+        chroma_1 = np.take_along_axis(chroma_bounds, index + 1, -1)[..., 0]
+
+        chroma_new = np.copy(chroma_current)
+        chroma_new[is_interpolated] = _interpolate_linear(
+            rho_input_b, rho_0, rho_1, chroma_0, chroma_1)
+
+        x_current, y_current, _Y_current = (
+            _munsell_specification_to_xyY_vectorised(hue_new, value_i,
+                                                     chroma_new, code_new))
+
+        difference = np.where(
+            is_interpolated,
+            np.reshape(
+                euclidean_distance(
+                    tstack([x_i, y_i]), tstack([x_current, y_current])),
+                indexes.shape), difference)
+        is_failed |= np.logical_and(is_interpolated, np.isnan(x_current))
+        is_converged = np.logical_and(difference < convergence_threshold,
+                                      ~is_failed)
+
+        hue[indexes], chroma[indexes], code[indexes] = (hue_new, chroma_new,
+                                                        code_new)
+
+        specification[indexes[is_converged]] = tstack(
+            [hue_new, value_i, chroma_new, code_new])[is_converged]
+        is_unresolved[indexes[is_failed]] = True
+
+        indexes = indexes[~np.logical_or(is_converged, is_failed)]
+
+    is_unresolved[indexes] = True
+
+    chroma_scale = 50 if get_domain_range_scale() == '1' else 2
+
+    return (from_range_10(specification, np.array([10, 10, chroma_scale, 10])),
+            is_unresolved)
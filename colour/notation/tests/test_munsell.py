@@ -27,12 +27,13 @@ from colour.notation.munsell import (munsell_colour_to_xyY,
                                      xyY_to_munsell_colour)
 from colour.notation.munsell import (munsell_specification_to_xyY,
                                      xyY_to_munsell_specification)
+from colour.notation.munsell import _xyY_to_munsell_specification
 from colour.notation import (
     munsell_value_Priest1920, munsell_value_Munsell1933,
     munsell_value_Moon1943, munsell_value_Saunderson1944,
     munsell_value_Ladd1955, munsell_value_McCamy1987, munsell_value_ASTMD1535)
 from colour.utilities import (as_float_array, domain_range_scale,
-                              ignore_numpy_errors, tstack)
+                              ignore_numpy_errors, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -1484,6 +1485,23 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
             rtol=0.00001,
             atol=0.00001)
 
+    def test_vectorised_xyY_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition vectorised computations consistency with the per-sample
+        computations.
+        """
+
+        xyY = as_float_array(list(MUNSELL_SPECIFICATIONS[..., 1]))
+
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specification(xyY),
+            as_float_array([_xyY_to_munsell_specification(a) for a in xyY]),
+            decimal=7)
+
+        xyY = np.vstack([xyY, [0.90615118, 0.57945103, 0.91984064]])
+        self.assertRaises(RuntimeError, xyY_to_munsell_specification, xyY)
+
     def test_n_dimensional_xyY_to_munsell_specification(self):
         """
         Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
@@ -1837,6 +1855,18 @@ class TestBoundingHuesFromRenotation(unittest.TestCase):
                 bounding_hues_from_renotation(hue, code),
                 MUNSELL_BOUNDING_HUES[i])
 
+    def test_n_dimensional_bounding_hues_from_renotation(self):
+        """
+        Tests :func:`colour.notation.munsell.bounding_hues_from_renotation`
+        definition n-dimensional arrays support.
+        """
+
+        hue, _value, _chroma, code = tsplit(
+            as_float_array(list(MUNSELL_SPECIFICATIONS[..., 0])))
+        np.testing.assert_array_equal(
+            bounding_hues_from_renotation(hue, code),
+            MUNSELL_BOUNDING_HUES[:len(hue)])
+
 
 class TestHueToHueAngle(unittest.TestCase):
     """
@@ -1867,6 +1897,16 @@ class TestHueAngleToHue(unittest.TestCase):
         for hue, code, angle in MUNSELL_HUE_TO_ANGLE:
             np.testing.assert_array_equal(hue_angle_to_hue(angle), (hue, code))
 
+    def test_n_dimensional_hue_angle_to_hue(self):
+        """
+        Tests :func:`colour.notation.munsell.hue_angle_to_hue` definition
+        n-dimensional arrays support.
+        """
+
+        hue, code, angle = tsplit(MUNSELL_HUE_TO_ANGLE)
+        np.testing.assert_array_equal(
+            hue_angle_to_hue(angle), tstack([hue, code]))
+
 
 class TestHueTo_ASTM_hue(unittest.TestCase):
     """
@@ -1882,6 +1922,15 @@ class TestHueTo_ASTM_hue(unittest.TestCase):
         for hue, code, angle in MUNSELL_HUE_TO_ASTM_HUE:
             self.assertEqual(hue_to_ASTM_hue(hue, code), angle)
 
+    def test_n_dimensional_hue_to_ASTM_hue(self):
+        """
+        Tests :func:`colour.notation.munsell.hue_to_ASTM_hue` definition
+        n-dimensional arrays support.
+        """
+
+        hue, code, angle = tsplit(MUNSELL_HUE_TO_ASTM_HUE)
+        np.testing.assert_array_equal(hue_to_ASTM_hue(hue, code), angle)
+
 
 class TestInterpolationMethodFromRenotationOvoid(unittest.TestCase):
     """
@@ -1971,6 +2020,25 @@ class TestLCHabToMunsellSpecification(unittest.TestCase):
             np.array([10.000000000000000, 10.0, 4.314420714000000, 7]),
             decimal=7)
 
+    def test_n_dimensional_LCHab_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.LCHab_to_munsell_specification`
+        definition n-dimensional arrays support.
+        """
+
+        LCHab = np.array([100.00000000, 21.57210357, 272.22819350])
+        specification = LCHab_to_munsell_specification(LCHab)
+
+        LCHab = np.tile(LCHab, (6, 1))
+        specification = np.tile(specification, (6, 1))
+        np.testing.assert_almost_equal(
+            LCHab_to_munsell_specification(LCHab), specification, decimal=7)
+
+        LCHab = np.reshape(LCHab, (2, 3, 3))
+        specification = np.reshape(specification, (2, 3, 4))
+        np.testing.assert_almost_equal(
+            LCHab_to_munsell_specification(LCHab), specification, decimal=7)
+
 
 class TestMaximumChromaFromRenotation(unittest.TestCase):
     """
@@ -3,28 +3,37 @@
 from .datasets import *  # noqa
 from . import datasets
 from .cfi2017 import (ColourRendering_Specification_CIE2017,
-                      colour_fidelity_index_CIE2017)
-from .cri import ColourRendering_Specification_CRI, colour_rendering_index
+                      colour_fidelity_index_CIE2017,
+                      msds_colour_fidelity_index_CIE2017)
+from .cri import (ColourRendering_Specification_CRI, colour_rendering_index,
+                  msds_colour_rendering_index)
 from .cqs import (COLOUR_QUALITY_SCALE_METHODS,
-                  ColourRendering_Specification_CQS, colour_quality_scale)
+                  ColourRendering_Specification_CQS, colour_quality_scale,
+                  msds_colour_quality_scale)
 from .ssi import spectral_similarity_index
 from .tm3018 import (ColourQuality_Specification_ANSIIESTM3018,
-                     colour_fidelity_index_ANSIIESTM3018)
+                     colour_fidelity_index_ANSIIESTM3018,
+                     msds_colour_fidelity_index_ANSIIESTM3018)
 from colour.utilities import CaseInsensitiveMapping
 
 __all__ = []
 __all__ += datasets.__all__
 __all__ += [
-    'ColourRendering_Specification_CIE2017', 'colour_fidelity_index_CIE2017'
+    'ColourRendering_Specification_CIE2017', 'colour_fidelity_index_CIE2017',
+    'msds_colour_fidelity_index_CIE2017'
 ]
 __all__ += [
     'ColourQuality_Specification_ANSIIESTM3018',
-    'colour_fidelity_index_ANSIIESTM3018'
+    'colour_fidelity_index_ANSIIESTM3018',
+    'msds_colour_fidelity_index_ANSIIESTM3018'
+]
+__all__ += [
+    'ColourRendering_Specification_CRI', 'colour_rendering_index',
+    'msds_colour_rendering_index'
 ]
-__all__ += ['ColourRendering_Specification_CRI', 'colour_rendering_index']
 __all__ += [
     'ColourRendering_Specification_CQS', 'COLOUR_QUALITY_SCALE_METHODS',
-    'colour_quality_scale'
+    'colour_quality_scale', 'msds_colour_quality_scale'
 ]
 __all__ += ['spectral_similarity_index']
 
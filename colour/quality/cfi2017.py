@@ -7,6 +7,7 @@ Defines the *CIE 2017 Colour Fidelity Index* (CFI) computation objects:
 
 - :class:`colour.quality.ColourRendering_Specification_CIE2017`
 - :func:`colour.quality.colour_fidelity_index_CIE2017`
+- :func:`colour.quality.msds_colour_fidelity_index_CIE2017`
 
 References
 ----------
@@ -18,14 +19,21 @@ import numpy as np
 import os
 from collections import namedtuple
 
-from colour.algebra import euclidean_distance, Extrapolator
-from colour.appearance import XYZ_to_CIECAM02, VIEWING_CONDITIONS_CIECAM02
+from colour.algebra import (euclidean_distance, Extrapolator,
+                            LinearInterpolator)
+from colour.appearance import (CAM_Specification_CIECAM02, XYZ_to_CIECAM02,
+                               VIEWING_CONDITIONS_CIECAM02)
 from colour.colorimetry import (
-    SpectralShape, SpectralDistribution, MultiSpectralDistributions, sd_to_XYZ,
-    sd_blackbody, MSDS_CMFS, sd_ones, sd_CIE_illuminant_D_series)
+    SPECTRAL_SHAPE_DEFAULT, SpectralShape, SpectralDistribution,
+    MultiSpectralDistributions, sd_to_XYZ, sd_blackbody, MSDS_CMFS,
+    MSDS_CMFS_STANDARD_OBSERVER, SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES,
+    planck_law, sd_ones, sd_CIE_illuminant_D_series)
+from colour.colorimetry.tristimulus import SPECTRAL_SHAPE_ASTME308
 from colour.models import XYZ_to_UCS, UCS_to_uv, JMh_CIECAM02_to_CAM02UCS
 from colour.temperature import uv_to_CCT_Ohno2013, CCT_to_xy_CIE_D
-from colour.utilities import as_int, lerp, usage_warning
+from colour.utilities import (CACHE_REGISTRY, as_float_array, as_int,
+                              from_range_100, full, lerp, tsplit, tstack,
+                              usage_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -37,9 +45,9 @@ __status__ = 'Production'
 __all__ = [
     'SPECTRAL_SHAPE_CIE2017', 'RESOURCES_DIRECTORY_CIE2017',
     'TCS_ColorimetryData_CIE2017', 'ColourRendering_Specification_CIE2017',
-    'colour_fidelity_index_CIE2017', 'load_TCS_CIE2017',
-    'CCT_reference_illuminant', 'sd_reference_illuminant',
-    'tcs_colorimetry_data', 'delta_E_to_R_f'
+    'colour_fidelity_index_CIE2017', 'msds_colour_fidelity_index_CIE2017',
+    'msds_test_CIE2017', 'load_TCS_CIE2017', 'CCT_reference_illuminant',
+    'sd_reference_illuminant', 'tcs_colorimetry_data', 'delta_E_to_R_f'
 ]
 
 SPECTRAL_SHAPE_CIE2017 = SpectralShape(380, 780, 1)
@@ -58,7 +66,8 @@ RESOURCES_DIRECTORY_CIE2017 = os.path.join(
 RESOURCES_DIRECTORY_CIE2017 : unicode
 """
 
-_CACHE_TCS_CIE2017 = {}
+_CACHE_TCS_CIE2017 = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TCS_CIE2017'.format(__name__))
 
 
 class TCS_ColorimetryData_CIE2017(
@@ -182,6 +191,179 @@ def colour_fidelity_index_CIE2017(sd_test, additional_data=False):
         return R_f
 
 
+def msds_colour_fidelity_index_CIE2017(msds_test,
+                                       additional_data=False,
+                                       shape=None):
+    """
+    Returns the *CIE 2017 Colour Fidelity Index* (CFI) :math:`R_f` of given
+    multi-spectral distributions.
+
+    The test spectral distributions are processed at once: the reference
+    illuminants, the *test colour samples* tristimulus values and their
+    *CAM02-UCS* colourspace coordinates are computed for the whole stack of
+    test spectral distributions and *test colour samples*.
+
+    Parameters
+    ----------
+    msds_test : MultiSpectralDistributions or array_like
+        Test multi-spectral distributions, if an *array_like* the wavelengths
+        are expected to be in the last axis, e.g. for 1000 test spectral
+        distributions with 81 bins, ``msds_test`` shape should be (1000, 81).
+    additional_data : bool, optional
+        Whether to output additional data.
+    shape : SpectralShape, optional
+        Spectral shape of the test multi-spectral distributions when given as
+        an *array_like*.
+
+    Returns
+    -------
+    ndarray or ColourRendering_Specification_CIE2017
+        *CIE 2017 Colour Fidelity Index* (CFI) :math:`R_f`. The additional
+        data attributes are arrays whose first axis is the test spectral
+        distributions axis, the ``name`` attribute is the test
+        multi-spectral distributions labels, the ``sd_reference`` attribute is
+        a :class:`colour.MultiSpectralDistributions` class instance and the
+        ``colorimetry_data`` attribute contains a
+        :class:`colour.quality.cfi2017.TCS_ColorimetryData_CIE2017` class
+        instance with array attributes for the test and reference
+        computations.
+
+    References
+    ----------
+    :cite:`CIETC1-902017`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
+    >>> msds = sds_and_msds_to_msds(
+    ...     [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL11']])
+    >>> msds_colour_fidelity_index_CIE2017(msds)  # doctest: +ELLIPSIS
+    array([ 70.1208254...,  80.0404945...])
+    """
+
+    msds_test = msds_test_CIE2017(msds_test, shape)
+
+    if msds_test.shape.start > 380 or msds_test.shape.end < 780:
+        usage_warning('Test multi-spectral distributions shape does not '
+                      'span the recommended 380-780nm range, missing values '
+                      'will be filled with zeros!')
+
+        # NOTE: "CIE 2017 Colour Fidelity Index" standard recommends filling
+        # missing values with zeros.
+        msds_test = msds_test.copy()
+        msds_test.extrapolator = Extrapolator
+        msds_test.extrapolator_kwargs = {
+            'method': 'constant',
+            'left': 0,
+            'right': 0
+        }
+
+    if msds_test.shape.interval > 5:
+        raise ValueError('Test multi-spectral distributions interval is '
+                         'greater than 5nm which is the maximum recommended '
+                         'value for computing the "CIE 2017 Colour Fidelity '
+                         'Index"!')
+
+    shape = SpectralShape(SPECTRAL_SHAPE_CIE2017.start,
+                          SPECTRAL_SHAPE_CIE2017.end, msds_test.shape.interval)
+
+    CCT, D_uv = tsplit(
+        uv_to_CCT_Ohno2013(
+            UCS_to_uv(XYZ_to_UCS(_msds_to_XYZ_CIE1931(msds_test)))))
+
+    values_test = np.transpose(msds_test.copy().align(shape).values)
+    values_reference = _msds_reference_illuminant(CCT, shape)
+
+    # NOTE: All computations except CCT calculation use the
+    # "CIE 1964 10 Degree Standard Observer".
+    cmfs_10 = MSDS_CMFS['CIE 1964 10 Degree Standard Observer'].copy().align(
+        shape)
+
+    sds_tcs = load_TCS_CIE2017(shape).align(shape)
+
+    # The test and reference colorimetry data are computed at once.
+    count = values_test.shape[0]
+    tcs_colorimetry_data = _msds_tcs_colorimetry_data(
+        np.vstack([values_test, values_reference]), sds_tcs, cmfs_10)
+    test_tcs_colorimetry_data, reference_tcs_colorimetry_data = [
+        TCS_ColorimetryData_CIE2017(
+            tcs_colorimetry_data.name, tcs_colorimetry_data.XYZ[i],
+            CAM_Specification_CIECAM02(*[
+                None if correlate is None else correlate[i]
+                for correlate in tcs_colorimetry_data.CAM
+            ]), tcs_colorimetry_data.JMh[i], tcs_colorimetry_data.Jpapbp[i])
+        for i in (slice(None, count), slice(count, None))
+    ]
+
+    delta_E_s = np.linalg.norm(
+        test_tcs_colorimetry_data.Jpapbp -
+        reference_tcs_colorimetry_data.Jpapbp,
+        axis=-1)
+
+    R_s = delta_E_to_R_f(delta_E_s)
+    R_f = delta_E_to_R_f(np.average(delta_E_s, axis=-1))
+
+    if additional_data:
+        msds_reference = MultiSpectralDistributions(
+            np.transpose(values_reference),
+            shape.range(),
+            name='{0} - Reference Illuminants'.format(msds_test.name),
+            labels=msds_test.labels)
+
+        return ColourRendering_Specification_CIE2017(
+            msds_test.labels, msds_reference, R_f, R_s, CCT, D_uv,
+            (test_tcs_colorimetry_data, reference_tcs_colorimetry_data),
+            delta_E_s)
+    else:
+        return R_f
+
+
+def msds_test_CIE2017(msds_test, shape=None):
+    """
+    Returns given test multi-spectral distributions as a
+    :class:`colour.MultiSpectralDistributions` class instance.
+
+    Parameters
+    ----------
+    msds_test : MultiSpectralDistributions or array_like
+        Test multi-spectral distributions, if an *array_like* the wavelengths
+        are expected to be in the last axis.
+    shape : SpectralShape, optional
+        Spectral shape of the test multi-spectral distributions when given as
+        an *array_like*.
+
+    Returns
+    -------
+    MultiSpectralDistributions
+        Test multi-spectral distributions, the labels of the
+        multi-spectral distributions converted from an *array_like* are the
+        indexes of the test spectral distributions.
+
+    Examples
+    --------
+    >>> msds = msds_test_CIE2017(
+    ...     np.ones([2, 81]), SpectralShape(380, 780, 5))
+    >>> msds.labels
+    ['0', '1']
+    """
+
+    if isinstance(msds_test, MultiSpectralDistributions):
+        return msds_test
+
+    values = np.atleast_2d(as_float_array(msds_test))
+
+    msd_shape_m_1, shape_wl_count = values.shape[-1], len(shape.range())
+    assert msd_shape_m_1 == shape_wl_count, (
+        'Multi-spectral distributions array with {0} wavelengths '
+        'is not compatible with spectral shape with {1} wavelengths!'.format(
+            msd_shape_m_1, shape_wl_count))
+
+    return MultiSpectralDistributions(
+        np.transpose(np.reshape(values, (-1, msd_shape_m_1))),
+        shape.range(),
+        labels=[str(i) for i in range(values.size // msd_shape_m_1)])
+
+
 def load_TCS_CIE2017(shape):
     """
     Loads the *CIE 2017 Test Colour Samples* dataset appropriate for the given
@@ -207,8 +389,6 @@ def load_TCS_CIE2017(shape):
     99
     """
 
-    global _CACHE_TCS_CIE2017
-
     interval = shape.interval
 
     assert interval in (1, 5), (
@@ -216,8 +396,9 @@ def load_TCS_CIE2017(shape):
 
     filename = 'tcs_cfi2017_{0}_nm.csv.gz'.format(as_int(interval))
 
-    if filename in _CACHE_TCS_CIE2017:
-        return _CACHE_TCS_CIE2017[filename]
+    tcs = _CACHE_TCS_CIE2017.get(filename)
+    if tcs is not None:
+        return tcs
 
     data = np.genfromtxt(
         str(os.path.join(RESOURCES_DIRECTORY_CIE2017, filename)),
@@ -387,6 +568,174 @@ def tcs_colorimetry_data(sd_irradiance, sds_tcs, cmfs):
     return tcs_data
 
 
+def _msds_to_XYZ_CIE1931(msds):
+    """
+    Converts given multi-spectral distributions to *CIE XYZ* tristimulus
+    values using the *CIE 1931 2 Degree Standard Observer* as the
+    :func:`colour.sd_to_XYZ` definition does with its default arguments for
+    1nm and 5nm measurement intervals.
+
+    Parameters
+    ----------
+    msds : MultiSpectralDistributions
+        Multi-spectral distributions.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values.
+    """
+
+    if msds.shape.interval not in (1, 5):
+        raise ValueError(
+            'Tristimulus values conversion from spectral data according to '
+            'practise "ASTM E308-15" should be performed on spectral data '
+            'with measurement interval of 1 or 5nm!')
+
+    cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+        'CIE 1931 2 Degree Standard Observer'].copy().trim(
+            SPECTRAL_SHAPE_DEFAULT).trim(SPECTRAL_SHAPE_ASTME308)
+
+    if msds.shape.interval == 5:
+        cmfs = cmfs.interpolate(SpectralShape(interval=5))
+
+    if msds.shape != cmfs.shape:
+        msds = msds.copy().align(cmfs.shape)
+
+    dw = cmfs.shape.interval
+    k = 100 / (np.sum(cmfs.values[..., 1]) * dw)
+
+    return k * np.dot(np.transpose(msds.values), cmfs.values) * dw
+
+
+def _msds_reference_illuminant(CCT, shape):
+    """
+    Computes the reference illuminants for given correlated colour
+    temperatures :math:`T_{cp}`, i.e. the vectorised
+    :func:`colour.quality.cfi2017.sd_reference_illuminant` definition.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Desired shape of the reference illuminants.
+
+    Returns
+    -------
+    ndarray
+        Reference illuminants values, the wavelengths are in the last axis.
+    """
+
+    CCT = np.reshape(as_float_array(CCT), (-1, 1))
+    wavelengths = shape.range()
+
+    is_planckian = CCT[..., 0] <= 5000
+    is_daylight = CCT[..., 0] >= 4000
+
+    values_planckian = full([CCT.shape[0], len(wavelengths)], np.nan)
+    values_planckian[is_planckian] = planck_law(wavelengths * 1e-9,
+                                                CCT[is_planckian]) * 1e-9
+
+    # NOTE: The basis functions are interpolated linearly as the
+    # spectral distributions returned by the
+    # :func:`colour.sd_CIE_illuminant_D_series` definition.
+    S0, S1, S2 = [
+        SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES[basis].copy()
+        for basis in ('S0', 'S1', 'S2')
+    ]
+    for basis in (S0, S1, S2):
+        basis.interpolator = LinearInterpolator
+        basis.align(shape)
+
+    x, y = tsplit(CCT_to_xy_CIE_D(CCT[is_daylight]))
+
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = np.around((-1.3515 - 1.7703 * x + 5.9114 * y) / M, 3)
+    M2 = np.around((0.0300 - 31.4424 * x + 30.0717 * y) / M, 3)
+
+    values_daylight = full([CCT.shape[0], len(wavelengths)], np.nan)
+    values_daylight[is_daylight] = (
+        S0.values + M1 * S1.values + M2 * S2.values)
+
+    values = np.where(is_planckian[..., np.newaxis], values_planckian,
+                      values_daylight)
+
+    is_mixture = np.logical_and(is_planckian, is_daylight)
+    if np.any(is_mixture):
+        # Planckian and daylight illuminant must be normalised so that the
+        # mixture isn't biased.
+        values_mixture = [
+            values_planckian[is_mixture], values_daylight[is_mixture]
+        ]
+        for i, values_m in enumerate(values_mixture):
+            values_mixture[i] = values_m / _msds_to_XYZ_CIE1931(
+                MultiSpectralDistributions(
+                    np.transpose(values_m), wavelengths))[..., 1:2]
+
+        # Mixture: 4200K should be 80% Planckian, 20% CIE Illuminant D Series.
+        m = (CCT[is_mixture] - 4000) / 1000
+        values[is_mixture] = lerp(values_mixture[0], values_mixture[1], m)
+
+    return values
+
+
+def _msds_tcs_colorimetry_data(values_irradiance, sds_tcs, cmfs):
+    """
+    Returns the *test colour samples* colorimetry data under given test light
+    sources or reference illuminants for the
+    *CIE 2017 Colour Fidelity Index* (CFI) computations, i.e. the vectorised
+    :func:`colour.quality.cfi2017.tcs_colorimetry_data` definition.
+
+    Parameters
+    ----------
+    values_irradiance : array_like
+        Test light sources or reference illuminants values, i.e. the
+        irradiance emitters, with the wavelengths in the last axis and the
+        shape of the colour matching functions.
+    sds_tcs : MultiSpectralDistributions
+        *Test colour samples* spectral distributions.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    TCS_ColorimetryData_CIE2017
+        *Test colour samples* colorimetry data, the attributes are arrays
+        whose first and second axes are respectively the irradiance emitters
+        and the *test colour samples* axes.
+    """
+
+    S = as_float_array(values_irradiance)
+    R = sds_tcs.values
+
+    dw = cmfs.shape.interval
+    k = 100 / (np.dot(S, cmfs.values[..., 1]) * dw)
+
+    XYZ_w = from_range_100(k[..., np.newaxis] * np.dot(S, cmfs.values) * dw)
+    XYZ = from_range_100(
+        tstack([
+            k[..., np.newaxis] * np.dot(S * cmfs.values[..., i] * dw, R)
+            for i in range(3)
+        ]))
+
+    # The *test colour samples* axis is moved first so that the whitepoints
+    # and the viewing conditions dependent parameters broadcast against the
+    # tristimulus values without being repeated for each sample.
+    CAM = XYZ_to_CIECAM02(
+        np.moveaxis(XYZ, 1, 0), XYZ_w, full(XYZ_w.shape[:-1], 100),
+        full(XYZ_w.shape[:-1], 20), VIEWING_CONDITIONS_CIECAM02['Average'],
+        True)
+    CAM = CAM_Specification_CIECAM02(*[
+        None if correlate is None else np.moveaxis(correlate, 0, 1)
+        for correlate in CAM
+    ])
+    JMh = tstack([CAM.J, CAM.M, CAM.h])
+    Jpapbp = JMh_CIECAM02_to_CAM02UCS(JMh)
+
+    return TCS_ColorimetryData_CIE2017(sds_tcs.labels, XYZ, CAM, JMh, Jpapbp)
+
+
 def delta_E_to_R_f(delta_E):
     """
     Converts from colour-appearance difference to
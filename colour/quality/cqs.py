@@ -7,6 +7,7 @@ Defines *Colour Quality Scale* (CQS) computation objects:
 
 -   :class:`colour.quality.ColourRendering_Specification_CQS`
 -   :func:`colour.colour_quality_scale`
+-   :func:`colour.quality.msds_colour_quality_scale`
 
 References
 ----------
@@ -29,12 +30,14 @@ from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     SPECTRAL_SHAPE_DEFAULT, sd_CIE_illuminant_D_series, CCS_ILLUMINANTS,
     MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody, sd_to_XYZ)
+from colour.quality.cri import _msds_reference_illuminant, _msds_test_aligned
 from colour.quality.datasets.vs import INDEXES_TO_NAMES_VS, SDS_VS
 from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
 from colour.adaptation import chromatic_adaptation_VonKries
-from colour.utilities import as_float_array, domain_range_scale, tsplit
+from colour.utilities import (CACHE_REGISTRY, as_float_array,
+                              domain_range_scale, tsplit, tstack)
 from colour.utilities.documentation import (DocstringTuple,
                                             is_documentation_building)
 
@@ -48,8 +51,9 @@ __status__ = 'Production'
 __all__ = [
     'GAMUT_AREA_D65', 'VS_ColorimetryData', 'VS_ColourQualityScaleData',
     'ColourRendering_Specification_CQS', 'COLOUR_QUALITY_SCALE_METHODS',
-    'colour_quality_scale', 'gamut_area', 'vs_colorimetry_data', 'CCT_factor',
-    'scale_conversion', 'delta_E_RMS', 'colour_quality_scales'
+    'colour_quality_scale', 'msds_colour_quality_scale', 'gamut_area',
+    'vs_colorimetry_data', 'CCT_factor', 'scale_conversion', 'delta_E_RMS',
+    'colour_quality_scales'
 ]
 
 GAMUT_AREA_D65 = 8210
@@ -59,6 +63,9 @@ Gamut area for *CIE Illuminant D Series D65*.
 GAMUT_AREA_D65 : int
 """
 
+_CACHE_VS_REFLECTANCES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_VS_REFLECTANCES'.format(__name__))
+
 
 class VS_ColorimetryData(
         namedtuple('VS_ColorimetryData', ('name', 'XYZ', 'Lab', 'C'))):
@@ -253,6 +260,277 @@ def colour_quality_scale(sd_test, additional_data=False,
         return Q_a
 
 
+def msds_colour_quality_scale(msds_test,
+                              additional_data=False,
+                              method='NIST CQS 9.0',
+                              shape=None):
+    """
+    Returns the *Colour Quality Scale* (CQS) of given multi-spectral
+    distributions using given method.
+
+    The test spectral distributions are processed at once: the aligned
+    *VS test colour samples* reflectances and colour matching functions are
+    shared by the whole stack of test spectral distributions.
+
+    Parameters
+    ----------
+    msds_test : MultiSpectralDistributions or list or array_like
+        Test multi-spectral distributions, a list of
+        :class:`colour.SpectralDistribution` or
+        :class:`colour.MultiSpectralDistributions` class instances or an
+        *array_like* whose wavelengths are expected to be in the last axis,
+        e.g. for 1000 test spectral distributions with 81 bins, ``msds_test``
+        shape should be (1000, 81).
+    additional_data : bool, optional
+        Whether to output additional data.
+    method : unicode, optional
+        **{'NIST CQS 9.0', 'NIST CQS 7.4'}**,
+        Computation method.
+    shape : SpectralShape, optional
+        Spectral shape of the test multi-spectral distributions when given as
+        an *array_like*.
+
+    Returns
+    -------
+    ndarray or ColourRendering_Specification_CQS
+        Color quality scale. The additional data ``name`` attribute is the
+        test multi-spectral distributions labels, the ``Q_as`` attribute and
+        the ``colorimetry_data`` attribute items are structured arrays whose
+        fields are the :class:`colour.quality.cqs.VS_ColourQualityScaleData`
+        and :class:`colour.quality.cqs.VS_ColorimetryData` classes
+        attributes, their first and second axes are respectively the test
+        spectral distributions and the *VS test colour samples* axes.
+
+    Notes
+    -----
+    -   The spectral distributions of a list are aligned to the colour
+        matching functions spectral shape with their own interpolator before
+        being stacked, thus the results match the
+        :func:`colour.quality.colour_quality_scale` definition. The
+        multi-spectral distributions are aligned with their own interpolator,
+        i.e. :attr:`colour.MultiSpectralDistributions.interpolator`
+        attribute.
+
+    References
+    ----------
+    :cite:`Davis2010a`, :cite:`Ohno2008a`, :cite:`Ohno2013`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SDS_ILLUMINANTS
+    >>> sds = [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL11']]
+    >>> msds_colour_quality_scale(sds)  # doctest: +ELLIPSIS
+    array([ 64.1117031...,  81.0670017...])
+    """
+
+    method = method.lower()
+    assert method.lower() in [
+        m.lower() for m in COLOUR_QUALITY_SCALE_METHODS
+    ], ('"{0}" method is invalid, must be one of {1}!'.format(
+        method, COLOUR_QUALITY_SCALE_METHODS))
+
+    cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+        'CIE 1931 2 Degree Standard Observer'].copy().trim(
+            SPECTRAL_SHAPE_DEFAULT)
+
+    msds_test = _msds_test_aligned(msds_test, cmfs.shape, shape)
+
+    shape = cmfs.shape
+    values_test = np.transpose(msds_test.values)
+    names_vs, reflectances_vs = _vs_reflectances(method, shape)
+
+    uv = UCS_to_uv(XYZ_to_UCS(np.dot(values_test, cmfs.values)))
+    CCT, _D_uv = tsplit(uv_to_CCT_Ohno2013(uv))
+
+    values_reference = _msds_reference_illuminant(CCT, shape)
+
+    test_vs_colorimetry_data = _msds_vs_colorimetry_data(
+        values_test,
+        values_reference,
+        names_vs,
+        reflectances_vs,
+        cmfs,
+        chromatic_adaptation=True)
+
+    reference_vs_colorimetry_data = _msds_vs_colorimetry_data(
+        values_reference, values_reference, names_vs, reflectances_vs, cmfs)
+
+    if method == 'nist cqs 9.0':
+        CCT_f = np.ones(CCT.shape)
+        scaling_f = 3.2
+    else:
+        XYZ_r = np.dot(values_reference, cmfs.values)
+        XYZ_r /= XYZ_r[..., 1:2]
+
+        xy_w = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
+        XYZ_a = chromatic_adaptation_VonKries(
+            reference_vs_colorimetry_data['XYZ'],
+            XYZ_r[..., np.newaxis, :],
+            xy_to_XYZ(xy_w),
+            transform='CMCCAT2000')
+        G_r = gamut_area(XYZ_to_Lab(XYZ_a, illuminant=xy_w)) / GAMUT_AREA_D65
+        CCT_f = np.where(G_r > 1, 1, G_r)
+        scaling_f = 3.104
+
+    D_C_ab = test_vs_colorimetry_data['C'] - reference_vs_colorimetry_data['C']
+    D_E_ab = np.linalg.norm(
+        test_vs_colorimetry_data['Lab'] - reference_vs_colorimetry_data['Lab'],
+        axis=-1)
+    D_Ep_ab = np.sqrt(
+        np.where(D_C_ab > 0, D_E_ab ** 2 - D_C_ab ** 2, D_E_ab ** 2))
+
+    Q_as = np.zeros(
+        D_E_ab.shape,
+        dtype=[('name', names_vs.dtype), ('Q_a', np.float_),
+               ('D_C_ab', np.float_), ('D_E_ab', np.float_), ('D_Ep_ab',
+                                                              np.float_)])
+    Q_as['name'] = names_vs
+    Q_as['Q_a'] = scale_conversion(D_Ep_ab, CCT_f[..., np.newaxis], scaling_f)
+    Q_as['D_C_ab'] = D_C_ab
+    Q_as['D_E_ab'] = D_E_ab
+    Q_as['D_Ep_ab'] = D_Ep_ab
+
+    D_E_RMS = np.sqrt(np.mean(D_E_ab ** 2, axis=-1))
+    D_Ep_RMS = np.sqrt(np.mean(D_Ep_ab ** 2, axis=-1))
+
+    Q_a = scale_conversion(D_Ep_RMS, CCT_f, scaling_f)
+
+    if method == 'nist cqs 9.0':
+        scaling_f = 2.93 * 1.0343
+    else:
+        scaling_f = 2.928
+
+    Q_f = scale_conversion(D_E_RMS, CCT_f, scaling_f)
+
+    G_t = gamut_area(test_vs_colorimetry_data['Lab'])
+    G_r = gamut_area(reference_vs_colorimetry_data['Lab'])
+
+    Q_g = G_t / GAMUT_AREA_D65 * 100
+
+    if method == 'nist cqs 9.0':
+        Q_d = Q_p = None
+    else:
+        p_delta_C = np.average(np.where(D_C_ab > 0, D_C_ab, 0), axis=-1)
+        Q_p = 100 - 3.6 * (D_Ep_RMS - p_delta_C)
+        Q_d = G_t / G_r * CCT_f * 100
+
+    if additional_data:
+        return ColourRendering_Specification_CQS(
+            msds_test.labels, Q_a, Q_f, Q_p, Q_g, Q_d, Q_as,
+            (test_vs_colorimetry_data, reference_vs_colorimetry_data))
+    else:
+        return Q_a
+
+
+def _vs_reflectances(method, shape):
+    """
+    Returns the *VS test colour samples* names and reflectances of given
+    method aligned to given spectral shape.
+
+    Parameters
+    ----------
+    method : unicode
+        **{'NIST CQS 9.0', 'NIST CQS 7.4'}**,
+        Computation method.
+    shape : SpectralShape
+        Spectral shape to align the *VS test colour samples* to.
+
+    Returns
+    -------
+    tuple
+        *VS test colour samples* names and reflectances, the wavelengths are
+        in the first axis.
+    """
+
+    key = (method.lower(), shape.start, shape.end, shape.interval)
+    names_reflectances = _CACHE_VS_REFLECTANCES.get(key)
+    if names_reflectances is not None:
+        return names_reflectances
+
+    sds_vs = SDS_VS[method]
+    names = [value for _key, value in sorted(INDEXES_TO_NAMES_VS.items())]
+    reflectances = np.transpose(
+        [sds_vs[name].copy().align(shape).values for name in names])
+
+    names_reflectances = np.array(names), reflectances
+    _CACHE_VS_REFLECTANCES[key] = names_reflectances
+
+    return names_reflectances
+
+
+def _msds_vs_colorimetry_data(values_test,
+                              values_reference,
+                              names_vs,
+                              reflectances_vs,
+                              cmfs,
+                              chromatic_adaptation=False):
+    """
+    Returns the *VS test colour samples* colorimetry data of given test
+    spectral distributions values, i.e. the vectorised
+    :func:`colour.quality.cqs.vs_colorimetry_data` definition.
+
+    Parameters
+    ----------
+    values_test : ndarray
+        Test spectral distributions values, the wavelengths are in the last
+        axis.
+    values_reference : ndarray
+        Reference spectral distributions values, the wavelengths are in the
+        last axis.
+    names_vs : ndarray
+        *VS test colour samples* names.
+    reflectances_vs : ndarray
+        *VS test colour samples* reflectances, the wavelengths are in the
+        first axis.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    ndarray
+        *VS test colour samples* colorimetry data structured array whose
+        fields are the :class:`colour.quality.cqs.VS_ColorimetryData` class
+        attributes.
+    """
+
+    XYZ_t = np.dot(values_test, cmfs.values)
+    XYZ_t /= XYZ_t[..., 1:2]
+
+    XYZ_r = np.dot(values_reference, cmfs.values)
+    XYZ_r /= XYZ_r[..., 1:2]
+    xy_r = XYZ_to_xy(XYZ_r)
+
+    dw = cmfs.shape.interval
+    k = 1 / (np.dot(values_test, cmfs.values[..., 1]) * dw)
+    XYZ_vs = tstack([
+        k[..., np.newaxis] * np.dot(values_test * cmfs.values[..., i] * dw,
+                                    reflectances_vs) for i in range(3)
+    ])
+
+    if chromatic_adaptation:
+        XYZ_vs = chromatic_adaptation_VonKries(
+            XYZ_vs,
+            XYZ_t[..., np.newaxis, :],
+            XYZ_r[..., np.newaxis, :],
+            transform='CMCCAT2000')
+
+    Lab_vs = XYZ_to_Lab(XYZ_vs, illuminant=xy_r[..., np.newaxis, :])
+    _L_vs, C_vs, _Hab = tsplit(Lab_to_LCHab(Lab_vs))
+
+    vs_data = np.zeros(
+        XYZ_vs.shape[:-1],
+        dtype=[('name', names_vs.dtype), ('XYZ', np.float_, (3, )),
+               ('Lab', np.float_, (3, )), ('C', np.float_)])
+    vs_data['name'] = names_vs
+    vs_data['XYZ'] = XYZ_vs
+    vs_data['Lab'] = Lab_vs
+    vs_data['C'] = C_vs
+
+    return vs_data
+
+
 def gamut_area(Lab):
     """
     Returns the gamut area :math:`G` covered by given *CIE L\\*a\\*b\\**
@@ -260,12 +538,12 @@ def gamut_area(Lab):
 
     Parameters
     ----------
-    Lab : array_like
+    Lab : array_like, (..., n, 3)
         *CIE L\\*a\\*b\\** colourspace matrices.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Gamut area :math:`G`.
 
     Examples
@@ -292,18 +570,18 @@ def gamut_area(Lab):
     """
 
     Lab = as_float_array(Lab)
-    Lab_s = np.roll(np.copy(Lab), -3)
+    Lab_s = np.roll(Lab, -1, axis=-2)
 
     _L, a, b = tsplit(Lab)
     _L_s, a_s, b_s = tsplit(Lab_s)
 
     A = np.linalg.norm(Lab[..., 1:3], axis=-1)
     B = np.linalg.norm(Lab_s[..., 1:3], axis=-1)
-    C = np.linalg.norm(np.dstack([a_s - a, b_s - b]), axis=-1)
+    C = np.linalg.norm(tstack([a_s - a, b_s - b]), axis=-1)
     t = (A + B + C) / 2
     S = np.sqrt(t * (t - A) * (t - B) * (t - C))
 
-    return np.sum(S)
+    return np.sum(S, axis=-1)
 
 
 def vs_colorimetry_data(sd_test,
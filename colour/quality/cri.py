@@ -7,6 +7,7 @@ Defines *Colour Rendering Index* (CRI) computation objects:
 
 -   :class:`colour.quality.ColourRendering_Specification_CRI`
 -   :func:`colour.colour_rendering_index`
+-   :func:`colour.quality.msds_colour_rendering_index`
 
 References
 ----------
@@ -19,14 +20,18 @@ usp=sharing
 import numpy as np
 from collections import namedtuple
 
-from colour.algebra import euclidean_distance, spow
+from colour.algebra import LinearInterpolator, euclidean_distance, spow
 from colour.colorimetry import (
-    SPECTRAL_SHAPE_DEFAULT, sd_CIE_illuminant_D_series,
-    MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody, sd_to_XYZ)
+    SPECTRAL_SHAPE_DEFAULT, SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES,
+    MultiSpectralDistributions, SpectralDistribution,
+    sd_CIE_illuminant_D_series, MSDS_CMFS_STANDARD_OBSERVER, planck_law,
+    sd_blackbody, sd_to_XYZ, sds_and_msds_to_msds)
+from colour.quality.cfi2017 import msds_test_CIE2017
 from colour.quality.datasets.tcs import INDEXES_TO_NAMES_TCS, SDS_TCS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
-from colour.utilities import domain_range_scale
+from colour.utilities import (CACHE_REGISTRY, domain_range_scale, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -38,9 +43,13 @@ __status__ = 'Production'
 __all__ = [
     'TCS_ColorimetryData', 'TCS_ColourQualityScaleData',
     'ColourRendering_Specification_CRI', 'colour_rendering_index',
-    'tcs_colorimetry_data', 'colour_rendering_indexes'
+    'msds_colour_rendering_index', 'tcs_colorimetry_data',
+    'colour_rendering_indexes'
 ]
 
+_CACHE_TCS_REFLECTANCES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TCS_REFLECTANCES'.format(__name__))
+
 
 class TCS_ColorimetryData(
         namedtuple('TCS_ColorimetryData', ('name', 'XYZ', 'uv', 'UVW'))):
@@ -150,6 +159,319 @@ def colour_rendering_index(sd_test, additional_data=False):
         return Q_a
 
 
+def msds_colour_rendering_index(msds_test, additional_data=False, shape=None):
+    """
+    Returns the *Colour Rendering Index* (CRI) :math:`Q_a` of given
+    multi-spectral distributions.
+
+    The test spectral distributions are processed at once: the aligned
+    *test colour samples* reflectances and colour matching functions are
+    shared by the whole stack of test spectral distributions.
+
+    Parameters
+    ----------
+    msds_test : MultiSpectralDistributions or list or array_like
+        Test multi-spectral distributions, a list of
+        :class:`colour.SpectralDistribution` or
+        :class:`colour.MultiSpectralDistributions` class instances or an
+        *array_like* whose wavelengths are expected to be in the last axis,
+        e.g. for 1000 test spectral distributions with 81 bins, ``msds_test``
+        shape should be (1000, 81).
+    additional_data : bool, optional
+        Whether to output additional data.
+    shape : SpectralShape, optional
+        Spectral shape of the test multi-spectral distributions when given as
+        an *array_like*.
+
+    Returns
+    -------
+    ndarray or ColourRendering_Specification_CRI
+        *Colour Rendering Index* (CRI). The additional data ``name``
+        attribute is the test multi-spectral distributions labels, the
+        ``Q_as`` attribute and the ``colorimetry_data`` attribute items are
+        structured arrays whose fields are the
+        :class:`colour.quality.cri.TCS_ColourQualityScaleData` and
+        :class:`colour.quality.cri.TCS_ColorimetryData` classes attributes,
+        their first and second axes are respectively the test spectral
+        distributions and the *test colour samples* axes.
+
+    Notes
+    -----
+    -   The spectral distributions of a list are aligned to the colour
+        matching functions spectral shape with their own interpolator before
+        being stacked, thus the results match the
+        :func:`colour.quality.colour_rendering_index` definition. The
+        multi-spectral distributions are aligned with their own interpolator,
+        i.e. :attr:`colour.MultiSpectralDistributions.interpolator`
+        attribute.
+
+    References
+    ----------
+    :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SDS_ILLUMINANTS
+    >>> sds = [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL11']]
+    >>> msds_colour_rendering_index(sds)  # doctest: +ELLIPSIS
+    array([ 64.2337241...,  82.8591468...])
+    """
+
+    cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+        'CIE 1931 2 Degree Standard Observer'].copy().trim(
+            SPECTRAL_SHAPE_DEFAULT)
+
+    msds_test = _msds_test_aligned(msds_test, cmfs.shape, shape)
+
+    shape = cmfs.shape
+    values_test = np.transpose(msds_test.values)
+    names_tcs, reflectances_tcs = _tcs_reflectances(shape)
+
+    uv = UCS_to_uv(XYZ_to_UCS(np.dot(values_test, cmfs.values)))
+    CCT, _D_uv = tsplit(uv_to_CCT_Robertson1968(uv))
+
+    values_reference = _msds_reference_illuminant(CCT, shape)
+
+    test_tcs_colorimetry_data = _msds_tcs_colorimetry_data(
+        values_test,
+        values_reference,
+        names_tcs,
+        reflectances_tcs,
+        cmfs,
+        chromatic_adaptation=True)
+
+    reference_tcs_colorimetry_data = _msds_tcs_colorimetry_data(
+        values_reference, values_reference, names_tcs, reflectances_tcs, cmfs)
+
+    Q_as = np.zeros(
+        test_tcs_colorimetry_data.shape,
+        dtype=[('name', names_tcs.dtype), ('Q_a', np.float_)])
+    Q_as['name'] = names_tcs
+    Q_as['Q_a'] = 100 - 4.6 * np.linalg.norm(
+        reference_tcs_colorimetry_data['UVW'] -
+        test_tcs_colorimetry_data['UVW'],
+        axis=-1)
+
+    Q_a = np.average(Q_as['Q_a'][..., :8], axis=-1)
+
+    if additional_data:
+        return ColourRendering_Specification_CRI(
+            msds_test.labels, Q_a, Q_as,
+            (test_tcs_colorimetry_data, reference_tcs_colorimetry_data))
+    else:
+        return Q_a
+
+
+def _msds_test_aligned(msds_test, shape, shape_test=None):
+    """
+    Returns given test multi-spectral distributions aligned to given spectral
+    shape.
+
+    Parameters
+    ----------
+    msds_test : MultiSpectralDistributions or list or array_like
+        Test multi-spectral distributions, a list of
+        :class:`colour.SpectralDistribution` or
+        :class:`colour.MultiSpectralDistributions` class instances or an
+        *array_like* whose wavelengths are expected to be in the last axis.
+    shape : SpectralShape
+        Spectral shape to align the test multi-spectral distributions to.
+    shape_test : SpectralShape, optional
+        Spectral shape of the test multi-spectral distributions when given as
+        an *array_like*.
+
+    Returns
+    -------
+    MultiSpectralDistributions
+        Aligned test multi-spectral distributions.
+    """
+
+    if isinstance(msds_test, (list, tuple)) and all(
+            isinstance(sd, (SpectralDistribution, MultiSpectralDistributions))
+            for sd in msds_test):
+        # NOTE: The spectral distributions are aligned with their own
+        # interpolator before being stacked as the stacked multi-spectral
+        # distributions have a single interpolator.
+        return sds_and_msds_to_msds(
+            [sd.copy().align(shape) for sd in msds_test])
+
+    return msds_test_CIE2017(msds_test, shape_test).copy().align(shape)
+
+
+def _tcs_reflectances(shape):
+    """
+    Returns the *test colour samples* names and reflectances aligned to given
+    spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape to align the *test colour samples* to.
+
+    Returns
+    -------
+    tuple
+        *Test colour samples* names and reflectances, the wavelengths are in
+        the first axis.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+    names_reflectances = _CACHE_TCS_REFLECTANCES.get(key)
+    if names_reflectances is not None:
+        return names_reflectances
+
+    names = [value for _key, value in sorted(INDEXES_TO_NAMES_TCS.items())]
+    reflectances = np.transpose(
+        [SDS_TCS[name].copy().align(shape).values for name in names])
+
+    names_reflectances = np.array(names), reflectances
+    _CACHE_TCS_REFLECTANCES[key] = names_reflectances
+
+    return names_reflectances
+
+
+def _msds_reference_illuminant(CCT, shape):
+    """
+    Computes the reference illuminants values for given correlated colour
+    temperatures :math:`T_{cp}`: a planckian radiator below 5000K and a
+    *CIE Illuminant D Series* otherwise.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+
+    Returns
+    -------
+    ndarray
+        Reference illuminants values, the wavelengths are in the last axis.
+    """
+
+    CCT = np.reshape(CCT, (-1, 1))
+    wavelengths = shape.range()
+
+    is_planckian = CCT[..., 0] < 5000
+
+    values = np.empty([CCT.shape[0], len(wavelengths)])
+    values[is_planckian] = planck_law(wavelengths * 1e-9,
+                                      CCT[is_planckian]) * 1e-9
+
+    if not np.all(is_planckian):
+        # The basis functions are interpolated linearly as the spectral
+        # distributions returned by the "sd_CIE_illuminant_D_series"
+        # definition.
+        S0, S1, S2 = [
+            SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES[basis].copy()
+            for basis in ('S0', 'S1', 'S2')
+        ]
+        for basis in (S0, S1, S2):
+            basis.interpolator = LinearInterpolator
+            basis.align(shape)
+
+        x, y = tsplit(CCT_to_xy_CIE_D(CCT[~is_planckian]))
+
+        M = 0.0241 + 0.2562 * x - 0.7341 * y
+        M1 = np.around((-1.3515 - 1.7703 * x + 5.9114 * y) / M, 3)
+        M2 = np.around((0.0300 - 31.4424 * x + 30.0717 * y) / M, 3)
+
+        values[~is_planckian] = S0.values + M1 * S1.values + M2 * S2.values
+
+    return values
+
+
+def _msds_tcs_colorimetry_data(values_t,
+                               values_r,
+                               names_tcs,
+                               reflectances_tcs,
+                               cmfs,
+                               chromatic_adaptation=False):
+    """
+    Returns the *test colour samples* colorimetry data of given test
+    spectral distributions values, i.e. the vectorised
+    :func:`colour.quality.cri.tcs_colorimetry_data` definition.
+
+    Parameters
+    ----------
+    values_t : ndarray
+        Test spectral distributions values, the wavelengths are in the last
+        axis.
+    values_r : ndarray
+        Reference spectral distributions values, the wavelengths are in the
+        last axis.
+    names_tcs : ndarray
+        *Test colour samples* names.
+    reflectances_tcs : ndarray
+        *Test colour samples* reflectances, the wavelengths are in the first
+        axis.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    ndarray
+        *Test colour samples* colorimetry data structured array whose fields
+        are the :class:`colour.quality.cri.TCS_ColorimetryData` class
+        attributes.
+    """
+
+    u_t, v_t = tsplit(UCS_to_uv(XYZ_to_UCS(np.dot(values_t, cmfs.values))))
+    u_r, v_r = tsplit(UCS_to_uv(XYZ_to_UCS(np.dot(values_r, cmfs.values))))
+
+    dw = cmfs.shape.interval
+    k = 100 / (np.dot(values_t, cmfs.values[..., 1]) * dw)
+    XYZ_tcs = tstack([
+        k[..., np.newaxis] * np.dot(values_t * cmfs.values[..., i] * dw,
+                                    reflectances_tcs) for i in range(3)
+    ])
+    uv_tcs = UCS_to_uv(XYZ_to_UCS(XYZ_tcs))
+    u_tcs, v_tcs = tsplit(uv_tcs)
+
+    u_t, v_t, u_r, v_r = [a[..., np.newaxis] for a in (u_t, v_t, u_r, v_r)]
+
+    if chromatic_adaptation:
+
+        def c(x, y):
+            """
+            Computes the :math:`c` term.
+            """
+
+            return (4 - x - 10 * y) / y
+
+        def d(x, y):
+            """
+            Computes the :math:`d` term.
+            """
+
+            return (1.708 * y + 0.404 - 1.481 * x) / y
+
+        c_t, d_t = c(u_t, v_t), d(u_t, v_t)
+        c_r, d_r = c(u_r, v_r), d(u_r, v_r)
+        tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
+        u_tcs = ((10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+        v_tcs = (
+            5.52 / (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+
+    W_tcs = 25 * spow(XYZ_tcs[..., 1], 1 / 3) - 17
+    U_tcs = 13 * W_tcs * (u_tcs - u_r)
+    V_tcs = 13 * W_tcs * (v_tcs - v_r)
+
+    tcs_data = np.zeros(
+        XYZ_tcs.shape[:-1],
+        dtype=[('name', names_tcs.dtype), ('XYZ', np.float_, (3, )),
+               ('uv', np.float_, (2, )), ('UVW', np.float_, (3, ))])
+    tcs_data['name'] = names_tcs
+    tcs_data['XYZ'] = XYZ_tcs
+    tcs_data['uv'] = uv_tcs
+    tcs_data['UVW'] = tstack([U_tcs, V_tcs, W_tcs])
+
+    return tcs_data
+
+
 def tcs_colorimetry_data(sd_t, sd_r, sds_tcs, cmfs,
                          chromatic_adaptation=False):
     """
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 
-from .tcs import SDS_TCS
-from .vs import SDS_VS
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(globals(), {
+    'tcs': ['SDS_TCS'],
+    'vs': ['SDS_VS']
+})
+del lazy_module_attributes
 
 __all__ = ['SDS_TCS', 'SDS_VS']
@@ -12,10 +12,11 @@ import numpy as np
 import unittest
 
 from colour.colorimetry import (SpectralShape, SpectralDistribution,
-                                sd_blackbody, SDS_ILLUMINANTS)
-from colour.quality.cfi2017 import (CCT_reference_illuminant,
-                                    sd_reference_illuminant,
-                                    colour_fidelity_index_CIE2017)
+                                sd_blackbody, SDS_ILLUMINANTS,
+                                sds_and_msds_to_msds)
+from colour.quality.cfi2017 import (
+    CCT_reference_illuminant, sd_reference_illuminant,
+    colour_fidelity_index_CIE2017, msds_colour_fidelity_index_CIE2017)
 from colour.utilities import ColourUsageWarning
 
 __author__ = 'Colour Developers'
@@ -28,7 +29,8 @@ __status__ = 'Production'
 __all__ = [
     'DATA_SD_SAMPLE_5NM', 'SD_SAMPLE_5NM', 'DATA_SD_SAMPLE_1NM',
     'SD_SAMPLE_1NM', 'TestColourFidelityIndexCIE2017',
-    'TestCctReferenceIlluminant', 'TestSdReferenceIlluminant'
+    'TestMsdsColourFidelityIndexCIE2017', 'TestCctReferenceIlluminant',
+    'TestSdReferenceIlluminant'
 ]
 
 DATA_SD_SAMPLE_5NM = {
@@ -596,6 +598,77 @@ class TestColourFidelityIndexCIE2017(unittest.TestCase):
         self.assertRaises(ValueError, colour_fidelity_index_CIE2017, sd)
 
 
+class TestMsdsColourFidelityIndexCIE2017(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.CIE2017.msds_colour_fidelity_index_CIE2017`
+    definition unit tests methods.
+    """
+
+    def test_msds_colour_fidelity_index_CIE2017(self):
+        """
+        Tests :func:`colour.quality.CIE2017.msds_colour_fidelity_index_CIE2017`
+        definition.
+        """
+
+        for shape in (SpectralShape(380, 780, 5), SpectralShape(380, 780, 1)):
+            sds = [
+                SDS_ILLUMINANTS[illuminant].copy().align(shape)
+                for illuminant in ('FL2', 'FL11', 'A', 'D65', 'LED-B1')
+            ]
+            sds.append(SD_SAMPLE_5NM.copy().align(shape))
+
+            specification = msds_colour_fidelity_index_CIE2017(
+                sds_and_msds_to_msds(sds), additional_data=True)
+
+            for i, sd in enumerate(sds):
+                specification_s = colour_fidelity_index_CIE2017(
+                    sd, additional_data=True)
+
+                np.testing.assert_almost_equal(
+                    specification.R_f[i], specification_s.R_f, decimal=7)
+                np.testing.assert_almost_equal(
+                    specification.R_s[i], specification_s.R_s, decimal=7)
+                np.testing.assert_almost_equal(
+                    specification.CCT[i], specification_s.CCT, decimal=7)
+                np.testing.assert_almost_equal(
+                    specification.D_uv[i], specification_s.D_uv, decimal=7)
+                np.testing.assert_almost_equal(
+                    specification.sd_reference.values[..., i],
+                    specification_s.sd_reference.values,
+                    decimal=7)
+                Jpapbp = [
+                    data.Jpapbp for data in specification_s.colorimetry_data[1]
+                ]
+                np.testing.assert_almost_equal(
+                    specification.colorimetry_data[1].Jpapbp[i],
+                    Jpapbp,
+                    decimal=7)
+
+        values = [
+            SDS_ILLUMINANTS['FL2'].values, SDS_ILLUMINANTS['FL11'].values
+        ]
+        np.testing.assert_almost_equal(
+            msds_colour_fidelity_index_CIE2017(
+                values, shape=SDS_ILLUMINANTS['FL2'].shape),
+            [70.1208254, 80.0404945],
+            decimal=7)
+
+    def test_raise_exception_msds_colour_fidelity_index_CIE2017(self):
+        """
+        Tests :func:`colour.quality.CIE2017.msds_colour_fidelity_index_CIE2017`
+        definition raised exception.
+        """
+
+        msds = sds_and_msds_to_msds(
+            [SDS_ILLUMINANTS['FL2'].copy().align(SpectralShape(400, 700, 5))])
+        self.assertWarns(ColourUsageWarning,
+                         msds_colour_fidelity_index_CIE2017, msds)
+
+        msds = sds_and_msds_to_msds(
+            [SDS_ILLUMINANTS['FL2'].copy().align(SpectralShape(380, 780, 10))])
+        self.assertRaises(ValueError, msds_colour_fidelity_index_CIE2017, msds)
+
+
 class TestCctReferenceIlluminant(unittest.TestCase):
     """
     Defines :func:`colour.quality.CIE2017.CCT_reference_illuminant`
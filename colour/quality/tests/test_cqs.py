@@ -7,9 +7,11 @@ import numpy as np
 import unittest
 
 from colour.quality import (ColourRendering_Specification_CQS,
-                            colour_quality_scale)
-from colour.colorimetry import SDS_ILLUMINANTS, SDS_LIGHT_SOURCES
-from colour.quality.cqs import VS_ColorimetryData, VS_ColourQualityScaleData
+                            colour_quality_scale, msds_colour_quality_scale)
+from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT, SDS_ILLUMINANTS,
+                                SDS_LIGHT_SOURCES, sds_and_msds_to_msds)
+from colour.quality.cqs import (VS_ColorimetryData, VS_ColourQualityScaleData,
+                                gamut_area)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -18,7 +20,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestColourQualityScale']
+__all__ = [
+    'TestColourQualityScale', 'TestMsdsColourQualityScale', 'TestGamutArea'
+]
 
 
 class TestColourQualityScale(unittest.TestCase):
@@ -673,5 +677,107 @@ class TestColourQualityScale(unittest.TestCase):
         )
 
 
+class TestMsdsColourQualityScale(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.msds_colour_quality_scale` definition
+    unit tests methods.
+    """
+
+    def test_msds_colour_quality_scale(self):
+        """
+        Tests :func:`colour.quality.cqs.msds_colour_quality_scale` definition.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2'],
+            SDS_ILLUMINANTS['D65'],
+            SDS_LIGHT_SOURCES['Neodimium Incandescent'],
+            SDS_LIGHT_SOURCES['F32T8/TL841 (Triphosphor)'],
+            SDS_LIGHT_SOURCES['H38HT-100 (Mercury)'],
+            SDS_LIGHT_SOURCES['Luxeon WW 2880']
+        ]
+        sds = [sd.copy().align(SPECTRAL_SHAPE_DEFAULT) for sd in sds]
+        msds = sds_and_msds_to_msds(sds)
+
+        for method in ('NIST CQS 9.0', 'NIST CQS 7.4'):
+            specification = msds_colour_quality_scale(
+                msds, additional_data=True, method=method)
+
+            for i, sd in enumerate(sds):
+                specification_s = colour_quality_scale(
+                    sd, additional_data=True, method=method)
+
+                for attribute in ('Q_a', 'Q_f', 'Q_p', 'Q_g', 'Q_d'):
+                    if getattr(specification_s, attribute) is None:
+                        self.assertIsNone(getattr(specification, attribute))
+                    else:
+                        self.assertAlmostEqual(
+                            getattr(specification, attribute)[i],
+                            getattr(specification_s, attribute),
+                            places=7)
+
+                for attribute in ('Q_a', 'D_C_ab', 'D_E_ab', 'D_Ep_ab'):
+                    np.testing.assert_almost_equal(
+                        specification.Q_as[attribute][i], [
+                            getattr(data, attribute)
+                            for data in specification_s.Q_as.values()
+                        ],
+                        decimal=7)
+
+                for j in range(2):
+                    for attribute in ('XYZ', 'Lab', 'C'):
+                        np.testing.assert_almost_equal(
+                            specification.colorimetry_data[j][attribute][i], [
+                                getattr(data, attribute)
+                                for data in specification_s.colorimetry_data[j]
+                            ],
+                            decimal=7)
+
+            np.testing.assert_almost_equal(
+                msds_colour_quality_scale(
+                    [sd.values for sd in sds],
+                    method=method,
+                    shape=SPECTRAL_SHAPE_DEFAULT),
+                specification.Q_a,
+                decimal=7)
+
+        sds = [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL11']]
+        for method in ('NIST CQS 9.0', 'NIST CQS 7.4'):
+            np.testing.assert_almost_equal(
+                msds_colour_quality_scale(sds, method=method),
+                [colour_quality_scale(sd, method=method) for sd in sds],
+                decimal=7)
+
+
+class TestGamutArea(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.gamut_area` definition unit tests
+    methods.
+    """
+
+    def test_n_dimensional_gamut_area(self):
+        """
+        Tests :func:`colour.quality.cqs.gamut_area` definition n-dimensional
+        arrays support.
+        """
+
+        Lab = np.array([
+            [39.94996006, 34.59018231, -19.86046321],
+            [36.60576301, 7.06742454, -43.21461177],
+            [56.50196523, -29.54655550, -20.50177194],
+            [76.72952110, -23.92148210, 61.04740432],
+            [61.26281449, 40.87950839, 44.97606172],
+        ])
+        G = gamut_area(Lab)
+
+        Lab = np.tile(Lab, (6, 1, 1))
+        G = np.tile(G, 6)
+        np.testing.assert_almost_equal(gamut_area(Lab), G, decimal=7)
+
+        Lab = np.reshape(Lab, (2, 3, 5, 3))
+        G = np.reshape(G, (2, 3))
+        np.testing.assert_almost_equal(gamut_area(Lab), G, decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
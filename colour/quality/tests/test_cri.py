@@ -7,8 +7,10 @@ import numpy as np
 import unittest
 
 from colour.quality import (ColourRendering_Specification_CRI,
-                            colour_rendering_index)
-from colour.colorimetry import SDS_ILLUMINANTS, SpectralDistribution
+                            colour_rendering_index,
+                            msds_colour_rendering_index)
+from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT, SDS_ILLUMINANTS,
+                                SpectralDistribution, sds_and_msds_to_msds)
 from colour.quality.cri import TCS_ColorimetryData, TCS_ColourQualityScaleData
 
 __author__ = 'Colour Developers'
@@ -18,7 +20,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestColourRenderingIndex']
+__all__ = ['TestColourRenderingIndex', 'TestMsdsColourRenderingIndex']
 
 DATA_SAMPLE = {
     380: 0.00588346,
@@ -343,5 +345,64 @@ class TestColourRenderingIndex(unittest.TestCase):
         )
 
 
+class TestMsdsColourRenderingIndex(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cri.msds_colour_rendering_index`
+    definition unit tests methods.
+    """
+
+    def test_msds_colour_rendering_index(self):
+        """
+        Tests :func:`colour.quality.cri.msds_colour_rendering_index`
+        definition.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2'],
+            SDS_ILLUMINANTS['FL11'], SDS_ILLUMINANTS['A'],
+            SDS_ILLUMINANTS['D65'],
+            SpectralDistribution(DATA_SAMPLE)
+        ]
+        sds = [sd.copy().align(SPECTRAL_SHAPE_DEFAULT) for sd in sds]
+
+        specification = msds_colour_rendering_index(
+            sds_and_msds_to_msds(sds), additional_data=True)
+
+        for i, sd in enumerate(sds):
+            specification_s = colour_rendering_index(sd, additional_data=True)
+
+            self.assertAlmostEqual(
+                specification.Q_a[i], specification_s.Q_a, places=7)
+
+            np.testing.assert_equal(
+                specification.Q_as['name'][i],
+                [data.name for data in specification_s.Q_as.values()])
+            np.testing.assert_almost_equal(
+                specification.Q_as['Q_a'][i],
+                [data.Q_a for data in specification_s.Q_as.values()],
+                decimal=7)
+
+            for j in range(2):
+                for attribute in ('XYZ', 'uv', 'UVW'):
+                    np.testing.assert_almost_equal(
+                        specification.colorimetry_data[j][attribute][i], [
+                            getattr(data, attribute)
+                            for data in specification_s.colorimetry_data[j]
+                        ],
+                        decimal=7)
+
+        np.testing.assert_almost_equal(
+            msds_colour_rendering_index(
+                [sd.values for sd in sds], shape=SPECTRAL_SHAPE_DEFAULT),
+            specification.Q_a,
+            decimal=7)
+
+        sds = [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL11']]
+        np.testing.assert_almost_equal(
+            msds_colour_rendering_index(sds),
+            [colour_rendering_index(sd) for sd in sds],
+            decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -12,9 +12,10 @@ Notes
 import numpy as np
 import unittest
 
-from colour.colorimetry import SDS_ILLUMINANTS
+from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
 from colour.quality.tm3018 import (averages_area,
-                                   colour_fidelity_index_ANSIIESTM3018)
+                                   colour_fidelity_index_ANSIIESTM3018,
+                                   msds_colour_fidelity_index_ANSIIESTM3018)
 from colour.utilities import as_float_array
 
 __author__ = 'Colour Developers'
@@ -24,7 +25,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestColourFidelityIndexANSIIESTM3018', 'TestAveragesArea']
+__all__ = [
+    'TestColourFidelityIndexANSIIESTM3018',
+    'TestMsdsColourFidelityIndexANSIIESTM3018', 'TestAveragesArea'
+]
 
 
 class TestColourFidelityIndexANSIIESTM3018(unittest.TestCase):
@@ -70,6 +74,50 @@ class TestColourFidelityIndexANSIIESTM3018(unittest.TestCase):
         ], 2)
 
 
+class TestMsdsColourFidelityIndexANSIIESTM3018(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.tm3018.\
+msds_colour_fidelity_index_ANSIIESTM3018` definition unit tests methods.
+    """
+
+    def test_msds_colour_fidelity_index_ANSIIESTM3018(self):
+        """
+        Tests :func:`colour.quality.tm3018.\
+msds_colour_fidelity_index_ANSIIESTM3018` definition.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS[illuminant]
+            for illuminant in ('FL2', 'FL7', 'FL11', 'A', 'D65')
+        ]
+
+        msds = sds_and_msds_to_msds(sds)
+        specification = msds_colour_fidelity_index_ANSIIESTM3018(
+            msds, additional_data=True)
+
+        for i, sd in enumerate(msds.to_sds()):
+            specification_s = colour_fidelity_index_ANSIIESTM3018(
+                sd, additional_data=True)
+
+            for attribute in ('R_f', 'R_s', 'CCT', 'D_uv', 'R_g',
+                              'averages_test', 'averages_reference',
+                              'average_norms', 'R_fs', 'R_cs', 'R_hs'):
+                np.testing.assert_almost_equal(
+                    getattr(specification, attribute)[i],
+                    getattr(specification_s, attribute),
+                    decimal=7)
+
+            for j, bin_ in enumerate(specification_s.bins):
+                np.testing.assert_equal(
+                    np.where(specification.bins[i] == j)[0], bin_)
+
+        np.testing.assert_almost_equal(
+            msds_colour_fidelity_index_ANSIIESTM3018(
+                np.transpose(msds.values), shape=msds.shape),
+            specification.R_f,
+            decimal=7)
+
+
 class TestAveragesArea(unittest.TestCase):
     """
     Defines :func:`colour.quality.tm3018.averages_area` definition unit tests
@@ -89,6 +137,25 @@ class TestAveragesArea(unittest.TestCase):
         poly = np.array([[1., -1], [1, 1], [3, 1], [3, 3], [-1, 3], [-1, -1]])
         np.allclose(averages_area(poly), 12)
 
+    def test_n_dimensional_averages_area(self):
+        """
+        Tests :func:`colour.quality.tm3018.averages_area` definition
+        n-dimensional arrays support.
+        """
+
+        rectangle = as_float_array([[2, 1], [1, 2], [-2, -1], [-1, -2]])
+        area = averages_area(rectangle)
+
+        rectangle = np.tile(rectangle, (6, 1, 1))
+        area = np.tile(area, 6)
+        np.testing.assert_almost_equal(
+            averages_area(rectangle), area, decimal=7)
+
+        rectangle = np.reshape(rectangle, (2, 3, 4, 2))
+        area = np.reshape(area, (2, 3))
+        np.testing.assert_almost_equal(
+            averages_area(rectangle), area, decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
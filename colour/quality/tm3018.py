@@ -8,6 +8,7 @@ objects:
 
 - :class:`colour.quality.ColourQuality_Specification_ANSIIESTM3018`
 - :func:`colour.quality.colour_fidelity_index_ANSIIESTM3018`
+- :func:`colour.quality.msds_colour_fidelity_index_ANSIIESTM3018`
 
 References
 ----------
@@ -19,8 +20,9 @@ References
 import numpy as np
 from collections import namedtuple
 
-from colour.quality import colour_fidelity_index_CIE2017
-from colour.quality.cfi2017 import delta_E_to_R_f
+from colour.quality import (colour_fidelity_index_CIE2017,
+                            msds_colour_fidelity_index_CIE2017)
+from colour.quality.cfi2017 import delta_E_to_R_f, msds_test_CIE2017
 from colour.utilities import as_float_array, as_int
 
 
@@ -158,27 +160,139 @@ def colour_fidelity_index_ANSIIESTM3018(sd_test, additional_data=False):
         averages_test, averages_reference, average_norms, R_fs, R_cs, R_hs)
 
 
+def msds_colour_fidelity_index_ANSIIESTM3018(msds_test,
+                                             additional_data=False,
+                                             shape=None):
+    """
+    Returns the *ANSI/IES TM-30-18 Colour Fidelity Index* (CFI) :math:`R_f`
+    of given multi-spectral distributions.
+
+    The hue bins averages, the *Gamut Index* :math:`R_g` and the local
+    indexes are computed for the whole stack of test spectral distributions
+    from the :func:`colour.quality.msds_colour_fidelity_index_CIE2017`
+    definition additional data.
+
+    Parameters
+    ----------
+    msds_test : MultiSpectralDistributions or array_like
+        Test multi-spectral distributions, if an *array_like* the wavelengths
+        are expected to be in the last axis, e.g. for 1000 test spectral
+        distributions with 81 bins, ``msds_test`` shape should be (1000, 81).
+    additional_data : bool, optional
+        Whether to output additional data.
+    shape : SpectralShape, optional
+        Spectral shape of the test multi-spectral distributions when given as
+        an *array_like*.
+
+    Returns
+    -------
+    ndarray or ColourQuality_Specification_ANSIIESTM3018
+        *ANSI/IES TM-30-18 Colour Fidelity Index* (CFI). The additional data
+        attributes are arrays whose first axis is the test spectral
+        distributions axis, the ``bins`` attribute is an array of the hue bin
+        index of each colour sample.
+
+    References
+    ----------
+    :cite:`ANSI2018`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
+    >>> msds = sds_and_msds_to_msds(
+    ...     [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL11']])
+    >>> msds_colour_fidelity_index_ANSIIESTM3018(msds)  # doctest: +ELLIPSIS
+    array([ 70.1208254...,  80.0404945...])
+    """
+
+    msds_test = msds_test_CIE2017(msds_test, shape)
+
+    if not additional_data:
+        return msds_colour_fidelity_index_CIE2017(msds_test, False)
+
+    specification = msds_colour_fidelity_index_CIE2017(msds_test, True)
+
+    test_tcs_colorimetry_data, reference_tcs_colorimetry_data = (
+        specification.colorimetry_data)
+
+    # Setup bins based on where the reference a'b' points are located.
+    bins = as_int(np.floor(reference_tcs_colorimetry_data.CAM.h / 22.5))
+
+    # Per-bin a'b' averages, the bins of each test spectral distribution are
+    # offset so that a single "np.bincount" call processes the whole stack.
+    count = bins.shape[0]
+    indexes = np.ravel(bins + 16 * np.arange(count)[..., np.newaxis])
+    samples_count = np.bincount(indexes, minlength=16 * count)
+
+    def bins_mean(a):
+        """
+        Returns the per-bin mean of given array.
+        """
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.reshape(
+                np.bincount(indexes, np.ravel(a), 16 * count) / samples_count,
+                (count, 16))
+
+    averages_test = np.stack(
+        [bins_mean(test_tcs_colorimetry_data.Jpapbp[..., i]) for i in (1, 2)],
+        axis=-1)
+    averages_reference = np.stack(
+        [
+            bins_mean(reference_tcs_colorimetry_data.Jpapbp[..., i])
+            for i in (1, 2)
+        ],
+        axis=-1)
+
+    # Gamut Index.
+    R_g = 100 * (
+        averages_area(averages_test) / averages_area(averages_reference))
+
+    # Local colour fidelity indexes, i.e. 16 CFIs for each bin.
+    R_fs = delta_E_to_R_f(bins_mean(specification.delta_E_s))
+
+    # Angles bisecting the hue bins.
+    angles = (22.5 * np.arange(16) + 11.25) / 180 * np.pi
+    cosines = np.cos(angles)
+    sines = np.sin(angles)
+
+    average_norms = np.linalg.norm(averages_reference, axis=-1)
+    a_deltas = averages_test[..., 0] - averages_reference[..., 0]
+    b_deltas = averages_test[..., 1] - averages_reference[..., 1]
+
+    # Local chromaticity shifts, multiplied by 100 to obtain percentages.
+    R_cs = 100 * (a_deltas * cosines + b_deltas * sines) / average_norms
+
+    # Local hue shifts.
+    R_hs = (-a_deltas * sines + b_deltas * cosines) / average_norms
+
+    return ColourQuality_Specification_ANSIIESTM3018(
+        specification.name, msds_test, specification.sd_reference,
+        specification.R_f, specification.R_s, specification.CCT,
+        specification.D_uv, specification.colorimetry_data, R_g, bins,
+        averages_test, averages_reference, average_norms, R_fs, R_cs, R_hs)
+
+
 def averages_area(averages):
     """
     Computes the area of the polygon formed by the hue bin averages.
 
     Parameters
     ----------
-    averages : array_like, (n, 2)
+    averages : array_like, (..., n, 2)
         Hue bin averages.
 
     Returns
     -------
-    float
+    numeric or ndarray
         Area of the polygon.
     """
 
-    N = averages.shape[0]
+    averages = as_float_array(averages)
+
+    u = averages
+    v = np.roll(averages, -1, axis=-2)
 
-    triangle_areas = np.empty(N)
-    for i in range(N):
-        u = averages[i, :]
-        v = averages[(i + 1) % N, :]
-        triangle_areas[i] = (u[0] * v[1] - u[1] * v[0]) / 2
+    triangle_areas = (u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]) / 2
 
-    return np.sum(triangle_areas)
+    return np.sum(triangle_areas, axis=-1)
@@ -324,49 +324,49 @@ def XYZ_to_sd(XYZ, method='Meng 2015', **kwargs):
     ...     XYZ, method='Meng 2015', cmfs=cmfs, illuminant=illuminant)
     >>> with numpy_print_options(suppress=True):
     ...     sd  # doctest: +ELLIPSIS
-    SpectralDistribution([[ 360.        ,    0.0765153...],
-                          [ 370.        ,    0.0764771...],
-                          [ 380.        ,    0.0764286...],
-                          [ 390.        ,    0.0764329...],
-                          [ 400.        ,    0.0765863...],
-                          [ 410.        ,    0.0764339...],
-                          [ 420.        ,    0.0757213...],
-                          [ 430.        ,    0.0733091...],
-                          [ 440.        ,    0.0676493...],
-                          [ 450.        ,    0.0577616...],
-                          [ 460.        ,    0.0440805...],
-                          [ 470.        ,    0.0284802...],
-                          [ 480.        ,    0.0138019...],
-                          [ 490.        ,    0.0033557...],
+    SpectralDistribution([[ 360.        ,    0.0762423...],
+                          [ 370.        ,    0.0762478...],
+                          [ 380.        ,    0.0762143...],
+                          [ 390.        ,    0.0761789...],
+                          [ 400.        ,    0.0762866...],
+                          [ 410.        ,    0.0762398...],
+                          [ 420.        ,    0.0754766...],
+                          [ 430.        ,    0.0731883...],
+                          [ 440.        ,    0.0676419...],
+                          [ 450.        ,    0.0578100...],
+                          [ 460.        ,    0.0441518...],
+                          [ 470.        ,    0.0285482...],
+                          [ 480.        ,    0.0138309...],
+                          [ 490.        ,    0.0033443...],
                           [ 500.        ,    0.       ...],
                           [ 510.        ,    0.       ...],
                           [ 520.        ,    0.       ...],
                           [ 530.        ,    0.       ...],
-                          [ 540.        ,    0.0055360...],
-                          [ 550.        ,    0.0317335...],
-                          [ 560.        ,    0.075457 ...],
-                          [ 570.        ,    0.1314930...],
-                          [ 580.        ,    0.1938219...],
-                          [ 590.        ,    0.2559747...],
-                          [ 600.        ,    0.3122869...],
-                          [ 610.        ,    0.3584363...],
-                          [ 620.        ,    0.3927112...],
-                          [ 630.        ,    0.4158866...],
-                          [ 640.        ,    0.4305832...],
-                          [ 650.        ,    0.4391142...],
-                          [ 660.        ,    0.4439484...],
-                          [ 670.        ,    0.4464121...],
-                          [ 680.        ,    0.4475718...],
-                          [ 690.        ,    0.4481182...],
-                          [ 700.        ,    0.4483734...],
-                          [ 710.        ,    0.4484743...],
-                          [ 720.        ,    0.4485753...],
-                          [ 730.        ,    0.4486474...],
-                          [ 740.        ,    0.4486629...],
-                          [ 750.        ,    0.4486995...],
-                          [ 760.        ,    0.4486925...],
-                          [ 770.        ,    0.4486794...],
-                          [ 780.        ,    0.4486982...]],
+                          [ 540.        ,    0.0055876...],
+                          [ 550.        ,    0.0317526...],
+                          [ 560.        ,    0.0754300...],
+                          [ 570.        ,    0.1314261...],
+                          [ 580.        ,    0.1937623...],
+                          [ 590.        ,    0.2559592...],
+                          [ 600.        ,    0.3123223...],
+                          [ 610.        ,    0.3585108...],
+                          [ 620.        ,    0.3927241...],
+                          [ 630.        ,    0.4159257...],
+                          [ 640.        ,    0.4306515...],
+                          [ 650.        ,    0.4390541...],
+                          [ 660.        ,    0.4439236...],
+                          [ 670.        ,    0.4463195...],
+                          [ 680.        ,    0.4474220...],
+                          [ 690.        ,    0.4479364...],
+                          [ 700.        ,    0.4481473...],
+                          [ 710.        ,    0.4482216...],
+                          [ 720.        ,    0.4482826...],
+                          [ 730.        ,    0.4483577...],
+                          [ 740.        ,    0.4484108...],
+                          [ 750.        ,    0.4484735...],
+                          [ 760.        ,    0.4484616...],
+                          [ 770.        ,    0.4484497...],
+                          [ 780.        ,    0.4484816...]],
                          interpolator=SpragueInterpolator,
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
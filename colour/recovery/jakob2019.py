@@ -18,8 +18,12 @@ References
     38(2), 147-155. doi:10.1111/cgf.13626
 """
 
+import hashlib
 import numpy as np
+import os
 import struct
+import tempfile
+from functools import partial
 from scipy.optimize import minimize
 from scipy.interpolate import RegularGridInterpolator
 
@@ -32,7 +36,8 @@ from colour.difference import JND_CIE1976
 from colour.models import XYZ_to_xy, XYZ_to_Lab, RGB_to_XYZ
 from colour.utilities import (as_float_array, domain_range_scale, full,
                               index_along_last_axis, is_tqdm_installed,
-                              message_box, to_domain_1, runtime_warning, zeros)
+                              message_box, multiprocessing_pool, to_domain_1,
+                              runtime_warning, zeros)
 try:
     from unittest import mock
 except ImportError:  # pragma: no cover
@@ -575,6 +580,83 @@ def XYZ_to_sd_Jakob2019(
         return sd
 
 
+def _generate_column_Jakob2019(ijk_chroma, lightness_scale_, whitepoint,
+                               matrix_RGB_to_XYZ, xy_n, cmfs, illuminant):
+    """
+    Solves the coefficients of given chroma column of a
+    :class:`colour.recovery.LUT3D_Jakob2019` class instance, i.e. for all the
+    lightness steps of given fully bright colour.
+
+    Parameters
+    ----------
+    ijk_chroma : tuple
+        Cube indexes and fully bright colour of the chroma column.
+    lightness_scale_ : ndarray
+        Lookup table lightness scale.
+    whitepoint : array_like
+        *RGB* colourspace whitepoint.
+    matrix_RGB_to_XYZ : array_like
+        *RGB* colourspace to *CIE XYZ* tristimulus values matrix.
+    xy_n : array_like
+        Illuminant *CIE xy* chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+
+    Returns
+    -------
+    tuple
+        Cube indexes and dimensional coefficients of the chroma column.
+
+    Notes
+    -----
+    -   The columns are independent from each other, this definition is thus
+        defined at module level so that they can be dispatched to a
+        multiprocessing pool.
+    """
+
+    ijk, chroma = ijk_chroma
+
+    lightness_steps = len(lightness_scale_)
+    coefficients = np.empty([lightness_steps, 3])
+
+    def optimize(L, coefficients_0):
+        """
+        Solves for a specific lightness and stores the result in the
+        appropriate cell.
+        """
+
+        RGB = lightness_scale_[L] * chroma
+
+        XYZ = RGB_to_XYZ(RGB, whitepoint, xy_n, matrix_RGB_to_XYZ)
+
+        coefficients_L, _error = find_coefficients_Jakob2019(
+            XYZ, cmfs, illuminant, coefficients_0, dimensionalise=False)
+
+        coefficients[L] = dimensionalise_coefficients(coefficients_L,
+                                                      cmfs.shape)
+
+        return coefficients_L
+
+    # Starts from somewhere in the middle, similarly to how feedback works in
+    # "colour.recovery.find_coefficients_Jakob2019" definition.
+    L_middle = lightness_steps // 3
+    coefficients_middle = optimize(L_middle, zeros(3))
+
+    # Goes down the lightness scale.
+    coefficients_0 = coefficients_middle
+    for L in reversed(range(0, L_middle)):
+        coefficients_0 = optimize(L, coefficients_0)
+
+    # Goes up the lightness scale.
+    coefficients_0 = coefficients_middle
+    for L in range(L_middle + 1, lightness_steps):
+        coefficients_0 = optimize(L, coefficients_0)
+
+    return ijk, coefficients
+
+
 class LUT3D_Jakob2019:
     """
     Class for working with pre-computed lookup tables for the
@@ -758,7 +840,9 @@ class LUT3D_Jakob2019:
                  illuminant=SDS_ILLUMINANTS['D65'].copy().align(
                      SPECTRAL_SHAPE_JAKOB2019),
                  size=64,
-                 print_callable=print):
+                 print_callable=print,
+                 processes=None,
+                 checkpoint_path=None):
         """
         Generates the lookup table data for given *RGB* colourspace, colour
         matching functions, illuminant and given size.
@@ -777,6 +861,31 @@ class LUT3D_Jakob2019:
             *\\*.coeff* files have a resolution of 64.
         print_callable : callable, optional
             Callable used to print progress and diagnostic information.
+        processes : int, optional
+            Number of processes of the multiprocessing pool the chroma columns
+            are solved with, if *None*, the number of *CPUs* is used.
+        checkpoint_path : unicode, optional
+            Path to a *\\*.npz* file the progress is saved to after every
+            batch of chroma columns. If the file exists, the generation
+            resumes from it.
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint file was saved for different generation
+            parameters.
+
+        Notes
+        -----
+        -   The coefficients of a chroma column, i.e. the lightness steps of a
+            fully bright colour, are solved serially as each one is used as
+            the starting point of the next one, the chroma columns are however
+            independent from each other and are spread over a multiprocessing
+            pool, see :func:`colour.utilities.multiprocessing_pool` and
+            :func:`colour.utilities.disable_multiprocessing` definitions. The
+            generated lookup table is identical to the one generated serially
+            irrespective of the number of processes and whether the
+            generation was resumed.
 
         Examples
         --------
@@ -839,6 +948,29 @@ class LUT3D_Jakob2019:
             [ij, np.roll(ij, 1, axis=1),
              np.roll(ij, 2, axis=1)])
 
+        # The checkpoint stores the solved chroma columns along with a key of
+        # the generation parameters so that it is not resumed with different
+        # ones.
+        checkpoint_key = hashlib.sha256()
+        for a in (size, colourspace.whitepoint, colourspace.matrix_RGB_to_XYZ,
+                  cmfs.domain, cmfs.range, illuminant.domain,
+                  illuminant.range):
+            checkpoint_key.update(as_float_array(a).tobytes())
+        checkpoint_key = checkpoint_key.hexdigest()
+        solved = np.zeros([3, chroma_steps, chroma_steps], dtype=np.bool_)
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            with np.load(checkpoint_path) as checkpoint:
+                if str(checkpoint['key']) != checkpoint_key:
+                    raise ValueError(
+                        '"{0}" checkpoint was saved for different generation '
+                        'parameters!'.format(checkpoint_path))
+
+                self._coefficients[...] = checkpoint['coefficients']
+                solved[...] = checkpoint['solved']
+
+        columns = [(ijk, chroma) for ijk, chroma in zip(cube_indexes, chromas)
+                   if not solved[ijk]]
+
         message_box(
             '"Jakob et al. (2018)" LUT Optimisation',
             print_callable=print_callable)
@@ -846,52 +978,66 @@ class LUT3D_Jakob2019:
         print_callable(
             '\nOptimising {0} coefficients...\n'.format(total_coefficients))
 
-        def optimize(ijkL, coefficients_0):
-            """
-            Solves for a specific lightness and stores the result in the
-            appropriate cell.
-            """
-
-            i, j, k, L = ijkL
-
-            RGB = self._lightness_scale[L] * chroma
-
-            XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, xy_n,
-                             colourspace.matrix_RGB_to_XYZ)
-
-            coefficients, _error = find_coefficients_Jakob2019(
-                XYZ, cmfs, illuminant, coefficients_0, dimensionalise=False)
-
-            self._coefficients[i, L, j, k, :] = dimensionalise_coefficients(
-                coefficients, shape)
-
-            return coefficients
+        generate_column = partial(
+            _generate_column_Jakob2019,
+            lightness_scale_=self._lightness_scale,
+            whitepoint=colourspace.whitepoint,
+            matrix_RGB_to_XYZ=colourspace.matrix_RGB_to_XYZ,
+            xy_n=xy_n,
+            cmfs=cmfs,
+            illuminant=illuminant)
+
+        with multiprocessing_pool(processes) as pool, tqdm(
+                total=total_coefficients,
+                initial=total_coefficients - len(columns)) as progress:
+            # A batch of chroma columns is solved between two checkpoints.
+            for b in range(0, len(columns), chroma_steps):
+                batch = columns[b:b + chroma_steps]
+                for (i, j, k), coefficients in pool.map(
+                        generate_column, batch):
+                    self._coefficients[i, :, j, k, :] = coefficients
+                    solved[i, j, k] = True
+
+                progress.update(len(batch))
+
+                if checkpoint_path is not None:
+                    self._write_checkpoint(checkpoint_path, checkpoint_key,
+                                           solved)
 
-        with tqdm(total=total_coefficients) as progress:
-            for ijk, chroma in zip(cube_indexes, chromas):
-                progress.update()
+        self._size = size
+        self._create_interpolator()
 
-                # Starts from somewhere in the middle, similarly to how
-                # feedback works in "colour.recovery.\
-                # find_coefficients_Jakob2019" definition.
-                L_middle = lightness_steps // 3
-                coefficients_middle = optimize(
-                    np.hstack([ijk, L_middle]), zeros(3))
+    def _write_checkpoint(self, path, key, solved):
+        """
+        Writes the lookup table generation progress to given *\\*.npz* file.
 
-                # Goes down the lightness scale.
-                coefficients_0 = coefficients_middle
-                for L in reversed(range(0, L_middle)):
-                    coefficients_0 = optimize(
-                        np.hstack([ijk, L]), coefficients_0)
+        The file is written in a temporary file first and then renamed so
+        that an interrupted write does not corrupt an existing checkpoint.
 
-                # Goes up the lightness scale.
-                coefficients_0 = coefficients_middle
-                for L in range(L_middle + 1, lightness_steps):
-                    coefficients_0 = optimize(
-                        np.hstack([ijk, L]), coefficients_0)
+        Parameters
+        ----------
+        path : unicode
+            Path to the file.
+        key : unicode
+            Key of the generation parameters.
+        solved : ndarray
+            Whether the chroma columns are solved.
+        """
 
-        self._size = size
-        self._create_interpolator()
+        descriptor, temporary_path = tempfile.mkstemp(
+            suffix='.npz', dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(descriptor, 'wb') as checkpoint_file:
+                np.savez(
+                    checkpoint_file,
+                    key=key,
+                    coefficients=self._coefficients,
+                    solved=solved)
+
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
 
     def RGB_to_coefficients(self, RGB):
         """
@@ -21,13 +21,14 @@ import numpy as np
 from collections import namedtuple
 from unittest import mock
 
-from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS,
-                                SpectralDistribution, SpectralShape,
-                                msds_to_XYZ, sd_to_XYZ)
+from colour.colorimetry import (
+    MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS, MultiSpectralDistributions,
+    SpectralDistribution, SpectralShape, msds_to_XYZ, sd_to_XYZ)
+from colour.constants import DEFAULT_INT_DTYPE
 from colour.models import XYZ_to_xy
 from colour.recovery import (SPECTRAL_SHAPE_OTSU2018, BASIS_FUNCTIONS_OTSU2018,
                              CLUSTER_MEANS_OTSU2018, SELECTOR_ARRAY_OTSU2018)
-from colour.utilities import (as_float_array, domain_range_scale,
+from colour.utilities import (as_float_array, as_int_array, domain_range_scale,
                               is_tqdm_installed, message_box, runtime_warning,
                               to_domain_1, zeros)
 
@@ -194,29 +195,42 @@ class Dataset_Otsu2018:
 
         Parameters
         ----------
-        xy : array_like, (2,)
+        xy : array_like, (2,) or (..., 2)
             *CIE xy* chromaticity coordinates.
 
         Returns
         -------
-        int
+        int or ndarray
             Cluster index.
         """
 
-        i = 0
-        while True:
-            row = self._selector_array[i, :]
-            direction, origin, lesser_index, greater_index = row
+        xy = as_float_array(xy)
 
-            if xy[int(direction)] <= origin:
-                index = int(lesser_index)
-            else:
-                index = int(greater_index)
+        # The selector array of a tree with just a root node is a single row
+        # selecting the first cluster.
+        selector_array = np.atleast_2d(self._selector_array)
 
-            if index < 0:
-                i = -index
-            else:
-                return index
+        xy_f = np.reshape(xy, (-1, 2))
+        row_indexes = np.zeros(xy_f.shape[0], dtype=DEFAULT_INT_DTYPE)
+        indexes = np.full(xy_f.shape[0], -1, dtype=DEFAULT_INT_DTYPE)
+        unresolved = np.arange(xy_f.shape[0])
+        while len(unresolved) != 0:
+            direction, origin, lesser_index, greater_index = np.transpose(
+                selector_array[row_indexes[unresolved]])
+
+            index = np.where(
+                xy_f[unresolved, as_int_array(direction)] <= origin,
+                lesser_index, greater_index).astype(DEFAULT_INT_DTYPE)
+
+            is_row = index < 0
+            row_indexes[unresolved[is_row]] = -index[is_row]
+            indexes[unresolved[~is_row]] = index[~is_row]
+            unresolved = unresolved[is_row]
+
+        if xy.ndim == 1:
+            return int(indexes[0])
+        else:
+            return np.reshape(indexes, xy.shape[:-1])
 
     def cluster(self, xy):
         """
@@ -225,14 +239,14 @@ class Dataset_Otsu2018:
 
         Parameters
         ----------
-        xy : array_like, (2,)
+        xy : array_like, (2,) or (..., 2)
             *CIE xy* chromaticity coordinates.
 
         Returns
         -------
-        basis_functions : ndarray, (3, n)
+        basis_functions : ndarray, (3, n) or (..., 3, n)
             Three basis functions.
-        mean : ndarray, (n,)
+        mean : ndarray, (n,) or (..., n)
             Dataset mean.
         """
 
@@ -353,7 +367,7 @@ def XYZ_to_sd_Otsu2018(
 
     Parameters
     ----------
-    XYZ : array_like, (3,)
+    XYZ : array_like, (3,) or (..., 3)
         *CIE XYZ* tristimulus values to recover the spectral distribution from.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
@@ -370,8 +384,10 @@ def XYZ_to_sd_Otsu2018(
 
     Returns
     -------
-    SpectralDistribution
-        Recovered spectral distribution. Its shape is always that of the
+    SpectralDistribution or MultiSpectralDistributions
+        Recovered spectral distribution, or multi-spectral distributions with
+        one distribution per *CIE XYZ* tristimulus values of a n-dimensional
+        array in C-order. Its shape is always that of the
         :class:`colour.recovery.SPECTRAL_SHAPE_OTSU2018` class instance.
 
     References
@@ -439,28 +455,113 @@ def XYZ_to_sd_Otsu2018(
     XYZ = to_domain_1(XYZ)
     xy = XYZ_to_xy(XYZ)
 
-    basis_functions, mean = dataset.cluster(xy)
+    indexes = as_int_array(dataset.select(xy))
 
-    M = np.empty((3, 3))
-    for i in range(3):
-        sd = SpectralDistribution(basis_functions[i, :], dataset.shape.range())
+    # The matrices are computed once per cluster used by the tristimulus
+    # values, the reflectances are then reconstructed at once.
+    M_inverse = np.empty(indexes.shape + (3, 3))
+    XYZ_mu = np.empty(indexes.shape + (3, ))
+    for index in np.unique(indexes):
+        basis_functions = dataset.basis_functions[index, :, :]
 
-        with domain_range_scale('ignore'):
-            M[:, i] = sd_to_XYZ(sd, cmfs, illuminant) / 100
+        M = np.empty((3, 3))
+        for i in range(3):
+            sd = SpectralDistribution(basis_functions[i, :],
+                                      dataset.shape.range())
 
-    M_inverse = np.linalg.inv(M)
+            with domain_range_scale('ignore'):
+                M[:, i] = sd_to_XYZ(sd, cmfs, illuminant) / 100
 
-    sd = SpectralDistribution(mean, dataset.shape.range())
+        sd = SpectralDistribution(dataset.means[index, :],
+                                  dataset.shape.range())
 
-    with domain_range_scale('ignore'):
-        XYZ_mu = sd_to_XYZ(sd, cmfs, illuminant) / 100
+        mask = indexes == index
+        M_inverse[mask] = np.linalg.inv(M)
+        with domain_range_scale('ignore'):
+            XYZ_mu[mask] = sd_to_XYZ(sd, cmfs, illuminant) / 100
 
-    weights = np.dot(M_inverse, XYZ - XYZ_mu)
-    recovered_sd = np.dot(weights, basis_functions) + mean
+    weights = np.einsum('...ij,...j->...i', M_inverse, XYZ - XYZ_mu)
+    recovered_sd = np.einsum('...i,...ij->...j', weights,
+                             dataset.basis_functions[indexes, :, :])
+    recovered_sd += dataset.means[indexes, :]
 
     recovered_sd = np.clip(recovered_sd, 0, 1) if clip else recovered_sd
 
-    return SpectralDistribution(recovered_sd, dataset.shape.range())
+    if recovered_sd.ndim == 1:
+        return SpectralDistribution(recovered_sd, dataset.shape.range())
+    else:
+        return MultiSpectralDistributions(
+            np.transpose(
+                np.reshape(recovered_sd, (-1, recovered_sd.shape[-1]))),
+            dataset.shape.range())
+
+
+def _PCA_Otsu2018(tree, count, sum_, sum_outer):
+    """
+    Performs the *Principal Component Analysis* (PCA) of reflectances from
+    their count, sum and sum of outer products.
+
+    Parameters
+    ----------
+    tree : NodeTree_Otsu2018
+        The tree which determines the standard observer colour matching
+        functions and illuminant used in colourimetric calculations.
+    count : int
+        Reflectances count.
+    sum_ : ndarray, (m,)
+        Reflectances sum.
+    sum_outer : ndarray, (m, m)
+        Reflectances sum of outer products.
+
+    Returns
+    -------
+    tuple
+        Mean, basis functions, inverse of the basis functions *CIE XYZ*
+        tristimulus values matrix and mean *CIE XYZ* tristimulus values.
+    """
+
+    mean = sum_ / count
+    matrix_covariance = sum_outer - count * np.outer(mean, mean)
+    _eigenvalues, eigenvectors = np.linalg.eigh(matrix_covariance)
+    basis_functions = np.transpose(eigenvectors[:, -3:])
+
+    M = np.transpose(tree.msds_to_XYZ(basis_functions))
+
+    return (mean, basis_functions, np.linalg.inv(M), tree.msds_to_XYZ(mean))
+
+
+def _reconstruction_error_Otsu2018(reflectances, XYZ, mean, basis_functions,
+                                   M_inverse, XYZ_mu):
+    """
+    Reconstructs the reflectances of given *CIE XYZ* tristimulus values and
+    returns the reconstruction errors summation against given reflectances.
+
+    Parameters
+    ----------
+    reflectances : ndarray, (n, m)
+        Measured reflectances.
+    XYZ : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values of the measured reflectances.
+    mean : ndarray, (m,)
+        Reflectances mean.
+    basis_functions : ndarray, (3, m)
+        Three basis functions.
+    M_inverse : ndarray, (3, 3)
+        Inverse of the basis functions *CIE XYZ* tristimulus values matrix.
+    XYZ_mu : ndarray, (3,)
+        Mean *CIE XYZ* tristimulus values.
+
+    Returns
+    -------
+    float
+        Reconstruction errors summation.
+    """
+
+    weights = np.dot(XYZ - XYZ_mu, np.transpose(M_inverse))
+    recovered_reflectances = np.clip(
+        np.dot(weights, basis_functions) + mean, 0, 1)
+
+    return np.sum((reflectances - recovered_reflectances) ** 2)
 
 
 class PartitionAxis(namedtuple('PartitionAxis', ('origin', 'direction'))):
@@ -1015,12 +1116,9 @@ class Node:
         if self._M is None:
             self.PCA()
 
-        error = 0
-        for i in range(len(self.colour_data)):
-            sd = self.colour_data.reflectances[i, :]
-            XYZ = self.colour_data.XYZ[i, :]
-            recovered_sd = self.reconstruct(XYZ)
-            error += np.sum((sd - recovered_sd.values) ** 2)
+        error = _reconstruction_error_Otsu2018(
+            self.colour_data.reflectances, self.colour_data.XYZ, self._mean,
+            self._basis_functions, self._M_inverse, self._XYZ_mu)
 
         self._cached_leaf_reconstruction_error = error
 
@@ -1101,27 +1199,82 @@ class Node:
             return self._best_partition
 
         leaf_error = self.leaf_reconstruction_error()
-        best_error = None
 
-        with tqdm(total=2 * len(self.colour_data)) as progress:
-            for direction in [0, 1]:
-                for i in range(len(self.colour_data)):
-                    progress.update()
-                    origin = self.colour_data.xy[i, direction]
-                    axis = PartitionAxis(origin, direction)
-
-                    try:
-                        partition_error, partition = (
-                            self.partition_reconstruction_error(axis))
-                    except RuntimeError:
-                        continue
+        reflectances = self.colour_data.reflectances
+        XYZ = self.colour_data.XYZ
+        xy = self.colour_data.xy
+
+        count = len(self.colour_data)
+        minimum_cluster_size = self._tree.minimum_cluster_size
 
-                    if partition_error >= leaf_error:
+        sum_ = np.sum(reflectances, axis=0)
+        sum_outer = np.dot(np.transpose(reflectances), reflectances)
+
+        # Every colour of the colour data defines a candidate partition axis.
+        # The colours are sorted along the partition direction so that the
+        # lesser part of each distinct candidate origin is a prefix of them,
+        # the statistics of both parts are then updated incrementally from
+        # one candidate to the next instead of being computed from scratch.
+        best_axis = None
+        with tqdm(total=2 * count) as progress:
+            for direction in [0, 1]:
+                order = np.argsort(xy[:, direction], kind='stable')
+                reflectances_s, XYZ_s = reflectances[order], XYZ[order]
+
+                origins = np.unique(xy[:, direction])
+                lesser_counts = np.searchsorted(
+                    xy[order, direction], origins, side='right')
+
+                errors = np.full(len(origins), np.inf)
+                sum_l = zeros(sum_.shape)
+                sum_outer_l = zeros(sum_outer.shape)
+                lesser_count_p = 0
+                for i, lesser_count in enumerate(lesser_counts):
+                    progress.update(lesser_count - lesser_count_p)
+
+                    added = slice(lesser_count_p, lesser_count)
+                    reflectances_a = reflectances_s[added]
+                    sum_l += np.sum(reflectances_a, axis=0)
+                    sum_outer_l += np.dot(
+                        np.transpose(reflectances_a), reflectances_a)
+                    lesser_count_p = lesser_count
+
+                    if (lesser_count < minimum_cluster_size or
+                            count - lesser_count < minimum_cluster_size):
                         continue
 
-                    if best_error is None or partition_error < best_error:
-                        self._best_partition = (partition_error, axis,
-                                                partition)
+                    lesser = slice(None, lesser_count)
+                    greater = slice(lesser_count, None)
+                    PCA_l = _PCA_Otsu2018(self._tree, lesser_count, sum_l,
+                                          sum_outer_l)
+                    PCA_g = _PCA_Otsu2018(self._tree, count - lesser_count,
+                                          sum_ - sum_l,
+                                          sum_outer - sum_outer_l)
+
+                    error_l = _reconstruction_error_Otsu2018(
+                        reflectances_s[lesser], XYZ_s[lesser], *PCA_l)
+                    error_g = _reconstruction_error_Otsu2018(
+                        reflectances_s[greater], XYZ_s[greater], *PCA_g)
+
+                    errors[i] = error_l + error_g
+
+                # The candidates are visited in the colour data order and the
+                # last one reducing the leaf error is retained rather than the
+                # one minimising the partition error, i.e.
+                # "np.argmin(errors)": this is on purpose and reproduces the
+                # selection of the previous unbatched implementation, whose
+                # best error was never updated, so that the optimised trees
+                # are unchanged.
+                candidates = np.where(errors[np.searchsorted(
+                    origins, xy[:, direction])] < leaf_error)[0]
+                if len(candidates) != 0:
+                    best_axis = PartitionAxis(xy[candidates[-1], direction],
+                                              direction)
+
+        if best_axis is not None:
+            partition_error, partition = (
+                self.partition_reconstruction_error(best_axis))
+            self._best_partition = (partition_error, best_axis, partition)
 
         if self._best_partition is None:
             raise RuntimeError('Could not find a best partition!')
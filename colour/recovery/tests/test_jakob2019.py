@@ -17,7 +17,8 @@ from colour.models import RGB_COLOURSPACE_sRGB, RGB_to_XYZ, XYZ_to_Lab
 from colour.recovery.jakob2019 import (
     XYZ_to_sd_Jakob2019, sd_Jakob2019, error_function,
     dimensionalise_coefficients, SPECTRAL_SHAPE_JAKOB2019, LUT3D_Jakob2019)
-from colour.utilities import domain_range_scale, full, ones, zeros
+from colour.utilities import (disable_multiprocessing, domain_range_scale,
+                              full, ones, zeros)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -276,6 +277,70 @@ class TestLUT3D_Jakob2019(unittest.TestCase):
                 self.fail('Delta E for RGB={0} in colourspace {1} is {2}!'
                           .format(RGB, self._RGB_colourspace.name, error))
 
+    def test_generate(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.LUT3D_Jakob2019.generate`
+        method multiprocessing and checkpointing.
+        """
+
+        def print_callable(x):
+            """
+            Does not print progress and diagnostic information.
+            """
+
+        with disable_multiprocessing():
+            LUT_serial = LUT3D_Jakob2019()
+            LUT_serial.generate(self._RGB_colourspace, self._cmfs,
+                                self._sd_D65, 3, print_callable)
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(
+            self._RGB_colourspace,
+            self._cmfs,
+            self._sd_D65,
+            3,
+            print_callable,
+            processes=2)
+        np.testing.assert_equal(LUT.coefficients, LUT_serial.coefficients)
+
+        path = os.path.join(self._temporary_directory, 'Jakob2019.npz')
+        LUT.generate(
+            self._RGB_colourspace,
+            self._cmfs,
+            self._sd_D65,
+            3,
+            print_callable,
+            checkpoint_path=path)
+        np.testing.assert_equal(LUT.coefficients, LUT_serial.coefficients)
+
+        # Simulating an interrupted generation by discarding the solved
+        # chroma columns of the second and third cube faces.
+        with np.load(path) as checkpoint:
+            checkpoint = dict(checkpoint)
+        checkpoint['solved'][1:] = False
+        checkpoint['coefficients'][1:] = 0
+        np.savez(path, **checkpoint)
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(
+            self._RGB_colourspace,
+            self._cmfs,
+            self._sd_D65,
+            3,
+            print_callable,
+            checkpoint_path=path)
+        np.testing.assert_equal(LUT.coefficients, LUT_serial.coefficients)
+
+        self.assertRaises(
+            ValueError,
+            LUT.generate,
+            self._RGB_colourspace,
+            self._cmfs,
+            self._sd_D65,
+            4,
+            print_callable,
+            checkpoint_path=path)
+
 
 if __name__ == '__main__':
     unittest.main()
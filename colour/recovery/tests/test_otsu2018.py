@@ -11,12 +11,14 @@ import unittest
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER,
+                                MultiSpectralDistributions, sd_to_XYZ)
 from colour.difference import delta_E_CIE1976
 from colour.models import XYZ_to_Lab
 from colour.recovery import (XYZ_to_sd_Otsu2018, SPECTRAL_SHAPE_OTSU2018,
                              Dataset_Otsu2018, NodeTree_Otsu2018)
-from colour.recovery.otsu2018 import ColourData, Node
+from colour.recovery.otsu2018 import (DATASET_REFERENCE_OTSU2018, ColourData,
+                                      Node, PartitionAxis)
 from colour.utilities import domain_range_scale, metric_mse
 
 __author__ = 'Colour Developers'
@@ -59,6 +61,20 @@ class TestDataset_Otsu2018(unittest.TestCase):
         for method in required_methods:
             self.assertIn(method, dir(Dataset_Otsu2018))
 
+    def test_select(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Dataset_Otsu2018.select` method.
+        """
+
+        xy = np.random.RandomState(4).uniform(0.1, 0.6, (20, 2))
+        indexes = np.array([DATASET_REFERENCE_OTSU2018.select(a) for a in xy])
+
+        self.assertIsInstance(DATASET_REFERENCE_OTSU2018.select(xy[0]), int)
+        np.testing.assert_equal(DATASET_REFERENCE_OTSU2018.select(xy), indexes)
+        np.testing.assert_equal(
+            DATASET_REFERENCE_OTSU2018.select(np.reshape(xy, (4, 5, 2))),
+            np.reshape(indexes, (4, 5)))
+
 
 class TestXYZ_to_sd_Otsu2018(unittest.TestCase):
     """
@@ -102,6 +118,32 @@ class TestXYZ_to_sd_Otsu2018(unittest.TestCase):
             delta_E = delta_E_CIE1976(Lab, recovered_Lab)
             self.assertLess(delta_E, 1e-12)
 
+    def test_n_dimensional_XYZ_to_sd_Otsu2018(self):
+        """
+        Tests :func:`colour.recovery.otsu2018.XYZ_to_sd_Otsu2018` definition
+        n-dimensional arrays support.
+        """
+
+        XYZ = np.array([
+            sd_to_XYZ(sd, self._cmfs, self._sd_D65) / 100
+            for sd in SDS_COLOURCHECKERS['ColorChecker N Ohta'].values()
+        ])
+        values = np.array([
+            XYZ_to_sd_Otsu2018(a, self._cmfs, self._sd_D65).values for a in XYZ
+        ])
+
+        msds = XYZ_to_sd_Otsu2018(XYZ, self._cmfs, self._sd_D65)
+        self.assertIsInstance(msds, MultiSpectralDistributions)
+        np.testing.assert_array_equal(msds.wavelengths,
+                                      SPECTRAL_SHAPE_OTSU2018.range())
+        np.testing.assert_almost_equal(
+            np.transpose(msds.values), values, decimal=7)
+
+        msds = XYZ_to_sd_Otsu2018(
+            np.reshape(XYZ, (4, 6, 3)), self._cmfs, self._sd_D65)
+        np.testing.assert_almost_equal(
+            np.transpose(msds.values), values, decimal=7)
+
     def test_domain_range_scale_XYZ_to_sd_Otsu2018(self):
         """
         Tests :func:`colour.recovery.otsu2018.XYZ_to_sd_Otsu2018` definition
@@ -185,6 +227,54 @@ class TestNode(unittest.TestCase):
         for method in required_methods:
             self.assertIn(method, dir(Node))
 
+    def test_find_best_partition(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Node.find_best_partition` method.
+        """
+
+        shape = SPECTRAL_SHAPE_OTSU2018
+        cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(shape)
+        sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(shape)
+
+        reflectances = []
+        for colourchecker in ['ColorChecker N Ohta', 'BabelColor Average']:
+            for sd in SDS_COLOURCHECKERS[colourchecker].values():
+                reflectances.append(sd.copy().align(shape).values)
+
+        node_tree = NodeTree_Otsu2018(reflectances, cmfs, sd_D65)
+        node_tree._minimum_cluster_size = 6
+
+        leaf_error = node_tree.leaf_reconstruction_error()
+        leaf_error_s = 0
+        for sd, XYZ in zip(node_tree.colour_data.reflectances,
+                           node_tree.colour_data.XYZ):
+            sd_r = node_tree.reconstruct(XYZ).values
+            leaf_error_s += np.sum((sd - sd_r) ** 2)
+        self.assertAlmostEqual(leaf_error, leaf_error_s, places=7)
+
+        # Exhaustive search, the last candidate reducing the leaf error is
+        # retained.
+        axis_e = None
+        for direction in [0, 1]:
+            for origin in node_tree.colour_data.xy[:, direction]:
+                axis = PartitionAxis(origin, direction)
+                try:
+                    error, _partition = (
+                        node_tree.partition_reconstruction_error(axis))
+                except RuntimeError:
+                    continue
+
+                if error < leaf_error:
+                    axis_e, error_e = axis, error
+
+        partition_error, axis, partition = node_tree.find_best_partition()
+        self.assertEqual(axis, axis_e)
+        self.assertAlmostEqual(partition_error, error_e, places=7)
+        self.assertEqual(
+            len(partition[0].colour_data) + len(partition[1].colour_data),
+            len(reflectances))
+
 
 class TestNodeTree_Otsu2018(unittest.TestCase):
     """
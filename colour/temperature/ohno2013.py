@@ -24,10 +24,11 @@ import numpy as np
 from collections import namedtuple
 
 from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody,
-                                sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER, planck_law,
+                                sd_blackbody, sd_to_XYZ)
 from colour.models import UCS_to_uv, XYZ_to_UCS
-from colour.utilities import as_float_array, runtime_warning, tsplit
+from colour.utilities import (CACHE_REGISTRY, as_float_array, runtime_warning,
+                              tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -51,6 +52,135 @@ CCT_MAXIMAL = 100000
 CCT_SAMPLES = 10
 CCT_CALCULATION_ITERATIONS = 6
 
+_CACHE_PLANCKIAN_LOCUS_CMFS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_PLANCKIAN_LOCUS_CMFS'.format(__name__), 16)
+
+_CACHE_PLANCKIAN_LOCUS_TABLES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_PLANCKIAN_LOCUS_TABLES'.format(__name__), 64)
+
+_PLANCKIAN_LOCUS_CHUNK_SIZE = 4096
+"""
+Number of temperatures for which the planckian radiators spectral
+distributions are computed at once, bounding the memory footprint of
+:func:`colour.temperature.ohno2013._planckian_locus_uv` definition.
+
+_PLANCKIAN_LOCUS_CHUNK_SIZE : int
+"""
+
+
+def _planckian_locus_cmfs(cmfs):
+    """
+    Returns given colour matching functions trimmed to
+    :attr:`colour.SPECTRAL_SHAPE_DEFAULT` attribute spectral shape.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    XYZ_ColourMatchingFunctions
+        Trimmed colour matching functions.
+    """
+
+    hash_key = hash(cmfs)
+    trimmed_cmfs = _CACHE_PLANCKIAN_LOCUS_CMFS.get(hash_key)
+    if trimmed_cmfs is None:
+        trimmed_cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
+        _CACHE_PLANCKIAN_LOCUS_CMFS[hash_key] = trimmed_cmfs
+
+    return trimmed_cmfs
+
+
+def _planckian_locus_uv(CCT, cmfs):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of the
+    planckian radiators at given temperatures.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Temperatures in kelvins.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions, trimmed to
+        :attr:`colour.SPECTRAL_SHAPE_DEFAULT` attribute spectral shape.
+
+    Returns
+    -------
+    ndarray
+        *uv* chromaticity coordinates.
+
+    Notes
+    -----
+    -   The *uv* chromaticity coordinates are invariant to the scale of the
+        tristimulus values, thus, for the *1nm* and *5nm* measurement
+        intervals for which practise *ASTM E308-15* reduces to an integration
+        with an equal-energy illuminant, the tristimulus values are computed
+        for all the temperatures at once with a matrix product. Any other
+        measurement interval is processed with
+        :func:`colour.sd_to_XYZ` definition.
+    """
+
+    CCT = as_float_array(CCT)
+
+    shape = cmfs.shape
+    CCT_f = np.ravel(CCT)
+
+    if shape.interval in (1, 5):
+        wavelengths = shape.range() * 1e-9
+        XYZ = np.zeros([CCT_f.size, 3])
+        for i in range(0, CCT_f.size, _PLANCKIAN_LOCUS_CHUNK_SIZE):
+            chunk = slice(i, i + _PLANCKIAN_LOCUS_CHUNK_SIZE)
+            XYZ[chunk] = np.dot(
+                planck_law(wavelengths, CCT_f[chunk, np.newaxis]), cmfs.values)
+    else:
+        XYZ = as_float_array(
+            [sd_to_XYZ(sd_blackbody(T, shape), cmfs) for T in CCT_f])
+
+    XYZ /= np.max(XYZ, axis=-1)[..., np.newaxis]
+
+    return np.reshape(UCS_to_uv(XYZ_to_UCS(XYZ)), CCT.shape + (2, ))
+
+
+def _planckian_locus_table(cmfs, start, end, count):
+    """
+    Returns the temperatures and *CIE UCS* colourspace *uv* chromaticity
+    coordinates of the planckian locus for given colour matching functions and
+    temperature range.
+
+    The table does not depend on the test chromaticity coordinates and is
+    cached so that it is shared by all the
+    :func:`colour.temperature.uv_to_CCT_Ohno2013` definition calls.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric
+        Temperature range start in kelvins.
+    end : numeric
+        Temperature range end in kelvins.
+    count : int
+        Temperatures count in the planckian table.
+
+    Returns
+    -------
+    tuple
+        Temperatures :math:`T_i` and *uv* chromaticity coordinates.
+    """
+
+    hash_key = (hash(cmfs), start, end, count)
+    table = _CACHE_PLANCKIAN_LOCUS_TABLES.get(hash_key)
+    if table is None:
+        Ti = np.linspace(start, end, count)
+        table = (Ti, _planckian_locus_uv(Ti, _planckian_locus_cmfs(cmfs)))
+        _CACHE_PLANCKIAN_LOCUS_TABLES[hash_key] = table
+
+    Ti, uvi = table
+
+    return np.copy(Ti), np.copy(uvi)
+
 
 def planckian_table(uv, cmfs, start, end, count):
     """
@@ -112,21 +242,11 @@ ui=0.4456351..., vi=0.3548306..., di=0.2514749...)]
 
     ux, vx = uv
 
-    cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
-
-    shape = cmfs.shape
-
-    table = []
-    for Ti in np.linspace(start, end, count):
-        sd = sd_blackbody(Ti, shape)
-        XYZ = sd_to_XYZ(sd, cmfs)
-        XYZ /= np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        ui, vi = UCS_to_uv(UVW)
-        di = np.hypot(ux - ui, vx - vi)
-        table.append(PLANCKIAN_TABLE_TUVD(Ti, ui, vi, di))
+    Ti, uvi = _planckian_locus_table(cmfs, start, end, count)
+    ui, vi = tsplit(uvi)
+    di = np.hypot(ux - ui, vx - vi)
 
-    return table
+    return [PLANCKIAN_TABLE_TUVD(*row) for row in zip(Ti, ui, vi, di)]
 
 
 def planckian_table_minimal_distance_index(planckian_table_):
@@ -201,33 +321,55 @@ def _uv_to_CCT_Ohno2013(
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
     """
 
+    uv = as_float_array(uv)
+    ux, vx = tsplit(uv)
+
     # Ensuring we do at least one iteration to initialise variables.
     iterations = max(iterations, 1)
 
-    # Planckian table creation through cascade expansion.
-    for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
+    # Planckian table creation through cascade expansion: The first table is
+    # shared by all the chromaticity coordinates, the subsequent ones are
+    # computed once per distinct temperature range.
+    Ti, uvi = _planckian_locus_table(cmfs, start, end, count)
+    Ti = np.resize(Ti, ux.shape + (count, ))
+    uvi = np.resize(uvi, ux.shape + (count, 2))
+    cmfs = _planckian_locus_cmfs(cmfs)
+    for i in range(iterations):
+        if i != 0:
+            ranges, inverse = np.unique(
+                np.reshape(tstack([start, end]), (-1, 2)),
+                axis=0,
+                return_inverse=True)
+            Ti_u = np.linspace(ranges[..., 0], ranges[..., 1], count, axis=-1)
+            uvi_u = _planckian_locus_uv(Ti_u, cmfs)
+            Ti = np.reshape(Ti_u[inverse], ux.shape + (count, ))
+            uvi = np.reshape(uvi_u[inverse], ux.shape + (count, 2))
+
+        ui, vi = tsplit(uvi)
+        di = np.hypot(ux[..., np.newaxis] - ui, vx[..., np.newaxis] - vi)
+        index = np.argmin(di, axis=-1)[..., np.newaxis]
+        if np.any(index == 0):
             runtime_warning(
                 ('Minimal distance index is on lowest planckian table bound, '
                  'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
+        if np.any(index == count - 1):
             runtime_warning(
                 ('Minimal distance index is on highest planckian table bound, '
                  'unpredictable results may occur!'))
-            index -= 1
-
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
+        index = np.clip(index, 1, count - 2)
 
-    _ux, vx = uv
+        start = np.take_along_axis(Ti, index - 1, axis=-1)[..., 0]
+        end = np.take_along_axis(Ti, index + 1, axis=-1)[..., 0]
 
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
+    Tip, uip, vip, dip = [
+        np.take_along_axis(a, index - 1, axis=-1)[..., 0]
+        for a in (Ti, ui, vi, di)
+    ]
+    Tin, uin, vin, din = [
+        np.take_along_axis(a, index + 1, axis=-1)[..., 0]
+        for a in (Ti, ui, vi, di)
+    ]
+    Ti, di = [np.take_along_axis(a, index, axis=-1)[..., 0] for a in (Ti, di)]
 
     # Triangular solution.
     l = np.hypot(uin - uip, vin - vip)  # noqa
@@ -235,24 +377,25 @@ def _uv_to_CCT_Ohno2013(
     T = Tip + (Tin - Tip) * (x / l)
 
     vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
+    sign = np.where(vx - vtx >= 0, 1, -1)
     D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
     # Parabolic solution.
-    if np.abs(D_uv) >= 0.002:
-        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
-        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
-        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
-               (di - dip)) * X ** -1)
-        c = (
-            -(dip * (Tin - Ti) * Ti * Tin + di *
-              (Tip - Tin) * Tip * Tin + din * (Ti - Tip) * Tip * Ti) * X ** -1)
+    X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
+    a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
+    b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
+           (di - dip)) * X ** -1)
+    c = (-(dip * (Tin - Ti) * Ti * Tin + di * (Tip - Tin) * Tip * Tin + din *
+           (Ti - Tip) * Tip * Ti) * X ** -1)
 
-        T = -b / (2 * a)
+    T_p = -b / (2 * a)
+    D_uv_p = sign * (a * T_p ** 2 + b * T_p + c)
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
+    parabolic = np.abs(D_uv) >= 0.002
+    T = np.where(parabolic, T_p, T)
+    D_uv = np.where(parabolic, D_uv_p, D_uv)
 
-    return np.array([T, D_uv])
+    return tstack([T, D_uv])
 
 
 def uv_to_CCT_Ohno2013(uv,
@@ -306,17 +449,10 @@ def uv_to_CCT_Ohno2013(uv,
     ... )
     >>> uv = np.array([0.1978, 0.3122])
     >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
-    array([  6.5074738...e+03,   3.2233460...e-03])
+    array([  6.5074738...e+03,   3.223346...e-03])
     """
 
-    uv = as_float_array(uv)
-
-    CCT_D_uv = [
-        _uv_to_CCT_Ohno2013(a, cmfs, start, end, count, iterations)
-        for a in np.reshape(uv, (-1, 2))
-    ]
-
-    return as_float_array(CCT_D_uv).reshape(uv.shape)
+    return _uv_to_CCT_Ohno2013(uv, cmfs, start, end, count, iterations)
 
 
 def _CCT_to_uv_Ohno2013(CCT_D_uv,
@@ -329,7 +465,7 @@ def _CCT_to_uv_Ohno2013(CCT_D_uv,
 
     Parameters
     ----------
-    CCT_D_uv : ndarray
+    CCT_D_uv : array_like
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
@@ -342,34 +478,20 @@ def _CCT_to_uv_Ohno2013(CCT_D_uv,
 
     CCT, D_uv = tsplit(CCT_D_uv)
 
-    cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
-
-    shape = cmfs.shape
+    cmfs = _planckian_locus_cmfs(cmfs)
 
     delta = 0.01
 
-    sd = sd_blackbody(CCT, shape)
-    XYZ = sd_to_XYZ(sd, cmfs)
-    XYZ *= 1 / np.max(XYZ)
-    UVW = XYZ_to_UCS(XYZ)
-    u0, v0 = UCS_to_uv(UVW)
-
-    if D_uv == 0:
-        return np.array([u0, v0])
-    else:
-        sd = sd_blackbody(CCT + delta, shape)
-        XYZ = sd_to_XYZ(sd, cmfs)
-        XYZ *= 1 / np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        u1, v1 = UCS_to_uv(UVW)
+    u0, v0 = tsplit(_planckian_locus_uv(CCT, cmfs))
+    u1, v1 = tsplit(_planckian_locus_uv(CCT + delta, cmfs))
 
-        du = u0 - u1
-        dv = v0 - v1
+    du = u0 - u1
+    dv = v0 - v1
 
-        u = u0 - D_uv * (dv / np.hypot(du, dv))
-        v = v0 + D_uv * (du / np.hypot(du, dv))
+    u = np.where(D_uv == 0, u0, u0 - D_uv * (dv / np.hypot(du, dv)))
+    v = np.where(D_uv == 0, v0, v0 + D_uv * (du / np.hypot(du, dv)))
 
-        return np.array([u, v])
+    return tstack([u, v])
 
 
 def CCT_to_uv_Ohno2013(CCT_D_uv,
@@ -411,6 +533,6 @@ def CCT_to_uv_Ohno2013(CCT_D_uv,
 
     CCT_D_uv = as_float_array(CCT_D_uv)
 
-    uv = [_CCT_to_uv_Ohno2013(a, cmfs) for a in np.reshape(CCT_D_uv, (-1, 2))]
+    uv = _CCT_to_uv_Ohno2013(np.reshape(CCT_D_uv, (-1, 2)), cmfs)
 
-    return as_float_array(uv).reshape(CCT_D_uv.shape)
+    return np.reshape(uv, CCT_D_uv.shape)
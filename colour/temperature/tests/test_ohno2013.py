@@ -7,7 +7,7 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.colorimetry import MSDS_CMFS_STANDARD_OBSERVER
+from colour.colorimetry import MSDS_CMFS_STANDARD_OBSERVER, SpectralShape
 from colour.temperature import CCT_to_uv_Ohno2013, uv_to_CCT_Ohno2013
 from colour.temperature.ohno2013 import (
     planckian_table, planckian_table_minimal_distance_index)
@@ -108,6 +108,37 @@ class Testuv_to_CCT_Ohno2013(unittest.TestCase):
             np.array([2452.15316417, -0.08437064]),
             decimal=7)
 
+    def test_vectorised_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.ohno2013.uv_to_CCT_Ohno2013` definition
+        vectorised computations consistency with per chromaticity coordinates
+        computations.
+        """
+
+        uv = np.array([
+            [0.1978, 0.3122],
+            [0.4328, 0.2883],
+            [0.2927, 0.2722],
+            [0.2100, 0.3200],
+            [0.2500, 0.3400],
+        ])
+
+        for iterations in (1, 3, 6):
+            np.testing.assert_almost_equal(
+                uv_to_CCT_Ohno2013(uv, iterations=iterations),
+                np.array([
+                    uv_to_CCT_Ohno2013(a, iterations=iterations) for a in uv
+                ]),
+                decimal=7)
+
+        cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(
+                SpectralShape(360, 780, 10))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(uv_to_CCT_Ohno2013(uv[:3], cmfs), cmfs),
+            uv[:3],
+            decimal=6)
+
     def test_n_dimensional_uv_to_CCT_Ohno2013(self):
         """
         Tests :func:`colour.temperature.ohno2013.uv_to_CCT_Ohno2013` definition
@@ -5,14 +5,16 @@ from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
 from .common import (
     handle_numpy_errors, ignore_numpy_errors, raise_numpy_errors,
     print_numpy_errors, warn_numpy_errors, ignore_python_warnings, batch,
-    disable_multiprocessing, multiprocessing_pool, is_matplotlib_installed,
-    is_networkx_installed, is_openimageio_installed, is_pandas_installed,
-    is_tqdm_installed, required, is_iterable, is_string, is_numeric,
-    is_integer, is_sibling, filter_kwargs, filter_mapping, first_item,
-    get_domain_range_scale, set_domain_range_scale, domain_range_scale,
-    to_domain_1, to_domain_10, to_domain_100, to_domain_degrees, to_domain_int,
-    from_range_1, from_range_10, from_range_100, from_range_degrees,
-    from_range_int, copy_definition)
+    disable_multiprocessing, multiprocessing_pool, Cache, CacheRegistry,
+    CACHE_REGISTRY, is_caching_enabled, set_caching_enable, caching_enable,
+    is_matplotlib_installed, is_networkx_installed, is_openimageio_installed,
+    is_pandas_installed, is_tqdm_installed, required, is_iterable, is_string,
+    is_numeric, is_integer, is_sibling, filter_kwargs, filter_mapping,
+    first_item, get_domain_range_scale, set_domain_range_scale,
+    domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
+    to_domain_degrees, to_domain_int, from_range_1, from_range_10,
+    from_range_100, from_range_degrees, from_range_int, copy_definition,
+    lazy_module_attributes)
 from .verbose import (
     ColourWarning, ColourUsageWarning, ColourRuntimeWarning, message_box,
     show_warning, warning, runtime_warning, usage_warning, filter_warnings,
@@ -35,15 +37,17 @@ __all__ = [
 __all__ += [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
-    'batch', 'disable_multiprocessing', 'multiprocessing_pool',
-    'is_matplotlib_installed', 'is_networkx_installed',
-    'is_openimageio_installed', 'is_pandas_installed', 'is_tqdm_installed',
-    'required', 'is_iterable', 'is_string', 'is_numeric', 'is_integer',
-    'is_sibling', 'filter_kwargs', 'filter_mapping', 'first_item',
-    'get_domain_range_scale', 'set_domain_range_scale', 'domain_range_scale',
-    'to_domain_1', 'to_domain_10', 'to_domain_100', 'to_domain_degrees',
-    'to_domain_int', 'from_range_1', 'from_range_10', 'from_range_100',
-    'from_range_degrees', 'from_range_int', 'copy_definition'
+    'batch', 'disable_multiprocessing', 'multiprocessing_pool', 'Cache',
+    'CacheRegistry', 'CACHE_REGISTRY', 'is_caching_enabled',
+    'set_caching_enable', 'caching_enable', 'is_matplotlib_installed',
+    'is_networkx_installed', 'is_openimageio_installed', 'is_pandas_installed',
+    'is_tqdm_installed', 'required', 'is_iterable', 'is_string', 'is_numeric',
+    'is_integer', 'is_sibling', 'filter_kwargs', 'filter_mapping',
+    'first_item', 'get_domain_range_scale', 'set_domain_range_scale',
+    'domain_range_scale', 'to_domain_1', 'to_domain_10', 'to_domain_100',
+    'to_domain_degrees', 'to_domain_int', 'from_range_1', 'from_range_10',
+    'from_range_100', 'from_range_degrees', 'from_range_int',
+    'copy_definition', 'lazy_module_attributes'
 ]
 __all__ += [
     'ColourWarning', 'ColourUsageWarning', 'ColourRuntimeWarning',
@@ -24,7 +24,7 @@ from collections.abc import Mapping, ValuesView
 from contextlib import contextmanager
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE, EPSILON
-from colour.utilities import suppress_warnings
+from colour.utilities import CACHE_REGISTRY, suppress_warnings
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -299,6 +299,9 @@ def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
         `set COLOUR_SCIENCE__FLOAT_PRECISION=float32`.
     -   Some definition returning a single-scalar ndarray might not honour the
         given float precision: https://github.com/numpy/numpy/issues/16353
+    -   The caches of the :attr:`colour.utilities.CACHE_REGISTRY` attribute
+        are cleared so that the cached objects, e.g. interpolators, are
+        created again with the given float precision.
 
     Examples
     --------
@@ -322,6 +325,8 @@ def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
 
             setattr(module, 'DEFAULT_FLOAT_DTYPE', dtype)
 
+    CACHE_REGISTRY.clear_all_caches()
+
 
 def set_int_precision(dtype=DEFAULT_INT_DTYPE):
     """
@@ -20,11 +20,13 @@ import multiprocessing.pool
 import functools
 import numpy as np
 import re
+import threading
 import types
 import warnings
 from contextlib import contextmanager
 from collections import OrderedDict
 from copy import copy
+from importlib import import_module
 
 from colour.constants import INTEGER_THRESHOLD, DEFAULT_FLOAT_DTYPE
 from colour.utilities import CaseInsensitiveMapping, Lookup
@@ -39,15 +41,17 @@ __status__ = 'Production'
 __all__ = [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
-    'batch', 'disable_multiprocessing', 'multiprocessing_pool',
-    'is_matplotlib_installed', 'is_networkx_installed',
-    'is_openimageio_installed', 'is_pandas_installed', 'is_tqdm_installed',
-    'required', 'is_iterable', 'is_string', 'is_numeric', 'is_integer',
-    'is_sibling', 'filter_kwargs', 'filter_mapping', 'first_item',
-    'get_domain_range_scale', 'set_domain_range_scale', 'domain_range_scale',
-    'to_domain_1', 'to_domain_10', 'to_domain_100', 'to_domain_degrees',
-    'to_domain_int', 'from_range_1', 'from_range_10', 'from_range_100',
-    'from_range_degrees', 'from_range_int', 'copy_definition'
+    'batch', 'disable_multiprocessing', 'multiprocessing_pool', 'Cache',
+    'CacheRegistry', 'CACHE_REGISTRY', 'is_caching_enabled',
+    'set_caching_enable', 'caching_enable', 'is_matplotlib_installed',
+    'is_networkx_installed', 'is_openimageio_installed', 'is_pandas_installed',
+    'is_tqdm_installed', 'required', 'is_iterable', 'is_string', 'is_numeric',
+    'is_integer', 'is_sibling', 'filter_kwargs', 'filter_mapping',
+    'first_item', 'get_domain_range_scale', 'set_domain_range_scale',
+    'domain_range_scale', 'to_domain_1', 'to_domain_10', 'to_domain_100',
+    'to_domain_degrees', 'to_domain_int', 'from_range_1', 'from_range_10',
+    'from_range_100', 'from_range_degrees', 'from_range_int',
+    'copy_definition', 'lazy_module_attributes'
 ]
 
 
@@ -299,6 +303,562 @@ def multiprocessing_pool(*args, **kwargs):
         pool.terminate()
 
 
+_CACHING_ENABLED = True
+"""
+Whether *Colour* caching is enabled.
+
+_CACHING_ENABLED : bool
+"""
+
+
+def is_caching_enabled():
+    """
+    Returns whether *Colour* caching is enabled.
+
+    Returns
+    -------
+    bool
+        Whether *Colour* caching is enabled.
+
+    Examples
+    --------
+    >>> with caching_enable(False):
+    ...     is_caching_enabled()
+    False
+    >>> with caching_enable(True):
+    ...     is_caching_enabled()
+    True
+    """
+
+    return _CACHING_ENABLED
+
+
+def set_caching_enable(enable):
+    """
+    Sets *Colour* caching enabled state.
+
+    Parameters
+    ----------
+    enable : bool
+        Whether to enable *Colour* caching.
+
+    Examples
+    --------
+    >>> with caching_enable(True):
+    ...     print(is_caching_enabled())
+    ...     set_caching_enable(False)
+    ...     print(is_caching_enabled())
+    True
+    False
+    """
+
+    global _CACHING_ENABLED
+
+    _CACHING_ENABLED = bool(enable)
+
+
+class caching_enable:
+    """
+    A context manager and decorator temporarily setting *Colour* caching
+    enabled state.
+
+    Parameters
+    ----------
+    enable : bool
+        Whether to enable or disable *Colour* caching.
+    """
+
+    def __init__(self, enable):
+        self._enable = enable
+        self._previous_state = is_caching_enabled()
+
+    def __enter__(self):
+        """
+        Called upon entering the context manager and decorator.
+        """
+
+        self._previous_state = is_caching_enabled()
+
+        set_caching_enable(self._enable)
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Called upon exiting the context manager and decorator.
+        """
+
+        set_caching_enable(self._previous_state)
+
+    def __call__(self, function):
+        """
+        Calls the wrapped definition.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self:
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
+class Cache:
+    """
+    Defines a thread safe cache with an optional least recently used eviction
+    policy and hits, misses and evictions counters.
+
+    The cache does not store nor return any value while *Colour* caching is
+    disabled, see :func:`colour.utilities.caching_enable` definition.
+
+    Parameters
+    ----------
+    name : unicode
+        Cache name.
+    maximum_size : int, optional
+        Maximum number of entries stored in the cache, the least recently used
+        entries are evicted when it is exceeded. If *None*, the cache is
+        unbounded.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.Cache.name`
+    -   :attr:`~colour.utilities.Cache.maximum_size`
+    -   :attr:`~colour.utilities.Cache.hits`
+    -   :attr:`~colour.utilities.Cache.misses`
+    -   :attr:`~colour.utilities.Cache.evictions`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.Cache.__init__`
+    -   :meth:`~colour.utilities.Cache.__contains__`
+    -   :meth:`~colour.utilities.Cache.__getitem__`
+    -   :meth:`~colour.utilities.Cache.__setitem__`
+    -   :meth:`~colour.utilities.Cache.__len__`
+    -   :meth:`~colour.utilities.Cache.get`
+    -   :meth:`~colour.utilities.Cache.clear`
+    -   :meth:`~colour.utilities.Cache.statistics`
+
+    Examples
+    --------
+    >>> cache = Cache('Cache', 2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+    >>> cache.get('b') is None
+    True
+    >>> cache.statistics()
+    {'size': 2, 'maximum_size': 2, 'hits': 1, 'misses': 1, 'evictions': 1}
+    """
+
+    def __init__(self, name, maximum_size=None):
+        self._name = name
+        self._maximum_size = None
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self.maximum_size = maximum_size
+
+    @property
+    def name(self):
+        """
+        Getter property for the cache name.
+
+        Returns
+        -------
+        unicode
+            Cache name.
+        """
+
+        return self._name
+
+    @property
+    def maximum_size(self):
+        """
+        Getter and setter property for the cache maximum size, setting it
+        evicts the least recently used entries exceeding it.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the cache maximum size with.
+
+        Returns
+        -------
+        int
+            Cache maximum size.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for the **self.maximum_size** property.
+        """
+
+        if value is not None:
+            assert value >= 0, (
+                '"{0}" attribute: "{1}" must be positive or zero!'.format(
+                    'maximum_size', value))
+
+        with self._lock:
+            self._maximum_size = value
+            self._evict()
+
+    @property
+    def hits(self):
+        """
+        Getter property for the cache hits count.
+
+        Returns
+        -------
+        int
+            Cache hits count.
+        """
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Getter property for the cache misses count.
+
+        Returns
+        -------
+        int
+            Cache misses count.
+        """
+
+        return self._misses
+
+    @property
+    def evictions(self):
+        """
+        Getter property for the cache evictions count.
+
+        Returns
+        -------
+        int
+            Cache evictions count.
+        """
+
+        return self._evictions
+
+    def _evict(self):
+        """
+        Evicts the least recently used entries exceeding the cache maximum
+        size.
+        """
+
+        if self._maximum_size is None:
+            return
+
+        while len(self._data) > self._maximum_size:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    def __contains__(self, key):
+        """
+        Returns whether the cache contains given key, the counters are not
+        updated.
+
+        Parameters
+        ----------
+        key : object
+            Key to check the presence.
+
+        Returns
+        -------
+        bool
+            Whether the cache contains given key.
+        """
+
+        return _CACHING_ENABLED and key in self._data
+
+    def __getitem__(self, key):
+        """
+        Returns the value of given key and marks it as the most recently used.
+
+        Parameters
+        ----------
+        key : object
+            Key to return the value of.
+
+        Returns
+        -------
+        object
+            Key value.
+
+        Raises
+        ------
+        KeyError
+            If the key is not in the cache or if *Colour* caching is disabled.
+        """
+
+        with self._lock:
+            if not _CACHING_ENABLED or key not in self._data:
+                self._misses += 1
+
+                raise KeyError(key)
+
+            self._hits += 1
+            self._data.move_to_end(key)
+
+            return self._data[key]
+
+    def __setitem__(self, key, value):
+        """
+        Sets given key with given value, evicting the least recently used
+        entries if the cache maximum size is exceeded. The value is discarded
+        if *Colour* caching is disabled.
+
+        Parameters
+        ----------
+        key : object
+            Key to set.
+        value : object
+            Value to set the key with.
+        """
+
+        if not _CACHING_ENABLED:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def __len__(self):
+        """
+        Returns the cache entries count.
+
+        Returns
+        -------
+        int
+            Cache entries count.
+        """
+
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of given key or given default value if the key is
+        not in the cache.
+
+        Parameters
+        ----------
+        key : object
+            Key to return the value of.
+        default : object, optional
+            Value returned if the key is not in the cache.
+
+        Returns
+        -------
+        object
+            Key value or default value.
+        """
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def clear(self):
+        """
+        Clears the cache entries, the counters are not reset.
+        """
+
+        with self._lock:
+            self._data.clear()
+
+    def statistics(self):
+        """
+        Returns the cache statistics.
+
+        Returns
+        -------
+        dict
+            Cache size, maximum size, hits, misses and evictions counts.
+        """
+
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'maximum_size': self._maximum_size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+            }
+
+
+class CacheRegistry:
+    """
+    Defines a registry of the *Colour* caches.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.CacheRegistry.registry`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.CacheRegistry.__init__`
+    -   :meth:`~colour.utilities.CacheRegistry.__str__`
+    -   :meth:`~colour.utilities.CacheRegistry.register_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.unregister_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.clear_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.clear_all_caches`
+    -   :meth:`~colour.utilities.CacheRegistry.statistics`
+
+    Examples
+    --------
+    >>> cache_registry = CacheRegistry()
+    >>> cache_a = cache_registry.register_cache('Cache A')
+    >>> cache_a['Foo'] = 'Bar'
+    >>> cache_b = cache_registry.register_cache('Cache B', maximum_size=8)
+    >>> cache_b['John'] = 'Doe'
+    >>> cache_b['Luke'] = 'Skywalker'
+    >>> print(cache_registry)
+    {'Cache A': '1 item(s)', 'Cache B': '2 item(s)'}
+    >>> cache_registry.clear_cache('Cache A')
+    >>> print(cache_registry)
+    {'Cache A': '0 item(s)', 'Cache B': '2 item(s)'}
+    >>> cache_registry.unregister_cache('Cache B')
+    >>> print(cache_registry)
+    {'Cache A': '0 item(s)'}
+    """
+
+    def __init__(self):
+        self._registry = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def registry(self):
+        """
+        Getter property for the cache registry.
+
+        Returns
+        -------
+        OrderedDict
+            Cache registry.
+        """
+
+        return self._registry
+
+    def __str__(self):
+        """
+        Returns a formatted string representation of the cache registry.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        return '{{{0}}}'.format(', '.join([
+            '{0!r}: \'{1} item(s)\''.format(name, len(cache))
+            for name, cache in self._registry.items()
+        ]))
+
+    def register_cache(self, name, maximum_size=None):
+        """
+        Registers a new cache with given name in the registry, the existing
+        cache is returned if a cache with given name is already registered.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name for the registry.
+        maximum_size : int, optional
+            Maximum number of entries stored in the cache, if *None*, the
+            cache is unbounded.
+
+        Returns
+        -------
+        Cache
+            Registered cache.
+
+        Examples
+        --------
+        >>> cache_registry = CacheRegistry()
+        >>> cache_a = cache_registry.register_cache('Cache A')
+        >>> cache_a['Foo'] = 'Bar'
+        >>> cache_b = cache_registry.register_cache('Cache B')
+        >>> cache_b['John'] = 'Doe'
+        >>> cache_b['Luke'] = 'Skywalker'
+        >>> print(cache_registry)
+        {'Cache A': '1 item(s)', 'Cache B': '2 item(s)'}
+        """
+
+        with self._lock:
+            if name not in self._registry:
+                self._registry[name] = Cache(name, maximum_size)
+
+            return self._registry[name]
+
+    def unregister_cache(self, name):
+        """
+        Unregisters cache with given name from the registry.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name in the registry.
+        """
+
+        with self._lock:
+            del self._registry[name]
+
+    def clear_cache(self, name):
+        """
+        Clears the cache with given name.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name in the registry.
+        """
+
+        self._registry[name].clear()
+
+    def clear_all_caches(self):
+        """
+        Clears all the caches in the registry.
+        """
+
+        with self._lock:
+            for cache in self._registry.values():
+                cache.clear()
+
+    def statistics(self):
+        """
+        Returns the statistics of the caches in the registry.
+
+        Returns
+        -------
+        OrderedDict
+            Caches statistics.
+        """
+
+        with self._lock:
+            return OrderedDict((name, cache.statistics())
+                               for name, cache in self._registry.items())
+
+
+CACHE_REGISTRY = CacheRegistry()
+"""
+*Colour* cache registry referencing all the caches used for repetitive or long
+computations.
+
+CACHE_REGISTRY : CacheRegistry
+"""
+
+
 def is_matplotlib_installed(raise_exception=False):
     """
     Returns if *Matplotlib* is installed and available.
@@ -1611,3 +2171,110 @@ def copy_definition(definition, name=None):
     copy.__dict__.update(definition.__dict__)
 
     return copy
+
+
+def lazy_module_attributes(namespace, attributes):
+    """
+    Builds the module ``__getattr__`` and ``__dir__`` definitions, as given by
+    *PEP 562*, importing the module attributes from their sub-modules on first
+    access.
+
+    Parameters
+    ----------
+    namespace : dict
+        Module namespace, i.e. the module :func:`globals`, the imported
+        attributes are stored into so that they are imported only once.
+    attributes : dict
+        Attributes names per sub-module name, relative to the module. A *None*
+        value stands for the attributes listed by the sub-module ``__all__``
+        attribute. The sub-modules themselves are attributes of the module.
+
+    Returns
+    -------
+    tuple
+        Module ``__getattr__`` and ``__dir__`` definitions.
+
+    Notes
+    -----
+    -   The module ``__getattr__`` definition must be defined before the module
+        imports any of its sub-modules so that the latter can import the
+        module attributes whatever the import order is.
+    -   The ``__dir__`` definition returns the same names whether the
+        attributes have been imported or not and omits the ``__getattr__`` and
+        ``__dir__`` definitions themselves, i.e. the names are those of the
+        module importing its attributes eagerly.
+
+    Examples
+    --------
+    >>> namespace = {'__name__': 'colour'}
+    >>> __getattr__, __dir__ = lazy_module_attributes(
+    ...     namespace, {'models': ['XYZ_to_Lab', 'Lab_to_XYZ']})
+    >>> __dir__()
+    ['Lab_to_XYZ', 'XYZ_to_Lab', '__name__', 'models']
+    >>> __getattr__('XYZ_to_Lab')  # doctest: +ELLIPSIS
+    <function XYZ_to_Lab at 0x...>
+    >>> namespace['XYZ_to_Lab']  # doctest: +ELLIPSIS
+    <function XYZ_to_Lab at 0x...>
+    """
+
+    module = namespace['__name__']
+    submodules = {
+        attribute: submodule
+        for submodule, submodule_attributes in attributes.items()
+        if submodule_attributes is not None
+        for attribute in submodule_attributes
+    }
+    submodules_all = [
+        submodule for submodule, submodule_attributes in attributes.items()
+        if submodule_attributes is None
+    ]
+
+    def import_submodule(submodule):
+        """
+        Imports given sub-module of the module.
+        """
+
+        return import_module('.{0}'.format(submodule), module)
+
+    def __getattr__(attribute):
+        """
+        Returns given module attribute value, importing it from its sub-module
+        on first access.
+        """
+
+        error = AttributeError('module "{0}" has no attribute "{1}"'.format(
+            module, attribute))
+
+        if attribute in submodules:
+            value = getattr(import_submodule(submodules[attribute]), attribute)
+        elif attribute in attributes:
+            value = import_submodule(attribute)
+        elif attribute.startswith('__'):
+            raise error
+        else:
+            for submodule in submodules_all:
+                submodule = import_submodule(submodule)
+                if attribute in submodule.__all__:
+                    value = getattr(submodule, attribute)
+                    break
+            else:
+                raise error
+
+        namespace[attribute] = value
+
+        return value
+
+    def __dir__():
+        """
+        Returns the module attributes names.
+        """
+
+        attributes_all = [
+            attribute for submodule in submodules_all
+            for attribute in import_submodule(submodule).__all__
+        ]
+
+        return sorted((set(namespace) - {'__getattr__', '__dir__'}) |
+                      set(attributes) | set(submodules) | set(attributes_all))
+
+    return __getattr__, __dir__
@@ -29,6 +29,7 @@ structures.py#L37
 """
 
 from collections.abc import Mapping, MutableMapping
+from functools import partial
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -418,11 +419,22 @@ class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
     Methods
     -------
     -   :meth:`~colour.utilities.LazyCaseInsensitiveMapping.__getitem__`
+    -   :meth:`~colour.utilities.LazyCaseInsensitiveMapping.update`
+    -   :meth:`~colour.utilities.LazyCaseInsensitiveMapping.is_evaluated`
+    -   :meth:`~colour.utilities.LazyCaseInsensitiveMapping.copy`
+    -   :meth:`~colour.utilities.LazyCaseInsensitiveMapping.lower_items`
 
     Warnings
     --------
     The keys are expected to be unicode or string-like objects.
 
+    Notes
+    -----
+    -   Updating the mapping with another
+        :class:`colour.utilities.LazyCaseInsensitiveMapping` class instance
+        does not evaluate its values: they are evaluated once on first access
+        from any of the mappings and then shared.
+
     Examples
     --------
     >>> def callable_a():
@@ -435,6 +447,8 @@ class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
     >>> methods['hernandez']
     2
     2
+    >>> methods['hernandez']
+    2
     """
 
     def __getitem__(self, item):
@@ -460,6 +474,95 @@ class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
 
         if callable(value):
             value = value()
-            super(LazyCaseInsensitiveMapping, self).__setitem__(item, value)
+            super(LazyCaseInsensitiveMapping, self).__setitem__(
+                self._data[item.lower()][0], value)
 
         return value
+
+    def update(self, *args, **kwargs):
+        """
+        Updates the mapping with given mappings and key / value pairs.
+
+        The values of the given
+        :class:`colour.utilities.LazyCaseInsensitiveMapping` class instances
+        not evaluated yet are stored as callables retrieving them, i.e. they
+        are not evaluated.
+
+        Other Parameters
+        ----------------
+        \\*args : list, optional
+            Mappings or iterables of key / value pairs.
+        \\**kwargs : dict, optional
+            Key / Value pairs.
+        """
+
+        for data in args:
+            if isinstance(data, LazyCaseInsensitiveMapping):
+                data = dict((item, value) if data.is_evaluated(item) else (
+                    item, partial(data.__getitem__, item))
+                            for item, value in data._data.values())
+
+            super(LazyCaseInsensitiveMapping, self).update(data)
+
+        super(LazyCaseInsensitiveMapping, self).update(**kwargs)
+
+    def is_evaluated(self, item):
+        """
+        Returns whether the value of given item does not require to be
+        evaluated, i.e. it is not a callable.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+
+        Returns
+        -------
+        bool
+            Whether the value of given item is evaluated.
+
+        Examples
+        --------
+        >>> methods = LazyCaseInsensitiveMapping(
+        ...     {'McCamy': 1, 'Hernandez': lambda: 2})
+        >>> methods.is_evaluated('McCamy')
+        True
+        >>> methods.is_evaluated('Hernandez')
+        False
+        >>> methods['Hernandez']
+        2
+        >>> methods.is_evaluated('Hernandez')
+        True
+        """
+
+        return not callable(self._data[item.lower()][1])
+
+    def copy(self):
+        """
+        Returns a copy of the mapping.
+
+        Returns
+        -------
+        LazyCaseInsensitiveMapping
+            Mapping copy.
+
+        Notes
+        -----
+        -   The :class:`colour.utilities.LazyCaseInsensitiveMapping` class
+            copy returned is a simple *copy* not a *deepcopy*, the values not
+            evaluated yet are shared with the copy.
+        """
+
+        return LazyCaseInsensitiveMapping(self)
+
+    def lower_items(self):
+        """
+        Iterates over the lower items names and their evaluated values.
+
+        Returns
+        -------
+        generator
+            Lower item names.
+        """
+
+        return ((item, self[item]) for item in self._data)
@@ -6,6 +6,7 @@ Defines unit tests for :mod:`colour.utilities.array` module.
 import numpy as np
 import unittest
 from collections import namedtuple
+from functools import partial
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities import (
@@ -255,6 +256,93 @@ class TestSetFloatPrecision(unittest.TestCase):
 
             self.assertEqual(dtype_getter(convert(a, source, target)), dtype)
 
+    def test_set_float_precision_accuracy(self):
+        """
+        Tests whether :func:`colour.utilities.array.set_float_precision` effect
+        is preserved from input to output by the models, colour appearance
+        models, colour difference and *LUT* definitions and whether their
+        accuracy is preserved.
+        """
+
+        from colour.algebra import table_interpolation_tetrahedral
+        from colour.appearance import (
+            CIECAM02_to_XYZ, VIEWING_CONDITIONS_LLAB, XYZ_to_CAM16,
+            XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
+            XYZ_to_RLAB, VIEWING_CONDITIONS_HUNT)
+        from colour.difference import DELTA_E_METHODS, delta_E
+        from colour.io import LUT1D, LUT3x1D, LUT3D
+        from colour.models import (
+            RGB_COLOURSPACE_ACESCG, RGB_COLOURSPACE_sRGB, IgPgTg_to_XYZ,
+            Lab_to_XYZ, RGB_to_RGB, XYZ_to_hdr_IPT, XYZ_to_IgPgTg, XYZ_to_Lab,
+            XYZ_to_OSA_UCS, XYZ_to_xyY, eotf, eotf_inverse, log_decoding,
+            log_encoding)
+
+        XYZ_w = np.array([95.047, 100.000, 108.883])
+        LUT = LUT3D(LUT3D.linear_table(17) ** (1 / 2.2))
+
+        cases = [
+            (XYZ_to_Lab, 1e-5),
+            (Lab_to_XYZ, 1e-5),
+            (XYZ_to_xyY, 1e-6),
+            (XYZ_to_IgPgTg, 1e-5),
+            (IgPgTg_to_XYZ, 1e-5),
+            (XYZ_to_hdr_IPT, 1e-5),
+            (lambda a: XYZ_to_OSA_UCS(a * 100), 1e-5),
+            (lambda a: RGB_to_RGB(
+                a, RGB_COLOURSPACE_sRGB, RGB_COLOURSPACE_ACESCG,
+                apply_cctf_decoding=True), 1e-6),
+            (lambda a: log_encoding(a, 'ACESproxy'), 1e-6),
+            (lambda a: log_decoding(a, 'ALEXA Log C'), 1e-5),
+            (lambda a: eotf(a, 'ITU-R BT.2100 HLG'), 1e-5),
+            (lambda a: eotf_inverse(a, 'ITU-R BT.2100 HLG'), 1e-5),
+            (lambda a: eotf(a, 'ST 2084'), 1e-4),
+            (lambda a: XYZ_to_CIECAM02(a * 100, XYZ_w, 20, 20).J, 1e-5),
+            (lambda a: CIECAM02_to_XYZ(
+                XYZ_to_CIECAM02(a * 100, XYZ_w, 20, 20), XYZ_w, 20, 20),
+             1e-5),
+            (lambda a: XYZ_to_CAM16(a * 100, XYZ_w, 20, 20).J, 1e-5),
+            (lambda a: XYZ_to_Hunt(
+                a * 100, XYZ_w, XYZ_w * 0.2, 318.31,
+                VIEWING_CONDITIONS_HUNT['Normal Scenes'], CCT_w=6504).J,
+             1e-5),
+            (lambda a: XYZ_to_LLAB(
+                a * 100, XYZ_w, 318.31, 20,
+                VIEWING_CONDITIONS_LLAB['ref_average_4_minus']).J, 1e-4),
+            (lambda a: XYZ_to_Nayatani95(
+                a * 100, XYZ_w, 20, 5000, 1000).L_star_P, 1e-5),
+            (lambda a: XYZ_to_RLAB(a * 100, XYZ_w, 318.31, 0.4347).J, 1e-5),
+            (LUT1D(LUT1D.linear_table(1024) ** (1 / 2.2)).apply, 1e-6),
+            (LUT3x1D(LUT3x1D.linear_table(1024) ** (1 / 2.2)).apply, 1e-6),
+            (LUT.apply, 1e-6),
+            (lambda a: LUT.apply(
+                a, interpolator=table_interpolation_tetrahedral), 1e-6),
+        ]
+
+        def delta_E_reversed(a, method):
+            """
+            Returns the colour difference between given array and its reverse.
+            """
+
+            return delta_E(a * 100, a[::-1] * 100, method)
+
+        for method in DELTA_E_METHODS:
+            cases.append((partial(delta_E_reversed, method=method), 1e-4))
+
+        a = np.random.RandomState(4).uniform(0.05, 0.95, (64, 3))
+        for definition, tolerance in cases:
+            set_float_precision(np.float64)
+            reference = definition(a)
+
+            set_float_precision(np.float32)
+            value = definition(a.astype(np.float32))
+
+            self.assertEqual(value.dtype, np.float32)
+            np.testing.assert_allclose(
+                value,
+                reference,
+                rtol=tolerance,
+                atol=tolerance * np.nanmax(np.abs(reference)))
+
     def tearDown(self):
         """
         After tests actions.
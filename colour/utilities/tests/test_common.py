@@ -9,12 +9,13 @@ from collections import OrderedDict
 from functools import partial
 
 from colour.utilities import (
-    batch, multiprocessing_pool, is_iterable, is_string, is_numeric,
+    batch, multiprocessing_pool, Cache, CacheRegistry, is_caching_enabled,
+    set_caching_enable, caching_enable, is_iterable, is_string, is_numeric,
     is_integer, is_sibling, filter_kwargs, filter_mapping, first_item,
     get_domain_range_scale, set_domain_range_scale, domain_range_scale,
     to_domain_1, to_domain_10, to_domain_100, to_domain_int, to_domain_degrees,
     from_range_1, from_range_10, from_range_100, from_range_int,
-    from_range_degrees)
+    from_range_degrees, lazy_module_attributes)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -24,13 +25,15 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestBatch', 'TestMultiprocessingPool', 'TestIsIterable', 'TestIsString',
-    'TestIsNumeric', 'TestIsInteger', 'TestIsSibling', 'TestFilterKwargs',
-    'TestFilterMapping', 'TestFirstItem', 'TestGetDomainRangeScale',
-    'TestSetDomainRangeScale', 'TestDomainRangeScale', 'TestToDomain1',
-    'TestToDomain10', 'TestToDomain100', 'TestToDomainDegrees',
-    'TestToDomainInt', 'TestFromRange1', 'TestFromRange10', 'TestFromRange100',
-    'TestFromRangeDegrees', 'TestFromRangeInt'
+    'TestBatch', 'TestMultiprocessingPool', 'TestIsCachingEnabled',
+    'TestSetCachingEnabled', 'TestCachingEnable', 'TestCache',
+    'TestCacheRegistry', 'TestIsIterable', 'TestIsString', 'TestIsNumeric',
+    'TestIsInteger', 'TestIsSibling', 'TestFilterKwargs', 'TestFilterMapping',
+    'TestFirstItem', 'TestGetDomainRangeScale', 'TestSetDomainRangeScale',
+    'TestDomainRangeScale', 'TestToDomain1', 'TestToDomain10',
+    'TestToDomain100', 'TestToDomainDegrees', 'TestToDomainInt',
+    'TestFromRange1', 'TestFromRange10', 'TestFromRange100',
+    'TestFromRangeDegrees', 'TestFromRangeInt', 'TestLazyModuleAttributes'
 ]
 
 
@@ -98,6 +101,264 @@ class TestMultiprocessingPool(unittest.TestCase):
                 [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
 
 
+class TestIsCachingEnabled(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.is_caching_enabled` definition unit
+    tests methods.
+    """
+
+    def test_is_caching_enabled(self):
+        """
+        Tests :func:`colour.utilities.common.is_caching_enabled` definition.
+        """
+
+        with caching_enable(True):
+            self.assertTrue(is_caching_enabled())
+
+        with caching_enable(False):
+            self.assertFalse(is_caching_enabled())
+
+
+class TestSetCachingEnabled(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.set_caching_enable` definition unit
+    tests methods.
+    """
+
+    def test_set_caching_enable(self):
+        """
+        Tests :func:`colour.utilities.common.set_caching_enable` definition.
+        """
+
+        with caching_enable(is_caching_enabled()):
+            set_caching_enable(True)
+            self.assertTrue(is_caching_enabled())
+
+        with caching_enable(is_caching_enabled()):
+            set_caching_enable(False)
+            self.assertFalse(is_caching_enabled())
+
+
+class TestCachingEnable(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.caching_enable` definition unit
+    tests methods.
+    """
+
+    def test_caching_enable(self):
+        """
+        Tests :func:`colour.utilities.common.caching_enable` definition.
+        """
+
+        with caching_enable(True):
+            self.assertTrue(is_caching_enabled())
+
+            with caching_enable(False):
+                self.assertFalse(is_caching_enabled())
+
+            self.assertTrue(is_caching_enabled())
+
+        @caching_enable(False)
+        def fn_a():
+            """
+            :func:`caching_enable` unit tests :func:`fn_a` definition.
+            """
+
+            return is_caching_enabled()
+
+        self.assertFalse(fn_a())
+
+
+class TestCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.common.Cache` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name', 'maximum_size', 'hits', 'misses',
+                               'evictions')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(Cache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__contains__', '__getitem__',
+                            '__setitem__', '__len__', 'get', 'clear',
+                            'statistics')
+
+        for method in required_methods:
+            self.assertIn(method, dir(Cache))
+
+    def test_get(self):
+        """
+        Tests :meth:`colour.utilities.common.Cache.get` method.
+        """
+
+        cache = Cache('Cache')
+        cache['a'] = 1
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('b', 2), 2)
+        self.assertRaises(KeyError, lambda: cache['b'])
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 3)
+
+        with caching_enable(False):
+            self.assertIsNone(cache.get('a'))
+            self.assertNotIn('a', cache)
+
+            cache['c'] = 3
+
+        self.assertNotIn('c', cache)
+
+    def test_maximum_size(self):
+        """
+        Tests :attr:`colour.utilities.common.Cache.maximum_size` property.
+        """
+
+        cache = Cache('Cache', 2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('a')
+        cache['c'] = 3
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(cache.evictions, 1)
+
+        cache.maximum_size = 1
+        self.assertEqual(len(cache), 1)
+        self.assertIn('c', cache)
+        self.assertEqual(cache.evictions, 2)
+
+        cache.maximum_size = None
+        for i in range(10):
+            cache[i] = i
+
+        self.assertEqual(len(cache), 11)
+
+    def test_clear(self):
+        """
+        Tests :meth:`colour.utilities.common.Cache.clear` method.
+        """
+
+        cache = Cache('Cache')
+        cache['a'] = 1
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertDictEqual(
+            cache.statistics(), {
+                'size': 0,
+                'maximum_size': None,
+                'hits': 0,
+                'misses': 0,
+                'evictions': 0
+            })
+
+
+class TestCacheRegistry(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.common.CacheRegistry` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('registry', )
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CacheRegistry))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__str__', 'register_cache',
+                            'unregister_cache', 'clear_cache',
+                            'clear_all_caches', 'statistics')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CacheRegistry))
+
+    def test_register_cache(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.register_cache`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A', 8)
+
+        self.assertIs(cache_registry.register_cache('Cache A'), cache_a)
+        self.assertEqual(cache_a.maximum_size, 8)
+        self.assertListEqual(list(cache_registry.registry), ['Cache A'])
+
+    def test_unregister_cache(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.unregister_cache`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_registry.register_cache('Cache A')
+        cache_registry.unregister_cache('Cache A')
+
+        self.assertDictEqual(dict(cache_registry.registry), {})
+
+    def test_clear_cache(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.clear_cache`
+        and :meth:`colour.utilities.common.CacheRegistry.clear_all_caches`
+        methods.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A')
+        cache_a['Foo'] = 'Bar'
+        cache_b = cache_registry.register_cache('Cache B')
+        cache_b['John'] = 'Doe'
+
+        cache_registry.clear_cache('Cache A')
+        self.assertEqual(len(cache_a), 0)
+        self.assertEqual(len(cache_b), 1)
+
+        cache_registry.clear_all_caches()
+        self.assertEqual(len(cache_b), 0)
+
+    def test_statistics(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.statistics`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A')
+        cache_a['Foo'] = 'Bar'
+        cache_a.get('Foo')
+        cache_a.get('Bar')
+
+        statistics = cache_registry.statistics()['Cache A']
+        self.assertEqual(statistics['size'], 1)
+        self.assertEqual(statistics['hits'], 1)
+        self.assertEqual(statistics['misses'], 1)
+
+
 class TestIsIterable(unittest.TestCase):
     """
     Defines :func:`colour.utilities.common.is_iterable` definition unit tests
@@ -745,5 +1006,58 @@ class TestFromRangeInt(unittest.TestCase):
                 from_range_int(1, dtype=np.float16).dtype, np.float16)
 
 
+class TestLazyModuleAttributes(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.lazy_module_attributes` definition
+    units tests methods.
+    """
+
+    def test_lazy_module_attributes(self):
+        """
+        Tests :func:`colour.utilities.common.lazy_module_attributes`
+        definition.
+        """
+
+        import colour.algebra
+        import colour.notation.datasets
+
+        namespace = {'__name__': 'colour'}
+        __getattr__, __dir__ = lazy_module_attributes(namespace, {
+            'algebra': ['spow', 'LinearInterpolator'],
+            'notation': None,
+        })
+
+        names = ['__name__', 'algebra', 'notation', 'spow']
+        names += ['LinearInterpolator'] + colour.notation.__all__
+        self.assertListEqual(__dir__(), sorted(names))
+
+        self.assertIs(__getattr__('spow'), colour.algebra.spow)
+        self.assertIs(namespace['spow'], colour.algebra.spow)
+        self.assertIs(__getattr__('algebra'), colour.algebra)
+        self.assertIs(
+            __getattr__('MUNSELL_COLOURS_ALL'),
+            colour.notation.datasets.MUNSELL_COLOURS_ALL)
+
+        self.assertRaises(AttributeError, lambda: __getattr__('undefined'))
+        self.assertRaises(AttributeError, lambda: __getattr__('__wrapped__'))
+
+    def test_colour_lazy_attributes(self):
+        """
+        Tests the :mod:`colour` package attributes imported on first access.
+        """
+
+        import colour
+
+        attributes = dir(colour)
+        for attribute in colour.__all__:
+            self.assertIn(attribute, attributes)
+            self.assertIsNotNone(getattr(colour, attribute))
+
+        self.assertIs(colour.XYZ_to_Lab, colour.models.XYZ_to_Lab)
+        self.assertIs(colour.SDS_ILLUMINANTS,
+                      colour.colorimetry.SDS_ILLUMINANTS)
+        self.assertListEqual(dir(colour), attributes)
+
+
 if __name__ == '__main__':
     unittest.main()
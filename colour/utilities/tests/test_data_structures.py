@@ -356,7 +356,8 @@ LazyCaseInsensitiveMapping` class unit tests methods.
         Tests presence of required methods.
         """
 
-        required_methods = ('__getitem__', )
+        required_methods = ('__getitem__', 'update', 'is_evaluated', 'copy',
+                            'lower_items')
 
         for method in required_methods:
             self.assertIn(method, dir(LazyCaseInsensitiveMapping))
@@ -377,6 +378,94 @@ LazyCaseInsensitiveMapping.__getitem__` method.
 
         self.assertEqual(mapping['jane'], 'Doe')
 
+        self.assertListEqual(list(mapping), ['John', 'Jane'])
+
+        evaluations = []
+
+        def callable_a():
+            """
+            Returns an object and counts the evaluations.
+            """
+
+            evaluations.append(None)
+
+            return object()
+
+        mapping = LazyCaseInsensitiveMapping(John=callable_a)
+
+        self.assertIs(mapping['John'], mapping['john'])
+        self.assertEqual(len(evaluations), 1)
+
+    def test__setitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.__setitem__` method.
+        """
+
+        mapping = LazyCaseInsensitiveMapping(John=lambda: 'Doe')
+        self.assertEqual(mapping['John'], 'Doe')
+
+        mapping['John'] = lambda: 'Smith'
+        self.assertFalse(mapping.is_evaluated('John'))
+        self.assertEqual(mapping['John'], 'Smith')
+
+    def test_update(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.update` method.
+        """
+
+        mapping_a = LazyCaseInsensitiveMapping(
+            John=lambda: object(), Jane=lambda: object())
+        jane = mapping_a['Jane']
+
+        mapping_b = LazyCaseInsensitiveMapping(mapping_a)
+        self.assertFalse(mapping_a.is_evaluated('John'))
+        self.assertFalse(mapping_b.is_evaluated('John'))
+        self.assertTrue(mapping_b.is_evaluated('Jane'))
+
+        self.assertIs(mapping_b['John'], mapping_a['John'])
+        self.assertIs(mapping_b['Jane'], jane)
+
+    def test_is_evaluated(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.is_evaluated` method.
+        """
+
+        mapping = LazyCaseInsensitiveMapping(John='Doe', Jane=lambda: 'Doe')
+
+        self.assertTrue(mapping.is_evaluated('John'))
+        self.assertFalse(mapping.is_evaluated('jane'))
+
+        mapping['Jane']
+        self.assertTrue(mapping.is_evaluated('jane'))
+
+    def test_copy(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.copy` method.
+        """
+
+        mapping_a = LazyCaseInsensitiveMapping(John=lambda: object())
+        mapping_b = mapping_a.copy()
+
+        self.assertIsInstance(mapping_b, LazyCaseInsensitiveMapping)
+        self.assertIsNot(mapping_a, mapping_b)
+        self.assertIs(mapping_b['John'], mapping_a['John'])
+
+    def test_lower_items(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.lower_items` method.
+        """
+
+        mapping = LazyCaseInsensitiveMapping(John='Doe', Jane=lambda: 'Doe')
+
+        self.assertListEqual(
+            sorted([item for item in mapping.lower_items()]),
+            [('jane', 'Doe'), ('john', 'Doe')])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,28 +1,55 @@
 # -*- coding: utf-8 -*-
 
-from .datasets import *  # noqa
-from . import datasets
-from .macadam_limits import is_within_macadam_limits
-from .mesh import is_within_mesh_volume
-from .pointer_gamut import is_within_pointer_gamut
-from .spectrum import (generate_pulse_waves, XYZ_outer_surface,
-                       is_within_visible_spectrum)
-from .rgb import (RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
-                  RGB_colourspace_volume_coverage_MonteCarlo,
-                  RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
-                  RGB_colourspace_visible_spectrum_coverage_MonteCarlo)
+from colour.utilities import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(), {
+        'datasets':
+            None,
+        'mesh': [
+            'CHUNK_SIZE_VOLUME_INDEX', 'VOLUME_INDEX_METHODS', 'VolumeIndex',
+            'is_within_mesh_volume', 'mesh_volume'
+        ],
+        'macadam_limits': ['is_within_macadam_limits'],
+        'pointer_gamut': ['is_within_pointer_gamut'],
+        'spectrum': [
+            'generate_pulse_waves', 'XYZ_outer_surface',
+            'is_within_visible_spectrum'
+        ],
+        'rgb': [
+            'CHUNK_SIZE_MONTE_CARLO', 'SEQUENCES_MONTE_CARLO',
+            'Estimate_MonteCarlo', 'ratio_MonteCarlo',
+            'RGB_colourspace_limits', 'RGB_colourspace_volume_MonteCarlo',
+            'RGB_colourspace_volume_coverage_MonteCarlo',
+            'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
+            'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+            'RGB_colourspace_volume_Mesh',
+            'RGB_colourspace_volume_intersection_Mesh',
+            'RGB_colourspace_volume_union_Mesh'
+        ]
+    })
+del lazy_module_attributes
+
+from . import datasets  # noqa
 
 __all__ = []
 __all__ += datasets.__all__
 __all__ += ['is_within_macadam_limits']
-__all__ += ['is_within_mesh_volume']
+__all__ += [
+    'CHUNK_SIZE_VOLUME_INDEX', 'VOLUME_INDEX_METHODS', 'VolumeIndex',
+    'is_within_mesh_volume', 'mesh_volume'
+]
 __all__ += ['is_within_pointer_gamut']
 __all__ += [
     'generate_pulse_waves', 'XYZ_outer_surface', 'is_within_visible_spectrum'
 ]
 __all__ += [
-    'RGB_colourspace_limits', 'RGB_colourspace_volume_MonteCarlo',
+    'CHUNK_SIZE_MONTE_CARLO', 'SEQUENCES_MONTE_CARLO', 'Estimate_MonteCarlo',
+    'ratio_MonteCarlo', 'RGB_colourspace_limits',
+    'RGB_colourspace_volume_MonteCarlo',
     'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
+    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+    'RGB_colourspace_volume_Mesh', 'RGB_colourspace_volume_intersection_Mesh',
+    'RGB_colourspace_volume_union_Mesh'
 ]
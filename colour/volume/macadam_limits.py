@@ -6,11 +6,9 @@ Optimal Colour Stimuli - MacAdam Limits
 Defines objects related to *Optimal Colour Stimuli* computations.
 """
 
-import numpy as np
-from scipy.spatial import Delaunay
-
 from colour.models import xyY_to_XYZ
-from colour.volume import OPTIMAL_COLOUR_STIMULI_ILLUMINANTS
+from colour.utilities import CACHE_REGISTRY
+from colour.volume import OPTIMAL_COLOUR_STIMULI_ILLUMINANTS, VolumeIndex
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -21,8 +19,12 @@ __status__ = 'Production'
 
 __all__ = ['is_within_macadam_limits']
 
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = {}
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS = {}
+_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_OPTIMAL_COLOUR_STIMULI_XYZ'.format(__name__))
+_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_VOLUME_INDEXES = (
+    CACHE_REGISTRY.register_cache(
+        '{0}._CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_VOLUME_INDEXES'.format(
+            __name__)))
 
 
 def _XYZ_optimal_colour_stimuli(illuminant):
@@ -88,6 +90,7 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
 
     Examples
     --------
+    >>> import numpy as np
     >>> is_within_macadam_limits(np.array([0.3205, 0.4131, 0.51]), 'A')
     array(True, dtype=bool)
     >>> a = np.array([[0.3205, 0.4131, 0.51],
@@ -97,14 +100,10 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     """
 
     optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant)
-    triangulation = _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS.get(
-        illuminant)
-
-    if triangulation is None:
-        _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS[illuminant] = \
-            triangulation = Delaunay(optimal_colour_stimuli)
+    index = _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_VOLUME_INDEXES.get(illuminant)
 
-    simplex = triangulation.find_simplex(xyY_to_XYZ(xyY), tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    if index is None:
+        _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_VOLUME_INDEXES[illuminant] = \
+            index = VolumeIndex(optimal_colour_stimuli)
 
-    return simplex
+    return index.is_within(xyY_to_XYZ(xyY), tolerance)
@@ -4,10 +4,19 @@ Mesh Volume Computation Helpers
 ===============================
 
 Defines helpers objects related to volume computations.
+
+-   :attr:`colour.volume.CHUNK_SIZE_VOLUME_INDEX`
+-   :attr:`colour.volume.VOLUME_INDEX_METHODS`
+-   :class:`colour.volume.VolumeIndex`
+-   :func:`colour.is_within_mesh_volume`
+-   :func:`colour.volume.mesh_volume`
 """
 
 import numpy as np
-from scipy.spatial import Delaunay
+from scipy.spatial import ConvexHull, Delaunay
+
+from colour.constants import EPSILON
+from colour.utilities import CACHE_REGISTRY, as_float_array, as_int_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -16,7 +25,395 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['is_within_mesh_volume']
+__all__ = [
+    'CHUNK_SIZE_VOLUME_INDEX', 'VOLUME_INDEX_METHODS', 'VolumeIndex',
+    'is_within_mesh_volume', 'mesh_volume'
+]
+
+CHUNK_SIZE_VOLUME_INDEX = 2 ** 20
+"""
+Point to hyperplane distances count computed at once by the
+:class:`colour.volume.VolumeIndex` class, bounding its memory footprint.
+
+CHUNK_SIZE_VOLUME_INDEX : int
+"""
+
+VOLUME_INDEX_METHODS = ('Delaunay', 'Half-Space')
+"""
+Supported :class:`colour.volume.VolumeIndex` class containment test methods.
+
+VOLUME_INDEX_METHODS : tuple
+    **{'Delaunay', 'Half-Space'}**
+"""
+
+_TOLERANCE_VOLUME_INDEX = 100 * EPSILON
+"""
+Default tolerance of the :class:`colour.volume.VolumeIndex` class, matching
+the default tolerance of the :meth:`scipy.spatial.Delaunay.find_simplex`
+method.
+
+_TOLERANCE_VOLUME_INDEX : numeric
+"""
+
+_DIRECTIONS_COUNTS_VOLUME_INDEX = (64, 1024)
+"""
+Directions counts used to select the convex hull facets of the
+:class:`colour.volume.VolumeIndex` class successively culling the points
+outside the volume before the *Delaunay* triangulation search.
+
+_DIRECTIONS_COUNTS_VOLUME_INDEX : tuple
+"""
+
+_CELLS_COUNT_VOLUME_INDEX = 32
+"""
+Cells count per axis of the grid used to sort the points spatially before the
+*Delaunay* triangulation search, so that consecutive points walk from nearby
+simplices.
+
+_CELLS_COUNT_VOLUME_INDEX : int
+"""
+
+_CACHE_VOLUME_INDEXES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_VOLUME_INDEXES'.format(__name__), 32)
+
+
+def _directions_Fibonacci(count):
+    """
+    Returns given count of directions evenly distributed on the unit sphere
+    using a *Fibonacci* lattice.
+
+    Parameters
+    ----------
+    count : int
+        Directions count.
+
+    Returns
+    -------
+    ndarray
+        Directions.
+    """
+
+    i = np.arange(count) + 0.5
+    z = 1 - 2 * i / count
+    r = np.sqrt(1 - z ** 2)
+    phi = np.pi * (3 - np.sqrt(5)) * i
+
+    return np.stack([r * np.cos(phi), r * np.sin(phi), z], axis=-1)
+
+
+class VolumeIndex:
+    """
+    Defines an index of the volume enclosed by the convex hull of given mesh
+    points, built once and answering whether many points are within it.
+
+    The *Half-Space* method tests the points against the planes of the convex
+    hull facets and is best suited to meshes with few facets, e.g. *RGB*
+    colourspaces or *Pointer's Gamut*. The *Delaunay* method searches the
+    *Delaunay* triangulation simplices containing the points and is best
+    suited to meshes with many facets, e.g. the visible spectrum outer
+    surface: the points are first culled with a subset of the convex hull
+    facets, avoiding the costly exhaustive search performed by
+    :meth:`scipy.spatial.Delaunay.find_simplex` method for points outside the
+    triangulation.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume.
+    method : unicode, optional
+        **{'Delaunay', 'Half-Space'}**,
+        Containment test method.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.volume.VolumeIndex.mesh`
+    -   :attr:`~colour.volume.VolumeIndex.method`
+    -   :attr:`~colour.volume.VolumeIndex.equations`
+    -   :attr:`~colour.volume.VolumeIndex.triangulation`
+
+    Methods
+    -------
+    -   :meth:`~colour.volume.VolumeIndex.__init__`
+    -   :meth:`~colour.volume.VolumeIndex.is_within`
+    -   :meth:`~colour.volume.VolumeIndex.distance`
+
+    Notes
+    -----
+    -   The tolerance of the *Delaunay* method is the tolerance of the
+        barycentric coordinates of the points in the simplices, i.e. the
+        tolerance of the :meth:`scipy.spatial.Delaunay.find_simplex` method,
+        while the tolerance of the *Half-Space* method is a distance to the
+        convex hull boundary.
+    -   The :meth:`scipy.spatial.Delaunay.find_simplex` method search depends
+        on the points order, with a non-zero tolerance, the *Delaunay* method
+        may classify the points at about the tolerance from the boundary
+        differently than a single method call on the unsorted points.
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> index = VolumeIndex(mesh)
+    >>> a = np.array([[0.0005, 0.0031, 0.0010],
+    ...               [0.3205, 0.4131, 0.5100]])
+    >>> index.is_within(a)
+    array([ True, False], dtype=bool)
+    >>> index.distance(a)  # doctest: +ELLIPSIS
+    array([-0.4449...,  0.1936...])
+    """
+
+    def __init__(self, mesh, method='Delaunay'):
+        self._mesh = as_float_array(mesh)
+        assert method.lower() in [
+            m.lower() for m in VOLUME_INDEX_METHODS
+        ], ('"{0}" method is invalid, must be one of {1}!'.format(
+            method, VOLUME_INDEX_METHODS))
+
+        self._method = method
+
+        self._equations = None
+        self._equations_culling = None
+        self._triangulation = None
+        self._extent = np.linalg.norm(np.ptp(self._mesh, axis=0))
+
+    @property
+    def mesh(self):
+        """
+        Getter property for the volume points.
+
+        Returns
+        -------
+        ndarray
+            Volume points.
+        """
+
+        return self._mesh
+
+    @property
+    def method(self):
+        """
+        Getter property for the containment test method.
+
+        Returns
+        -------
+        unicode
+            Containment test method.
+        """
+
+        return self._method
+
+    @property
+    def equations(self):
+        """
+        Getter property for the volume convex hull facets hyperplane
+        equations, i.e. the outward unit normals and offsets, computed on
+        first access.
+
+        Returns
+        -------
+        ndarray
+            Convex hull facets hyperplane equations.
+        """
+
+        if self._equations is None:
+            # Coplanar facets share the same hyperplane equation.
+            self._equations = np.unique(
+                np.around(ConvexHull(self._mesh).equations, 12), axis=0)
+
+        return self._equations
+
+    @property
+    def triangulation(self):
+        """
+        Getter property for the volume *Delaunay* triangulation, computed on
+        first access.
+
+        Returns
+        -------
+        Delaunay
+            Volume *Delaunay* triangulation.
+        """
+
+        if self._triangulation is None:
+            self._triangulation = Delaunay(self._mesh)
+
+        return self._triangulation
+
+    def _equations_culling_Delaunay(self):
+        """
+        Returns the successive convex hull facets hyperplanes equations used
+        to cull the points outside the volume with the *Delaunay* method, i.e.
+        the facets supporting the volume along evenly distributed directions.
+
+        Returns
+        -------
+        list
+            Culling hyperplanes equations.
+        """
+
+        if self._equations_culling is None:
+            equations = self.equations
+            self._equations_culling = []
+            for count in _DIRECTIONS_COUNTS_VOLUME_INDEX:
+                if equations.shape[-1] != 4 or len(equations) <= count:
+                    self._equations_culling.append(equations)
+                    break
+
+                directions = _directions_Fibonacci(count)
+                self._equations_culling.append(equations[np.unique(
+                    np.argmax(
+                        np.dot(equations[..., :-1], directions.T), axis=0))])
+
+        return self._equations_culling
+
+    @staticmethod
+    def _distance_hyperplanes(points, equations):
+        """
+        Returns the maximum signed distance of given points to given
+        hyperplanes, computed in chunks.
+
+        Parameters
+        ----------
+        points : ndarray
+            Points of shape (n, dimensions).
+        equations : ndarray
+            Hyperplanes equations.
+
+        Returns
+        -------
+        ndarray
+            Maximum signed distance.
+        """
+
+        normals, offsets = equations[..., :-1].T, equations[..., -1]
+        size = max(CHUNK_SIZE_VOLUME_INDEX // len(equations), 1)
+
+        distance = np.empty(points.shape[0])
+        for i in range(0, points.shape[0], size):
+            chunk = slice(i, i + size)
+            distance[chunk] = np.max(
+                np.dot(points[chunk], normals) + offsets, axis=-1)
+
+        return distance
+
+    def is_within(self, points, tolerance=None):
+        """
+        Returns if given points are within the volume.
+
+        Parameters
+        ----------
+        points : array_like
+            Points to check if they are within the volume.
+        tolerance : numeric, optional
+            Tolerance allowed in the containment test, see the class
+            notes.
+
+        Returns
+        -------
+        ndarray
+            Is within the volume.
+        """
+
+        points = as_float_array(points)
+        shape, dimensions = points.shape[:-1], points.shape[-1]
+        points = np.reshape(points, (-1, dimensions))
+
+        if tolerance is None:
+            tolerance = _TOLERANCE_VOLUME_INDEX
+
+        if self._method.lower() == 'half-space':
+            within = self._distance_hyperplanes(points,
+                                                self.equations) <= tolerance
+        else:
+            # A point whose barycentric coordinates are greater than
+            # "-tolerance" is at most at "dimensions * tolerance" times the
+            # volume extent from any hyperplane. The search also accepts
+            # degenerate simplices with a "sqrt(tolerance)" tolerance, thus
+            # the culling only discards points outside the triangulation: the
+            # points are culled with the hyperplanes supporting the volume
+            # along increasingly many evenly distributed directions, sparing
+            # most of the exhaustive searches. The points are then sorted
+            # spatially, shortening the directed searches.
+            threshold = ((dimensions + 1) * self._extent *
+                         (np.sqrt(tolerance) + _TOLERANCE_VOLUME_INDEX))
+
+            candidates = np.arange(points.shape[0])
+            for equations in self._equations_culling_Delaunay():
+                candidates = candidates[self._distance_hyperplanes(
+                    points[candidates], equations) <= threshold]
+
+            cells = np.floor((points[candidates] - np.min(self._mesh, axis=0))
+                             * _CELLS_COUNT_VOLUME_INDEX / self._extent)
+            candidates = candidates[np.lexsort(cells.T[::-1])]
+
+            within = np.zeros(points.shape[0], dtype=np.bool_)
+            if candidates.size:
+                within[candidates] = self.triangulation.find_simplex(
+                    points[candidates], tol=tolerance) >= 0
+
+        return np.reshape(within, shape)
+
+    def distance(self, points):
+        """
+        Returns the signed distance of given points to the volume boundary,
+        negative within the volume and positive outside of it.
+
+        Parameters
+        ----------
+        points : array_like
+            Points to compute the distance of.
+
+        Returns
+        -------
+        ndarray
+            Signed distance to the volume boundary.
+
+        Notes
+        -----
+        -   The distance is the maximum signed distance to the convex hull
+            facets hyperplanes: it is exact within the volume and a lower
+            bound of the euclidean distance outside of it, exact when the
+            closest boundary point is not on a convex hull edge or vertex.
+        -   The cost is proportional to the convex hull facets count.
+        """
+
+        points = as_float_array(points)
+        shape, dimensions = points.shape[:-1], points.shape[-1]
+
+        return np.reshape(
+            self._distance_hyperplanes(
+                np.reshape(points, (-1, dimensions)), self.equations), shape)
+
+
+def _volume_index(mesh):
+    """
+    Returns the :class:`colour.volume.VolumeIndex` class instance of given
+    mesh and caches it if not existing.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume.
+
+    Returns
+    -------
+    VolumeIndex
+        Volume index.
+    """
+
+    mesh = as_float_array(mesh)
+    key = (mesh.shape, mesh.tobytes())
+
+    index = _CACHE_VOLUME_INDEXES.get(key)
+    if index is None:
+        _CACHE_VOLUME_INDEXES[key] = index = VolumeIndex(mesh)
+
+    return index
 
 
 def is_within_mesh_volume(points, mesh, tolerance=None):
@@ -24,6 +421,9 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     Returns if given points are within given mesh volume using Delaunay
     triangulation.
 
+    The :class:`colour.volume.VolumeIndex` class instance of the mesh is
+    cached, repeated calls with the same mesh do not triangulate it again.
+
     Parameters
     ----------
     points : array_like
@@ -55,9 +455,49 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    triangulation = Delaunay(mesh)
+    return _volume_index(mesh).is_within(points, tolerance)
+
+
+def mesh_volume(vertices, faces):
+    """
+    Returns the volume enclosed by given closed triangular mesh using the
+    divergence theorem.
+
+    Parameters
+    ----------
+    vertices : array_like
+        Vertices of the mesh.
+    faces : array_like
+        Indices of the vertices of the triangular faces of the mesh, the faces
+        must be consistently oriented.
+
+    Returns
+    -------
+    numeric
+        Volume enclosed by the mesh, positive if the faces are oriented
+        outwards and negative otherwise.
+
+    Examples
+    --------
+    >>> vertices = np.array(
+    ...     [[0.0, 0.0, 0.0],
+    ...      [1.0, 0.0, 0.0],
+    ...      [0.0, 1.0, 0.0],
+    ...      [0.0, 0.0, 1.0]]
+    ... )
+    >>> faces = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+    >>> mesh_volume(vertices, faces)  # doctest: +ELLIPSIS
+    0.1666666...
+    """
+
+    vertices = as_float_array(vertices)
+    faces = as_int_array(faces)
 
-    simplex = triangulation.find_simplex(points, tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    # The signed volumes of the tetrahedra formed by the faces and the mesh
+    # centroid are summed, using the centroid as apex reduces the
+    # cancellation errors.
+    vertices = vertices - np.mean(vertices, axis=0)
 
-    return simplex
+    return np.einsum(
+        'ij,ij->', vertices[faces[..., 0]],
+        np.cross(vertices[faces[..., 1]], vertices[faces[..., 2]])) / 6
@@ -10,18 +10,29 @@ Defines various RGB colourspace volume computation objects:
 -   :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
+-   :class:`colour.volume.Estimate_MonteCarlo`
+-   :func:`colour.volume.ratio_MonteCarlo`
+-   :func:`colour.volume.RGB_colourspace_volume_Mesh`
+-   :func:`colour.volume.RGB_colourspace_volume_intersection_Mesh`
+-   :func:`colour.volume.RGB_colourspace_volume_union_Mesh`
 """
 
 import itertools
-import multiprocessing
 import numpy as np
+from collections import namedtuple
+from scipy.special import ndtri
 
-from colour.algebra import random_triplet_generator
+from colour.algebra import (halton_triplet_generator, random_triplet_generator,
+                            sobol_triplet_generator)
 from colour.colorimetry import CCS_ILLUMINANTS
 from colour.constants import DEFAULT_INT_DTYPE
+from colour.geometry import primitive_cube
 from colour.models import (Lab_to_XYZ, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_RGB)
-from colour.volume import is_within_pointer_gamut, is_within_visible_spectrum
-from colour.utilities import as_float_array, multiprocessing_pool
+from colour.volume import (is_within_pointer_gamut, is_within_visible_spectrum,
+                           mesh_volume)
+from colour.utilities import (CACHE_REGISTRY, CaseInsensitiveMapping,
+                              as_float_array, as_int_array,
+                              ignore_numpy_errors)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -31,32 +42,181 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'sample_RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_limits',
-    'RGB_colourspace_volume_MonteCarlo',
+    'CHUNK_SIZE_MONTE_CARLO', 'SEQUENCES_MONTE_CARLO', 'Estimate_MonteCarlo',
+    'ratio_MonteCarlo', 'sample_RGB_colourspace_volume_MonteCarlo',
+    'RGB_colourspace_limits', 'RGB_colourspace_volume_MonteCarlo',
     'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
+    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+    'RGB_colourspace_volume_Mesh', 'RGB_colourspace_volume_intersection_Mesh',
+    'RGB_colourspace_volume_union_Mesh'
 ]
 
+CHUNK_SIZE_MONTE_CARLO = 2 ** 16
+"""
+Samples count processed at once by the *Monte Carlo* method.
+
+CHUNK_SIZE_MONTE_CARLO : int
+"""
+
+SEQUENCES_MONTE_CARLO = CaseInsensitiveMapping({
+    'Halton': halton_triplet_generator,
+    'Sobol': sobol_triplet_generator,
+})
+SEQUENCES_MONTE_CARLO.__doc__ = """
+Supported low-discrepancy sequences for the *Monte Carlo* method, the
+*Random* sequence uses the random triplet generator given to the computation
+definitions.
+
+SEQUENCES_MONTE_CARLO : CaseInsensitiveMapping
+    **{'Halton', 'Sobol'}**
+"""
+
+_EPSILON_RGB_MESH = 1e-7
+"""
+Tolerance of the *RGB* colourspace cube containment test of the mesh based
+computations.
 
-def _wrapper_RGB_colourspace_volume_MonteCarlo(arguments):
+_EPSILON_RGB_MESH : numeric
+"""
+
+_CACHE_TESSELLATIONS_RGB_CUBE = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TESSELLATIONS_RGB_CUBE'.format(__name__))
+
+
+class Estimate_MonteCarlo(
+        namedtuple('Estimate_MonteCarlo',
+                   ('value', 'standard_error', 'samples'))):
     """
-    Convenient wrapper to be able to call
-    :func:`colour.volume.rgb.sample_RGB_colourspace_volume_MonteCarlo`:
-    definition with multiple arguments.
+    Defines a *Monte Carlo* method estimate.
 
     Parameters
     ----------
-    arguments : array_like, optional
-        Arguments.
+    value : numeric
+        Estimated value.
+    standard_error : numeric
+        Standard error of the estimated value.
+    samples : int
+        Samples count used to compute the estimate.
+    """
+
+
+def ratio_MonteCarlo(count_within,
+                     limits=np.array([[0, 1], [0, 1], [0, 1]]),
+                     samples=10e6,
+                     chunk_size=CHUNK_SIZE_MONTE_CARLO,
+                     sequence='Random',
+                     random_generator=random_triplet_generator,
+                     random_state=None,
+                     confidence_interval=None,
+                     confidence_level=0.95):
+    """
+    Estimates a ratio of samples using *Monte Carlo* method by streaming
+    fixed-size chunks of samples within given limits to given counting
+    definition.
+
+    The estimate is the ratio of the counts of samples within the volume of
+    interest to the counts of samples considered, its standard error is the
+    binomial proportion standard error. The computation stops either once the
+    samples count is reached or once the confidence interval of the estimate
+    at given confidence level is narrower than given confidence interval.
+
+    Parameters
+    ----------
+    count_within : callable
+        Definition receiving a chunk of samples and returning the count of
+        samples within the volume of interest and the count of samples
+        considered, e.g. the chunk size.
+    limits : array_like, optional
+        Samples limits on each axis.
+    samples : numeric, optional
+        Maximum samples count.
+    chunk_size : int, optional
+        Samples count processed at once.
+    sequence : unicode, optional
+        **{'Random', 'Halton', 'Sobol'}**,
+        Samples sequence, *Random* uses given random triplet generator.
+    random_generator : generator, optional
+        Random triplet generator providing the random samples.
+    random_state : RandomState, optional
+        Mersenne Twister pseudo-random number generator to use in the random
+        number generator.
+    confidence_interval : numeric, optional
+        Half-width of the confidence interval of the ratio at which the
+        computation stops, the whole samples count is used if omitted.
+    confidence_level : numeric, optional
+        Confidence level of the confidence interval.
 
     Returns
     -------
-    integer
-        Inside *RGB* colourspace volume samples count.
+    Estimate_MonteCarlo
+        Ratio estimate.
+
+    Notes
+    -----
+    -   The binomial proportion standard error is a conservative estimate of
+        the error of the low-discrepancy sequences.
+
+    Examples
+    --------
+    >>> def count_within(XYZ):
+    ...     return np.sum(np.sum(XYZ ** 2, axis=-1) <= 1), len(XYZ)
+    >>> ratio_MonteCarlo(
+    ...     count_within, samples=10e3, sequence='Sobol')
+    ... # doctest: +ELLIPSIS
+    Estimate_MonteCarlo(value=0.5228..., standard_error=0.0049947..., \
+samples=10000)
+    """
+
+    random_state = (random_state
+                    if random_state is not None else np.random.RandomState())
+    samples = DEFAULT_INT_DTYPE(samples)
+    chunk_size = DEFAULT_INT_DTYPE(chunk_size)
+
+    z = None
+    if confidence_interval is not None:
+        z = ndtri((1 + confidence_level) / 2)
+
+    count, within = 0, 0
+    processed = 0
+    ratio = standard_error = np.nan
+    while processed < samples:
+        size = min(chunk_size, samples - processed)
+
+        if sequence.lower() == 'random':
+            points = random_generator(
+                size, limits=limits, random_state=random_state)
+        else:
+            points = SEQUENCES_MONTE_CARLO[sequence](
+                size, limits=limits, offset=processed)
+
+        within_c, count_c = count_within(points)
+        within += within_c
+        count += count_c
+        processed += size
+
+        if count == 0:
+            continue
+
+        ratio = within / count
+        standard_error = np.sqrt(ratio * (1 - ratio) / count)
+
+        if (z is not None and 0 < within < count and
+                z * standard_error <= confidence_interval):
+            break
+
+    return Estimate_MonteCarlo(ratio, standard_error, processed)
+
+
+def _count_within_RGB_colourspace(RGB):
+    """
+    Returns the count of given *RGB* colourspace array values within the
+    *RGB* colourspace volume.
     """
 
-    return sample_RGB_colourspace_volume_MonteCarlo(*arguments)
+    return np.sum(
+        np.logical_and(np.min(RGB, axis=-1) >= 0,
+                       np.max(RGB, axis=-1) <= 1))
 
 
 def sample_RGB_colourspace_volume_MonteCarlo(
@@ -186,10 +346,19 @@ def RGB_colourspace_volume_MonteCarlo(
             'D65'],
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=CHUNK_SIZE_MONTE_CARLO,
+        sequence='Random',
+        confidence_interval=None,
+        confidence_level=0.95,
+        additional_data=False):
     """
     Performs given *RGB* colourspace volume computation using *Monte Carlo*
-    method and multiprocessing.
+    method.
+
+    The *CIE L\\*a\\*b\\** colourspace volume samples are streamed in
+    fixed-size chunks so that the memory usage does not depend on the samples
+    count.
 
     Parameters
     ----------
@@ -212,10 +381,23 @@ def RGB_colourspace_volume_MonteCarlo(
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : int, optional
+        Samples count processed at once.
+    sequence : unicode, optional
+        **{'Random', 'Halton', 'Sobol'}**,
+        Samples sequence, *Random* uses given random triplet generator.
+    confidence_interval : numeric, optional
+        Half-width of the confidence interval of the volume at which the
+        computation stops, the whole samples count is used if omitted.
+    confidence_level : numeric, optional
+        Confidence level of the confidence interval.
+    additional_data : bool, optional
+        Whether to output the standard error and samples count of the
+        estimate.
 
     Returns
     -------
-    float
+    float or Estimate_MonteCarlo
         *RGB* colourspace volume.
 
     Notes
@@ -232,27 +414,44 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     Examples
     --------
     >>> from colour.models import RGB_COLOURSPACE_sRGB as sRGB
-    >>> from colour.utilities import disable_multiprocessing
     >>> prng = np.random.RandomState(2)
-    >>> with disable_multiprocessing():
-    ...     RGB_colourspace_volume_MonteCarlo(sRGB, 10e3, random_state=prng)
+    >>> RGB_colourspace_volume_MonteCarlo(sRGB, 10e3, random_state=prng)
     ... # doctest: +ELLIPSIS
     8...
+    >>> RGB_colourspace_volume_MonteCarlo(
+    ...     sRGB, 10e6, sequence='Sobol', confidence_interval=10000,
+    ...     additional_data=True)  # doctest: +ELLIPSIS
+    Estimate_MonteCarlo(value=8..., standard_error=..., samples=...)
     """
 
-    processes = multiprocessing.cpu_count()
-    process_samples = DEFAULT_INT_DTYPE(np.round(samples / processes))
+    def count_within(Lab):
+        """
+        Returns the count of given *CIE L\\*a\\*b\\** colourspace samples
+        within the *RGB* colourspace volume.
+        """
 
-    arguments = (colourspace, process_samples, limits, illuminant_Lab,
-                 chromatic_adaptation_method, random_generator, random_state)
+        RGB = XYZ_to_RGB(
+            Lab_to_XYZ(Lab, illuminant_Lab),
+            illuminant_Lab,
+            colourspace.whitepoint,
+            colourspace.matrix_XYZ_to_RGB,
+            chromatic_adaptation_transform=chromatic_adaptation_method)
 
-    with multiprocessing_pool() as pool:
-        results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
-                           [arguments for _ in range(processes)])
+        return _count_within_RGB_colourspace(RGB), len(Lab)
 
     Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
 
-    return Lab_volume * np.sum(results) / (process_samples * processes)
+    estimate = ratio_MonteCarlo(
+        count_within, limits, samples, chunk_size, sequence, random_generator,
+        random_state, None if confidence_interval is None else
+        confidence_interval / Lab_volume, confidence_level)
+
+    if additional_data:
+        return Estimate_MonteCarlo(Lab_volume * estimate.value,
+                                   Lab_volume * estimate.standard_error,
+                                   estimate.samples)
+    else:
+        return Lab_volume * estimate.value
 
 
 def RGB_colourspace_volume_coverage_MonteCarlo(
@@ -260,7 +459,12 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
         coverage_sampler,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=CHUNK_SIZE_MONTE_CARLO,
+        sequence='Random',
+        confidence_interval=None,
+        confidence_level=0.95,
+        additional_data=False):
     """
     Returns given *RGB* colourspace percentage coverage of an arbitrary volume.
 
@@ -277,10 +481,24 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : int, optional
+        Samples count processed at once.
+    sequence : unicode, optional
+        **{'Random', 'Halton', 'Sobol'}**,
+        Samples sequence, *Random* uses given random triplet generator.
+    confidence_interval : numeric, optional
+        Half-width of the confidence interval of the percentage coverage at
+        which the computation stops, the whole samples count is used if
+        omitted.
+    confidence_level : numeric, optional
+        Confidence level of the confidence interval.
+    additional_data : bool, optional
+        Whether to output the standard error and samples count of the
+        estimate.
 
     Returns
     -------
-    float
+    float or Estimate_MonteCarlo
         Percentage coverage of volume.
 
     Examples
@@ -293,29 +511,46 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     81...
     """
 
-    random_state = (random_state
-                    if random_state is not None else np.random.RandomState())
+    def count_within(XYZ):
+        """
+        Returns the count of given *CIE XYZ* tristimulus values samples within
+        both the coverage volume and the *RGB* colourspace volume, and the
+        count of samples within the coverage volume.
+        """
 
-    # TODO: Investigate for generator yielding directly a ndarray.
-    XYZ = as_float_array(
-        list(random_generator(samples, random_state=random_state)))
-    XYZ_vs = XYZ[coverage_sampler(XYZ)]
+        XYZ_vs = XYZ[coverage_sampler(XYZ)]
 
-    RGB = XYZ_to_RGB(XYZ_vs, colourspace.whitepoint, colourspace.whitepoint,
-                     colourspace.matrix_XYZ_to_RGB)
+        RGB = XYZ_to_RGB(XYZ_vs, colourspace.whitepoint,
+                         colourspace.whitepoint, colourspace.matrix_XYZ_to_RGB)
 
-    RGB_c = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0,
-        np.max(RGB, axis=-1) <= 1)]
+        return _count_within_RGB_colourspace(RGB), len(XYZ_vs)
+
+    if confidence_interval is not None:
+        confidence_interval = confidence_interval / 100
 
-    return 100 * RGB_c.size / XYZ_vs.size
+    estimate = ratio_MonteCarlo(count_within, np.array(
+        [[0, 1], [0, 1], [0, 1]]), samples, chunk_size, sequence,
+                                random_generator, random_state,
+                                confidence_interval, confidence_level)
+
+    if additional_data:
+        return Estimate_MonteCarlo(100 * estimate.value,
+                                   100 * estimate.standard_error,
+                                   estimate.samples)
+    else:
+        return 100 * estimate.value
 
 
 def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=CHUNK_SIZE_MONTE_CARLO,
+        sequence='Random',
+        confidence_interval=None,
+        confidence_level=0.95,
+        additional_data=False):
     """
     Returns given *RGB* colourspace percentage coverage of Pointer's Gamut
     volume using *Monte Carlo* method.
@@ -331,10 +566,24 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : int, optional
+        Samples count processed at once.
+    sequence : unicode, optional
+        **{'Random', 'Halton', 'Sobol'}**,
+        Samples sequence, *Random* uses given random triplet generator.
+    confidence_interval : numeric, optional
+        Half-width of the confidence interval of the percentage coverage at
+        which the computation stops, the whole samples count is used if
+        omitted.
+    confidence_level : numeric, optional
+        Confidence level of the confidence interval.
+    additional_data : bool, optional
+        Whether to output the standard error and samples count of the
+        estimate.
 
     Returns
     -------
-    float
+    float or Estimate_MonteCarlo
         Percentage coverage of *Pointer's Gamut* volume.
 
     Examples
@@ -348,14 +597,20 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
 
     return RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace, is_within_pointer_gamut, samples, random_generator,
-        random_state)
+        random_state, chunk_size, sequence, confidence_interval,
+        confidence_level, additional_data)
 
 
 def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=CHUNK_SIZE_MONTE_CARLO,
+        sequence='Random',
+        confidence_interval=None,
+        confidence_level=0.95,
+        additional_data=False):
     """
     Returns given *RGB* colourspace percentage coverage of visible spectrum
     volume using *Monte Carlo* method.
@@ -371,10 +626,24 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : int, optional
+        Samples count processed at once.
+    sequence : unicode, optional
+        **{'Random', 'Halton', 'Sobol'}**,
+        Samples sequence, *Random* uses given random triplet generator.
+    confidence_interval : numeric, optional
+        Half-width of the confidence interval of the percentage coverage at
+        which the computation stops, the whole samples count is used if
+        omitted.
+    confidence_level : numeric, optional
+        Confidence level of the confidence interval.
+    additional_data : bool, optional
+        Whether to output the standard error and samples count of the
+        estimate.
 
     Returns
     -------
-    float
+    float or Estimate_MonteCarlo
         Percentage coverage of visible spectrum volume.
 
     Examples
@@ -388,4 +657,499 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
 
     return RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace, is_within_visible_spectrum, samples, random_generator,
-        random_state)
+        random_state, chunk_size, sequence, confidence_interval,
+        confidence_level, additional_data)
+
+
+def _tessellation_RGB_cube(segments):
+    """
+    Returns the vertices and faces of the tessellated *RGB* colourspace unit
+    cube boundary with given segments count along each edge.
+    """
+
+    vertices_faces = _CACHE_TESSELLATIONS_RGB_CUBE.get(segments)
+    if vertices_faces is not None:
+        return vertices_faces
+
+    vertices, faces, _outline = primitive_cube(
+        width_segments=segments,
+        height_segments=segments,
+        depth_segments=segments)
+
+    vertices_faces = vertices['position'] + 0.5, as_int_array(faces)
+    _CACHE_TESSELLATIONS_RGB_CUBE[segments] = vertices_faces
+
+    return vertices_faces
+
+
+@ignore_numpy_errors
+def _RGB_to_model(RGB, colourspace, model, illuminant,
+                  chromatic_adaptation_method, **kwargs):
+    """
+    Converts given *RGB* colourspace array to given colourspace model.
+    """
+
+    XYZ = RGB_to_XYZ(
+        RGB,
+        colourspace.whitepoint,
+        illuminant,
+        colourspace.matrix_RGB_to_XYZ,
+        chromatic_adaptation_transform=chromatic_adaptation_method)
+
+    if model.lower() == 'cie lab':
+        return XYZ_to_Lab(XYZ, illuminant)
+
+    from colour.graph import convert
+
+    settings = {'illuminant': illuminant}
+    settings.update(kwargs)
+
+    # The black point of some colourspace models, e.g. *CIE L\\*u\\*v\\**,
+    # is undefined and converges to the origin.
+    return np.nan_to_num(convert(XYZ, 'CIE XYZ', model, **settings))
+
+
+@ignore_numpy_errors
+def _model_to_RGB(a, colourspace, model, illuminant,
+                  chromatic_adaptation_method, **kwargs):
+    """
+    Converts given colourspace model array to given *RGB* colourspace.
+
+    The inverse of the *RGB* colourspace normalised primary matrix is used
+    instead of its *CIE XYZ* tristimulus values to *RGB* matrix, which might
+    be rounded, so that the conversion round-trips with
+    :func:`colour.volume.rgb._RGB_to_model` definition.
+    """
+
+    if model.lower() == 'cie lab':
+        XYZ = Lab_to_XYZ(a, illuminant)
+    else:
+        from colour.graph import convert
+
+        settings = {'illuminant': illuminant}
+        settings.update(kwargs)
+
+        XYZ = np.nan_to_num(convert(a, model, 'CIE XYZ', **settings))
+
+    return XYZ_to_RGB(
+        XYZ,
+        illuminant,
+        colourspace.whitepoint,
+        np.linalg.inv(colourspace.matrix_RGB_to_XYZ),
+        chromatic_adaptation_transform=chromatic_adaptation_method)
+
+
+def _clip_polygons_RGB_cube(polygons, epsilon=0):
+    """
+    Clips given convex polygons with the *RGB* colourspace unit cube offset by
+    given epsilon using the *Sutherland-Hodgman* algorithm.
+
+    Parameters
+    ----------
+    polygons : ndarray
+        Polygons vertices of shape (n, k, 3), the polygons with less than
+        :math:`k` vertices repeat their last vertex.
+    epsilon : numeric, optional
+        Offset of the *RGB* colourspace unit cube faces, a positive value
+        expands the cube and a negative value shrinks it.
+
+    Returns
+    -------
+    ndarray
+        Clipped polygons vertices of shape (n, k + 6, 3), the polygons outside
+        the cube are collapsed onto a single vertex.
+    """
+
+    for axis, side in itertools.product(range(3), (0, 1)):
+        if side == 0:
+            distance = polygons[..., axis] + epsilon
+        else:
+            distance = 1 + epsilon - polygons[..., axis]
+
+        polygons_n = np.roll(polygons, -1, axis=1)
+        distance_n = np.roll(distance, -1, axis=1)
+
+        is_inside = distance >= 0
+        is_crossing = is_inside != (distance_n >= 0)
+
+        t = distance / np.where(is_crossing, distance - distance_n, 1)
+        intersections = polygons + t[..., np.newaxis] * (polygons_n - polygons)
+
+        n, k = is_inside.shape
+        candidates = np.reshape(
+            np.stack([polygons, intersections], axis=2), (n, 2 * k, 3))
+        is_valid = np.reshape(
+            np.stack([is_inside, is_crossing], axis=2), (n, 2 * k))
+
+        # A convex polygon clipped by a plane gains one vertex at most, the
+        # valid vertices are compacted and the last one is repeated.
+        order = np.argsort(~is_valid, axis=1, kind='stable')[:, :k + 1]
+        last = np.maximum(np.sum(is_valid, axis=1) - 1, 0)[:, np.newaxis]
+        order = np.take_along_axis(
+            order, np.minimum(np.arange(k + 1), last), axis=1)
+
+        polygons = np.take_along_axis(candidates, order[..., np.newaxis], 1)
+
+    return polygons
+
+
+def _flux_polygons(polygons, origin):
+    """
+    Returns the flux of the position vector relative to given origin through
+    given planar polygons, i.e. the signed volumes of the cones joining the
+    origin to the polygons.
+    """
+
+    polygons = polygons - origin
+
+    return np.einsum('ij,ikj->', polygons[:, 0],
+                     np.cross(polygons[:, 1:-1], polygons[:, 2:])) / 6
+
+
+def _flux_within_RGB_colourspace(a, faces, colourspace_a, colourspace_b,
+                                 origin, epsilon, settings):
+    """
+    Returns the flux through the part of given boundary of the first *RGB*
+    colourspace, converted to the colourspace model, within the second *RGB*
+    colourspace volume.
+    """
+
+    RGB = _model_to_RGB(a, colourspace_b, **settings)
+
+    is_below = RGB < -epsilon
+    is_above = RGB > 1 + epsilon
+
+    is_outside_v = np.any(np.logical_or(is_below, is_above), axis=-1)
+    is_within = ~np.any(is_outside_v[faces], axis=-1)
+    faces_w, faces = faces[is_within], faces[~is_within]
+
+    is_below_f = np.all(is_below[faces], axis=-2)
+    is_above_f = np.all(is_above[faces], axis=-2)
+    is_outside = np.any(np.logical_or(is_below_f, is_above_f), axis=-1)
+    faces = faces[~is_outside]
+
+    flux = _flux_polygons(a[faces_w], origin)
+
+    if faces.size:
+        polygons = _clip_polygons_RGB_cube(RGB[faces], epsilon)
+        flux += _flux_polygons(
+            _RGB_to_model(polygons, colourspace_b, **settings), origin)
+
+    return flux
+
+
+def _volumes_Mesh(colourspace_a, colourspace_b, segments, settings):
+    """
+    Returns the volumes of given *RGB* colourspaces and the volume of their
+    intersection with the *RGB* colourspace cube tessellated with given
+    segments count.
+    """
+
+    vertices, faces = _tessellation_RGB_cube(segments)
+
+    a = _RGB_to_model(vertices, colourspace_a, **settings)
+    b = _RGB_to_model(vertices, colourspace_b, **settings)
+
+    origin = np.mean(a, axis=0)
+    volume_a = mesh_volume(a, faces)
+    volume_b = mesh_volume(b, faces)
+
+    # The intersection boundary is made of the part of each boundary within
+    # the other volume. The faces shared by both boundaries are accounted for
+    # once, with the first boundary, by expanding the second cube and
+    # shrinking the first one.
+    flux_a = _flux_within_RGB_colourspace(a, faces, colourspace_a,
+                                          colourspace_b, origin,
+                                          _EPSILON_RGB_MESH, settings)
+    flux_b = _flux_within_RGB_colourspace(b, faces, colourspace_b,
+                                          colourspace_a, origin,
+                                          -_EPSILON_RGB_MESH, settings)
+    volume_i = np.sign(volume_a) * flux_a + np.sign(volume_b) * flux_b
+
+    return np.abs([volume_a, volume_b, volume_i])
+
+
+def _extrapolate_Mesh(volume, segments, maximum_segments, tolerance):
+    """
+    Extrapolates given volume definition of the *RGB* colourspace cube
+    tessellation segments count by successive subdivisions of the
+    tessellation.
+
+    The tessellation error decreases quadratically with the segments count:
+    the volume is extrapolated from two successive subdivisions with the
+    *Richardson* extrapolation and the difference between two successive
+    extrapolations estimates its error.
+    """
+
+    segments = DEFAULT_INT_DTYPE(segments)
+
+    volume_p, volume_e_p = volume(segments), None
+    while True:
+        segments *= 2
+        volume_c = volume(segments)
+        volume_e = volume_c + (volume_c - volume_p) / 3
+
+        if volume_e_p is not None:
+            error = np.abs(volume_e - volume_e_p)
+            if (np.all(error <= tolerance * np.abs(volume_e)) or
+                    segments >= maximum_segments):
+                return volume_e
+
+        volume_p, volume_e_p = volume_c, volume_e
+
+
+def RGB_colourspace_volume_Mesh(
+        colourspace,
+        model='CIE Lab',
+        tolerance=1e-4,
+        segments=16,
+        maximum_segments=512,
+        illuminant=CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02',
+        **kwargs):
+    """
+    Computes given *RGB* colourspace volume in given colourspace model by
+    integrating over the tessellated boundary of the *RGB* colourspace cube.
+
+    The *RGB* colourspace cube boundary is tessellated with
+    :func:`colour.geometry.primitive_cube` definition, converted to the
+    colourspace model and the enclosed volume is computed with the divergence
+    theorem. The tessellation is subdivided until the extrapolated volume
+    relative error estimate is lower than given tolerance.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    model : unicode, optional
+        **{'CIE Lab', 'CIE XYZ', 'CIE Luv', 'CAM02UCS', 'CAM16UCS', 'DIN99',
+        'Hunter Lab', 'ICtCp', 'IPT', 'JzAzBz', 'OSA UCS', 'Oklab', ...}**,
+        Cartesian colourspace model the volume is computed into, see
+        :attr:`colour.COLOURSPACE_MODELS` attribute for the list of supported
+        colourspace models.
+    tolerance : numeric, optional
+        Relative tolerance of the volume.
+    segments : int, optional
+        Initial segments count along each edge of the *RGB* colourspace cube.
+    maximum_segments : int, optional
+        Maximum segments count along each edge of the *RGB* colourspace cube.
+    illuminant : array_like, optional
+        Colourspace model *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02 Brill 2008',
+        'Bianco 2010', 'Bianco PC 2010'}**,
+        *Chromatic adaptation* method.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Keywords arguments for the conversion to the colourspace model.
+
+    Returns
+    -------
+    float
+        *RGB* colourspace volume.
+
+    Notes
+    -----
+    -   Contrary to :func:`colour.RGB_colourspace_volume_MonteCarlo`
+        definition, the volume is not bounded by the *CIE L\\*a\\*b\\**
+        colourspace limits.
+    -   The *CIE L\\*a\\*b\\** colourspace volume is expressed in the
+        *Reference* domain-range scale as with
+        :func:`colour.RGB_colourspace_volume_MonteCarlo` definition, the
+        other colourspace models are converted with :func:`colour.convert`
+        definition and their volume is expressed in domain-range scale **'1'**.
+
+    Examples
+    --------
+    >>> from colour.models import RGB_COLOURSPACE_sRGB as sRGB
+    >>> RGB_colourspace_volume_Mesh(sRGB)  # doctest: +ELLIPSIS
+    820435...
+    """
+
+    settings = {
+        'model': model,
+        'illuminant': illuminant,
+        'chromatic_adaptation_method': chromatic_adaptation_method,
+    }
+    settings.update(kwargs)
+
+    def volume(segments):
+        """
+        Returns the volume enclosed by the *RGB* colourspace cube tessellated
+        with given segments count.
+        """
+
+        vertices, faces = _tessellation_RGB_cube(segments)
+
+        return abs(
+            mesh_volume(
+                _RGB_to_model(vertices, colourspace, **settings), faces))
+
+    return _extrapolate_Mesh(volume, segments, maximum_segments, tolerance)
+
+
+def RGB_colourspace_volume_intersection_Mesh(
+        colourspace_a,
+        colourspace_b,
+        model='CIE Lab',
+        tolerance=1e-4,
+        segments=16,
+        maximum_segments=512,
+        illuminant=CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02',
+        **kwargs):
+    """
+    Computes the volume of the intersection of given *RGB* colourspaces in
+    given colourspace model by integrating over the parts of their tessellated
+    boundaries within each other.
+
+    The tessellated boundary of each *RGB* colourspace cube is converted to
+    the other *RGB* colourspace and clipped by its cube. The intersection
+    volume is computed with the divergence theorem over the clipped
+    boundaries converted to the colourspace model. The tessellation is
+    subdivided until the extrapolated volume relative error estimate is lower
+    than given tolerance.
+
+    Parameters
+    ----------
+    colourspace_a : RGB_Colourspace
+        First *RGB* colourspace.
+    colourspace_b : RGB_Colourspace
+        Second *RGB* colourspace.
+    model : unicode, optional
+        **{'CIE Lab', 'CIE XYZ', 'CIE Luv', 'CAM02UCS', 'CAM16UCS', 'DIN99',
+        'Hunter Lab', 'ICtCp', 'IPT', 'JzAzBz', 'OSA UCS', 'Oklab', ...}**,
+        Cartesian colourspace model the volume is computed into, see
+        :attr:`colour.COLOURSPACE_MODELS` attribute for the list of supported
+        colourspace models.
+    tolerance : numeric, optional
+        Relative tolerance of the volume.
+    segments : int, optional
+        Initial segments count along each edge of the *RGB* colourspace cube.
+    maximum_segments : int, optional
+        Maximum segments count along each edge of the *RGB* colourspace cube.
+    illuminant : array_like, optional
+        Colourspace model *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02 Brill 2008',
+        'Bianco 2010', 'Bianco PC 2010'}**,
+        *Chromatic adaptation* method.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Keywords arguments for the conversion to the colourspace model.
+
+    Returns
+    -------
+    float
+        *RGB* colourspaces intersection volume.
+
+    Examples
+    --------
+    >>> from colour.models import (
+    ...     RGB_COLOURSPACE_DCI_P3 as DCI_P3, RGB_COLOURSPACE_sRGB as sRGB)
+    >>> RGB_colourspace_volume_intersection_Mesh(sRGB, DCI_P3)
+    ... # doctest: +ELLIPSIS
+    8...
+    """
+
+    settings = {
+        'model': model,
+        'illuminant': illuminant,
+        'chromatic_adaptation_method': chromatic_adaptation_method,
+    }
+    settings.update(kwargs)
+
+    return _extrapolate_Mesh(
+        lambda x: _volumes_Mesh(colourspace_a, colourspace_b, x, settings)[2],
+        segments, maximum_segments, tolerance)
+
+
+def RGB_colourspace_volume_union_Mesh(
+        colourspace_a,
+        colourspace_b,
+        model='CIE Lab',
+        tolerance=1e-4,
+        segments=16,
+        maximum_segments=512,
+        illuminant=CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02',
+        **kwargs):
+    """
+    Computes the volume of the union of given *RGB* colourspaces in given
+    colourspace model.
+
+    The volumes of the *RGB* colourspaces and of their intersection are
+    computed from the same tessellations as with
+    :func:`colour.volume.RGB_colourspace_volume_Mesh` and
+    :func:`colour.volume.RGB_colourspace_volume_intersection_Mesh`
+    definitions.
+
+    Parameters
+    ----------
+    colourspace_a : RGB_Colourspace
+        First *RGB* colourspace.
+    colourspace_b : RGB_Colourspace
+        Second *RGB* colourspace.
+    model : unicode, optional
+        **{'CIE Lab', 'CIE XYZ', 'CIE Luv', 'CAM02UCS', 'CAM16UCS', 'DIN99',
+        'Hunter Lab', 'ICtCp', 'IPT', 'JzAzBz', 'OSA UCS', 'Oklab', ...}**,
+        Cartesian colourspace model the volume is computed into, see
+        :attr:`colour.COLOURSPACE_MODELS` attribute for the list of supported
+        colourspace models.
+    tolerance : numeric, optional
+        Relative tolerance of the volume.
+    segments : int, optional
+        Initial segments count along each edge of the *RGB* colourspace cube.
+    maximum_segments : int, optional
+        Maximum segments count along each edge of the *RGB* colourspace cube.
+    illuminant : array_like, optional
+        Colourspace model *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02 Brill 2008',
+        'Bianco 2010', 'Bianco PC 2010'}**,
+        *Chromatic adaptation* method.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Keywords arguments for the conversion to the colourspace model.
+
+    Returns
+    -------
+    float
+        *RGB* colourspaces union volume.
+
+    Examples
+    --------
+    >>> from colour.models import (
+    ...     RGB_COLOURSPACE_DCI_P3 as DCI_P3, RGB_COLOURSPACE_sRGB as sRGB)
+    >>> RGB_colourspace_volume_union_Mesh(sRGB, DCI_P3)
+    ... # doctest: +ELLIPSIS
+    1...
+    """
+
+    settings = {
+        'model': model,
+        'illuminant': illuminant,
+        'chromatic_adaptation_method': chromatic_adaptation_method,
+    }
+    settings.update(kwargs)
+
+    volume_a, volume_b, volume_i = _extrapolate_Mesh(
+        lambda x: _volumes_Mesh(colourspace_a, colourspace_b, x, settings),
+        segments, maximum_segments, tolerance)
+
+    return volume_a + volume_b - volume_i
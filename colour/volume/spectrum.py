@@ -19,8 +19,8 @@ import numpy as np
 
 from colour.colorimetry import (MSDS_CMFS, msds_to_XYZ, SpectralShape, sd_ones)
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.volume import is_within_mesh_volume
-from colour.utilities import zeros
+from colour.volume import VolumeIndex
+from colour.utilities import CACHE_REGISTRY, zeros
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -42,8 +42,10 @@ interval of 5.
 SPECTRAL_SHAPE_OUTER_SURFACE_XYZ : SpectralShape
 """
 
-_CACHE_OUTER_SURFACE_XYZ = {}
-_CACHE_OUTER_SURFACE_XYZ_POINTS = {}
+_CACHE_OUTER_SURFACE_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_OUTER_SURFACE_XYZ'.format(__name__), 32)
+_CACHE_OUTER_SURFACE_XYZ_VOLUME_INDEXES = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_OUTER_SURFACE_XYZ_VOLUME_INDEXES'.format(__name__), 32)
 
 
 def generate_pulse_waves(bins):
@@ -273,10 +275,10 @@ def is_within_visible_spectrum(
     """
 
     key = (hash(cmfs), hash(illuminant), str(kwargs))
-    vertices = _CACHE_OUTER_SURFACE_XYZ_POINTS.get(key)
+    index = _CACHE_OUTER_SURFACE_XYZ_VOLUME_INDEXES.get(key)
 
-    if vertices is None:
-        _CACHE_OUTER_SURFACE_XYZ_POINTS[key] = vertices = (XYZ_outer_surface(
-            cmfs, illuminant, **kwargs))
+    if index is None:
+        _CACHE_OUTER_SURFACE_XYZ_VOLUME_INDEXES[key] = index = VolumeIndex(
+            XYZ_outer_surface(cmfs, illuminant, **kwargs))
 
-    return is_within_mesh_volume(XYZ, vertices, tolerance)
+    return index.is_within(XYZ, tolerance)
@@ -6,8 +6,10 @@ Defines unit tests for :mod:`colour.volume.mesh` module.
 import numpy as np
 import unittest
 from itertools import permutations
+from scipy.spatial import Delaunay
 
-from colour.volume import is_within_mesh_volume
+from colour.geometry import primitive_cube
+from colour.volume import VolumeIndex, is_within_mesh_volume, mesh_volume
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -17,7 +19,135 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMeshVolume']
+__all__ = ['TestVolumeIndex', 'TestIsWithinMeshVolume', 'TestMeshVolume']
+
+
+class TestVolumeIndex(unittest.TestCase):
+    """
+    Defines :class:`colour.volume.mesh.VolumeIndex` class unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        random_state = np.random.RandomState(4)
+
+        sphere = random_state.normal(size=(2000, 3))
+        self._sphere = sphere / np.linalg.norm(sphere, axis=-1)[..., None]
+        self._points = random_state.uniform(-1.5, 1.5, (5000, 3))
+
+        self._cube = primitive_cube()[0]['position']
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('mesh', 'method', 'equations', 'triangulation')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(VolumeIndex))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'is_within', 'distance')
+
+        for method in required_methods:
+            self.assertIn(method, dir(VolumeIndex))
+
+    def test_is_within(self):
+        """
+        Tests :meth:`colour.volume.mesh.VolumeIndex.is_within` method.
+        """
+
+        within = Delaunay(self._sphere).find_simplex(self._points) >= 0
+
+        np.testing.assert_equal(
+            VolumeIndex(self._sphere).is_within(self._points), within)
+
+        np.testing.assert_equal(
+            VolumeIndex(self._sphere, 'Half-Space').is_within(self._points),
+            within)
+
+        index = VolumeIndex(self._cube, 'Half-Space')
+        np.testing.assert_equal(
+            index.is_within(np.array([[0.5, 0.0, 0.0], [0.51, 0.0, 0.0]])),
+            np.array([True, False]))
+
+        np.testing.assert_equal(
+            index.is_within(
+                np.array([[0.5, 0.0, 0.0], [0.51, 0.0, 0.0]]), 0.02),
+            np.array([True, True]))
+
+    def test_distance(self):
+        """
+        Tests :meth:`colour.volume.mesh.VolumeIndex.distance` method.
+        """
+
+        np.testing.assert_almost_equal(
+            VolumeIndex(self._cube).distance(
+                np.array([
+                    [0.0, 0.0, 0.0],
+                    [0.25, 0.0, 0.1],
+                    [1.0, 0.0, 0.0],
+                    [1.0, 1.0, 0.0],
+                ])),
+            np.array([-0.5, -0.25, 0.5, 0.5]),
+            decimal=7)
+
+        index = VolumeIndex(self._sphere)
+        np.testing.assert_equal(
+            index.distance(self._points) <= 1e-12,
+            index.is_within(self._points))
+
+    def test_n_dimensional_VolumeIndex(self):
+        """
+        Tests :class:`colour.volume.mesh.VolumeIndex` class n-dimensional
+        arrays support.
+        """
+
+        index = VolumeIndex(self._cube)
+
+        a = np.array([0.25, 0.0, 0.1])
+        b = index.is_within(a)
+        c = index.distance(a)
+
+        a = np.tile(a, (6, 1))
+        b = np.tile(b, 6)
+        c = np.tile(c, 6)
+        np.testing.assert_equal(index.is_within(a), b)
+        np.testing.assert_almost_equal(index.distance(a), c, decimal=7)
+
+        a = np.reshape(a, (2, 3, 3))
+        b = np.reshape(b, (2, 3))
+        c = np.reshape(c, (2, 3))
+        np.testing.assert_equal(index.is_within(a), b)
+        np.testing.assert_almost_equal(index.distance(a), c, decimal=7)
+
+    def test_raise_exception_VolumeIndex(self):
+        """
+        Tests :class:`colour.volume.mesh.VolumeIndex` class raised exception.
+        """
+
+        self.assertRaises(AssertionError, VolumeIndex, self._cube, 'Undefined')
+
+    @ignore_numpy_errors
+    def test_nan_VolumeIndex(self):
+        """
+        Tests :class:`colour.volume.mesh.VolumeIndex` class nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        for method in ('Delaunay', 'Half-Space'):
+            index = VolumeIndex(self._cube, method)
+            index.is_within(cases)
+            index.distance(cases)
 
 
 class TestIsWithinMeshVolume(unittest.TestCase):
@@ -90,5 +220,38 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(case, self._mesh)
 
 
+class TestMeshVolume(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.mesh_volume` definition unit tests
+    methods.
+    """
+
+    def test_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.mesh_volume` definition.
+        """
+
+        vertices = np.array([
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+        ])
+        faces = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+
+        self.assertAlmostEqual(mesh_volume(vertices, faces), 1 / 6, places=7)
+
+        self.assertAlmostEqual(
+            mesh_volume(vertices + 10, faces), 1 / 6, places=7)
+
+        self.assertAlmostEqual(
+            mesh_volume(vertices, np.fliplr(faces)), -1 / 6, places=7)
+
+        vertices, faces, _outline = primitive_cube(1, 2, 3, 2, 3, 4)
+
+        self.assertAlmostEqual(
+            mesh_volume(vertices['position'], faces), 6, places=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -23,14 +23,15 @@ import numpy as np
 import unittest
 
 from colour.models import (RGB_COLOURSPACE_ACES2065_1, RGB_COLOURSPACE_BT2020,
-                           RGB_COLOURSPACE_BT709)
+                           RGB_COLOURSPACE_BT709, RGB_COLOURSPACE_DCI_P3)
 from colour.volume import (
-    RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
+    Estimate_MonteCarlo, ratio_MonteCarlo, RGB_colourspace_limits,
+    RGB_colourspace_volume_MonteCarlo,
     RGB_colourspace_volume_coverage_MonteCarlo,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
-    is_within_pointer_gamut)
-from colour.utilities import disable_multiprocessing
+    RGB_colourspace_volume_Mesh, RGB_colourspace_volume_intersection_Mesh,
+    RGB_colourspace_volume_union_Mesh, is_within_pointer_gamut)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -40,13 +41,92 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestRGB_colourspaceLimits', 'TestRGB_colourspaceVolumeMonteCarlo',
+    'TestRatioMonteCarlo', 'TestRGB_colourspaceLimits',
+    'TestRGB_colourspaceVolumeMonteCarlo',
     'TestRGB_colourspace_volume_coverage_MonteCarlo',
     'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
-    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo'
+    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo',
+    'TestRGB_colourspaceVolumeMesh',
+    'TestRGB_colourspaceVolumeIntersectionMesh',
+    'TestRGB_colourspaceVolumeUnionMesh'
 ]
 
 
+def _count_within_unit_sphere(XYZ):
+    """
+    Returns the count of given samples within the unit sphere.
+    """
+
+    return np.sum(np.sum(XYZ ** 2, axis=-1) <= 1), len(XYZ)
+
+
+class TestRatioMonteCarlo(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.ratio_MonteCarlo` definition unit tests
+    methods.
+
+    References
+    ----------
+    :cite:`Laurent2012a`
+    """
+
+    def test_ratio_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.ratio_MonteCarlo` definition.
+        """
+
+        estimate = ratio_MonteCarlo(
+            _count_within_unit_sphere,
+            samples=10e3,
+            random_state=np.random.RandomState(2))
+        self.assertIsInstance(estimate, Estimate_MonteCarlo)
+        self.assertAlmostEqual(estimate.value, 0.5259, places=7)
+        self.assertAlmostEqual(estimate.standard_error, 0.0049933, places=7)
+        self.assertEqual(estimate.samples, 10000)
+
+        estimate = ratio_MonteCarlo(
+            _count_within_unit_sphere, samples=10e3, sequence='Sobol')
+        self.assertAlmostEqual(estimate.value, 0.5228, places=7)
+
+        estimate = ratio_MonteCarlo(
+            _count_within_unit_sphere, samples=10e3, sequence='Halton')
+        self.assertAlmostEqual(estimate.value, 0.5242, places=7)
+
+    def test_chunk_size_ratio_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.ratio_MonteCarlo` definition
+        independence from the chunk size with low-discrepancy sequences.
+        """
+
+        for sequence in ('Halton', 'Sobol'):
+            self.assertEqual(
+                ratio_MonteCarlo(
+                    _count_within_unit_sphere, samples=10e3,
+                    sequence=sequence),
+                ratio_MonteCarlo(
+                    _count_within_unit_sphere,
+                    samples=10e3,
+                    chunk_size=1000,
+                    sequence=sequence))
+
+    def test_confidence_interval_ratio_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.ratio_MonteCarlo` definition
+        confidence interval stopping criterion.
+        """
+
+        estimate = ratio_MonteCarlo(
+            _count_within_unit_sphere,
+            samples=10e6,
+            chunk_size=1024,
+            sequence='Sobol',
+            confidence_interval=0.01)
+
+        self.assertEqual(estimate.samples, 10240)
+        self.assertLessEqual(1.959964 * estimate.standard_error, 0.01)
+        self.assertAlmostEqual(estimate.value, np.pi / 6, places=2)
+
+
 class TestRGB_colourspaceLimits(unittest.TestCase):
     """
     Defines :func:`colour.volume.rgb.RGB_colourspace_limits` definition unit
@@ -96,7 +176,6 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
     :cite:`Laurent2012a`
     """
 
-    @disable_multiprocessing()
     def test_RGB_colourspace_volume_MonteCarlo(self):
         """
         Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
@@ -111,6 +190,16 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
             821700.0 * 1e-6,
             places=1)
 
+        estimate = RGB_colourspace_volume_MonteCarlo(
+            RGB_COLOURSPACE_BT709,
+            10e3,
+            sequence='Sobol',
+            additional_data=True)
+        self.assertAlmostEqual(estimate.value, 818100.0, places=7)
+        self.assertAlmostEqual(
+            estimate.standard_error, 25872.0165236, places=7)
+        self.assertEqual(estimate.samples, 10000)
+
 
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
     """
@@ -190,5 +279,123 @@ RGB_colourspace_visible_spectrum_coverage_MonteCarlo` definition.
             decimal=7)
 
 
+class TestRGB_colourspaceVolumeMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_Mesh` definition
+    unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_Mesh`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_Mesh(
+                RGB_COLOURSPACE_BT709, maximum_segments=64) * 1e-6,
+            820414.47852541 * 1e-6,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_Mesh(
+                RGB_COLOURSPACE_BT2020, maximum_segments=64) * 1e-6,
+            1855006.21809128 * 1e-6,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_Mesh(RGB_COLOURSPACE_BT709, 'CIE XYZ'),
+            np.abs(np.linalg.det(RGB_COLOURSPACE_BT709.matrix_RGB_to_XYZ)),
+            places=5)
+
+        volume = RGB_colourspace_volume_Mesh(
+            RGB_COLOURSPACE_BT709, tolerance=1e-5)
+        self.assertAlmostEqual(
+            volume * 1e-6,
+            RGB_colourspace_volume_MonteCarlo(
+                RGB_COLOURSPACE_BT709, 10e5, sequence='Sobol') * 1e-6,
+            places=2)
+
+
+class TestRGB_colourspaceVolumeIntersectionMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_volume_intersection_Mesh` definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_intersection_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_intersection_Mesh` definition.
+        """
+
+        volume = RGB_colourspace_volume_Mesh(
+            RGB_COLOURSPACE_BT709, maximum_segments=64)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_intersection_Mesh(
+                RGB_COLOURSPACE_BT709,
+                RGB_COLOURSPACE_BT709,
+                maximum_segments=64) / volume,
+            1,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_intersection_Mesh(
+                RGB_COLOURSPACE_BT709,
+                RGB_COLOURSPACE_BT2020,
+                maximum_segments=64) / volume,
+            1,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_intersection_Mesh(
+                RGB_COLOURSPACE_DCI_P3,
+                RGB_COLOURSPACE_BT2020,
+                maximum_segments=64) * 1e-6,
+            1137292.87591381 * 1e-6,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_intersection_Mesh(
+                RGB_COLOURSPACE_BT2020,
+                RGB_COLOURSPACE_DCI_P3,
+                maximum_segments=64) * 1e-6,
+            RGB_colourspace_volume_intersection_Mesh(
+                RGB_COLOURSPACE_DCI_P3,
+                RGB_COLOURSPACE_BT2020,
+                maximum_segments=64) * 1e-6,
+            places=2)
+
+
+class TestRGB_colourspaceVolumeUnionMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_union_Mesh`
+    definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_union_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_union_Mesh`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_union_Mesh(
+                RGB_COLOURSPACE_BT709,
+                RGB_COLOURSPACE_BT2020,
+                maximum_segments=64) * 1e-6,
+            1855006.21809129 * 1e-6,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_union_Mesh(
+                RGB_COLOURSPACE_DCI_P3,
+                RGB_COLOURSPACE_BT709,
+                maximum_segments=64) * 1e-6,
+            1137367.32270197 * 1e-6,
+            places=5)
+
+
 if __name__ == '__main__':
     unittest.main()
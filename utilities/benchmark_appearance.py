@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - Colour Appearance Models
+====================================
+
+Compares the latency of the *CIECAM02* and *CAM16* colour appearance models
+*forward* and *inverse* definitions, i.e. :func:`colour.XYZ_to_CIECAM02`,
+:func:`colour.CIECAM02_to_XYZ`, :func:`colour.XYZ_to_CAM16` and
+:func:`colour.CAM16_to_XYZ`, with the methods of the prepared viewing
+conditions, i.e. :class:`colour.appearance.ViewingConditions_CIECAM02` and
+:class:`colour.appearance.ViewingConditions_CAM16` classes instances, for
+batches of stimuli of increasing size sharing the same viewing conditions, and
+reports the maximum absolute difference of the latter.
+"""
+
+import numpy as np
+import timeit
+
+from colour.appearance import (
+    CAM16_to_XYZ, CIECAM02_to_XYZ, ViewingConditions_CAM16,
+    ViewingConditions_CIECAM02, XYZ_to_CAM16, XYZ_to_CIECAM02)
+from colour.utilities import message_box
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'BATCH_SIZES', 'REPEAT', 'XYZ_W', 'L_A', 'Y_B', 'MODELS', 'benchmark_model'
+]
+
+BATCH_SIZES = (1, 16, 256, 4096, 65536)
+"""
+Stimuli count of the batches.
+
+BATCH_SIZES : tuple
+"""
+
+REPEAT = 5
+"""
+Timings repeat count, the minimum time is reported.
+
+REPEAT : int
+"""
+
+XYZ_W = np.array([95.05, 100.00, 108.88])
+"""
+*CIE XYZ* tristimulus values of reference white.
+
+XYZ_W : ndarray
+"""
+
+L_A = 318.31
+"""
+Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`.
+
+L_A : numeric
+"""
+
+Y_B = 20.0
+"""
+Luminous factor of background :math:`Y_b`.
+
+Y_B : numeric
+"""
+
+MODELS = {
+    'CIECAM02': (XYZ_to_CIECAM02, CIECAM02_to_XYZ, ViewingConditions_CIECAM02),
+    'CAM16': (XYZ_to_CAM16, CAM16_to_XYZ, ViewingConditions_CAM16),
+}
+"""
+Colour appearance models *forward* and *inverse* definitions and prepared
+viewing conditions class.
+
+MODELS : dict
+"""
+
+
+def benchmark_model(forward, inverse, viewing_conditions, XYZ):
+    """
+    Benchmarks given colour appearance model definitions against the methods
+    of given prepared viewing conditions.
+
+    Parameters
+    ----------
+    forward : callable
+        Colour appearance model *forward* definition.
+    inverse : callable
+        Colour appearance model *inverse* definition.
+    viewing_conditions : ViewingConditions_CIECAM02
+        Prepared viewing conditions.
+    XYZ : ndarray
+        *CIE XYZ* tristimulus values of the stimuli.
+
+    Returns
+    -------
+    tuple
+        Time in seconds per batch for the *forward* definition, the prepared
+        *forward* method, the *inverse* definition and the prepared *inverse*
+        method, and maximum absolute difference of the prepared methods.
+    """
+
+    def time(callable_):
+        """
+        Returns the minimum time in seconds of given callable.
+        """
+
+        number = max(1, 4096 // len(XYZ))
+
+        return min(timeit.repeat(callable_, number=number,
+                                 repeat=REPEAT)) / number
+
+    specification = forward(XYZ, XYZ_W, L_A, Y_B)
+
+    t_forward = time(lambda: forward(XYZ, XYZ_W, L_A, Y_B))
+    t_forward_p = time(lambda: viewing_conditions.forward(XYZ))
+    t_inverse = time(lambda: inverse(specification, XYZ_W, L_A, Y_B))
+    t_inverse_p = time(lambda: viewing_conditions.inverse(specification))
+
+    differences = [
+        a - b for a, b in zip(
+            viewing_conditions.forward(XYZ)[:-1], specification[:-1])
+    ]
+    differences.append(
+        viewing_conditions.inverse(specification) -
+        inverse(specification, XYZ_W, L_A, Y_B))
+    error = max(np.nanmax(np.abs(difference)) for difference in differences)
+
+    return t_forward, t_forward_p, t_inverse, t_inverse_p, error
+
+
+if __name__ == '__main__':
+    prng = np.random.RandomState(4)
+
+    for name, (forward, inverse, class_) in MODELS.items():
+        viewing_conditions = class_(XYZ_W, L_A, Y_B)
+
+        message = ('[ {0} ]\n\n'
+                   '{1:<6}  {2:<9} {3:<9} {4:<6} {5:<9} {6:<9} {7:<6} '
+                   '{8}\n'.format(name, 'batch', 'forward', 'prepared', 'gain',
+                                  'inverse', 'prepared', 'gain', 'error'))
+        for batch_size in BATCH_SIZES:
+            XYZ = prng.uniform(0, 100, (batch_size, 3))
+            t_forward, t_forward_p, t_inverse, t_inverse_p, error = (
+                benchmark_model(forward, inverse, viewing_conditions, XYZ))
+
+            message += ('{0:<6}: {1:.2e}s {2:.2e}s {3:>5.1f}x {4:.2e}s '
+                        '{5:.2e}s {6:>5.1f}x {7:.1e}\n'.format(
+                            batch_size, t_forward, t_forward_p,
+                            t_forward / t_forward_p, t_inverse, t_inverse_p,
+                            t_inverse / t_inverse_p, error))
+
+        message_box(message)
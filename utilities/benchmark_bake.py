@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - LUT Baking
+======================
+
+Reports the time to bake a *High Dynamic Range* display transform, i.e. an
+*ACES2065-1* to *ITU-R BT.2100 PQ* conversion, into a *LUT* sequence with
+:func:`colour.io.bake_LUT` definition, the time to apply the baked *LUT*
+sequence compared to the exact conversion and the maximum and mean absolute
+errors of the former, for increasing *LUT* sizes and the supported shapers.
+"""
+
+import numpy as np
+import timeit
+
+from colour.io import bake_LUT
+from colour.models import RGB_COLOURSPACES, RGB_to_RGB, oetf_PQ_BT2100
+from colour.utilities import message_box
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'SIZES', 'SHAPERS', 'REPEAT', 'SAMPLES_COUNT', 'conversion',
+    'benchmark_bake'
+]
+
+SIZES = (17, 33, 65)
+"""
+:class:`colour.LUT3D` class instance sizes.
+
+SIZES : tuple
+"""
+
+SHAPERS = {
+    None: (np.array([[0, 0, 0], [1, 1, 1]]), {}),
+    'Log2': (np.array([[2 ** -12, 2 ** -12, 2 ** -12], [1, 1, 1]]), {}),
+    'ST 2084': (np.array([[0, 0, 0], [1, 1, 1]]), {
+        'L_p': 1
+    }),
+}
+"""
+Shapers of the baked *LUT* sequences with their input domain and arguments.
+
+SHAPERS : dict
+"""
+
+REPEAT = 3
+"""
+Timings repeat count, the minimum time is reported.
+
+REPEAT : int
+"""
+
+SAMPLES_COUNT = 65536
+"""
+Count of the validation samples and of the samples the baked *LUT* sequences
+and the exact conversion are applied onto.
+
+SAMPLES_COUNT : int
+"""
+
+
+def conversion(RGB):
+    """
+    Converts given *ACES2065-1* colourspace array to *ITU-R BT.2100 PQ*
+    encoded values.
+    """
+
+    return oetf_PQ_BT2100(
+        RGB_to_RGB(RGB, RGB_COLOURSPACES['ACES2065-1'],
+                   RGB_COLOURSPACES['ITU-R BT.2020']).clip(0, None))
+
+
+def benchmark_bake(size, shaper):
+    """
+    Benchmarks the baking of the display transform with given *LUT* size and
+    shaper.
+
+    Parameters
+    ----------
+    size : int
+        :class:`colour.LUT3D` class instance size.
+    shaper : unicode
+        Shaper of the baked *LUT* sequence.
+
+    Returns
+    -------
+    tuple
+        Time in seconds to bake the *LUT* sequence, time in seconds to apply
+        the *LUT* sequence and the exact conversion to the samples, maximum
+        and mean absolute errors of the *LUT* sequence.
+    """
+
+    def time(callable_):
+        """
+        Returns the minimum time in seconds of given callable.
+        """
+
+        return min(timeit.repeat(callable_, number=1, repeat=REPEAT))
+
+    domain, shaper_kwargs = SHAPERS[shaper]
+
+    def bake():
+        """
+        Bakes the display transform.
+        """
+
+        return bake_LUT(
+            conversion,
+            size,
+            domain,
+            shaper,
+            shaper_kwargs=shaper_kwargs,
+            validation=SAMPLES_COUNT,
+            additional_data=True)
+
+    specification = bake()
+    RGB = specification.samples
+
+    return (time(bake), time(lambda: specification.LUT.apply(RGB)),
+            time(lambda: conversion(RGB)), specification.error_maximum,
+            specification.error_mean)
+
+
+if __name__ == '__main__':
+    message = ('[ LUT Baking ]\n\n'
+               '{0:<13}  {1:<9} {2:<9} {3:<9} {4:<7} {5}\n'.format(
+                   'shaper / size', 'bake', 'apply', 'exact', 'max', 'mean'))
+    for shaper in SHAPERS:
+        for size in SIZES:
+            t_bake, t_apply, t_exact, error_maximum, error_mean = (
+                benchmark_bake(size, shaper))
+
+            message += ('{0:<9} {1:>3}: {2:.2e}s {3:.2e}s {4:.2e}s {5:.1e} '
+                        '{6:.1e}\n'.format(
+                            str(shaper), size, t_bake, t_apply, t_exact,
+                            error_maximum, error_mean))
+
+    message_box(message)
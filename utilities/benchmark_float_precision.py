@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - Float Precision
+===========================
+
+Compares the computation time and peak memory of models, colour appearance
+models, colour difference and *LUT* definitions applied onto an image with
+*float64* and *float32* precision, i.e. with the
+:func:`colour.utilities.set_float_precision` definition, and reports the
+maximum error of the latter, absolute for the values with a magnitude lower
+than 1 and relative otherwise. The image pixels are the *CIE XYZ* tristimulus
+values of random *sRGB* colourspace values.
+"""
+
+import numpy as np
+import timeit
+import tracemalloc
+
+from colour.appearance import XYZ_to_CAM16, XYZ_to_CIECAM02
+from colour.difference import delta_E_CIE2000
+from colour.io import LUT3D
+from colour.models import (RGB_COLOURSPACE_ACESCG, RGB_COLOURSPACE_sRGB,
+                           RGB_to_RGB, XYZ_to_ICtCp, XYZ_to_Lab, eotf_ST2084)
+from colour.utilities import (message_box, set_float_precision,
+                              suppress_warnings, vector_dot)
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'IMAGE_SHAPE', 'REPEAT', 'XYZ_W', 'LUT', 'DEFINITIONS',
+    'benchmark_definition'
+]
+
+IMAGE_SHAPE = (1080, 1920, 3)
+"""
+Shape of the image the definitions are applied onto.
+
+IMAGE_SHAPE : tuple
+"""
+
+REPEAT = 3
+"""
+Computations count, the minimum time is reported.
+
+REPEAT : int
+"""
+
+XYZ_W = np.array([95.05, 100.00, 108.88])
+"""
+*CIE XYZ* tristimulus values of the reference white of the colour appearance
+models.
+
+XYZ_W : ndarray
+"""
+
+LUT = LUT3D(LUT3D.linear_table(33) ** (1 / 2.2))
+"""
+*LUT* applied onto the image.
+
+LUT : LUT3D
+"""
+
+DEFINITIONS = {
+    'XYZ_to_Lab': XYZ_to_Lab,
+    'XYZ_to_ICtCp': XYZ_to_ICtCp,
+    'RGB_to_RGB': lambda a: RGB_to_RGB(
+        a, RGB_COLOURSPACE_sRGB, RGB_COLOURSPACE_ACESCG,
+        apply_cctf_decoding=True),
+    'eotf_ST2084': eotf_ST2084,
+    'XYZ_to_CIECAM02': lambda a: XYZ_to_CIECAM02(a * 100, XYZ_W, 20, 20).J,
+    'XYZ_to_CAM16': lambda a: XYZ_to_CAM16(a * 100, XYZ_W, 20, 20).J,
+    'delta_E_CIE2000': lambda a: delta_E_CIE2000(a * 100, a[::-1] * 100),
+    'LUT3D.apply': LUT.apply,
+}
+"""
+Definitions applied onto the image.
+
+DEFINITIONS : dict
+"""
+
+
+def benchmark_definition(definition, image):
+    """
+    Benchmarks given definition with *float64* and *float32* precision.
+
+    Parameters
+    ----------
+    definition : callable
+        Definition applied onto the image.
+    image : ndarray
+        Image the definition is applied onto.
+
+    Returns
+    -------
+    tuple
+        Time in seconds and peak memory in bytes with *float64* precision,
+        time in seconds and peak memory in bytes with *float32* precision and
+        maximum error of the latter.
+    """
+
+    outputs, timings, peaks = [], [], []
+    for dtype in (np.float64, np.float32):
+        set_float_precision(dtype)
+        a = image.astype(dtype)
+
+        # The first call computes the cached objects, e.g. the interpolators.
+        definition(a[:1])
+
+        timings.append(
+            min(timeit.repeat(lambda: definition(a), repeat=REPEAT, number=1)))
+
+        tracemalloc.start()
+        outputs.append(definition(a))
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    set_float_precision(np.float64)
+
+    reference, value = outputs
+    finite = np.isfinite(reference) & np.isfinite(value)
+    value, reference = value[finite], reference[finite]
+    error = np.max(
+        np.abs(value - reference) / np.maximum(np.abs(reference), 1))
+
+    return timings[0], peaks[0], timings[1], peaks[1], error
+
+
+if __name__ == '__main__':
+    with suppress_warnings(
+            colour_usage_warnings=True,
+            colour_runtime_warnings=True,
+            python_warnings=True):
+        image = vector_dot(
+            RGB_COLOURSPACE_sRGB.matrix_RGB_to_XYZ,
+            np.random.RandomState(4).uniform(0.05, 0.95, IMAGE_SHAPE))
+
+        message = ('[ {0} Image ]\n\n'
+                   '{1:<16}  {2:<10} {3:<10} {4:<6} {5:<7} {6:<7} '
+                   '{7}\n'.format('x'.join(map(str, IMAGE_SHAPE)),
+                                  'definition', 'float64', 'float32', 'gain',
+                                  'mem. 64', 'mem. 32', 'error'))
+        for name, definition in DEFINITIONS.items():
+            t_64, peak_64, t_32, peak_32, error = benchmark_definition(
+                definition, image)
+
+            message += ('{0:<16}: {1:.3e}s {2:.3e}s {3:>5.2f}x {4:>4.0f}MiB '
+                        '{5:>4.0f}MiB {6:.1e}\n'.format(
+                            name, t_64, t_32, t_64 / t_32, peak_64 / 2 ** 20,
+                            peak_32 / 2 ** 20, error))
+
+        message_box(message)
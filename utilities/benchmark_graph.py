@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - Automatic Colour Conversion Graph
+=============================================
+
+Compares the per-call overhead of :func:`colour.convert` definition with that
+of a compiled :class:`colour.graph.Conversion_Plan` class instance for
+1-pixel and 4K image inputs. The cold compilation time, i.e. the overhead that
+was paid by every :func:`colour.convert` definition call before plans were
+cached, is reported alongside.
+"""
+
+import numpy as np
+import timeit
+
+import colour
+from colour.graph import conversion
+from colour.utilities import message_box, suppress_warnings
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['CONVERSIONS', 'INPUTS', 'benchmark_conversion']
+
+CONVERSIONS = (
+    ('CIE XYZ', 'sRGB'),
+    ('RGB', 'sRGB'),
+    ('CIE XYZ', 'CIE LCHab'),
+    ('Output-Referred RGB', 'CAM16UCS'),
+)
+"""
+Conversions to benchmark.
+
+CONVERSIONS : tuple
+"""
+
+INPUTS = {
+    '1-pixel': (np.array([0.20654008, 0.12197225, 0.05136952]), 10000),
+    '4K image': (np.random.random([2160, 3840, 3]), 2),
+}
+"""
+Inputs to benchmark and their respective number of repetitions.
+
+INPUTS : dict
+"""
+
+
+def benchmark_conversion(source, target, a, number):
+    """
+    Benchmarks the conversion of given array from source to target colour
+    representation.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation.
+    target : unicode
+        Target colour representation.
+    a : ndarray
+        Array to convert.
+    number : int
+        Number of repetitions.
+
+    Returns
+    -------
+    tuple
+        Average time per call in seconds for the cold plan compilation,
+        :func:`colour.convert` definition and
+        :class:`colour.graph.Conversion_Plan` class instance respectively.
+    """
+
+    def compile_cold():
+        conversion._CACHE_CONVERSION_PLANS.clear()
+
+        return colour.compile_conversion(source, target)
+
+    t_compile = timeit.timeit(compile_cold, number=100) / 100
+
+    plan = colour.compile_conversion(source, target)
+
+    t_convert = timeit.timeit(
+        lambda: colour.convert(a, source, target), number=number) / number
+    t_plan = timeit.timeit(lambda: plan(a), number=number) / number
+
+    return t_compile, t_convert, t_plan
+
+
+if __name__ == '__main__':
+    with suppress_warnings(colour_usage_warnings=True):
+        for name, (a, number) in INPUTS.items():
+            lines = []
+            for source, target in CONVERSIONS:
+                t_compile, t_convert, t_plan = benchmark_conversion(
+                    source, target, a, number)
+                lines.append('"{0}" --> "{1}"\n'
+                             '    compile (cold) : {2:.3e}s\n'
+                             '    convert        : {3:.3e}s\n'
+                             '    plan           : {4:.3e}s'.format(
+                                 source, target, t_compile, t_convert, t_plan))
+
+            message_box('[ {0} ]\n\n{1}'.format(name, '\n\n'.join(lines)))
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - Import
+==================
+
+Reports the time to import :mod:`colour` in a new *Python* interpreter, the
+time to import each of its sub-packages, imported on first access of their
+attributes, the time to evaluate the spectral datasets built on first access,
+i.e. stored into :class:`colour.utilities.LazyCaseInsensitiveMapping` class
+instances, and the count of their values evaluated at import time.
+"""
+
+import subprocess
+import sys
+
+from colour.utilities import message_box
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'REPEAT', 'SUBPACKAGES', 'DATASETS', 'STATEMENT_EVALUATE_DATASETS',
+    'benchmark_statement', 'datasets_evaluated'
+]
+
+REPEAT = 5
+"""
+*Python* interpreters count, the minimum time is reported.
+
+REPEAT : int
+"""
+
+SUBPACKAGES = ('adaptation', 'algebra', 'appearance', 'biochemistry',
+               'blindness', 'characterisation', 'colorimetry', 'constants',
+               'continuous', 'contrast', 'corresponding', 'difference',
+               'geometry', 'graph', 'io', 'models', 'notation', 'phenomena',
+               'quality', 'recovery', 'temperature', 'utilities', 'volume')
+"""
+Sub-packages of :mod:`colour` whose import time is reported.
+
+SUBPACKAGES : tuple
+"""
+
+DATASETS = ('colour.SDS_ILLUMINANTS', 'colour.SDS_LIGHT_SOURCES',
+            'colour.MSDS_CMFS', 'colour.SDS_LEFS',
+            'colour.SDS_COLOURCHECKERS["BabelColor Average"]',
+            'colour.SDS_COLOURCHECKERS["ColorChecker N Ohta"]')
+"""
+Spectral datasets built on first access.
+
+DATASETS : tuple
+"""
+
+STATEMENT_EVALUATE_DATASETS = """
+for dataset in {0}:
+    list(eval(dataset).values())
+""".format(DATASETS)
+"""
+Statement evaluating all the spectral datasets values.
+
+STATEMENT_EVALUATE_DATASETS : unicode
+"""
+
+
+def benchmark_statement(statement, setup=''):
+    """
+    Benchmarks given statement in new *Python* interpreters.
+
+    Parameters
+    ----------
+    statement : unicode
+        Statement to benchmark.
+    setup : unicode, optional
+        Statement executed before the benchmarked statement.
+
+    Returns
+    -------
+    numeric
+        Minimum time in seconds of the statement.
+    """
+
+    code = '\n'.join([
+        'import time', setup, 't = time.perf_counter()', statement,
+        'print(time.perf_counter() - t)'
+    ])
+
+    return min(
+        float(subprocess.check_output([sys.executable, '-c', code]))
+        for _ in range(REPEAT))
+
+
+def datasets_evaluated():
+    """
+    Returns the count of values evaluated at import time and the count of
+    values of the spectral datasets.
+
+    Returns
+    -------
+    dict
+        Count of values evaluated at import time and count of values per
+        spectral dataset.
+    """
+
+    code = '\n'.join([
+        'import colour', 'for dataset in {0}:'.format(DATASETS),
+        '    mapping = eval(dataset)',
+        '    evaluated = sum(mapping.is_evaluated(key) for key in mapping)',
+        '    print(dataset, evaluated, len(mapping))'
+    ])
+
+    counts = {}
+    for line in subprocess.check_output([sys.executable, '-c',
+                                         code]).decode().splitlines():
+        dataset, evaluated, count = line.rsplit(None, 2)
+        counts[dataset] = (int(evaluated), int(count))
+
+    return counts
+
+
+if __name__ == '__main__':
+    statement_import_subpackages = '\n'.join(
+        'import colour.{0}'.format(subpackage) for subpackage in SUBPACKAGES)
+
+    t_import = benchmark_statement('import colour')
+    t_subpackages = benchmark_statement(statement_import_subpackages,
+                                        'import colour')
+    t_datasets = benchmark_statement(
+        STATEMENT_EVALUATE_DATASETS,
+        'import colour\n{0}'.format(statement_import_subpackages))
+
+    message = ('[ Import ]\n\n'
+               'import colour             : {0:.3e}s\n'
+               'sub-packages              : {1:.3e}s\n'
+               'datasets (first access)   : {2:.3e}s\n'
+               'import colour (eager)     : {3:.3e}s (estimated)\n\n'
+               'sub-package (after "import colour")\n'.format(
+                   t_import, t_subpackages, t_datasets,
+                   t_import + t_subpackages + t_datasets))
+    for subpackage in SUBPACKAGES:
+        message += '{0:<26}: {1:.3e}s\n'.format(
+            subpackage,
+            benchmark_statement('import colour.{0}'.format(subpackage),
+                                'import colour'))
+
+    message += '\nevaluated at import\n'
+    for dataset, (evaluated, count) in datasets_evaluated().items():
+        message += '{0:<49}: {1} / {2}\n'.format(dataset, evaluated, count)
+
+    message_box(message)
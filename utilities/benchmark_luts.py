@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - LUT Reading and Application
+=======================================
+
+Compares the reading of large 3D *LUT* files line by line, i.e. the fallback
+used when their table cannot be parsed in bulk, with the bulk table parsing
+and the memory-mapped binary sidecar cache.
+
+Compares the application of a 3D *LUT* to an image with the
+:meth:`colour.LUT3D.apply` method and the interpolator returned by the
+:meth:`colour.LUT3D.prepare` method.
+"""
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import timeit
+
+from colour.algebra import (table_interpolation_tetrahedral,
+                            table_interpolation_trilinear)
+from colour.io import (LUT3D, read_LUT_Cinespace, read_LUT_IridasCube,
+                       read_LUT_SonySPI3D, write_LUT_Cinespace,
+                       write_LUT_IridasCube, write_LUT_SonySPI3D)
+from colour.io.luts import common
+from colour.utilities import message_box, suppress_warnings
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'LUT_SIZE', 'LUT_FORMATS', 'IMAGE_SHAPE', 'THREADS',
+    'read_LUT_line_by_line', 'benchmark_read_LUT', 'benchmark_apply_LUT3D'
+]
+
+LUT_SIZE = 65
+"""
+3D *LUT* size.
+
+LUT_SIZE : int
+"""
+
+LUT_FORMATS = {
+    'Iridas Cube': ('.cube', read_LUT_IridasCube, write_LUT_IridasCube),
+    'Sony SPI3D': ('.spi3d', read_LUT_SonySPI3D, write_LUT_SonySPI3D),
+    'Cinespace': ('.csp', read_LUT_Cinespace, write_LUT_Cinespace),
+}
+"""
+*LUT* formats extension, reading and writing definitions.
+
+LUT_FORMATS : dict
+"""
+
+IMAGE_SHAPE = (2160, 3840, 3)
+"""
+Shape of the image the 3D *LUT* is applied onto.
+
+IMAGE_SHAPE : tuple
+"""
+
+THREADS = os.cpu_count()
+"""
+Number of threads applying the prepared 3D *LUT*.
+
+THREADS : int
+"""
+
+
+def read_LUT_line_by_line(read_LUT, path):
+    """
+    Reads given *LUT* file line by line with given *LUT* reading definition by
+    disabling the bulk table parsing.
+
+    Parameters
+    ----------
+    read_LUT : callable
+        *LUT* reading definition.
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT1D or LUT3x1D or LUT3D or LUTSequence
+        *LUT*.
+    """
+
+    parse_table = common.parse_table
+    try:
+        common.parse_table = lambda text, shape: None
+
+        return read_LUT(path)
+    finally:
+        common.parse_table = parse_table
+
+
+def benchmark_read_LUT(directory, extension, read_LUT, write_LUT):
+    """
+    Benchmarks the reading of a 3D *LUT* written in given directory.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory to write the *LUT* files into.
+    extension : unicode
+        *LUT* file extension.
+    read_LUT : callable
+        *LUT* reading definition.
+    write_LUT : callable
+        *LUT* writing definition.
+
+    Returns
+    -------
+    tuple
+        Time in seconds for the line by line reading, the bulk reading, the
+        first cached reading, i.e. writing the cache, and the subsequent
+        cached reading.
+    """
+
+    LUT = LUT3D(size=LUT_SIZE)
+
+    path = os.path.join(directory, 'LUT{0}'.format(extension))
+    write_LUT(LUT, path)
+
+    t_line_by_line = timeit.timeit(
+        lambda: read_LUT_line_by_line(read_LUT, path), number=1)
+    t_bulk = timeit.timeit(lambda: read_LUT(path), number=1)
+    t_cache_cold = timeit.timeit(lambda: read_LUT(path, cache=True), number=1)
+    t_cache_warm = timeit.timeit(lambda: read_LUT(path, cache=True), number=1)
+
+    return t_line_by_line, t_bulk, t_cache_cold, t_cache_warm
+
+
+def benchmark_apply_LUT3D(method='Trilinear'):
+    """
+    Benchmarks the application of a 3D *LUT* to an image using given
+    interpolation method.
+
+    Parameters
+    ----------
+    method : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation method.
+
+    Returns
+    -------
+    tuple
+        Time in seconds for the :meth:`colour.LUT3D.apply` method, the
+        prepared *LUT* preparation, application and threaded application,
+        and maximum absolute difference between the applied images.
+    """
+
+    LUT = LUT3D(LUT3D.linear_table(LUT_SIZE) ** (1 / 2.2))
+    interpolator = {
+        'Trilinear': table_interpolation_trilinear,
+        'Tetrahedral': table_interpolation_tetrahedral,
+    }[method]
+
+    RGB = np.random.RandomState(4).random_sample(IMAGE_SHAPE)
+    RGB_o = np.empty(IMAGE_SHAPE)
+
+    t_apply = timeit.timeit(lambda: LUT.apply(RGB, interpolator), number=1)
+    t_prepare = timeit.timeit(lambda: LUT.prepare(method), number=1)
+
+    apply = LUT.prepare(method)
+    t_prepared = timeit.timeit(lambda: apply(RGB, out=RGB_o), number=1)
+    t_prepared_threaded = timeit.timeit(
+        lambda: apply(RGB, out=RGB_o, threads=THREADS), number=1)
+
+    difference = np.max(np.abs(LUT.apply(RGB, interpolator) - RGB_o))
+
+    return t_apply, t_prepare, t_prepared, t_prepared_threaded, difference
+
+
+if __name__ == '__main__':
+    with suppress_warnings(colour_usage_warnings=True):
+        directory = tempfile.mkdtemp()
+        try:
+            for method, (extension, read_LUT,
+                         write_LUT) in LUT_FORMATS.items():
+                t_line_by_line, t_bulk, t_cache_cold, t_cache_warm = (
+                    benchmark_read_LUT(directory, extension, read_LUT,
+                                       write_LUT))
+
+                message_box('[ {0} - {1}^3 ]\n\n'
+                            'line by line      : {2:.3e}s\n'
+                            'bulk              : {3:.3e}s ({4:.1f}x)\n'
+                            'cache (cold)      : {5:.3e}s\n'
+                            'cache (warm)      : {6:.3e}s ({7:.1f}x)'.format(
+                                method, LUT_SIZE, t_line_by_line, t_bulk,
+                                t_line_by_line / t_bulk, t_cache_cold,
+                                t_cache_warm, t_line_by_line / t_cache_warm))
+        finally:
+            shutil.rmtree(directory)
+
+        for method in ('Trilinear', 'Tetrahedral'):
+            (t_apply, t_prepare, t_prepared, t_prepared_threaded,
+             difference) = benchmark_apply_LUT3D(method)
+
+            message_box(
+                '[ LUT3D - {0} - {1}^3 - {2}x{3} ]\n\n'
+                'apply             : {4:.3e}s\n'
+                'prepare           : {5:.3e}s\n'
+                'prepared          : {6:.3e}s ({7:.1f}x)\n'
+                'prepared threaded : {8:.3e}s ({9:.1f}x, {10} '
+                'threads)\n'
+                'difference        : {11:.3e}'.format(
+                    method, LUT_SIZE, IMAGE_SHAPE[1], IMAGE_SHAPE[0], t_apply,
+                    t_prepare, t_prepared, t_apply / t_prepared,
+                    t_prepared_threaded, t_apply / t_prepared_threaded,
+                    THREADS, difference))
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - Munsell Renotation System
+=====================================
+
+Compares the vectorised :func:`colour.xyY_to_munsell_specification`
+definition with the per-sample scalar path it replaces. The scalar path is
+timed on a subset of the samples and its total time is extrapolated to the
+full samples count.
+"""
+
+import numpy as np
+import timeit
+
+from colour.notation import munsell
+from colour.utilities import message_box, suppress_warnings, tstack
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'SAMPLES_COUNT', 'SAMPLES_COUNT_SCALAR', 'generate_xyY_samples',
+    'benchmark_xyY_to_munsell_specification'
+]
+
+SAMPLES_COUNT = 100000
+"""
+*CIE xyY* colourspace samples count.
+
+SAMPLES_COUNT : int
+"""
+
+SAMPLES_COUNT_SCALAR = 1000
+"""
+*CIE xyY* colourspace samples count for the scalar path.
+
+SAMPLES_COUNT_SCALAR : int
+"""
+
+
+def generate_xyY_samples(count, seed=4):
+    """
+    Generates *CIE xyY* colourspace samples from random valid *Munsell*
+    *Colorlab* specifications.
+
+    Parameters
+    ----------
+    count : int
+        Samples count.
+    seed : int, optional
+        Random generator seed.
+
+    Returns
+    -------
+    ndarray
+        *CIE xyY* colourspace samples.
+    """
+
+    random_state = np.random.RandomState(seed)
+
+    hue = random_state.uniform(0, 10, count)
+    value = random_state.uniform(1, 9.5, count)
+    code = random_state.randint(1, 11, count).astype(np.float_)
+
+    # The chromas are scaled to stay within the renotation data.
+    chroma = random_state.uniform(0, 1, count) * (
+        munsell._maximum_chroma_from_renotation_vectorised(hue, value, code))
+
+    xyY = tstack(
+        munsell._munsell_specification_to_xyY_vectorised(
+            hue, value, chroma, code))
+
+    # Only the samples that can be converted back are retained.
+    xyY = xyY[~munsell._xyY_to_munsell_specification_vectorised(xyY)[1]]
+
+    return np.resize(xyY, (count, 3))
+
+
+def benchmark_xyY_to_munsell_specification(xyY, xyY_scalar):
+    """
+    Benchmarks the conversion of given *CIE xyY* colourspace samples to
+    *Munsell* *Colorlab* specification.
+
+    Parameters
+    ----------
+    xyY : ndarray
+        *CIE xyY* colourspace samples for the vectorised path.
+    xyY_scalar : ndarray
+        *CIE xyY* colourspace samples for the scalar path.
+
+    Returns
+    -------
+    tuple
+        Time in seconds for the vectorised path, time in seconds for the
+        scalar path and its extrapolation to the vectorised path samples
+        count.
+    """
+
+    t_vectorised = timeit.timeit(
+        lambda: munsell.xyY_to_munsell_specification(xyY), number=1)
+
+    t_scalar = timeit.timeit(
+        lambda: [munsell._xyY_to_munsell_specification(a) for a in xyY_scalar],
+        number=1)
+
+    return t_vectorised, t_scalar, t_scalar * len(xyY) / len(xyY_scalar)
+
+
+if __name__ == '__main__':
+    with suppress_warnings(colour_usage_warnings=True):
+        xyY = generate_xyY_samples(SAMPLES_COUNT)
+        xyY_scalar = xyY[:SAMPLES_COUNT_SCALAR]
+
+        t_vectorised, t_scalar, t_scalar_extrapolated = (
+            benchmark_xyY_to_munsell_specification(xyY, xyY_scalar))
+
+        specification = munsell.xyY_to_munsell_specification(xyY_scalar)
+        specification_scalar = np.array(
+            [munsell._xyY_to_munsell_specification(a) for a in xyY_scalar])
+
+        message_box(
+            '[ xyY_to_munsell_specification ]\n\n'
+            'samples (vectorised)        : {0}\n'
+            'samples (scalar)            : {1}\n\n'
+            'vectorised                  : {2:.3e}s\n'
+            'scalar                      : {3:.3e}s\n'
+            'scalar (extrapolated)       : {4:.3e}s\n'
+            'speedup                     : {5:.1f}x\n'
+            'maximum absolute difference : {6:.3e}'.format(
+                SAMPLES_COUNT, SAMPLES_COUNT_SCALAR, t_vectorised, t_scalar,
+                t_scalar_extrapolated, t_scalar_extrapolated / t_vectorised,
+                np.nanmax(np.abs(specification - specification_scalar))))
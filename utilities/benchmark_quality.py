@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - Colour Quality
+==========================
+
+Compares the *CIE 2017 Colour Fidelity Index* (CFI),
+*ANSI/IES TM-30-18 Colour Fidelity Index* (CFI), *Colour Rendering Index*
+(CRI) and *Colour Quality Scale* (CQS) computations of many test spectral
+distributions processed one at a time, e.g. with the
+:func:`colour.quality.colour_fidelity_index_CIE2017` definition, and at once,
+e.g. with the :func:`colour.quality.msds_colour_fidelity_index_CIE2017`
+definition. The per-spectral distribution computation is timed on a subset of
+the test spectral distributions and its total time is extrapolated to the
+full test spectral distributions count.
+"""
+
+import numpy as np
+import timeit
+
+from colour.colorimetry import SpectralDistribution, SpectralShape
+from colour.quality import (
+    colour_fidelity_index_ANSIIESTM3018, colour_fidelity_index_CIE2017,
+    colour_quality_scale, colour_rendering_index,
+    msds_colour_fidelity_index_ANSIIESTM3018,
+    msds_colour_fidelity_index_CIE2017, msds_colour_quality_scale,
+    msds_colour_rendering_index)
+from colour.utilities import message_box, suppress_warnings
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'SPECTRAL_SHAPE', 'SDS_COUNT', 'SDS_COUNT_PER_SD', 'METHODS',
+    'sds_LED_mixture', 'benchmark_colour_quality'
+]
+
+SPECTRAL_SHAPE = SpectralShape(380, 780, 5)
+"""
+Spectral shape of the test spectral distributions.
+
+SPECTRAL_SHAPE : SpectralShape
+"""
+
+SDS_COUNT = 10000
+"""
+Test spectral distributions count.
+
+SDS_COUNT : int
+"""
+
+SDS_COUNT_PER_SD = 10
+"""
+Test spectral distributions count for the per-spectral distribution
+computation.
+
+SDS_COUNT_PER_SD : int
+"""
+
+METHODS = {
+    'CIE 2017': (colour_fidelity_index_CIE2017,
+                 msds_colour_fidelity_index_CIE2017),
+    'ANSI/IES TM-30-18': (colour_fidelity_index_ANSIIESTM3018,
+                          msds_colour_fidelity_index_ANSIIESTM3018),
+    'CRI': (colour_rendering_index, msds_colour_rendering_index),
+    'CQS': (colour_quality_scale, msds_colour_quality_scale),
+}
+"""
+Colour quality per-spectral distribution and batched computation
+definitions.
+
+METHODS : dict
+"""
+
+
+def sds_LED_mixture(count, shape=SPECTRAL_SHAPE):
+    """
+    Returns random test spectral distributions mixing three gaussian *LED*
+    emission peaks over a small constant background.
+
+    Parameters
+    ----------
+    count : int
+        Test spectral distributions count.
+    shape : SpectralShape, optional
+        Spectral shape of the test spectral distributions.
+
+    Returns
+    -------
+    ndarray
+        Test spectral distributions values, the wavelengths are in the last
+        axis.
+    """
+
+    random_state = np.random.RandomState(4)
+
+    wavelengths = shape.range()
+    peaks = random_state.uniform(420, 660, (count, 3, 1))
+    weights = random_state.uniform(0.2, 1, (count, 3, 1))
+
+    gaussians = np.exp(-0.5 * ((wavelengths - peaks) / 15) ** 2)
+
+    return np.sum(weights * gaussians, axis=1) + 0.05
+
+
+def benchmark_colour_quality(method, values, values_per_sd):
+    """
+    Benchmarks the colour quality computation of given test spectral
+    distributions values using given method.
+
+    Parameters
+    ----------
+    method : unicode
+        **{'CIE 2017', 'ANSI/IES TM-30-18', 'CRI', 'CQS'}**,
+        Computation method.
+    values : ndarray
+        Test spectral distributions values for the batched computation.
+    values_per_sd : ndarray
+        Test spectral distributions values for the per-spectral distribution
+        computation.
+
+    Returns
+    -------
+    tuple
+        Time in seconds for the batched computation, time in seconds for the
+        per-spectral distribution computation and its extrapolation to the
+        batched computation test spectral distributions count, and maximum
+        absolute difference between the indexes of both computations.
+    """
+
+    colour_quality, msds_colour_quality = METHODS[method]
+
+    sds = [
+        SpectralDistribution(value, SPECTRAL_SHAPE.range())
+        for value in values_per_sd
+    ]
+
+    t_batched = timeit.timeit(
+        lambda: msds_colour_quality(values, True, shape=SPECTRAL_SHAPE),
+        number=1)
+    t_per_sd = timeit.timeit(
+        lambda: [colour_quality(sd, True) for sd in sds], number=1)
+
+    difference = np.nanmax(
+        np.abs(
+            msds_colour_quality(values_per_sd, shape=SPECTRAL_SHAPE) -
+            [colour_quality(sd) for sd in sds]))
+
+    return (t_batched, t_per_sd, t_per_sd * len(values) / len(values_per_sd),
+            difference)
+
+
+if __name__ == '__main__':
+    with suppress_warnings(
+            colour_usage_warnings=True, colour_runtime_warnings=True):
+        values = sds_LED_mixture(SDS_COUNT)
+        values_per_sd = values[:SDS_COUNT_PER_SD]
+
+        for method in METHODS:
+            t_batched, t_per_sd, t_per_sd_extrapolated, difference = (
+                benchmark_colour_quality(method, values, values_per_sd))
+
+            message_box('[ {0} ]\n\n'
+                        'spectral distributions (batched) : {1}\n'
+                        'spectral distributions (per-sd)  : {2}\n\n'
+                        'batched                          : {3:.3e}s\n'
+                        'per-sd                           : {4:.3e}s\n'
+                        'per-sd (extrapolated)            : {5:.3e}s\n'
+                        'speedup                          : {6:.1f}x\n'
+                        'maximum absolute difference      : {7:.3e}'.format(
+                            method, SDS_COUNT, SDS_COUNT_PER_SD, t_batched,
+                            t_per_sd, t_per_sd_extrapolated,
+                            t_per_sd_extrapolated / t_batched, difference))
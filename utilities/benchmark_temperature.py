@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - Correlated Colour Temperature
+=========================================
+
+Compares the vectorised :func:`colour.temperature.uv_to_CCT_Ohno2013`
+definition with a per-sample computation building every planckian table with
+a :func:`colour.sd_blackbody` and :func:`colour.sd_to_XYZ` definitions call
+per temperature. The per-sample computation is timed on a subset of the
+samples and its total time is extrapolated to the full samples count.
+"""
+
+import numpy as np
+import timeit
+
+from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
+                                MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody,
+                                sd_to_XYZ)
+from colour.models import UCS_to_uv, XYZ_to_UCS
+from colour.temperature import ohno2013
+from colour.utilities import message_box, suppress_warnings
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'SAMPLES_COUNT', 'SAMPLES_COUNT_PER_SAMPLE', 'CMFS',
+    'uv_to_CCT_Ohno2013_per_sample', 'benchmark_uv_to_CCT_Ohno2013'
+]
+
+SAMPLES_COUNT = 100000
+"""
+*CIE UCS* colourspace *uv* chromaticity coordinates samples count.
+
+SAMPLES_COUNT : int
+"""
+
+SAMPLES_COUNT_PER_SAMPLE = 20
+"""
+*CIE UCS* colourspace *uv* chromaticity coordinates samples count for the
+per-sample computation.
+
+SAMPLES_COUNT_PER_SAMPLE : int
+"""
+
+CMFS = MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+"""
+Standard observer colour matching functions.
+
+CMFS : XYZ_ColourMatchingFunctions
+"""
+
+
+def uv_to_CCT_Ohno2013_per_sample(uv, cmfs=CMFS):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
+    coordinates by computing the *Ohno (2013)* cascade expansion sample per
+    sample and the planckian tables temperature per temperature.
+
+    Parameters
+    ----------
+    uv : array_like
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray
+        Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
+    """
+
+    cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
+
+    CCT_D_uv = []
+    for ux, vx in np.reshape(uv, (-1, 2)):
+        start, end = ohno2013.CCT_MINIMAL, ohno2013.CCT_MAXIMAL
+        count = ohno2013.CCT_SAMPLES
+        for _i in range(ohno2013.CCT_CALCULATION_ITERATIONS - 1):
+            table = []
+            for Ti in np.linspace(start, end, count):
+                XYZ = sd_to_XYZ(sd_blackbody(Ti, cmfs.shape), cmfs)
+                ui, vi = UCS_to_uv(XYZ_to_UCS(XYZ / np.max(XYZ)))
+                table.append((Ti, ui, vi, np.hypot(ux - ui, vx - vi)))
+
+            table = np.array(table)
+            index = np.clip(np.argmin(table[:, 3]), 1, count - 2)
+            start, end = table[index - 1, 0], table[index + 1, 0]
+
+        # The last planckian table, and the triangular and parabolic
+        # solutions, are computed with the vectorised definition.
+        CCT_D_uv.append(
+            ohno2013.uv_to_CCT_Ohno2013(
+                np.array([ux, vx]), cmfs, start, end, count, 1))
+
+    return np.reshape(CCT_D_uv, np.shape(uv))
+
+
+def benchmark_uv_to_CCT_Ohno2013(uv, uv_per_sample):
+    """
+    Benchmarks the conversion of given *CIE UCS* colourspace *uv* chromaticity
+    coordinates to correlated colour temperature :math:`T_{cp}` and
+    :math:`\\Delta_{uv}`.
+
+    Parameters
+    ----------
+    uv : ndarray
+        *uv* chromaticity coordinates for the vectorised computation.
+    uv_per_sample : ndarray
+        *uv* chromaticity coordinates for the per-sample computation.
+
+    Returns
+    -------
+    tuple
+        Time in seconds for the vectorised computation with a cold and warm
+        planckian table cache, time in seconds for the per-sample computation
+        and its extrapolation to the vectorised computation samples count.
+    """
+
+    def uv_to_CCT_Ohno2013_cold():
+        ohno2013._CACHE_PLANCKIAN_LOCUS_CMFS.clear()
+        ohno2013._CACHE_PLANCKIAN_LOCUS_TABLES.clear()
+
+        return ohno2013.uv_to_CCT_Ohno2013(uv)
+
+    t_cold = timeit.timeit(uv_to_CCT_Ohno2013_cold, number=1)
+    t_warm = timeit.timeit(lambda: ohno2013.uv_to_CCT_Ohno2013(uv), number=1)
+
+    t_per_sample = timeit.timeit(
+        lambda: uv_to_CCT_Ohno2013_per_sample(uv_per_sample), number=1)
+
+    return (t_cold, t_warm, t_per_sample,
+            t_per_sample * len(uv) / len(uv_per_sample))
+
+
+if __name__ == '__main__':
+    with suppress_warnings(
+            colour_usage_warnings=True, colour_runtime_warnings=True):
+        uv = np.random.RandomState(4).uniform([0.18, 0.26], [0.45, 0.36],
+                                              (SAMPLES_COUNT, 2))
+        uv_per_sample = uv[:SAMPLES_COUNT_PER_SAMPLE]
+
+        t_cold, t_warm, t_per_sample, t_per_sample_extrapolated = (
+            benchmark_uv_to_CCT_Ohno2013(uv, uv_per_sample))
+
+        CCT_D_uv = ohno2013.uv_to_CCT_Ohno2013(uv_per_sample)
+        CCT_D_uv_per_sample = uv_to_CCT_Ohno2013_per_sample(uv_per_sample)
+
+        message_box('[ uv_to_CCT_Ohno2013 ]\n\n'
+                    'samples (vectorised)         : {0}\n'
+                    'samples (per-sample)         : {1}\n\n'
+                    'vectorised (cold)            : {2:.3e}s\n'
+                    'vectorised (warm)            : {3:.3e}s\n'
+                    'per-sample                   : {4:.3e}s\n'
+                    'per-sample (extrapolated)    : {5:.3e}s\n'
+                    'speedup                      : {6:.1f}x\n'
+                    'maximum absolute difference  : {7:.3e}K, {8:.3e}'.format(
+                        SAMPLES_COUNT, SAMPLES_COUNT_PER_SAMPLE, t_cold,
+                        t_warm, t_per_sample, t_per_sample_extrapolated,
+                        t_per_sample_extrapolated / t_warm,
+                        *np.max(
+                            np.abs(CCT_D_uv - CCT_D_uv_per_sample), axis=0)))
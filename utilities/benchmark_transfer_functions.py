@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - Transfer Functions
+==============================
+
+Compares the computation of every transfer function of the
+:func:`colour.log_encoding`, :func:`colour.log_decoding`, :func:`colour.oetf`,
+:func:`colour.oetf_inverse`, :func:`colour.eotf`, :func:`colour.eotf_inverse`,
+:func:`colour.cctf_encoding` and :func:`colour.cctf_decoding` definitions
+with their tabulated computation, i.e. with the ``tabulate`` argument set to
+*True*, and reports the maximum error of the latter, absolute for the values
+with a magnitude lower than 1 and relative otherwise.
+"""
+
+import numpy as np
+import timeit
+
+from colour.models import (
+    CCTF_DECODINGS, CCTF_ENCODINGS, EOTFS, EOTF_INVERSES, LOG_DECODINGS,
+    LOG_ENCODINGS, OETFS, OETF_INVERSES, cctf_decoding, cctf_encoding, eotf,
+    eotf_inverse, log_decoding, log_encoding, oetf, oetf_inverse)
+from colour.utilities import message_box, suppress_warnings
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['VALUES_COUNT', 'TRANSFER_FUNCTIONS', 'benchmark_transfer_function']
+
+VALUES_COUNT = 4194304
+"""
+Values count the transfer functions are applied onto.
+
+VALUES_COUNT : int
+"""
+
+TRANSFER_FUNCTIONS = {
+    'log_encoding': (log_encoding, LOG_ENCODINGS),
+    'log_decoding': (log_decoding, LOG_DECODINGS),
+    'oetf': (oetf, OETFS),
+    'oetf_inverse': (oetf_inverse, OETF_INVERSES),
+    'eotf': (eotf, EOTFS),
+    'eotf_inverse': (eotf_inverse, EOTF_INVERSES),
+    'cctf_encoding': (cctf_encoding, CCTF_ENCODINGS),
+    'cctf_decoding': (cctf_decoding, CCTF_DECODINGS),
+}
+"""
+Transfer functions dispatching definitions and their transfer functions.
+
+TRANSFER_FUNCTIONS : dict
+"""
+
+
+def benchmark_transfer_function(definition, function, values):
+    """
+    Benchmarks given transfer function of given dispatching definition.
+
+    Parameters
+    ----------
+    definition : callable
+        Transfer functions dispatching definition.
+    function : unicode
+        Transfer function name.
+    values : ndarray
+        Values the transfer function is applied onto.
+
+    Returns
+    -------
+    tuple
+        Time in seconds for the table computation, the computation and the
+        tabulated computation, and maximum error of the latter.
+    """
+
+    t_table = timeit.timeit(
+        lambda: definition(values[:1], function, tabulate=True), number=1)
+    t_exact = timeit.timeit(lambda: definition(values, function), number=1)
+    t_tabulated = timeit.timeit(
+        lambda: definition(values, function, tabulate=True), number=1)
+
+    exact = definition(values, function)
+    tabulated = definition(values, function, tabulate=True)
+    finite = np.isfinite(exact) & np.isfinite(tabulated)
+    tabulated, exact = tabulated[finite], exact[finite]
+    error = np.max(np.abs(tabulated - exact) / np.maximum(np.abs(exact), 1))
+
+    return t_table, t_exact, t_tabulated, error
+
+
+if __name__ == '__main__':
+    with suppress_warnings(
+            colour_usage_warnings=True,
+            colour_runtime_warnings=True,
+            python_warnings=True):
+        values = np.random.RandomState(4).random_sample(VALUES_COUNT)
+
+        for name, (definition, functions) in TRANSFER_FUNCTIONS.items():
+            message = ('[ {0} - {1} Values ]\n\n'
+                       '{2:<22}  {3:<8}  {4:<8}  {5:<8}  {6:<7}  {7}\n'.format(
+                           name, VALUES_COUNT, 'function', 'table', 'exact',
+                           'tabul.', 'speedup', 'error'))
+            for function in functions:
+                t_table, t_exact, t_tabulated, error = (
+                    benchmark_transfer_function(definition, function, values))
+
+                message += ('{0:<22}: {1:.2e}s {2:.2e}s {3:.2e}s {4:>6.1f}x '
+                            ' {5:.1e}\n'.format(function, t_table, t_exact,
+                                                t_tabulated,
+                                                t_exact / t_tabulated, error))
+
+            message_box(message)
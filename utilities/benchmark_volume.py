@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark - RGB Colourspace Volume
+==================================
+
+Compares the *RGB* colourspace volume computation using *Monte Carlo* method,
+i.e. with the :func:`colour.RGB_colourspace_volume_MonteCarlo` definition,
+and using the tessellated *RGB* colourspace cube boundary, i.e. with the
+:func:`colour.volume.RGB_colourspace_volume_Mesh` definition, at equal
+accuracy. The *Monte Carlo* method is timed on a fixed samples count and its
+time to reach the tolerance of the mesh based computation is extrapolated from
+its standard error.
+
+Compares the visible spectrum containment test of many points using a single
+:meth:`scipy.spatial.Delaunay.find_simplex` method call, i.e. the previous
+:func:`colour.is_within_visible_spectrum` definition implementation, with the
+:class:`colour.volume.VolumeIndex` class. The
+:meth:`scipy.spatial.Delaunay.find_simplex` method is timed on a subset of the
+points and its total time is extrapolated to the full points count.
+"""
+
+import numpy as np
+import timeit
+from scipy.spatial import Delaunay
+
+from colour.models import (RGB_COLOURSPACE_BT2020, RGB_COLOURSPACE_DCI_P3,
+                           RGB_COLOURSPACE_sRGB)
+from colour.utilities import message_box, suppress_warnings
+from colour.volume import (
+    RGB_colourspace_volume_Mesh, RGB_colourspace_volume_MonteCarlo,
+    RGB_colourspace_volume_intersection_Mesh,
+    RGB_colourspace_volume_union_Mesh, VolumeIndex, XYZ_outer_surface)
+
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'SAMPLES_COUNT', 'TOLERANCES', 'COLOURSPACES', 'POINTS_COUNT',
+    'POINTS_COUNT_DELAUNAY', 'benchmark_volume',
+    'benchmark_intersection_union', 'benchmark_is_within_visible_spectrum'
+]
+
+SAMPLES_COUNT = 10e6
+"""
+*Monte Carlo* method samples count.
+
+SAMPLES_COUNT : numeric
+"""
+
+TOLERANCES = (1e-3, 1e-4, 1e-5)
+"""
+Relative tolerances of the mesh based computation.
+
+TOLERANCES : tuple
+"""
+
+COLOURSPACES = (RGB_COLOURSPACE_sRGB, RGB_COLOURSPACE_DCI_P3,
+                RGB_COLOURSPACE_BT2020)
+"""
+*RGB* colourspaces to compute the volume of.
+
+COLOURSPACES : tuple
+"""
+
+POINTS_COUNT = 1000000
+"""
+*CIE XYZ* tristimulus values count tested against the visible spectrum.
+
+POINTS_COUNT : int
+"""
+
+POINTS_COUNT_DELAUNAY = 10000
+"""
+*CIE XYZ* tristimulus values count tested against the visible spectrum with a
+single :meth:`scipy.spatial.Delaunay.find_simplex` method call.
+
+POINTS_COUNT_DELAUNAY : int
+"""
+
+
+def benchmark_volume(colourspace):
+    """
+    Benchmarks the volume computation of given *RGB* colourspace.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+
+    Returns
+    -------
+    tuple
+        *Monte Carlo* method estimate and time in seconds, and for each
+        tolerance, the mesh based volume, its time in seconds and the
+        extrapolated time in seconds for the *Monte Carlo* method to reach
+        the same relative standard error.
+    """
+
+    estimate = []
+    t_MonteCarlo = timeit.timeit(
+        lambda: estimate.append(
+            RGB_colourspace_volume_MonteCarlo(
+                colourspace,
+                SAMPLES_COUNT,
+                sequence='Sobol',
+                additional_data=True)),
+        number=1)
+    estimate = estimate[0]
+
+    meshes = []
+    for tolerance in TOLERANCES:
+        volume = []
+        t_mesh = timeit.timeit(
+            lambda: volume.append(
+                RGB_colourspace_volume_Mesh(
+                    colourspace, tolerance=tolerance)),
+            number=1)
+        volume = volume[0]
+
+        # The standard error decreases with the square root of the samples
+        # count.
+        ratio = estimate.standard_error / (tolerance * volume)
+        t_MonteCarlo_extrapolated = t_MonteCarlo * ratio ** 2
+
+        meshes.append((tolerance, volume, t_mesh, t_MonteCarlo_extrapolated))
+
+    return estimate, t_MonteCarlo, meshes
+
+
+def benchmark_intersection_union(colourspace_a, colourspace_b):
+    """
+    Benchmarks the intersection and union volumes computation of given *RGB*
+    colourspaces.
+
+    Parameters
+    ----------
+    colourspace_a : RGB_Colourspace
+        First *RGB* colourspace.
+    colourspace_b : RGB_Colourspace
+        Second *RGB* colourspace.
+
+    Returns
+    -------
+    tuple
+        Intersection volume and time in seconds, union volume and time in
+        seconds.
+    """
+
+    intersection, union = [], []
+    t_intersection = timeit.timeit(
+        lambda: intersection.append(
+            RGB_colourspace_volume_intersection_Mesh(colourspace_a,
+                                                     colourspace_b)),
+        number=1)
+    t_union = timeit.timeit(
+        lambda: union.append(
+            RGB_colourspace_volume_union_Mesh(colourspace_a, colourspace_b)),
+        number=1)
+
+    return intersection[0], t_intersection, union[0], t_union
+
+
+def benchmark_is_within_visible_spectrum(XYZ, XYZ_Delaunay):
+    """
+    Benchmarks the visible spectrum containment test of given *CIE XYZ*
+    tristimulus values.
+
+    Parameters
+    ----------
+    XYZ : ndarray
+        *CIE XYZ* tristimulus values for the :class:`colour.volume.VolumeIndex`
+        class.
+    XYZ_Delaunay : ndarray
+        *CIE XYZ* tristimulus values for the
+        :meth:`scipy.spatial.Delaunay.find_simplex` method.
+
+    Returns
+    -------
+    tuple
+        Time in seconds for the :meth:`scipy.spatial.Delaunay.find_simplex`
+        method and its extrapolation to the
+        :class:`colour.volume.VolumeIndex` class points count, time in seconds
+        for the :class:`colour.volume.VolumeIndex` class *Delaunay* method
+        with a cold and warm index, *Half-Space* method and distance query,
+        and count of differing containment tests.
+    """
+
+    vertices = XYZ_outer_surface()
+
+    triangulation = Delaunay(vertices)
+    t_Delaunay = timeit.timeit(
+        lambda: triangulation.find_simplex(XYZ_Delaunay), number=1)
+
+    index = VolumeIndex(vertices)
+    t_index_cold = timeit.timeit(lambda: index.is_within(XYZ), number=1)
+    t_index_warm = timeit.timeit(lambda: index.is_within(XYZ), number=1)
+
+    index_half_space = VolumeIndex(vertices, 'Half-Space')
+    t_index_half_space = timeit.timeit(
+        lambda: index_half_space.is_within(XYZ), number=1)
+    t_distance = timeit.timeit(lambda: index.distance(XYZ), number=1)
+
+    is_within_Delaunay = triangulation.find_simplex(XYZ_Delaunay) >= 0
+    differences = np.sum(is_within_Delaunay != index.is_within(XYZ_Delaunay))
+
+    return (t_Delaunay, t_Delaunay * len(XYZ) / len(XYZ_Delaunay),
+            t_index_cold, t_index_warm, t_index_half_space, t_distance,
+            differences)
+
+
+if __name__ == '__main__':
+    with suppress_warnings(colour_usage_warnings=True):
+        for colourspace in COLOURSPACES:
+            estimate, t_MonteCarlo, meshes = benchmark_volume(colourspace)
+
+            message = ('[ {0} ]\n\n'
+                       'monte carlo (sobol)      : {1:.1f} +/- {2:.1f} '
+                       '({3:.3e}s, {4:.0f} samples)\n'.format(
+                           colourspace.name, estimate.value,
+                           estimate.standard_error, t_MonteCarlo,
+                           estimate.samples))
+            for tolerance, volume, t_mesh, t_extrapolated in meshes:
+                message += ('\nmesh ({0:.0e})            : {1:.1f} '
+                            '({2:.3e}s)\n'
+                            'monte carlo (equal acc.) : {3:.3e}s '
+                            '(extrapolated)\n'
+                            'speedup                  : {4:.1f}x\n'.format(
+                                tolerance, volume, t_mesh, t_extrapolated,
+                                t_extrapolated / t_mesh))
+
+            message_box(message)
+
+        for colourspace_a, colourspace_b in ((RGB_COLOURSPACE_sRGB,
+                                              RGB_COLOURSPACE_DCI_P3),
+                                             (RGB_COLOURSPACE_DCI_P3,
+                                              RGB_COLOURSPACE_BT2020)):
+            intersection, t_intersection, union, t_union = (
+                benchmark_intersection_union(colourspace_a, colourspace_b))
+
+            message_box('[ {0} - {1} ]\n\n'
+                        'intersection : {2:.1f} ({3:.3e}s)\n'
+                        'union        : {4:.1f} ({5:.3e}s)'.format(
+                            colourspace_a.name, colourspace_b.name,
+                            intersection, t_intersection, union, t_union))
+
+        XYZ = np.random.RandomState(4).uniform(-0.1, 1.2, (POINTS_COUNT, 3))
+        XYZ_Delaunay = XYZ[:POINTS_COUNT_DELAUNAY]
+
+        (t_Delaunay, t_Delaunay_extrapolated, t_index_cold, t_index_warm,
+         t_index_half_space, t_distance,
+         differences) = benchmark_is_within_visible_spectrum(
+             XYZ, XYZ_Delaunay)
+
+        message_box(
+            '[ Visible Spectrum - {0} Points ]\n\n'
+            'find_simplex                : {1:.3e}s ({2} points)\n'
+            'find_simplex (extrapolated) : {3:.3e}s\n'
+            'index (delaunay, cold)      : {4:.3e}s\n'
+            'index (delaunay, warm)      : {5:.3e}s ({6:.1f}x)\n'
+            'index (half-space)          : {7:.3e}s ({8:.1f}x)\n'
+            'index (distance)            : {9:.3e}s\n'
+            'differences                 : {10}'.format(
+                POINTS_COUNT, t_Delaunay, POINTS_COUNT_DELAUNAY,
+                t_Delaunay_extrapolated, t_index_cold, t_index_warm,
+                t_Delaunay_extrapolated / t_index_warm, t_index_half_space,
+                t_Delaunay_extrapolated / t_index_half_space, t_distance,
+                differences))